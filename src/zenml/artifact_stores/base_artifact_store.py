@@ -48,6 +48,8 @@ logger = get_logger(__name__)
 
 PathType = Union[bytes, str]
 
+CONTENT_ADDRESSED_DIRECTORY = "content_addressed"
+
 
 class _sanitize_paths:
     """Sanitizes path inputs before calling the original function.
@@ -169,9 +171,19 @@ class _sanitize_paths:
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
-    """Config class for `BaseArtifactStore`."""
+    """Config class for `BaseArtifactStore`.
+
+    Attributes:
+        path: The root path of the artifact store.
+        content_addressed: If True, artifacts are stored under a path derived
+            from a hash of their content. Artifacts with the same content are
+            only stored once and shared between all artifact versions that
+            contain them. This only applies to artifacts whose materializer
+            computes a content hash.
+    """
 
     path: str
+    content_addressed: bool = False
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]]
     IS_IMMUTABLE_FILESYSTEM: ClassVar[bool] = False
@@ -266,6 +278,19 @@ class BaseArtifactStore(StackComponent):
         return None
 
     # --- User interface ---
+    def get_content_addressed_uri(self, digest: str) -> str:
+        """Gets the URI under which content with a given digest is stored.
+
+        Args:
+            digest: The hex digest identifying the content.
+
+        Returns:
+            The URI for the content.
+        """
+        return os.path.join(
+            self.path, CONTENT_ADDRESSED_DIRECTORY, digest[:2], digest
+        )
+
     @abstractmethod
     def open(self, name: PathType, mode: str = "r") -> Any:
         """Open a file at the given path.
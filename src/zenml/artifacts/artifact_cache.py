@@ -0,0 +1,586 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local read-through cache for artifacts in remote artifact stores."""
+
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import sys
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager, suppress
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+from uuid import UUID, uuid4
+
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE_MB,
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    ENV_ZENML_SERVER,
+    handle_int_env_var,
+)
+from zenml.enums import StackComponentType
+from zenml.io.fileio import convert_to_str
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+
+logger = get_logger(__name__)
+
+ARTIFACT_CACHE_DIRECTORY = "artifact_cache"
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def _lock_file(f: IO[Any], blocking: bool) -> bool:
+    """Acquires an exclusive lock on an open file.
+
+    Args:
+        f: The open file to lock.
+        blocking: Whether to wait until the lock can be acquired.
+
+    Returns:
+        Whether the lock was acquired.
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), mode, 1)
+                return True
+            except OSError:
+                # `LK_LOCK` only retries for 10 seconds before failing
+                if not blocking:
+                    return False
+    else:
+        import fcntl
+
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(f.fileno(), flags)
+        except BlockingIOError:
+            return False
+        return True
+
+
+def _unlock_file(f: IO[Any]) -> None:
+    """Releases the lock on an open file.
+
+    Args:
+        f: The open file to unlock.
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def _file_lock(path: str, blocking: bool = True) -> Iterator[bool]:
+    """Context manager that holds an exclusive lock on a file.
+
+    The lock is shared between all threads and processes on the same machine.
+
+    Args:
+        path: Path of the lock file. It will be created if it doesn't exist.
+        blocking: Whether to wait until the lock can be acquired.
+
+    Yields:
+        Whether the lock was acquired. This is always True for blocking locks.
+    """
+    with open(path, "a+b") as f:
+        acquired = _lock_file(f, blocking=blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                _unlock_file(f)
+
+
+class ArtifactCache:
+    """Size-bounded on-disk cache for the data of artifact versions.
+
+    Artifact versions are immutable, which means their data can be cached
+    locally without ever being invalidated. The cache is safe to share
+    between all processes running on the same machine: Each entry is
+    downloaded by a single process while holding a lock, and concurrent
+    readers of the same entry wait for the download to finish instead of
+    downloading the data themselves.
+
+    Once the total size of all entries exceeds the maximum size, the least
+    recently used entries are evicted. Readers hold a lease on the entries
+    they read from, and entries are never evicted while they are leased.
+    Each lease is a locked file, which means the leases of a process are
+    released by the operating system if it exits without releasing them.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            path: The local directory in which to store the cached data.
+            max_size: The maximum size of the cache in bytes.
+        """
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+        self._artifact_store: Optional["BaseArtifactStore"] = None
+        self._process_leases: Dict[str, Callable[[], None]] = {}
+        self._process_leases_lock = threading.Lock()
+
+    @property
+    def _entries_path(self) -> str:
+        """Path of the directory containing the cache entries.
+
+        Returns:
+            The path of the entries directory.
+        """
+        return os.path.join(self.path, "entries")
+
+    @property
+    def _locks_path(self) -> str:
+        """Path of the directory containing the lock files of the entries.
+
+        Returns:
+            The path of the locks directory.
+        """
+        return os.path.join(self.path, "locks")
+
+    @property
+    def _leases_path(self) -> str:
+        """Path of the directory containing the lease files of the entries.
+
+        Returns:
+            The path of the leases directory.
+        """
+        return os.path.join(self.path, "leases")
+
+    @property
+    def _temp_path(self) -> str:
+        """Path of the directory in which data is downloaded.
+
+        Returns:
+            The path of the temporary directory.
+        """
+        return os.path.join(self.path, "tmp")
+
+    def get_artifact_store(
+        self, artifact_store: "BaseArtifactStore"
+    ) -> "BaseArtifactStore":
+        """Gets a local artifact store to read the cached data.
+
+        Args:
+            artifact_store: The artifact store from which the cached data was
+                downloaded.
+
+        Returns:
+            A local artifact store rooted at the cache directory.
+        """
+        if self._artifact_store is None:
+            from zenml.artifact_stores.local_artifact_store import (
+                LocalArtifactStore,
+                LocalArtifactStoreConfig,
+            )
+
+            now = datetime.utcnow()
+            self._artifact_store = LocalArtifactStore(
+                name=ARTIFACT_CACHE_DIRECTORY,
+                id=uuid4(),
+                config=LocalArtifactStoreConfig(path=self._entries_path),
+                flavor="local",
+                type=StackComponentType.ARTIFACT_STORE,
+                user=artifact_store.user,
+                workspace=artifact_store.workspace,
+                created=now,
+                updated=now,
+            )
+
+        return self._artifact_store
+
+    def get(
+        self,
+        artifact_version_id: Optional[UUID],
+        uri: str,
+        artifact_store: "BaseArtifactStore",
+    ) -> Tuple[str, Callable[[], None]]:
+        """Gets the local path of the cached data of an artifact version.
+
+        If the artifact version is not cached yet, its data is downloaded
+        from the artifact store first. The entry is leased to the caller
+        and won't be evicted until the lease is released.
+
+        Args:
+            artifact_version_id: The ID of the artifact version. If not
+                given, the data is cached only by its URI.
+            uri: The URI of the artifact version.
+            artifact_store: The artifact store in which the artifact version
+                is stored.
+
+        Returns:
+            The local path containing the data of the artifact version and a
+            function to release the lease once the data is not read anymore.
+
+        Raises:
+            BaseException: If the data could not be downloaded.
+        """
+        key_source = (
+            f"{artifact_version_id}:{uri}" if artifact_version_id else uri
+        )
+        key = hashlib.sha256(key_source.encode()).hexdigest()
+        data_path = os.path.join(self._entries_path, key)
+        info_path = f"{data_path}.json"
+
+        for directory in (
+            self._entries_path,
+            self._locks_path,
+            self._leases_path,
+            self._temp_path,
+        ):
+            os.makedirs(directory, exist_ok=True)
+
+        with _file_lock(os.path.join(self._locks_path, f"{key}.lock")):
+            if os.path.exists(info_path):
+                # Mark the entry as recently used
+                os.utime(info_path)
+                logger.debug(
+                    "Loading artifact `%s` from cache `%s`.", uri, data_path
+                )
+                return data_path, self._acquire_lease(key)
+
+            # The data of interrupted downloads might still exist
+            shutil.rmtree(data_path, ignore_errors=True)
+
+            logger.debug(
+                "Downloading artifact `%s` to cache `%s`.", uri, data_path
+            )
+            temp_path = tempfile.mkdtemp(dir=self._temp_path)
+            try:
+                size = self._download(
+                    uri=uri, artifact_store=artifact_store, path=temp_path
+                )
+                os.replace(temp_path, data_path)
+            except BaseException:
+                shutil.rmtree(temp_path, ignore_errors=True)
+                raise
+
+            # The info file marks the entry as complete, so it is written last
+            with open(info_path, "w") as f:
+                json.dump(
+                    {
+                        "artifact_version_id": str(artifact_version_id)
+                        if artifact_version_id
+                        else None,
+                        "uri": uri,
+                        "size": size,
+                    },
+                    f,
+                )
+
+            release = self._acquire_lease(key)
+
+        self._evict()
+        return data_path, release
+
+    def lease_for_process(self, path: str) -> None:
+        """Leases an entry until the current process exits.
+
+        Args:
+            path: The local path of the entry.
+        """
+        key = os.path.basename(path)
+        with self._process_leases_lock:
+            if key not in self._process_leases:
+                self._process_leases[key] = self._acquire_lease(key)
+
+    def _acquire_lease(self, key: str) -> Callable[[], None]:
+        """Acquires a lease on an entry.
+
+        This must be called while holding the lock of the entry, which
+        prevents it from being evicted at the same time.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            A function to release the lease.
+        """
+        lease_directory = os.path.join(self._leases_path, key)
+        os.makedirs(lease_directory, exist_ok=True)
+        lease_path = os.path.join(
+            lease_directory, f"{os.getpid()}-{uuid4().hex}"
+        )
+        f = open(lease_path, "a+b")
+        _lock_file(f, blocking=True)
+
+        def _release() -> None:
+            if f.closed:
+                return
+            _unlock_file(f)
+            f.close()
+            with suppress(OSError):
+                os.remove(lease_path)
+
+        return _release
+
+    def _is_leased(self, key: str) -> bool:
+        """Checks whether an entry is leased by any process.
+
+        Leases of processes that exited without releasing them are removed.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            Whether the entry is leased.
+        """
+        lease_directory = os.path.join(self._leases_path, key)
+        if not os.path.isdir(lease_directory):
+            return False
+
+        for file_name in os.listdir(lease_directory):
+            lease_path = os.path.join(lease_directory, file_name)
+            try:
+                f = open(lease_path, "a+b")
+            except OSError:
+                continue
+
+            with f:
+                if not _lock_file(f, blocking=False):
+                    return True
+                _unlock_file(f)
+
+            with suppress(OSError):
+                os.remove(lease_path)
+
+        return False
+
+    @staticmethod
+    def _download(
+        uri: str, artifact_store: "BaseArtifactStore", path: str
+    ) -> int:
+        """Downloads all files of an artifact into a local directory.
+
+        Args:
+            uri: The URI of the artifact.
+            artifact_store: The artifact store in which the artifact is
+                stored.
+            path: The local directory to download the files to.
+
+        Returns:
+            The total size of the downloaded files in bytes.
+        """
+        size = 0
+        for directory, _, file_names in artifact_store.walk(uri):
+            directory = convert_to_str(directory)
+            relative_directory = posixpath.relpath(directory, uri)
+            local_directory = os.path.normpath(
+                os.path.join(path, relative_directory)
+            )
+            os.makedirs(local_directory, exist_ok=True)
+
+            for file_name in file_names:
+                file_name = convert_to_str(file_name)
+                local_path = os.path.join(local_directory, file_name)
+                with artifact_store.open(
+                    posixpath.join(directory, file_name), "rb"
+                ) as source, open(local_path, "wb") as destination:
+                    shutil.copyfileobj(source, destination, COPY_BUFFER_SIZE)
+                size += os.path.getsize(local_path)
+
+        return size
+
+    def _evict(self) -> None:
+        """Evicts the least recently used entries until the cache fits.
+
+        Entries that are currently leased or locked are skipped.
+        """
+        with _file_lock(os.path.join(self.path, "evict.lock")):
+            entries = []
+            for file_name in os.listdir(self._entries_path):
+                if not file_name.endswith(".json"):
+                    continue
+
+                info_path = os.path.join(self._entries_path, file_name)
+                try:
+                    with open(info_path) as f:
+                        size = int(json.load(f)["size"])
+                    last_used = os.path.getmtime(info_path)
+                except (OSError, ValueError, KeyError):
+                    continue
+
+                entries.append((last_used, size, file_name[: -len(".json")]))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, key in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+
+                lock_path = os.path.join(self._locks_path, f"{key}.lock")
+                with _file_lock(lock_path, blocking=False) as acquired:
+                    if not acquired or self._is_leased(key):
+                        continue
+
+                    data_path = os.path.join(self._entries_path, key)
+                    os.remove(f"{data_path}.json")
+                    shutil.rmtree(data_path, ignore_errors=True)
+                    shutil.rmtree(
+                        os.path.join(self._leases_path, key),
+                        ignore_errors=True,
+                    )
+
+                total_size -= size
+
+
+@lru_cache(maxsize=None)
+def _get_artifact_cache(path: str, max_size: int) -> ArtifactCache:
+    """Gets the artifact cache for a path and maximum size.
+
+    Args:
+        path: The local directory of the cache.
+        max_size: The maximum size of the cache in bytes.
+
+    Returns:
+        The artifact cache.
+    """
+    return ArtifactCache(path=path, max_size=max_size)
+
+
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """Gets the artifact cache configured for this environment.
+
+    The cache is enabled by setting the `ZENML_ARTIFACT_CACHE_MAX_SIZE_MB`
+    environment variable to a positive value. The cache directory defaults
+    to a subdirectory of the global config directory and can be configured
+    using the `ZENML_ARTIFACT_CACHE_PATH` environment variable.
+
+    Returns:
+        The artifact cache or None if caching is disabled.
+    """
+    max_size_mb = handle_int_env_var(
+        ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE_MB, default=0
+    )
+    if max_size_mb <= 0:
+        return None
+
+    path = os.getenv(ENV_ZENML_ARTIFACT_CACHE_PATH) or os.path.join(
+        io_utils.get_global_config_directory(), ARTIFACT_CACHE_DIRECTORY
+    )
+    return _get_artifact_cache(path, max_size_mb * 1024 * 1024)
+
+
+def load_with_artifact_cache(
+    load: Callable[[str, Optional["BaseArtifactStore"]], Any],
+    artifact_version_id: Optional[UUID],
+    uri: str,
+    artifact_store: Optional["BaseArtifactStore"] = None,
+) -> Any:
+    """Loads the data of an artifact version, using the cache if possible.
+
+    If the artifact cache is enabled and the artifact version is stored in a
+    remote artifact store, the data is loaded from the locally cached copy.
+    Otherwise, it is loaded from its original location.
+
+    Materializers might load data lazily (e.g. memory-mapped arrays), which
+    means the cached files are still read after loading returns. The cache
+    entry therefore stays leased until the loaded data is garbage collected,
+    or until the process exits if the data can't be tracked.
+
+    Args:
+        load: Function that loads the data from a URI and artifact store.
+        artifact_version_id: The ID of the artifact version.
+        uri: The URI of the artifact version.
+        artifact_store: The artifact store in which the artifact version is
+            stored. If not given, the artifact store of the active stack is
+            used.
+
+    Returns:
+        The loaded data.
+
+    Raises:
+        BaseException: If the data could not be loaded.
+    """
+    if (
+        artifact_version_id is None
+        or not io_utils.is_remote(uri)
+        or ENV_ZENML_SERVER in os.environ
+    ):
+        return load(uri, artifact_store)
+
+    artifact_cache = get_artifact_cache()
+    if not artifact_cache:
+        return load(uri, artifact_store)
+
+    if not artifact_store:
+        from zenml.client import Client
+
+        artifact_store = Client().active_stack.artifact_store
+
+    try:
+        local_uri, release = artifact_cache.get(
+            artifact_version_id=artifact_version_id,
+            uri=uri,
+            artifact_store=artifact_store,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to cache artifact version `%s`, loading it directly from "
+            "the artifact store instead: %s",
+            artifact_version_id,
+            e,
+        )
+        return load(uri, artifact_store)
+
+    try:
+        data = load(
+            local_uri, artifact_cache.get_artifact_store(artifact_store)
+        )
+    except BaseException:
+        release()
+        raise
+
+    if isinstance(data, (str, bytes, int, float, bool, type(None))):
+        # Values of these types are never loaded lazily
+        release()
+        return data
+
+    try:
+        weakref.finalize(data, release)
+    except TypeError:
+        # Some types, e.g. lists and dicts, don't support weak references
+        # but might still contain lazily loaded values
+        artifact_cache.lease_for_process(local_uri)
+        release()
+
+    return data
@@ -14,19 +14,27 @@
 """Utility functions for handling artifacts."""
 
 import base64
+import hashlib
 import os
 import tempfile
-import time
 import zipfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from uuid import UUID, uuid4
 
+from zenml.artifacts.artifact_cache import load_with_artifact_cache
 from zenml.client import Client
-from zenml.constants import (
-    MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION,
-    MODEL_METADATA_YAML_FILE_NAME,
-)
+from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
 from zenml.enums import (
     ExecutionStatus,
     MetadataResourceTypes,
@@ -35,13 +43,11 @@ from zenml.enums import (
 )
 from zenml.exceptions import (
     DoesNotExistException,
-    EntityExistsError,
     StepContextError,
 )
 from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.models import (
-    ArtifactRequest,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
     ArtifactVisualizationRequest,
@@ -66,6 +72,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Name of the file inside a content addressed directory which contains the
+# name of the subdirectory with the committed data.
+CONTENT_ADDRESSED_MARKER_FILENAME = "committed"
+
 # ----------
 # Public API
 # ----------
@@ -114,7 +124,6 @@ def save_artifact(
 
     Raises:
         RuntimeError: If artifact URI already exists.
-        EntityExistsError: If artifact version already exists.
     """
     from zenml.materializers.materializer_registry import (
         materializer_registry,
@@ -123,25 +132,6 @@ def save_artifact(
 
     client = Client()
 
-    # Get or create the artifact
-    try:
-        artifact = client.list_artifacts(name=name)[0]
-        if artifact.has_custom_name != has_custom_name:
-            client.update_artifact(
-                name_id_or_prefix=artifact.id, has_custom_name=has_custom_name
-            )
-    except IndexError:
-        try:
-            artifact = client.zen_store.create_artifact(
-                ArtifactRequest(
-                    name=name,
-                    has_custom_name=has_custom_name,
-                    tags=tags,
-                )
-            )
-        except EntityExistsError:
-            artifact = client.list_artifacts(name=name)[0]
-
     # Get the current artifact store
     artifact_store = client.active_stack.artifact_store
 
@@ -161,9 +151,8 @@ def save_artifact(
                 f"{uri} because the URI is already used by artifact "
                 f"{other_artifact.name} (version {other_artifact.version})."
             )
-    artifact_store.makedirs(uri)
 
-    # Find and initialize the right materializer class
+    # Find the right materializer class
     if isinstance(materializer, type):
         materializer_class = materializer
     elif materializer:
@@ -172,104 +161,22 @@ def save_artifact(
         )
     else:
         materializer_class = materializer_registry[type(data)]
-    materializer_object = materializer_class(uri)
-
-    # Force URIs to have forward slashes
-    materializer_object.uri = materializer_object.uri.replace("\\", "/")
-
-    # Save the artifact to the artifact store
-    data_type = type(data)
-    materializer_object.validate_type_compatibility(data_type)
-    materializer_object.save(data)
 
-    # Save visualizations of the artifact
-    visualizations: List[ArtifactVisualizationRequest] = []
-    if include_visualizations:
-        try:
-            vis_data = materializer_object.save_visualizations(data)
-            for vis_uri, vis_type in vis_data.items():
-                vis_model = ArtifactVisualizationRequest(
-                    type=vis_type,
-                    uri=vis_uri,
-                )
-                visualizations.append(vis_model)
-        except Exception as e:
-            logger.warning(
-                f"Failed to save visualization for output artifact '{name}': "
-                f"{e}"
-            )
-
-    # Save metadata of the artifact
-    artifact_metadata: Dict[str, "MetadataType"] = {}
-    if extract_metadata:
-        try:
-            artifact_metadata = materializer_object.extract_full_metadata(data)
-            artifact_metadata.update(user_metadata or {})
-        except Exception as e:
-            logger.warning(
-                f"Failed to extract metadata for output artifact '{name}': {e}"
-            )
-
-    # Create the artifact version
-    def _create_version() -> Optional[ArtifactVersionResponse]:
-        artifact_version = ArtifactVersionRequest(
-            artifact_id=artifact.id,
-            version=version,
-            tags=tags,
-            type=materializer_object.ASSOCIATED_ARTIFACT_TYPE,
-            uri=materializer_object.uri,
-            materializer=source_utils.resolve(materializer_object.__class__),
-            data_type=source_utils.resolve(data_type),
-            user=Client().active_user.id,
-            workspace=Client().active_workspace.id,
-            artifact_store_id=artifact_store.id,
-            visualizations=visualizations,
-            has_custom_name=has_custom_name,
-        )
-        try:
-            return client.zen_store.create_artifact_version(
-                artifact_version=artifact_version
-            )
-        except EntityExistsError:
-            return None
-
-    response = None
-    if not version:
-        retries_made = 0
-        for i in range(MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION):
-            # Get new artifact version
-            version = _get_new_artifact_version(name)
-            if response := _create_version():
-                break
-            # smoothed exponential back-off, it will go as 0.2, 0.3,
-            # 0.45, 0.68, 1.01, 1.52, 2.28, 3.42, 5.13, 7.69, ...
-            sleep = 0.2 * 1.5**i
-            logger.debug(
-                f"Failed to create artifact version `{version}` for "
-                f"artifact `{name}`. Retrying in {sleep}..."
-            )
-            time.sleep(sleep)
-            retries_made += 1
-        if not response:
-            raise EntityExistsError(
-                f"Failed to create new artifact version for artifact "
-                f"`{name}`. Retried {retries_made} times. "
-                "This could be driven by exceptionally high concurrency of "
-                "pipeline runs. Please, reach out to us on ZenML Slack for support."
-            )
-    else:
-        response = _create_version()
-        if not response:
-            raise EntityExistsError(
-                f"Failed to create artifact version `{version}` for artifact "
-                f"`{name}`. Given version already exists."
-            )
-    if artifact_metadata:
-        client.create_run_metadata(
-            metadata=artifact_metadata,
-            resource_id=response.id,
-            resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
-        )
+    artifact_version_request = _store_artifact_data_and_prepare_request(
+        data=data,
+        name=name,
+        uri=uri,
+        materializer_class=materializer_class,
+        version=version,
+        tags=tags,
+        store_metadata=extract_metadata,
+        store_visualizations=include_visualizations,
+        has_custom_name=has_custom_name,
+        metadata=user_metadata,
+    )
+    response = client.zen_store.create_artifact_version(
+        artifact_version=artifact_version_request
+    )
 
     if manual_save:
         try:
@@ -302,6 +209,7 @@ def save_artifact(
 def load_artifact(
     name_or_id: Union[str, UUID],
     version: Optional[str] = None,
+    data_type: Optional[Type[Any]] = None,
 ) -> Any:
     """Load an artifact.
 
@@ -309,6 +217,8 @@ def load_artifact(
         name_or_id: The name or ID of the artifact to load.
         version: The version of the artifact to load, if `name_or_id` is a
             name. If not provided, the latest version will be loaded.
+        data_type: The type as which to load the artifact. If not provided,
+            the artifact will be loaded as the type it was saved as.
 
     Returns:
         The loaded artifact.
@@ -325,7 +235,7 @@ def load_artifact(
         )
     except RuntimeError:
         pass  # Cannot link to step run if called outside of a step
-    return load_artifact_from_response(artifact)
+    return load_artifact_from_response(artifact, data_type=data_type)
 
 
 def log_artifact_metadata(
@@ -453,11 +363,16 @@ def load_artifact_visualization(
         artifact_store.cleanup()
 
 
-def load_artifact_from_response(artifact: "ArtifactVersionResponse") -> Any:
+def load_artifact_from_response(
+    artifact: "ArtifactVersionResponse",
+    data_type: Optional[Type[Any]] = None,
+) -> Any:
     """Load the given artifact into memory.
 
     Args:
         artifact: The artifact to load.
+        data_type: The type as which to load the artifact. If not provided,
+            the artifact will be loaded as the type it was saved as.
 
     Returns:
         The artifact loaded into memory.
@@ -468,9 +383,10 @@ def load_artifact_from_response(artifact: "ArtifactVersionResponse") -> Any:
 
     return _load_artifact_from_uri(
         materializer=artifact.materializer,
-        data_type=artifact.data_type,
+        data_type=data_type or artifact.data_type,
         uri=artifact.uri,
         artifact_store=artifact_store,
+        artifact_version_id=artifact.id,
     )
 
 
@@ -577,19 +493,297 @@ def get_artifacts_versions_of_pipeline_run(
 # -------------------------
 
 
+def _store_artifact_data_and_prepare_request(
+    data: Any,
+    name: str,
+    uri: str,
+    materializer_class: Type["BaseMaterializer"],
+    version: Optional[Union[int, str]] = None,
+    tags: Optional[List[str]] = None,
+    store_metadata: bool = True,
+    store_visualizations: bool = True,
+    has_custom_name: bool = True,
+    metadata: Optional[Dict[str, "MetadataType"]] = None,
+    compute_content_hash: bool = False,
+) -> ArtifactVersionRequest:
+    """Store artifact data and prepare a request to the server.
+
+    Args:
+        data: The artifact data.
+        name: The artifact name.
+        uri: The artifact URI.
+        materializer_class: The materializer class to use for storing the
+            artifact data.
+        version: The artifact version. If not provided, the server will use
+            the next auto-incremented version.
+        tags: Tags for the artifact version.
+        store_metadata: Whether to store metadata for the artifact version.
+        store_visualizations: Whether to store visualizations for the artifact
+            version.
+        has_custom_name: Whether the artifact has a custom name.
+        metadata: Metadata to store for the artifact version. This will be
+            ignored if `store_metadata` is set to `False`.
+        compute_content_hash: Whether to compute the content hash of the
+            data even if the artifact store is not content addressed, e.g.
+            because it is used for content addressed caching.
+
+    Returns:
+        Artifact version request for the artifact data that was stored.
+    """
+    from zenml.metadata.metadata_types import validate_metadata
+
+    artifact_store = Client().active_stack.artifact_store
+
+    materializer = materializer_class(uri=uri, artifact_store=artifact_store)
+    data_type = type(data)
+    materializer.validate_type_compatibility(data_type)
+
+    content_hash = None
+    if compute_content_hash or artifact_store.config.content_addressed:
+        try:
+            content_hash = materializer.compute_content_hash(data)
+        except Exception as e:
+            logger.warning(
+                "Failed to compute content hash for output artifact "
+                f"'{name}': {e}"
+            )
+
+    existing_artifact_version = None
+    content_uri = None
+    if artifact_store.config.content_addressed and content_hash:
+        content_uri, existing_artifact_version = _get_content_addressed_uri(
+            artifact_store=artifact_store,
+            materializer_class=materializer_class,
+            data_type=data_type,
+            content_hash=content_hash,
+        )
+        # Remove the (empty) directory that was prepared for the artifact
+        if artifact_store.isdir(uri) and not artifact_store.listdir(uri):
+            artifact_store.rmtree(uri)
+        if existing_artifact_version:
+            materializer.uri = existing_artifact_version.uri
+        else:
+            # Other writers might store the same content concurrently, so
+            # each writer stores the data in its own subdirectory which is
+            # only committed once it is complete.
+            materializer.uri = f"{content_uri}/{uuid4().hex}"
+
+    # Force URIs to have forward slashes
+    materializer.uri = materializer.uri.replace("\\", "/")
+
+    visualizations: List[ArtifactVisualizationRequest] = []
+    if existing_artifact_version:
+        logger.debug(
+            "Reusing data of artifact version `%s` for output artifact `%s`.",
+            existing_artifact_version.id,
+            name,
+        )
+        visualizations = [
+            ArtifactVisualizationRequest(
+                type=visualization.type, uri=visualization.uri
+            )
+            for visualization in existing_artifact_version.visualizations or []
+        ]
+    else:
+        artifact_store.makedirs(materializer.uri)
+        try:
+            materializer.save(data)
+        except BaseException:
+            if content_uri:
+                artifact_store.rmtree(materializer.uri)
+            raise
+
+    if store_visualizations and not existing_artifact_version:
+        try:
+            vis_data = materializer.save_visualizations(data)
+            for vis_uri, vis_type in vis_data.items():
+                visualizations.append(
+                    ArtifactVisualizationRequest(type=vis_type, uri=vis_uri)
+                )
+        except Exception as e:
+            logger.warning(
+                f"Failed to save visualization for output artifact '{name}': "
+                f"{e}"
+            )
+
+    combined_metadata: Dict[str, "MetadataType"] = {}
+    if store_metadata:
+        try:
+            combined_metadata = materializer.extract_full_metadata(data)
+        except Exception as e:
+            logger.warning(
+                f"Failed to extract metadata for output artifact '{name}': {e}"
+            )
+
+        combined_metadata.update(metadata or {})
+
+    metadata_values, metadata_types = validate_metadata(combined_metadata)
+
+    if content_uri and not existing_artifact_version:
+        data_uri = materializer.uri
+        committed_uri = _commit_content_addressed_data(
+            artifact_store=artifact_store,
+            content_uri=content_uri,
+            data_uri=data_uri,
+        )
+        materializer.uri = committed_uri
+        visualizations = [
+            ArtifactVisualizationRequest(
+                type=visualization.type,
+                uri=visualization.uri.replace(data_uri, committed_uri, 1),
+            )
+            for visualization in visualizations
+        ]
+
+    client = Client()
+    return ArtifactVersionRequest(
+        artifact_name=name,
+        version=version,
+        tags=tags,
+        type=materializer.ASSOCIATED_ARTIFACT_TYPE,
+        uri=materializer.uri,
+        materializer=source_utils.resolve(materializer.__class__),
+        data_type=source_utils.resolve(data_type),
+        content_hash=content_hash,
+        user=client.active_user.id,
+        workspace=client.active_workspace.id,
+        artifact_store_id=artifact_store.id,
+        visualizations=visualizations,
+        has_custom_name=has_custom_name,
+        metadata=metadata_values or None,
+        metadata_types=metadata_types or None,
+    )
+
+
+def _get_content_addressed_uri(
+    artifact_store: "BaseArtifactStore",
+    materializer_class: Type["BaseMaterializer"],
+    data_type: Type[Any],
+    content_hash: str,
+) -> Tuple[str, Optional[ArtifactVersionResponse]]:
+    """Gets the content addressed URI for artifact data.
+
+    Args:
+        artifact_store: The artifact store in which to store the data.
+        materializer_class: The materializer class used to store the data.
+        data_type: The type of the data.
+        content_hash: The content hash of the data.
+
+    Returns:
+        The URI of the directory in which the data is stored, and an existing
+        artifact version that references the committed data in this
+        directory if one exists.
+    """
+    # The same content might be stored differently by different
+    # materializers or for different data types.
+    digest = hashlib.sha256(
+        ":".join(
+            [
+                source_utils.resolve(materializer_class).import_path,
+                source_utils.resolve(data_type).import_path,
+                content_hash,
+            ]
+        ).encode()
+    ).hexdigest()
+    uri = artifact_store.get_content_addressed_uri(digest).replace("\\", "/")
+
+    committed_uri = _get_committed_content_addressed_uri(
+        artifact_store=artifact_store, content_uri=uri
+    )
+    if committed_uri:
+        existing_artifact_versions = Client().list_artifact_versions(
+            uri=committed_uri, size=1, hydrate=True
+        )
+        if existing_artifact_versions.items:
+            return uri, existing_artifact_versions.items[0]
+    return uri, None
+
+
+def _get_committed_content_addressed_uri(
+    artifact_store: "BaseArtifactStore", content_uri: str
+) -> Optional[str]:
+    """Gets the URI of the committed data in a content addressed directory.
+
+    Args:
+        artifact_store: The artifact store in which the data is stored.
+        content_uri: The URI of the content addressed directory.
+
+    Returns:
+        The URI of the committed data, or None if no data was committed or
+        the committed data doesn't exist anymore.
+    """
+    marker_uri = f"{content_uri}/{CONTENT_ADDRESSED_MARKER_FILENAME}"
+    try:
+        with artifact_store.open(marker_uri, "r") as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+
+    if not name or "/" in name or "\\" in name:
+        return None
+
+    committed_uri = f"{content_uri}/{name}"
+    if not artifact_store.exists(committed_uri):
+        return None
+    return committed_uri
+
+
+def _commit_content_addressed_data(
+    artifact_store: "BaseArtifactStore", content_uri: str, data_uri: str
+) -> str:
+    """Commits artifact data stored in a content addressed directory.
+
+    The data is committed by writing the name of its subdirectory to a marker
+    file, which is a single file write and therefore also atomic in object
+    stores that don't support renaming directories. If other data was
+    already committed by a concurrent writer, the new copy is discarded
+    instead. As both contain the same content, it doesn't matter which one
+    is kept. Writers that commit at the same time might both keep their
+    copy, but each of them references complete data.
+
+    Args:
+        artifact_store: The artifact store in which the data is stored.
+        content_uri: The URI of the content addressed directory.
+        data_uri: The URI of the subdirectory containing the new data.
+
+    Returns:
+        The URI of the committed data.
+    """
+    if committed_uri := _get_committed_content_addressed_uri(
+        artifact_store=artifact_store, content_uri=content_uri
+    ):
+        logger.debug(
+            "Data for content addressed URI `%s` was already committed, "
+            "discarding the duplicate copy.",
+            content_uri,
+        )
+        artifact_store.rmtree(data_uri)
+        return committed_uri
+
+    marker_uri = f"{content_uri}/{CONTENT_ADDRESSED_MARKER_FILENAME}"
+    temporary_marker_uri = f"{marker_uri}.{uuid4().hex}.tmp"
+    with artifact_store.open(temporary_marker_uri, "w") as f:
+        f.write(data_uri.rsplit("/", 1)[-1])
+    artifact_store.rename(temporary_marker_uri, marker_uri, overwrite=True)
+    return data_uri
+
+
 def _load_artifact_from_uri(
     materializer: Union["Source", str],
-    data_type: Union["Source", str],
+    data_type: Union["Source", str, Type[Any]],
     uri: str,
     artifact_store: Optional["BaseArtifactStore"] = None,
+    artifact_version_id: Optional[UUID] = None,
 ) -> Any:
     """Load an artifact using the given materializer.
 
     Args:
         materializer: The source of the materializer class to use.
-        data_type: The source of the artifact data type.
+        data_type: The artifact data type or its source.
         uri: The uri of the artifact.
         artifact_store: The artifact store used to store this artifact.
+        artifact_version_id: The ID of the artifact version. If given, the
+            artifact data may be loaded from the local artifact cache.
 
     Returns:
         The artifact loaded into memory.
@@ -619,14 +813,17 @@ def _load_artifact_from_uri(
         raise ModuleNotFoundError(e) from e
 
     # Resolve the artifact class
-    try:
-        artifact_class = source_utils.load(data_type)
-    except (ModuleNotFoundError, AttributeError) as e:
-        logger.error(
-            f"ZenML cannot locate and import the data type of this "
-            f"artifact '{data_type}'."
-        )
-        raise ModuleNotFoundError(e) from e
+    if isinstance(data_type, type):
+        artifact_class = data_type
+    else:
+        try:
+            artifact_class = source_utils.load(data_type)
+        except (ModuleNotFoundError, AttributeError) as e:
+            logger.error(
+                f"ZenML cannot locate and import the data type of this "
+                f"artifact '{data_type}'."
+            )
+            raise ModuleNotFoundError(e) from e
 
     # Load the artifact
     logger.debug(
@@ -635,10 +832,21 @@ def _load_artifact_from_uri(
         artifact_class.__qualname__,
         uri,
     )
-    materializer_object: BaseMaterializer = materializer_class(
-        uri, artifact_store
+
+    def _load(uri: str, artifact_store: Optional["BaseArtifactStore"]) -> Any:
+        materializer_object: BaseMaterializer = materializer_class(
+            uri, artifact_store
+        )
+        if artifact_class is data_type:
+            materializer_object.validate_type_compatibility(artifact_class)
+        return materializer_object.load(artifact_class)
+
+    artifact = load_with_artifact_cache(
+        _load,
+        artifact_version_id=artifact_version_id,
+        uri=uri,
+        artifact_store=artifact_store,
     )
-    artifact = materializer_object.load(artifact_class)
     logger.debug("Artifact loaded successfully.")
 
     return artifact
@@ -720,30 +928,6 @@ def _get_artifact_store_from_response_or_from_active_stack(
     return Client().active_stack.artifact_store
 
 
-def _get_new_artifact_version(artifact_name: str) -> int:
-    """Get the next auto-incremented version for an artifact name.
-
-    Args:
-        artifact_name: The name of the artifact.
-
-    Returns:
-        The next auto-incremented version.
-    """
-    artifact_versions = Client().list_artifact_versions(
-        name=artifact_name,
-        sort_by="desc:version_number",
-        size=1,
-    )
-
-    # If a numbered version exists, increment it
-    try:
-        return int(artifact_versions[0].version) + 1
-
-    # If no numbered versions exist yet, start at 1
-    except (IndexError, ValueError):
-        return 1
-
-
 def _load_file_from_artifact_store(
     uri: str,
     artifact_store: "BaseArtifactStore",
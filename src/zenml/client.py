@@ -14,7 +14,6 @@
 """Client implementation."""
 
 import functools
-import json
 import os
 from abc import ABCMeta
 from collections import Counter
@@ -196,7 +195,7 @@ from zenml.utils.pagination_utils import depaginate
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
-    from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.service_connectors.service_connector import ServiceConnector
     from zenml.stack import Stack
     from zenml.zen_stores.base_zen_store import BaseZenStore
@@ -804,6 +803,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         external_user_id: Optional[str] = None,
@@ -822,6 +822,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             external_user_id: Use the external user id for filtering.
@@ -843,6 +844,7 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
                 logical_operator=logical_operator,
                 id=id,
                 external_user_id=external_user_id,
@@ -1014,6 +1016,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -1027,6 +1030,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the workspace ID to filter by.
             created: Use to filter by time of creation
@@ -1043,6 +1047,7 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1227,6 +1232,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -1244,6 +1250,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             created: Use to filter by time of creation
@@ -1262,6 +1269,7 @@ class Client(metaclass=ClientMetaClass):
         stack_filter_model = StackFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -1675,6 +1683,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -1698,6 +1707,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of services to filter by.
             created: Use to filter by time of creation
@@ -1724,6 +1734,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -1891,6 +1902,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -1910,6 +1922,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of component to filter by.
             created: Use to component by time of creation
@@ -1930,6 +1943,7 @@ class Client(metaclass=ClientMetaClass):
         component_filter_model = ComponentFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -2223,6 +2237,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -2239,6 +2254,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of flavors to filter by.
             created: Use to flavors by time of creation
@@ -2256,6 +2272,7 @@ class Client(metaclass=ClientMetaClass):
         flavor_filter_model = FlavorFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -2345,6 +2362,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -2363,6 +2381,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of pipeline to filter by.
             created: Use to filter by time of creation
@@ -2383,6 +2402,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2687,6 +2707,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -2708,6 +2729,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of build to filter by.
             created: Use to filter by time of creation
@@ -2731,6 +2753,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2827,6 +2850,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -2844,6 +2868,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of event_sources to filter by.
             created: Use to filter by time of creation
@@ -2862,6 +2887,7 @@ class Client(metaclass=ClientMetaClass):
         event_source_filter_model = EventSourceFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -3024,6 +3050,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -3041,6 +3068,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of the action to filter by.
             created: Use to filter by time of creation
@@ -3059,6 +3087,7 @@ class Client(metaclass=ClientMetaClass):
         filter_model = ActionFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -3198,6 +3227,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -3219,6 +3249,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of triggers to filter by.
             created: Use to filter by time of creation
@@ -3243,6 +3274,7 @@ class Client(metaclass=ClientMetaClass):
         trigger_filter_model = TriggerFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -3391,6 +3423,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3408,6 +3441,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of build to filter by.
             created: Use to filter by time of creation
@@ -3427,6 +3461,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3484,6 +3519,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3508,6 +3544,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             created: Use to filter by time of creation
@@ -3534,6 +3571,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3606,6 +3644,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "desc:created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3634,6 +3673,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: The id of the runs to filter by.
             created: Use to filter by time of creation
@@ -3664,6 +3704,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3747,6 +3788,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3771,6 +3813,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of runs to filter by.
             created: Use to filter by time of creation
@@ -3797,6 +3840,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             entrypoint_name=entrypoint_name,
@@ -3849,6 +3893,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -3864,6 +3909,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of artifact to filter by.
             created: Use to filter by time of creation
@@ -3881,6 +3927,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3953,7 +4000,27 @@ class Client(metaclass=ClientMetaClass):
             unused_artifact_versions = depaginate(
                 self.list_artifact_versions, only_unused=True
             )
+            # Artifact versions in content addressed artifact stores can share
+            # their data, which we can only delete if all artifact versions
+            # referencing it get deleted.
+            unused_references = Counter(
+                artifact_version.uri
+                for artifact_version in unused_artifact_versions
+            )
             for unused_artifact_version in unused_artifact_versions:
+                uri = unused_artifact_version.uri
+                if uri not in unused_references:
+                    # Already deleted
+                    continue
+                if self._count_artifact_version_references(
+                    uri
+                ) > unused_references.pop(uri):
+                    logger.info(
+                        f"Skipping deletion of artifact '{uri}' from the "
+                        "artifact store as it is still referenced by other "
+                        "artifact versions."
+                    )
+                    continue
                 self._delete_artifact_from_artifact_store(
                     unused_artifact_version
                 )
@@ -4003,6 +4070,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -4029,6 +4097,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of artifact version to filter by.
             created: Use to filter by time of creation
@@ -4058,6 +4127,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -4142,9 +4212,19 @@ class Client(metaclass=ClientMetaClass):
             name_id_or_prefix=name_id_or_prefix, version=version
         )
         if delete_from_artifact_store:
-            self._delete_artifact_from_artifact_store(
-                artifact_version=artifact_version
-            )
+            if (
+                self._count_artifact_version_references(artifact_version.uri)
+                > 1
+            ):
+                logger.info(
+                    f"Skipping deletion of artifact '{artifact_version.uri}' "
+                    "from the artifact store as it is still referenced by "
+                    "other artifact versions."
+                )
+            else:
+                self._delete_artifact_from_artifact_store(
+                    artifact_version=artifact_version
+                )
         if delete_metadata:
             self._delete_artifact_version(artifact_version=artifact_version)
 
@@ -4173,6 +4253,17 @@ class Client(metaclass=ClientMetaClass):
             f"'{artifact_version.artifact.name}'."
         )
 
+    def _count_artifact_version_references(self, uri: str) -> int:
+        """Count the artifact versions that reference data at a URI.
+
+        Args:
+            uri: The URI of the artifact data.
+
+        Returns:
+            The number of artifact versions with this URI.
+        """
+        return self.list_artifact_versions(uri=uri, size=1).total
+
     def _delete_artifact_from_artifact_store(
         self, artifact_version: ArtifactVersionResponse
     ) -> None:
@@ -4240,30 +4331,9 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             The created metadata, as string to model dictionary.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
-        values: Dict[str, "MetadataType"] = {}
-        types: Dict[str, "MetadataTypeEnum"] = {}
-        for key, value in metadata.items():
-            # Skip metadata that is too large to be stored in the database.
-            if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
-                logger.warning(
-                    f"Metadata value for key '{key}' is too large to be "
-                    "stored in the database. Skipping."
-                )
-                continue
-            # Skip metadata that is not of a supported type.
-            try:
-                metadata_type = get_metadata_type(value)
-            except ValueError as e:
-                logger.warning(
-                    f"Metadata value for key '{key}' is not of a supported "
-                    f"type. Skipping. Full error: {e}"
-                )
-                continue
-            values[key] = value
-            types[key] = metadata_type
+        from zenml.metadata.metadata_types import validate_metadata
 
+        values, types = validate_metadata(metadata)
         run_metadata = RunMetadataRequest(
             workspace=self.active_workspace.id,
             user=self.active_user.id,
@@ -4280,6 +4350,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -4300,6 +4371,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The field to sort the results by.
             page: The page number to return.
             size: The number of results to return per page.
+            after: The cursor from which to continue listing.
             logical_operator: The logical operator to use for filtering.
             id: The ID of the metadata.
             created: The creation time of the metadata.
@@ -4323,6 +4395,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -4516,6 +4589,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -4535,6 +4609,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of secrets to filter by.
             created: Use to secrets by time of creation
@@ -4556,6 +4631,7 @@ class Client(metaclass=ClientMetaClass):
         secret_filter_model = SecretFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -4866,6 +4942,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -4881,6 +4958,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by.
             page: The page of items.
             size: The maximum size of all pages.
+            after: The cursor from which to continue listing.
             logical_operator: Which logical operator to use [and, or].
             id: Use the id of the code repository to filter by.
             created: Use to filter by time of creation.
@@ -4898,6 +4976,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -5254,6 +5333,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[datetime] = None,
@@ -5275,6 +5355,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: The id of the service connector to filter by.
             created: Filter service connectors by time of creation
@@ -5300,6 +5381,7 @@ class Client(metaclass=ClientMetaClass):
         connector_filter_model = ServiceConnectorFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -5968,6 +6050,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -5981,6 +6064,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -5997,6 +6081,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             created=created,
             updated=updated,
@@ -6174,6 +6259,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "number",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -6191,6 +6277,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -6207,6 +6294,7 @@ class Client(metaclass=ClientMetaClass):
         model_version_filter_model = ModelVersionFilter(
             page=page,
             size=size,
+            after=after,
             sort_by=sort_by,
             logical_operator=logical_operator,
             created=created,
@@ -6279,6 +6367,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -6300,6 +6389,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -6325,6 +6415,7 @@ class Client(metaclass=ClientMetaClass):
                 logical_operator=logical_operator,
                 page=page,
                 size=size,
+                after=after,
                 created=created,
                 updated=updated,
                 workspace_id=workspace_id,
@@ -6397,6 +6488,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
@@ -6414,6 +6506,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
@@ -6435,6 +6528,7 @@ class Client(metaclass=ClientMetaClass):
                 logical_operator=logical_operator,
                 page=page,
                 size=size,
+                after=after,
                 created=created,
                 updated=updated,
                 workspace_id=workspace_id,
@@ -6454,6 +6548,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -6472,6 +6567,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by.
             page: The page of items.
             size: The maximum size of all pages.
+            after: The cursor from which to continue listing.
             logical_operator: Which logical operator to use [and, or].
             id: Use the id of the code repository to filter by.
             created: Use to filter by time of creation.
@@ -6492,6 +6588,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -6615,6 +6712,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         trigger_id: Optional[UUID] = None,
         hydrate: bool = False,
@@ -6625,6 +6723,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by.
             page: The page of items.
             size: The maximum size of all pages.
+            after: The cursor from which to continue listing.
             logical_operator: Which logical operator to use [and, or].
             trigger_id: ID of the trigger to filter by.
             hydrate: Flag deciding whether to hydrate the output model(s)
@@ -6638,6 +6737,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
         )
         filter_model.set_scope_workspace(self.active_workspace.id)
@@ -6922,6 +7022,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -6937,6 +7038,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by
             page: The page of items
             size: The maximum size of all pages
+            after: The cursor from which to continue listing
             logical_operator: Which logical operator to use [and, or]
             id: Use the id of stacks to filter by.
             created: Use to filter by time of creation
@@ -6955,6 +7057,7 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -7080,6 +7183,7 @@ class Client(metaclass=ClientMetaClass):
         sort_by: str = "created",
         page: int = PAGINATION_STARTING_PAGE,
         size: int = PAGE_SIZE_DEFAULT,
+        after: Optional[str] = None,
         logical_operator: LogicalOperators = LogicalOperators.AND,
         id: Optional[Union[UUID, str]] = None,
         created: Optional[Union[datetime, str]] = None,
@@ -7099,6 +7203,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by: The column to sort by.
             page: The page of items.
             size: The maximum size of all pages.
+            after: The cursor from which to continue listing.
             logical_operator: Which logical operator to use [and, or].
             id: Use the id of the API key to filter by.
             created: Use to filter by time of creation.
@@ -7122,6 +7227,7 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
             logical_operator=logical_operator,
             id=id,
             created=created,
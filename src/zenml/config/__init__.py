@@ -23,12 +23,16 @@ configuration. This ``GlobalConfiguration`` object handles the serialization and
 deserialization of the configuration options that are stored in the file in
 order to persist the configuration across sessions.
 """
+from zenml.config.cache_settings import CacheSettings
 from zenml.config.docker_settings import DockerSettings
+from zenml.config.output_saving_settings import OutputSavingSettings
 from zenml.config.resource_settings import ResourceSettings
 from zenml.config.retry_config import StepRetryConfig
 
 __all__ = [
+    "CacheSettings",
     "DockerSettings",
+    "OutputSavingSettings",
     "ResourceSettings",
     "StepRetryConfig",
 ]
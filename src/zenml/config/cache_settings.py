@@ -0,0 +1,36 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Cache settings class used to configure the caching of a step."""
+
+from zenml.config.base_settings import BaseSettings
+
+
+class CacheSettings(BaseSettings):
+    """Step cache settings.
+
+    By default, the cache key of a step includes the IDs of its input
+    artifacts, which means a step can only be cached if it receives the
+    exact same artifact versions as a previous run. With content addressed
+    caching enabled, input artifacts with a content hash (see
+    `BaseMaterializer.compute_content_hash`) are included in the cache key
+    with this hash instead. This allows a step to reuse the results of
+    previous runs if its inputs contain identical data, even if they were
+    produced by different upstream step runs.
+
+    Attributes:
+        content_addressed: Whether to include the content hashes instead of
+            the IDs of input artifacts in the cache key.
+    """
+
+    content_addressed: bool = False
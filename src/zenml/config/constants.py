@@ -13,5 +13,7 @@
 #  permissions and limitations under the License.
 """ZenML settings constants."""
 
+CACHE_SETTINGS_KEY = "cache"
 DOCKER_SETTINGS_KEY = "docker"
+OUTPUT_SAVING_SETTINGS_KEY = "output_saving"
 RESOURCE_SETTINGS_KEY = "resources"
@@ -0,0 +1,45 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Settings class used to configure how the outputs of a step are saved."""
+
+from typing import Optional
+
+from pydantic import Field
+
+from zenml.config.base_settings import BaseSettings
+
+
+class OutputSavingSettings(BaseSettings):
+    """Step output saving settings.
+
+    By default, the outputs of a step are materialized one after the other.
+    With parallel output saving enabled, the outputs are materialized
+    concurrently in a thread pool, which allows uploads of multiple outputs
+    to the artifact store to overlap. The artifact versions of all outputs are
+    published together once all outputs are saved.
+
+    Attributes:
+        parallel: Whether to materialize the outputs of the step in parallel.
+        max_workers: The maximum number of outputs to materialize at the same
+            time. If not set, all outputs are materialized at the same time.
+        memory_budget: Approximate upper limit in bytes for the in-memory size
+            of outputs that are materialized at the same time. An output that
+            exceeds this limit on its own is materialized while no other
+            output is being materialized. If not set, the memory usage is not
+            limited.
+    """
+
+    parallel: bool = False
+    max_workers: Optional[int] = Field(default=None, ge=1)
+    memory_budget: Optional[int] = Field(default=None, ge=1)
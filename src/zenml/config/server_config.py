@@ -24,13 +24,18 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 from zenml.constants import (
     DEFAULT_ZENML_JWT_TOKEN_ALGORITHM,
     DEFAULT_ZENML_JWT_TOKEN_LEEWAY,
+    DEFAULT_ZENML_SERVER_AUTH_CACHE_SIZE,
+    DEFAULT_ZENML_SERVER_AUTH_CACHE_TTL,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT,
+    DEFAULT_ZENML_SERVER_LAST_LOGIN_UPDATE_INTERVAL,
     DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY,
     DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE,
     DEFAULT_ZENML_SERVER_MAX_DEVICE_AUTH_ATTEMPTS,
     DEFAULT_ZENML_SERVER_NAME,
     DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW,
+    DEFAULT_ZENML_SERVER_RESPONSE_CACHE_SIZE,
+    DEFAULT_ZENML_SERVER_RESPONSE_CACHE_TTL,
     DEFAULT_ZENML_SERVER_SECURE_HEADERS_CACHE,
     DEFAULT_ZENML_SERVER_SECURE_HEADERS_CONTENT,
     DEFAULT_ZENML_SERVER_SECURE_HEADERS_CSP,
@@ -228,6 +233,18 @@ class ServerConfiguration(BaseModel):
         auto_activate: Whether to automatically activate the server and create a
             default admin user account with an empty password during the initial
             deployment.
+        response_cache_size: The maximum number of responses of immutable
+            entities (e.g. pipeline deployments or builds) that each server
+            process keeps in memory. Set to 0 to disable the cache.
+        response_cache_ttl: The number of seconds after which a cached
+            response expires.
+        auth_cache_size: The maximum number of authentication contexts and
+            RBAC permission decisions that each server process keeps in
+            memory. Set to 0 to disable the cache.
+        auth_cache_ttl: The number of seconds after which a cached
+            authentication context or RBAC permission decision expires.
+        last_login_update_interval: The minimum number of seconds between two
+            updates of the last login time of a device or API key.
     """
 
     deployment_type: ServerDeploymentType = ServerDeploymentType.OTHER
@@ -316,6 +333,15 @@ class ServerConfiguration(BaseModel):
 
     thread_pool_size: int = DEFAULT_ZENML_SERVER_THREAD_POOL_SIZE
 
+    response_cache_size: int = DEFAULT_ZENML_SERVER_RESPONSE_CACHE_SIZE
+    response_cache_ttl: int = DEFAULT_ZENML_SERVER_RESPONSE_CACHE_TTL
+
+    auth_cache_size: int = DEFAULT_ZENML_SERVER_AUTH_CACHE_SIZE
+    auth_cache_ttl: int = DEFAULT_ZENML_SERVER_AUTH_CACHE_TTL
+    last_login_update_interval: int = (
+        DEFAULT_ZENML_SERVER_LAST_LOGIN_UPDATE_INTERVAL
+    )
+
     _deployment_id: Optional[UUID] = None
 
     @model_validator(mode="before")
@@ -36,7 +36,12 @@ from zenml.artifacts.external_artifact_config import (
 )
 from zenml.client_lazy_loader import ClientLazyLoader
 from zenml.config.base_settings import BaseSettings, SettingsOrDict
-from zenml.config.constants import DOCKER_SETTINGS_KEY, RESOURCE_SETTINGS_KEY
+from zenml.config.constants import (
+    CACHE_SETTINGS_KEY,
+    DOCKER_SETTINGS_KEY,
+    OUTPUT_SAVING_SETTINGS_KEY,
+    RESOURCE_SETTINGS_KEY,
+)
 from zenml.config.retry_config import StepRetryConfig
 from zenml.config.source import Source, SourceWithValidator
 from zenml.config.strict_base_model import StrictBaseModel
@@ -47,7 +52,12 @@ from zenml.utils import deprecation_utils
 from zenml.utils.pydantic_utils import before_validator_handler
 
 if TYPE_CHECKING:
-    from zenml.config import DockerSettings, ResourceSettings
+    from zenml.config import (
+        CacheSettings,
+        DockerSettings,
+        OutputSavingSettings,
+        ResourceSettings,
+    )
 
 logger = get_logger(__name__)
 
@@ -240,6 +250,38 @@ class StepConfiguration(PartialStepConfiguration):
             model_or_dict = model_or_dict.model_dump()
         return DockerSettings.model_validate(model_or_dict)
 
+    @property
+    def cache_settings(self) -> "CacheSettings":
+        """Cache settings of this step configuration.
+
+        Returns:
+            The cache settings of this step configuration.
+        """
+        from zenml.config import CacheSettings
+
+        model_or_dict: SettingsOrDict = self.settings.get(
+            CACHE_SETTINGS_KEY, {}
+        )
+        if isinstance(model_or_dict, BaseSettings):
+            model_or_dict = model_or_dict.model_dump()
+        return CacheSettings.model_validate(model_or_dict)
+
+    @property
+    def output_saving_settings(self) -> "OutputSavingSettings":
+        """Output saving settings of this step configuration.
+
+        Returns:
+            The output saving settings of this step configuration.
+        """
+        from zenml.config import OutputSavingSettings
+
+        model_or_dict: SettingsOrDict = self.settings.get(
+            OUTPUT_SAVING_SETTINGS_KEY, {}
+        )
+        if isinstance(model_or_dict, BaseSettings):
+            model_or_dict = model_or_dict.model_dump()
+        return OutputSavingSettings.model_validate(model_or_dict)
+
 
 class InputSpec(StrictBaseModel):
     """Step input specification."""
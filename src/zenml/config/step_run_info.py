@@ -33,6 +33,7 @@ class StepRunInfo(StrictBaseModel):
     pipeline: PipelineConfiguration
 
     force_write_logs: Callable[..., Any]
+    compute_content_hashes: bool = False
 
     def get_image(self, key: str) -> str:
         """Gets the Docker image for the given key.
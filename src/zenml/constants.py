@@ -174,6 +174,8 @@ ENV_ZENML_PIPELINE_API_TOKEN_EXPIRES_MINUTES = (
 )
 ENV_ZENML_IGNORE_FAILURE_HOOK = "ZENML_IGNORE_FAILURE_HOOK"
 ENV_ZENML_CUSTOM_SOURCE_ROOT = "ZENML_CUSTOM_SOURCE_ROOT"
+ENV_ZENML_ARTIFACT_CACHE_PATH = "ZENML_ARTIFACT_CACHE_PATH"
+ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE_MB = "ZENML_ARTIFACT_CACHE_MAX_SIZE_MB"
 
 # ZenML Server environment variables
 ENV_ZENML_SERVER_PREFIX = "ZENML_SERVER_"
@@ -269,6 +271,11 @@ ZENML_API_KEY_PREFIX = "ZENKEY_"
 DEFAULT_ZENML_SERVER_PIPELINE_RUN_AUTH_WINDOW = 60 * 48  # 48 hours
 DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE = 5
 DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY = 1000
+DEFAULT_ZENML_SERVER_RESPONSE_CACHE_SIZE = 1024
+DEFAULT_ZENML_SERVER_RESPONSE_CACHE_TTL = 60  # seconds
+DEFAULT_ZENML_SERVER_AUTH_CACHE_SIZE = 1024
+DEFAULT_ZENML_SERVER_AUTH_CACHE_TTL = 30  # seconds
+DEFAULT_ZENML_SERVER_LAST_LOGIN_UPDATE_INTERVAL = 60  # seconds
 
 DEFAULT_ZENML_SERVER_SECURE_HEADERS_HSTS = (
     "max-age=63072000; includeSubdomains"
@@ -336,6 +343,8 @@ API_TOKEN = "/api_token"
 ARTIFACTS = "/artifacts"
 ARTIFACT_VERSIONS = "/artifact_versions"
 ARTIFACT_VISUALIZATIONS = "/artifact_visualizations"
+BATCH = "/batch"
+CACHE_LOOKUP = "/cache-lookup"
 CODE_REFERENCES = "/code_references"
 CODE_REPOSITORIES = "/code_repositories"
 COMPONENT_TYPES = "/component-types"
@@ -391,6 +400,8 @@ STATISTICS = "/statistics"
 STATUS = "/status"
 STEP_CONFIGURATION = "/step-configuration"
 STEPS = "/steps"
+STEP_OUTPUTS = "/step-outputs"
+STREAM = "/stream"
 TAGS = "/tags"
 TRIGGERS = "/triggers"
 TRIGGER_EXECUTIONS = "/trigger_executions"
@@ -15,7 +15,6 @@
 
 import os
 from collections import defaultdict
-from tempfile import TemporaryDirectory, mkdtemp
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,7 +33,6 @@ from zenml.enums import ArtifactType, VisualizationType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -86,12 +84,12 @@ class HFDatasetMaterializer(BaseMaterializer):
         Returns:
             The dataset read from the specified dir.
         """
-        temp_dir = mkdtemp()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            temp_dir,
-        )
-        return load_from_disk(temp_dir)
+        # The dataset memory-maps the loaded files, so we can't remove the
+        # local copy of a remote dataset.
+        with self.get_local_directory(
+            os.path.join(self.uri, DEFAULT_DATASET_DIR), cleanup=False
+        ) as local_dir:
+            return load_from_disk(local_dir)
 
     def save(self, ds: Union[Dataset, DatasetDict]) -> None:
         """Writes a Dataset to the specified dir.
@@ -99,16 +97,10 @@ class HFDatasetMaterializer(BaseMaterializer):
         Args:
             ds: The Dataset to write.
         """
-        temp_dir = TemporaryDirectory()
-        path = os.path.join(temp_dir.name, DEFAULT_DATASET_DIR)
-        try:
-            ds.save_to_disk(path)
-            io_utils.copy_dir(
-                path,
-                os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            )
-        finally:
-            fileio.rmtree(temp_dir.name)
+        with self.get_local_directory(
+            os.path.join(self.uri, DEFAULT_DATASET_DIR), mode="w"
+        ) as local_dir:
+            ds.save_to_disk(local_dir)
 
     def extract_metadata(
         self, ds: Union[Dataset, DatasetDict]
@@ -15,6 +15,8 @@
 
 from typing import TYPE_CHECKING, Optional, Type
 
+from pydantic import PositiveInt
+
 from zenml.config.base_settings import BaseSettings
 from zenml.constants import KUBERNETES_CLUSTER_RESOURCE_TYPE
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -85,6 +87,11 @@ class KubernetesOrchestratorConfig(
         parallel_step_startup_waiting_period: How long to wait in between
             starting parallel steps. This can be used to distribute server
             load when running pipelines with a huge amount of parallel steps.
+        max_parallelism: Maximum number of step pods to run at the same time.
+            If not set, all steps that are ready to run are started at once.
+        fail_fast: If `True`, no new step pods are started once a step
+            failed. Otherwise, only steps downstream of the failed step are
+            skipped.
     """
 
     incluster: bool = False
@@ -93,6 +100,8 @@ class KubernetesOrchestratorConfig(
     local: bool = False
     skip_local_validations: bool = False
     parallel_step_startup_waiting_period: Optional[float] = None
+    max_parallelism: Optional[PositiveInt] = None
+    fail_fast: bool = False
 
     @property
     def is_remote(self) -> bool:
@@ -14,6 +14,7 @@
 """Entrypoint of the Kubernetes master/orchestrator pod."""
 
 import argparse
+import os
 import socket
 
 from kubernetes import client as k8s_client
@@ -34,7 +35,8 @@ from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_pod_manifest,
 )
 from zenml.logger import get_logger
-from zenml.orchestrators.dag_runner import ThreadedDagRunner
+from zenml.orchestrators import cache_utils
+from zenml.orchestrators.dag_runner import FailurePolicy, ThreadedDagRunner
 from zenml.orchestrators.utils import get_config_environment_vars
 
 logger = get_logger(__name__)
@@ -82,6 +84,31 @@ def main() -> None:
     kube_client = orchestrator.get_kube_client(incluster=True)
     core_api = k8s_client.CoreV1Api(kube_client)
 
+    cached_steps = cache_utils.get_cached_steps(
+        deployment=deployment_config,
+        artifact_store=active_stack.artifact_store,
+    )
+    if cached_steps:
+        # Cached steps don't run any user code, so we publish them directly
+        # from the orchestrator pod instead of starting a pod for each of them.
+        os.environ[ENV_ZENML_KUBERNETES_RUN_ID] = orchestrator_run_id
+        orchestrator._prepare_run(deployment=deployment_config)
+        for step_name, step in deployment_config.step_configurations.items():
+            if step_name in cached_steps:
+                orchestrator.run_step(
+                    step=step, cached_step=cached_steps[step_name]
+                )
+
+        pipeline_dag = {
+            step_name: [
+                upstream_step
+                for upstream_step in upstream_steps
+                if upstream_step not in cached_steps
+            ]
+            for step_name, upstream_steps in pipeline_dag.items()
+            if step_name not in cached_steps
+        }
+
     def run_step_on_kubernetes(step_name: str) -> None:
         """Run a pipeline step in a separate Kubernetes pod.
 
@@ -154,10 +181,17 @@ def main() -> None:
     parallel_node_startup_waiting_period = (
         orchestrator.config.parallel_step_startup_waiting_period or 0.0
     )
+    failure_policy = (
+        FailurePolicy.FAIL_FAST
+        if orchestrator.config.fail_fast
+        else FailurePolicy.CONTINUE
+    )
     ThreadedDagRunner(
         dag=pipeline_dag,
         run_fn=run_step_on_kubernetes,
         parallel_node_startup_waiting_period=parallel_node_startup_waiting_period,
+        max_concurrency=orchestrator.config.max_parallelism,
+        failure_policy=failure_policy,
     ).run()
 
     logger.info("Orchestration pod completed.")
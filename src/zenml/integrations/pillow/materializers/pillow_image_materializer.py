@@ -14,7 +14,6 @@
 """Materializer for Pillow Image objects."""
 
 import os
-import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
 
 from PIL import Image
@@ -57,16 +56,12 @@ class PillowImageMaterializer(BaseMaterializer):
         files = io_utils.find_files(self.uri, f"{DEFAULT_IMAGE_FILENAME}.*")
         filepath = [file for file in files if not fileio.isdir(file)][0]
 
-        # create a temporary folder
-        temp_dir = tempfile.TemporaryDirectory(prefix="zenml-temp-")
-        temp_file = os.path.join(
-            temp_dir.name,
-            f"{DEFAULT_IMAGE_FILENAME}{os.path.splitext(filepath)[1]}",
-        )
-
-        # copy from artifact store to temporary file
-        fileio.copy(filepath, temp_file)
-        return Image.open(temp_file)
+        # Read the image directly from the artifact store. Pillow reads image
+        # data lazily, so we load it before the file is closed.
+        with self.artifact_store.open(filepath, "rb") as f:
+            image = Image.open(f)
+            image.load()
+        return image
 
     def save(self, image: Image.Image) -> None:
         """Write to artifact store.
@@ -74,18 +69,13 @@ class PillowImageMaterializer(BaseMaterializer):
         Args:
             image: An Image.Image object.
         """
-        temp_dir = tempfile.TemporaryDirectory(prefix="zenml-temp-")
         file_extension = image.format or DEFAULT_IMAGE_EXTENSION
         full_filename = f"{DEFAULT_IMAGE_FILENAME}.{file_extension}"
-        temp_image_path = os.path.join(temp_dir.name, full_filename)
-
-        # save the image in a temporary directory
-        image.save(temp_image_path)
-
-        # copy the saved image to the artifact store
         artifact_store_path = os.path.join(self.uri, full_filename)
-        io_utils.copy(temp_image_path, artifact_store_path, overwrite=True)  # type: ignore[attr-defined]
-        temp_dir.cleanup()
+
+        # Write the image directly to the artifact store
+        with self.artifact_store.open(artifact_store_path, "wb") as f:
+            image.save(f, format=file_extension)
 
     def save_visualizations(
         self, image: Image.Image
@@ -14,7 +14,6 @@
 """Polars materializer."""
 
 import os
-import tempfile
 from typing import Any, ClassVar, Tuple, Type, Union
 
 import polars as pl
@@ -22,9 +21,9 @@ import pyarrow as pa  # type: ignore
 import pyarrow.parquet as pq  # type: ignore
 
 from zenml.enums import ArtifactType
-from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
+
+PARQUET_FILENAME = "dataframe.parquet"
 
 
 class PolarsMaterializer(BaseMaterializer):
@@ -37,7 +36,10 @@ class PolarsMaterializer(BaseMaterializer):
     ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
 
     def load(self, data_type: Type[Any]) -> Any:
-        """Reads and returns Polars data after copying it to temporary path.
+        """Reads and returns Polars data.
+
+        The parquet file is read directly from the artifact store without
+        copying it to the local disk first.
 
         Args:
             data_type: The type of the data to read.
@@ -45,16 +47,10 @@ class PolarsMaterializer(BaseMaterializer):
         Returns:
             A Polars data frame or series.
         """
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
-
-        # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
-
-        # Load the data from the temporary directory
-        table = pq.read_table(
-            os.path.join(temp_dir.name, "dataframe.parquet").replace("\\", "/")
-        )
+        with self.artifact_store.open(
+            os.path.join(self.uri, PARQUET_FILENAME), "rb"
+        ) as f:
+            table = pq.read_table(f)
 
         # If the data is of type pl.Series, convert it back to a pyarrow array
         # instead of a table.
@@ -68,12 +64,7 @@ class PolarsMaterializer(BaseMaterializer):
                 table = table.column(0)
 
         # Convert the table to a Polars data frame or series
-        data = pl.from_arrow(table)
-
-        # Cleanup and return
-        fileio.rmtree(temp_dir.name)
-
-        return data
+        return pl.from_arrow(table)
 
     def save(self, data: Union[pl.DataFrame, pl.Series]) -> None:
         """Writes Polars data to the artifact store.
@@ -107,15 +98,8 @@ class PolarsMaterializer(BaseMaterializer):
             {b"zenml_is_pl_series": isinstance_bytes}
         )
 
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
-
-        # Write the table to a Parquet file
-        path = os.path.join(temp_dir.name, "dataframe.parquet").replace(
-            "\\", "/"
-        )
-        pq.write_table(table, path)  # Uses lz4 compression by default
-        io_utils.copy_dir(temp_dir.name, self.uri)
-
-        # Remove the temporary directory
-        fileio.rmtree(temp_dir.name)
+        # Write the table directly to a Parquet file in the artifact store
+        with self.artifact_store.open(
+            os.path.join(self.uri, PARQUET_FILENAME), "wb"
+        ) as f:
+            pq.write_table(table, f)  # Uses lz4 compression by default
@@ -0,0 +1,414 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Implementation of the PyTorch safetensors materializer."""
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+import cloudpickle
+import torch
+from safetensors import safe_open
+from safetensors.torch import load_file, save_file
+from torch.nn import Module
+
+from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+from zenml.enums import ArtifactType
+from zenml.integrations.pytorch.utils import count_module_params
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import io_utils
+
+if TYPE_CHECKING:
+    from zenml.metadata.metadata_types import MetadataType
+
+MODULE_FILENAME = "module.pt"
+INDEX_FILENAME = "model.safetensors.index.json"
+SINGLE_SHARD_FILENAME = "model.safetensors"
+SHARD_FILENAME_TEMPLATE = "model-{index:05d}-of-{total:05d}.safetensors"
+
+
+def _read_index(uri: str, artifact_store: BaseArtifactStore) -> Dict[str, Any]:
+    """Reads the index of a module stored as safetensors.
+
+    Args:
+        uri: The URI of the artifact.
+        artifact_store: The artifact store where the artifact is stored.
+
+    Returns:
+        The index, containing the shard file of each tensor and the tensors
+        that are aliases of other tensors.
+    """
+    with artifact_store.open(os.path.join(uri, INDEX_FILENAME), "r") as f:
+        index: Dict[str, Any] = json.load(f)
+    return index
+
+
+class LazyStateDict(Mapping[str, "torch.Tensor"]):
+    """Lazy state dict of a module stored by the safetensors materializer.
+
+    Using this class as the type annotation of a step input (or passing it as
+    `data_type` to `load_artifact`) does not load the module. Instead, each
+    tensor is only read when it is accessed. If the artifact is stored in a
+    remote artifact store, only the shards containing accessed tensors are
+    downloaded.
+    """
+
+    def __init__(self, uri: str, artifact_store: BaseArtifactStore) -> None:
+        """Initializes the lazy state dict.
+
+        Args:
+            uri: The URI of the artifact.
+            artifact_store: The artifact store where the artifact is stored.
+        """
+        self.uri = uri
+        self.artifact_store = artifact_store
+        index = _read_index(uri, artifact_store)
+        self._weight_map: Dict[str, str] = index["weight_map"]
+        self._aliases: Dict[str, str] = index.get("aliases", {})
+        self._local_files: Dict[str, str] = {}
+        self._temp_dir: Optional[str] = None
+
+    def __del__(self) -> None:
+        """Removes downloaded shards when the state dict is deleted."""
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+    def _get_local_path(self, filename: str) -> str:
+        """Gets the local path of a shard, downloading it if necessary.
+
+        Args:
+            filename: The filename of the shard.
+
+        Returns:
+            The local path of the shard.
+        """
+        path = os.path.join(self.uri, filename)
+        if not io_utils.is_remote(path):
+            return path
+
+        if filename not in self._local_files:
+            if not self._temp_dir:
+                self._temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
+            local_path = os.path.join(self._temp_dir, filename)
+            fileio.copy(path, local_path)
+            self._local_files[filename] = local_path
+
+        return self._local_files[filename]
+
+    def __getitem__(self, name: str) -> "torch.Tensor":
+        """Reads a single tensor.
+
+        Args:
+            name: The name of the tensor.
+
+        Returns:
+            The tensor.
+        """
+        name = self._aliases.get(name, name)
+        path = self._get_local_path(self._weight_map[name])
+        with safe_open(path, framework="pt", device="cpu") as f:
+            return f.get_tensor(name)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the tensor names.
+
+        Yields:
+            The tensor names.
+        """
+        yield from self._weight_map
+        yield from self._aliases
+
+    def __len__(self) -> int:
+        """Gets the number of tensors.
+
+        Returns:
+            The number of tensors.
+        """
+        return len(self._weight_map) + len(self._aliases)
+
+
+class PyTorchSafetensorsMaterializer(BaseMaterializer):
+    """Materializer to read/write PyTorch modules using safetensors.
+
+    The module structure is pickled without any tensor data, and the state
+    dict is stored as sharded safetensors files. Compared to the
+    `PyTorchModuleMaterializer`, this avoids holding a second copy of the
+    weights in memory when saving, loads the weights using memory mapping
+    and allows loading individual tensors using `LazyStateDict`.
+
+    This materializer is not registered as the default materializer for
+    modules. Use it by specifying it as the output materializer of a step:
+
+    ```python
+    @step(output_materializers=PyTorchSafetensorsMaterializer)
+    def train() -> torch.nn.Module:
+        ...
+    ```
+    """
+
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (Module,)
+    ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.MODEL
+
+    # Maximum number of bytes of tensor data per shard.
+    MAX_SHARD_SIZE: ClassVar[int] = 2 * 1024 * 1024 * 1024
+    # Maximum number of shards that are written or read concurrently.
+    MAX_WORKERS: ClassVar[int] = 4
+
+    @classmethod
+    def can_handle_type(cls, data_type: Type[Any]) -> bool:
+        """Whether the materializer can read/write a certain type.
+
+        Args:
+            data_type: The type to check.
+
+        Returns:
+            Whether the materializer can read/write the given type.
+        """
+        # `LazyStateDict` is not an associated type as it can only be loaded,
+        # not saved.
+        return issubclass(data_type, LazyStateDict) or super().can_handle_type(
+            data_type
+        )
+
+    def load(self, data_type: Type[Any]) -> Union[Module, LazyStateDict]:
+        """Loads a PyTorch module.
+
+        Args:
+            data_type: The type of the data to load. If this is
+                `LazyStateDict`, only the tensor index is read and a mapping
+                that loads tensors on access is returned.
+
+        Returns:
+            The loaded module or lazy state dict.
+        """
+        if issubclass(data_type, LazyStateDict):
+            return LazyStateDict(self.uri, self.artifact_store)
+
+        index = _read_index(self.uri, self.artifact_store)
+        filenames = sorted(set(index["weight_map"].values()))
+
+        # The tensors memory-map the loaded files, so we can't remove the
+        # local copy of a remote artifact.
+        with self.get_local_directory(self.uri, cleanup=False) as local_dir:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.MAX_WORKERS, len(filenames)))
+            ) as executor:
+                shards = list(
+                    executor.map(
+                        lambda filename: load_file(
+                            os.path.join(local_dir, filename), device="cpu"
+                        ),
+                        filenames,
+                    )
+                )
+
+            with open(os.path.join(local_dir, MODULE_FILENAME), "rb") as f:
+                module = torch.load(f)
+
+        state_dict: Dict[str, "torch.Tensor"] = {}
+        for shard in shards:
+            state_dict.update(shard)
+        for alias, name in index.get("aliases", {}).items():
+            state_dict[alias] = state_dict[name]
+
+        try:
+            # Assign the loaded tensors instead of copying them into the
+            # parameters of the module to avoid a second copy in memory.
+            module.load_state_dict(state_dict, assign=True)
+        except TypeError:
+            # Older PyTorch versions don't support assigning tensors
+            module = module.to_empty(device="cpu")
+            module.load_state_dict(state_dict)
+
+        return module
+
+    def save(self, module: Module) -> None:
+        """Saves a PyTorch module.
+
+        Args:
+            module: The module to save.
+        """
+        tensors, aliases = self._get_tensors(module)
+        shards = self._get_shards(tensors)
+
+        if len(shards) == 1:
+            filenames = [SINGLE_SHARD_FILENAME]
+        else:
+            filenames = [
+                SHARD_FILENAME_TEMPLATE.format(index=i + 1, total=len(shards))
+                for i in range(len(shards))
+            ]
+
+        index = {
+            "metadata": {
+                "total_size": sum(
+                    tensor.numel() * tensor.element_size()
+                    for tensor in tensors.values()
+                )
+            },
+            "weight_map": {
+                name: filename
+                for filename, shard in zip(filenames, shards)
+                for name in shard
+            },
+            "aliases": aliases,
+        }
+
+        with self.get_local_directory(self.uri, mode="w") as local_dir:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.MAX_WORKERS, len(shards)))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        save_file,
+                        shard,
+                        os.path.join(local_dir, filename),
+                        metadata={"format": "pt"},
+                    )
+                    for filename, shard in zip(filenames, shards)
+                ]
+                for future in futures:
+                    future.result()
+
+            with open(os.path.join(local_dir, MODULE_FILENAME), "wb") as f:
+                torch.save(
+                    self._get_module_structure(module),
+                    f,
+                    pickle_module=cloudpickle,
+                )
+
+            with open(os.path.join(local_dir, INDEX_FILENAME), "w") as f:
+                json.dump(index, f)
+
+    def extract_metadata(self, module: Module) -> Dict[str, "MetadataType"]:
+        """Extract metadata from the given `Module` object.
+
+        Args:
+            module: The `Module` object to extract metadata from.
+
+        Returns:
+            The extracted metadata as a dictionary.
+        """
+        return {**count_module_params(module)}
+
+    @staticmethod
+    def _get_module_structure(module: Module) -> Module:
+        """Copies a module without copying the data of its state dict.
+
+        All parameters and persistent buffers of the copy are tensors on the
+        `meta` device, which don't hold any data.
+
+        Args:
+            module: The module to copy.
+
+        Returns:
+            The copy of the module.
+        """
+        memo: Dict[int, Any] = {}
+        for parameter in module.parameters():
+            memo[id(parameter)] = torch.nn.Parameter(
+                parameter.to("meta"), requires_grad=parameter.requires_grad
+            )
+        for submodule in module.modules():
+            for name, buffer in submodule._buffers.items():
+                if (
+                    buffer is not None
+                    and name not in submodule._non_persistent_buffers_set
+                ):
+                    memo[id(buffer)] = buffer.to("meta")
+
+        return copy.deepcopy(module, memo)
+
+    @staticmethod
+    def _get_tensors(
+        module: Module,
+    ) -> Tuple[Dict[str, "torch.Tensor"], Dict[str, str]]:
+        """Gets the tensors of the state dict of a module.
+
+        Safetensors files can't contain tensors that share memory. Tensors
+        that are identical to a previous tensor, e.g. tied weights, are
+        stored as an alias of the previous tensor instead. Tensors that
+        share memory in any other way are copied.
+
+        Args:
+            module: The module.
+
+        Returns:
+            The tensors to store and a mapping from alias names to the names
+            of the tensors they refer to.
+        """
+        tensors: Dict[str, "torch.Tensor"] = {}
+        aliases: Dict[str, str] = {}
+        seen: Dict[Tuple[int, Tuple[int, ...], "torch.dtype"], str] = {}
+        storages: Set[int] = set()
+
+        for name, tensor in module.state_dict().items():
+            tensor = tensor.detach().cpu()
+            key = (tensor.data_ptr(), tuple(tensor.shape), tensor.dtype)
+            if tensor.numel() > 0 and key in seen:
+                aliases[name] = seen[key]
+                continue
+
+            seen[key] = name
+            storage = tensor.untyped_storage().data_ptr()
+            if storage in storages or not tensor.is_contiguous():
+                tensor = tensor.contiguous().clone()
+            storages.add(storage)
+            tensors[name] = tensor
+
+        return tensors, aliases
+
+    def _get_shards(
+        self, tensors: Dict[str, "torch.Tensor"]
+    ) -> List[Dict[str, "torch.Tensor"]]:
+        """Splits tensors into shards of at most `MAX_SHARD_SIZE` bytes.
+
+        Tensors larger than `MAX_SHARD_SIZE` are stored in a shard of their
+        own.
+
+        Args:
+            tensors: The tensors to split.
+
+        Returns:
+            The shards.
+        """
+        shards: List[Dict[str, "torch.Tensor"]] = [{}]
+        shard_size = 0
+        for name, tensor in tensors.items():
+            tensor_size = tensor.numel() * tensor.element_size()
+            if shards[-1] and shard_size + tensor_size > self.MAX_SHARD_SIZE:
+                shards.append({})
+                shard_size = 0
+            shards[-1][name] = tensor
+            shard_size += tensor_size
+
+        return shards
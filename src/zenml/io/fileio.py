@@ -14,16 +14,33 @@
 """Functionality for reading, writing and managing files."""
 
 import os
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 # this import required for CI to get local filesystem
 from zenml.io import local_filesystem  # noqa
 from zenml.io.filesystem import BaseFilesystem, PathType
 from zenml.io.filesystem_registry import default_filesystem_registry
 from zenml.logger import get_logger
+from zenml.utils.string_utils import get_human_readable_filesize
 
 logger = get_logger(__name__)
 
+DEFAULT_TRANSFER_MAX_WORKERS = 8
+DEFAULT_TRANSFER_PART_SIZE = 64 * 1024 * 1024
+
 
 def _get_filesystem(path: "PathType") -> Type["BaseFilesystem"]:
     """Returns a filesystem class for a given path from the registry.
@@ -87,11 +104,164 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
+        _stream_file(src, dst, part_size=DEFAULT_TRANSFER_PART_SIZE)
+
+
+def _stream_file(
+    src: "PathType",
+    dst: "PathType",
+    part_size: int,
+    progress_callback: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Streams a file from the source to the destination in parts.
+
+    Args:
+        src: The path of the file to copy.
+        dst: The path to copy the source file to.
+        part_size: The number of bytes to read and write at once.
+        progress_callback: Function called with the number of bytes after
+            each part that was copied.
+    """
+    with open(src, mode="rb") as source, open(dst, mode="wb") as destination:
+        while chunk := source.read(part_size):
+            destination.write(chunk)
+            if progress_callback:
+                progress_callback(len(chunk))
+
+
+def _copy_file_range(
+    src: "PathType",
+    dst: "PathType",
+    offset: int,
+    length: int,
+    part_size: int,
+    progress_callback: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Copies a byte range of a file into an existing local file.
+
+    Args:
+        src: The path of the file to copy.
+        dst: The local path to copy the byte range to.
+        offset: The offset of the byte range.
+        length: The length of the byte range.
+        part_size: The number of bytes to read and write at once.
+        progress_callback: Function called with the number of bytes after
+            each part that was copied.
+    """
+    with open(src, mode="rb") as source, open(dst, mode="r+b") as destination:
+        source.seek(offset)
+        destination.seek(offset)
+        remaining = length
+        while remaining > 0:
+            chunk = source.read(min(part_size, remaining))
+            if not chunk:
+                break
+            destination.write(chunk)
+            remaining -= len(chunk)
+            if progress_callback:
+                progress_callback(len(chunk))
+
+
+def copy_files(
+    files: Sequence[Tuple["PathType", "PathType"]],
+    overwrite: bool = False,
+    max_workers: int = DEFAULT_TRANSFER_MAX_WORKERS,
+    part_size: int = DEFAULT_TRANSFER_PART_SIZE,
+    progress_callback: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Copy multiple files concurrently.
+
+    Files are copied using a pool of threads. Files that are copied within a
+    single filesystem use the copy operation of that filesystem. All other
+    files are streamed in parts of `part_size` bytes, and files larger than
+    `part_size` that are copied to the local filesystem are split into byte
+    ranges that are downloaded in parallel.
+
+    Args:
+        files: Tuples of the source path and destination path of each file.
+            The parent directories of the destination paths must exist.
+        overwrite: Whether to overwrite destination files if they exist.
+        max_workers: The maximum number of files or byte ranges to copy
+            concurrently.
+        part_size: The number of bytes to read and write at once, and the
+            size of the byte ranges in which large files are downloaded.
+        progress_callback: Function called with the number of bytes whenever
+            a part of a file was copied between filesystems. This function
+            is called from multiple threads concurrently.
+
+    Raises:
+        FileExistsError: If a file already exists at a destination and
+            `overwrite` is not set to `True`.
+    """
+    start_time = time.perf_counter()
+    bytes_copied = 0
+    lock = threading.Lock()
+
+    def _report_progress(num_bytes: int) -> None:
+        nonlocal bytes_copied
+        with lock:
+            bytes_copied += num_bytes
+        if progress_callback:
+            progress_callback(num_bytes)
+
+    tasks: List[Callable[[], None]] = []
+    for src, dst in files:
+        src_fs = _get_filesystem(src)
+        dst_fs = _get_filesystem(dst)
+        if src_fs is dst_fs:
+            tasks.append(partial(src_fs.copyfile, src, dst, overwrite))
+            continue
+
+        if not overwrite and dst_fs.exists(dst):
+            raise FileExistsError(
+                f"Destination file '{convert_to_str(dst)}' already exists "
+                f"and `overwrite` is false."
+            )
+
+        if issubclass(dst_fs, local_filesystem.LocalFilesystem):
+            file_size = src_fs.size(src)
+            if isinstance(file_size, int) and file_size > part_size:
+                # Allocate the file so the byte ranges can be written in
+                # any order
+                with open(dst, mode="wb") as f:
+                    f.truncate(file_size)
+                for offset in range(0, file_size, part_size):
+                    tasks.append(
+                        partial(
+                            _copy_file_range,
+                            src,
+                            dst,
+                            offset,
+                            min(part_size, file_size - offset),
+                            part_size,
+                            _report_progress,
+                        )
+                    )
+                continue
+
+        tasks.append(
+            partial(_stream_file, src, dst, part_size, _report_progress)
+        )
 
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+    if max_workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            task()
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(tasks))
+        ) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            for future in futures:
+                future.result()
+
+    duration = time.perf_counter() - start_time
+    logger.debug(
+        "Copied %d files in %.2fs, transferred %s between filesystems (%s/s).",
+        len(files),
+        duration,
+        get_human_readable_filesize(bytes_copied),
+        get_human_readable_filesize(int(bytes_copied / max(duration, 1e-6))),
+    )
 
 
 def exists(path: "PathType") -> bool:
@@ -296,6 +466,7 @@ def walk(
 
 __all__ = [
     "copy",
+    "copy_files",
     "exists",
     "glob",
     "isdir",
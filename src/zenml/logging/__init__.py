@@ -20,5 +20,8 @@ STEP_LOGS_STORAGE_INTERVAL_SECONDS: int = 15
 # How many messages to buffer before uploading logs to the artifact store
 STEP_LOGS_STORAGE_MAX_MESSAGES: int = 100
 
+# How many messages to queue before dropping new messages
+STEP_LOGS_STORAGE_MAX_QUEUE_SIZE: int = 10000
+
 # How often to merge logs into a single file
 STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS: int = 10 * 60
@@ -13,15 +13,33 @@
 #  permissions and limitations under the License.
 """ZenML logging handler."""
 
+import codecs
 import os
+import queue
 import re
 import sys
+import threading
 import time
 from contextvars import ContextVar
+from datetime import datetime, timezone
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID, uuid4
 
+from pydantic import BaseModel, ValidationError
+
 from zenml.artifact_stores import BaseArtifactStore
 from zenml.artifacts.utils import (
     _load_artifact_store,
@@ -33,6 +51,7 @@ from zenml.logger import get_logger
 from zenml.logging import (
     STEP_LOGS_STORAGE_INTERVAL_SECONDS,
     STEP_LOGS_STORAGE_MAX_MESSAGES,
+    STEP_LOGS_STORAGE_MAX_QUEUE_SIZE,
     STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
 )
 from zenml.zen_stores.base_zen_store import BaseZenStore
@@ -43,6 +62,8 @@ logger = get_logger(__name__)
 redirected: ContextVar[bool] = ContextVar("redirected", default=False)
 
 LOGS_EXTENSION = ".log"
+LOGS_INDEX_EXTENSION = ".index"
+LOGS_STREAM_BLOCK_SIZE = 1024 * 1024
 
 
 def remove_ansi_escape_codes(text: str) -> str:
@@ -107,6 +128,245 @@ def prepare_logs_uri(
         return logs_uri
 
 
+class LogIndexEntry(BaseModel):
+    """Entry of a log index describing a chunk of a log segment.
+
+    Each log segment (a log file or a file inside a log folder) can have a
+    sidecar index file containing one JSON-serialized entry per line.
+    """
+
+    offset: int
+    size: int
+    lines: Optional[int] = None
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+
+
+class LogChunk(NamedTuple):
+    """Chunk of a log segment."""
+
+    uri: str
+    entry: LogIndexEntry
+
+
+def get_logs_index_uri(segment_uri: str) -> str:
+    """Gets the URI of the index file of a log segment.
+
+    Args:
+        segment_uri: The URI of the log segment.
+
+    Returns:
+        The URI of the index file.
+    """
+    return f"{segment_uri}{LOGS_INDEX_EXTENSION}"
+
+
+def _count_lines(data: bytes) -> int:
+    """Counts the lines in the given data.
+
+    Args:
+        data: The data in which to count the lines.
+
+    Returns:
+        The number of lines, including a trailing line without a newline.
+    """
+    lines = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        lines += 1
+    return lines
+
+
+def _get_timestamp_from_filename(file_name: str) -> Optional[float]:
+    """Gets the creation timestamp of a log file from its name.
+
+    Args:
+        file_name: The name of the log file.
+
+    Returns:
+        The timestamp or None if the name does not contain a timestamp.
+    """
+    timestamp = file_name.split("_")[0]
+    if timestamp.endswith(LOGS_EXTENSION):
+        timestamp = timestamp[: -len(LOGS_EXTENSION)]
+
+    try:
+        return float(timestamp)
+    except ValueError:
+        return None
+
+
+def _read_logs_index(
+    artifact_store: "BaseArtifactStore", index_uri: str
+) -> List[LogIndexEntry]:
+    """Reads the entries of a log index file.
+
+    Args:
+        artifact_store: The artifact store in which the index is stored.
+        index_uri: The URI of the index file.
+
+    Returns:
+        The index entries sorted by their offset.
+    """
+    entries = []
+    with artifact_store.open(index_uri, "r") as f:
+        for line in f.read().splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(LogIndexEntry.model_validate_json(line))
+            except ValidationError:
+                logger.debug("Skipping invalid log index entry: %s", line)
+
+    return sorted(entries, key=lambda entry: entry.offset)
+
+
+def _load_log_chunks(
+    artifact_store: "BaseArtifactStore", logs_uri: str
+) -> List[LogChunk]:
+    """Loads all chunks of a log.
+
+    Segments without an index (e.g. logs written by older ZenML versions) are
+    represented by a single chunk without a line count.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        logs_uri: The URI of the log file or folder.
+
+    Returns:
+        The chunks of the log in order.
+
+    Raises:
+        DoesNotExistException: If the logs do not exist.
+    """
+    chunks: List[LogChunk] = []
+
+    if artifact_store.isdir(logs_uri):
+        file_names = {str(f) for f in artifact_store.listdir(logs_uri)}
+        for file_name in sorted(file_names):
+            if file_name.endswith(LOGS_INDEX_EXTENSION):
+                continue
+
+            segment_uri = os.path.join(logs_uri, file_name)
+            if get_logs_index_uri(file_name) in file_names:
+                # Files in a logs folder are never modified once they are
+                # written, which means their index is complete
+                entries = _read_logs_index(
+                    artifact_store, get_logs_index_uri(segment_uri)
+                )
+            else:
+                timestamp = _get_timestamp_from_filename(file_name)
+                entries = [
+                    LogIndexEntry(
+                        offset=0,
+                        size=artifact_store.size(segment_uri) or 0,
+                        start_time=timestamp,
+                        end_time=timestamp,
+                    )
+                ]
+            chunks.extend(LogChunk(segment_uri, entry) for entry in entries)
+    else:
+        if not artifact_store.exists(logs_uri):
+            raise DoesNotExistException(
+                f"File '{logs_uri}' does not exist in artifact store "
+                f"'{artifact_store.name}'."
+            )
+
+        size = artifact_store.size(logs_uri) or 0
+        index_uri = get_logs_index_uri(logs_uri)
+        entries = []
+        if artifact_store.exists(index_uri):
+            entries = [
+                entry
+                for entry in _read_logs_index(artifact_store, index_uri)
+                if entry.offset + entry.size <= size
+            ]
+
+        # The log file might contain data which is not indexed yet
+        indexed_size = entries[-1].offset + entries[-1].size if entries else 0
+        if size > indexed_size:
+            entries.append(
+                LogIndexEntry(offset=indexed_size, size=size - indexed_size)
+            )
+        chunks.extend(LogChunk(logs_uri, entry) for entry in entries)
+
+    return chunks
+
+
+def _read_chunk(
+    artifact_store: "BaseArtifactStore",
+    chunk: LogChunk,
+    block_size: int = LOGS_STREAM_BLOCK_SIZE,
+) -> Iterator[bytes]:
+    """Reads a log chunk block by block.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        chunk: The chunk to read.
+        block_size: The maximum size of the blocks to read.
+
+    Yields:
+        The blocks of the chunk.
+
+    Raises:
+        DoesNotExistException: If the log segment does not exist.
+    """
+    try:
+        with artifact_store.open(chunk.uri, "rb") as f:
+            if chunk.entry.offset:
+                f.seek(chunk.entry.offset)
+
+            remaining = chunk.entry.size
+            while remaining > 0:
+                block = f.read(min(block_size, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                yield block
+    except FileNotFoundError:
+        raise DoesNotExistException(
+            f"File '{chunk.uri}' does not exist in artifact store "
+            f"'{artifact_store.name}'."
+        )
+
+
+def _read_chunk_lines(
+    artifact_store: "BaseArtifactStore", chunk: LogChunk
+) -> Iterator[bytes]:
+    """Reads a log chunk line by line.
+
+    Args:
+        artifact_store: The artifact store in which the logs are stored.
+        chunk: The chunk to read.
+
+    Yields:
+        The lines of the chunk, including their trailing newline.
+    """
+    remainder = b""
+    for block in _read_chunk(artifact_store, chunk):
+        lines = (remainder + block).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            yield line + b"\n"
+
+    if remainder:
+        yield remainder
+
+
+def _to_timestamp(value: datetime) -> float:
+    """Converts a datetime to a timestamp.
+
+    Args:
+        value: The datetime to convert. Naive datetimes are interpreted as
+            UTC.
+
+    Returns:
+        The timestamp.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
 def fetch_logs(
     zen_store: "BaseZenStore",
     artifact_store_id: Union[str, UUID],
@@ -149,64 +409,159 @@ def fetch_logs(
         if not artifact_store.isdir(logs_uri):
             return _read_file(logs_uri, offset, length)
         else:
-            files = artifact_store.listdir(logs_uri)
-            if len(files) == 1:
-                return _read_file(
-                    os.path.join(logs_uri, str(files[0])), offset, length
+            # The segment sizes are taken from the log indices if possible,
+            # which avoids querying the size of each file separately
+            segment_sizes: Dict[str, int] = {}
+            for chunk in _load_log_chunks(artifact_store, logs_uri):
+                segment_sizes[chunk.uri] = (
+                    segment_sizes.get(chunk.uri, 0) + chunk.entry.size
                 )
-            else:
-                is_negative_offset = offset < 0
-                files.sort(reverse=is_negative_offset)
-
-                # search for the first file we need to read
-                latest_file_id = 0
-                for i, file in enumerate(files):
-                    file_size: int = artifact_store.size(
-                        os.path.join(logs_uri, str(file))
-                    )  # type: ignore[assignment]
-
-                    if is_negative_offset:
-                        if file_size >= -offset:
-                            latest_file_id = -(i + 1)
-                            break
-                        else:
-                            offset += file_size
-                    else:
-                        if file_size > offset:
-                            latest_file_id = i
-                            break
-                        else:
-                            offset -= file_size
-
-                # read the files according to pre-filtering
-                files.sort()
-                ret = []
-                for file in files[latest_file_id:]:
-                    ret.append(
-                        _read_file(
-                            os.path.join(logs_uri, str(file)),
-                            offset,
-                            length,
-                        )
-                    )
-                    offset = 0
-                    length -= len(ret[-1])
-                    if length <= 0:
-                        # stop further reading, if the whole length is already read
-                        break
-
-                if not ret:
-                    raise DoesNotExistException(
-                        f"Folder '{logs_uri}' is empty in artifact store "
-                        f"'{artifact_store.name}'."
-                    )
-                return "".join(ret)
+
+            if not segment_sizes:
+                raise DoesNotExistException(
+                    f"Folder '{logs_uri}' is empty in artifact store "
+                    f"'{artifact_store.name}'."
+                )
+
+            if offset < 0:
+                offset = max(sum(segment_sizes.values()) + offset, 0)
+
+            ret = []
+            for segment_uri, segment_size in segment_sizes.items():
+                if offset >= segment_size:
+                    offset -= segment_size
+                    continue
+
+                ret.append(_read_file(segment_uri, offset, length))
+                offset = 0
+                length -= len(ret[-1])
+                if length <= 0:
+                    # stop further reading, if the whole length is already read
+                    break
+
+            return "".join(ret)
+    finally:
+        artifact_store.cleanup()
+
+
+def stream_logs(
+    zen_store: "BaseZenStore",
+    artifact_store_id: Union[str, UUID],
+    logs_uri: str,
+    tail: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+) -> Generator[str, None, None]:
+    """Streams the logs from the artifact store.
+
+    The log indices are used to only read the chunks of the logs that are
+    required for the given query, and the logs are read block by block so
+    they never have to be held in memory completely.
+
+    Args:
+        zen_store: The store in which the artifact is stored.
+        artifact_store_id: The ID of the artifact store.
+        logs_uri: The URI of the log file or folder.
+        tail: Only return the last `tail` lines matching the other filters.
+        start_line: Index of the first line to return.
+        end_line: Index after the last line to return.
+        start_time: Only return chunks of the logs which were written after
+            this time.
+        end_time: Only return chunks of the logs which were written before
+            this time.
+
+    Yields:
+        The logs in blocks of text.
+    """
+    artifact_store = _load_artifact_store(artifact_store_id, zen_store)
+    try:
+        chunks = _load_log_chunks(artifact_store, logs_uri)
+        filter_lines = (
+            tail is not None or start_line is not None or end_line is not None
+        )
+
+        selection: List[Tuple[LogChunk, int, int]] = []
+        first_line = 0
+        for chunk in chunks:
+            if filter_lines and chunk.entry.lines is None:
+                # Only chunks without an index need to be read to count lines
+                chunk.entry.lines = sum(
+                    1 for _ in _read_chunk_lines(artifact_store, chunk)
+                )
+            line_count = chunk.entry.lines or 0
+            chunk_first_line = first_line
+            first_line += line_count
+
+            if start_time or end_time:
+                if chunk.entry.start_time is None or (
+                    chunk.entry.end_time is None
+                ):
+                    continue
+                if start_time and chunk.entry.end_time < _to_timestamp(
+                    start_time
+                ):
+                    continue
+                if end_time and chunk.entry.start_time > _to_timestamp(
+                    end_time
+                ):
+                    continue
+
+            # Range of lines to return from this chunk
+            begin = max((start_line or 0) - chunk_first_line, 0)
+            end = line_count
+            if end_line is not None:
+                end = min(end_line - chunk_first_line, line_count)
+            if not filter_lines or begin < end:
+                selection.append((chunk, begin, end))
+
+        if tail is not None:
+            remaining = tail
+            for i in reversed(range(len(selection))):
+                chunk, begin, end = selection[i]
+                begin = max(begin, end - remaining)
+                remaining -= end - begin
+                selection[i] = (chunk, begin, end)
+            selection = [s for s in selection if s[1] < s[2]]
+
+        for chunk, begin, end in selection:
+            if not filter_lines:
+                decoder = codecs.getincrementaldecoder("utf-8")(
+                    errors="replace"
+                )
+                for block in _read_chunk(artifact_store, chunk):
+                    yield decoder.decode(block)
+                yield decoder.decode(b"", final=True)
+                continue
+
+            lines: List[bytes] = []
+            size = 0
+            for i, line in enumerate(_read_chunk_lines(artifact_store, chunk)):
+                if i >= end:
+                    break
+                if i < begin:
+                    continue
+                lines.append(line)
+                size += len(line)
+                if size >= LOGS_STREAM_BLOCK_SIZE:
+                    yield b"".join(lines).decode(errors="replace")
+                    lines, size = [], 0
+            if lines:
+                yield b"".join(lines).decode(errors="replace")
     finally:
         artifact_store.cleanup()
 
 
 class StepLogsStorage:
-    """Helper class which buffers and stores logs to a given URI."""
+    """Helper class which buffers and stores logs to a given URI.
+
+    Incoming messages are put in a bounded in-memory queue. A background
+    thread drains this queue and writes the messages to the artifact store in
+    batches, so the threads producing the logs never block on artifact store
+    I/O. If the queue is full, incoming messages are dropped and the number
+    of dropped messages is added to the logs.
+    """
 
     def __init__(
         self,
@@ -214,6 +569,7 @@ class StepLogsStorage:
         max_messages: int = STEP_LOGS_STORAGE_MAX_MESSAGES,
         time_interval: int = STEP_LOGS_STORAGE_INTERVAL_SECONDS,
         merge_files_interval: int = STEP_LOGS_STORAGE_MERGE_INTERVAL_SECONDS,
+        max_queue_size: int = STEP_LOGS_STORAGE_MAX_QUEUE_SIZE,
     ) -> None:
         """Initialization.
 
@@ -224,6 +580,8 @@ class StepLogsStorage:
                 automatically.
             merge_files_interval: the amount of seconds before the created files
                 get merged into a single file.
+            max_queue_size: the maximum number of messages waiting to be
+                written before new messages get dropped.
         """
         # Parameters
         self.logs_uri = logs_uri
@@ -232,15 +590,26 @@ class StepLogsStorage:
         self.merge_files_interval = merge_files_interval
 
         # State
-        self.buffer: List[str] = []
-        self.disabled_buffer: List[str] = []
+        self.buffer: List[Tuple[float, str]] = []
         self.last_save_time = time.time()
-        self.disabled = False
+        self.dropped_messages = 0
+        self._reported_dropped_messages = 0
+        self._dropped_messages_lock = threading.Lock()
         self._artifact_store: Optional["BaseArtifactStore"] = None
 
         # Immutable filesystems state
         self.last_merge_time = time.time()
 
+        # Background shipping state
+        self._queue: "queue.Queue[Union[Tuple[float, str], threading.Event]]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._closed = threading.Event()
+        self._shipper = threading.Thread(
+            target=self._ship_logs, name="zenml-step-logs-shipper", daemon=True
+        )
+        self._shipper.start()
+
     @property
     def artifact_store(self) -> "BaseArtifactStore":
         """Returns the active artifact store.
@@ -261,9 +630,16 @@ class StepLogsStorage:
         if text == "\n":
             return
 
-        if not self.disabled:
-            self.buffer.append(text)
-            self.save_to_file()
+        if threading.current_thread() is self._shipper:
+            # Messages emitted while writing the logs would otherwise end up
+            # triggering another write
+            return
+
+        try:
+            self._queue.put_nowait((time.time(), text))
+        except queue.Full:
+            with self._dropped_messages_lock:
+                self.dropped_messages += 1
 
     @property
     def _is_write_needed(self) -> bool:
@@ -292,51 +668,138 @@ class StepLogsStorage:
         """Method to save the buffer to the given URI.
 
         Args:
-            force: whether to force a save even if the write conditions not met.
+            force: whether to block until all messages queued so far are
+                written. Otherwise, this is a no-op as the messages get
+                written in the background once the write conditions are met.
         """
-        if not self.disabled and (self._is_write_needed or force):
-            # IMPORTANT: keep this as the first code line in this method! The
-            # code that follows might still emit logging messages, which will
-            # end up triggering this method again, causing an infinite loop.
-            self.disabled = True
+        if not force or threading.current_thread() is self._shipper:
+            return
 
+        flushed = threading.Event()
+        if self._shipper.is_alive():
+            self._queue.put(flushed)
+            while not flushed.wait(timeout=1):
+                if not self._shipper.is_alive():
+                    break
+
+        if not flushed.is_set():
+            # The shipper thread is not running anymore, which means we need
+            # to write the remaining messages ourselves
+            self._drain_queue()
+            self._write_buffer()
+
+    def close(self) -> None:
+        """Writes all queued messages and stops the background thread."""
+        self._closed.set()
+        self.save_to_file(force=True)
+        self._shipper.join()
+
+    def _ship_logs(self) -> None:
+        """Drains the message queue and writes the messages in batches."""
+        while not self._closed.is_set() or not self._queue.empty():
+            timeout = self.last_save_time + self.time_interval - time.time()
             try:
-                if self.buffer:
-                    if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
-                        _logs_uri = self._get_timestamped_filename()
-                        with self.artifact_store.open(
-                            os.path.join(
-                                self.logs_uri,
-                                _logs_uri,
-                            ),
-                            "w",
-                        ) as file:
-                            for message in self.buffer:
-                                file.write(
-                                    remove_ansi_escape_codes(message) + "\n"
-                                )
-                    else:
-                        with self.artifact_store.open(
-                            self.logs_uri, "a"
-                        ) as file:
-                            for message in self.buffer:
-                                file.write(
-                                    remove_ansi_escape_codes(message) + "\n"
-                                )
+                item = self._queue.get(timeout=max(timeout, 0.01))
+            except queue.Empty:
+                item = None
 
-            except (OSError, IOError) as e:
-                # This exception can be raised if there are issues with the
-                # underlying system calls, such as reaching the maximum number
-                # of open files, permission issues, file corruption, or other
-                # I/O errors.
-                logger.error(f"Error while trying to write logs: {e}")
-            finally:
-                self.buffer = []
-                self.last_save_time = time.time()
+            try:
+                if isinstance(item, threading.Event):
+                    self._write_buffer()
+                    item.set()
+                    continue
+
+                if item is not None:
+                    self.buffer.append(item)
+                if self._is_write_needed:
+                    self._write_buffer()
+
+                self._merge_log_files_if_needed()
+            except Exception as e:
+                logger.error(f"Error while trying to ship logs: {e}")
+
+    def _drain_queue(self) -> None:
+        """Moves all queued messages to the buffer."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                self.buffer.append(item)
+
+    def _write_buffer(self) -> None:
+        """Writes all buffered messages to the artifact store."""
+        with self._dropped_messages_lock:
+            dropped_messages = (
+                self.dropped_messages - self._reported_dropped_messages
+            )
+            self._reported_dropped_messages = self.dropped_messages
+        if dropped_messages:
+            self.buffer.append(
+                (
+                    time.time(),
+                    f"[{dropped_messages} log messages were dropped because "
+                    "they were produced faster than they could be stored.]",
+                )
+            )
+
+        try:
+            if self.buffer:
+                text = "".join(
+                    remove_ansi_escape_codes(message) + "\n"
+                    for _, message in self.buffer
+                )
 
-                self.disabled = False
-        # merge created files on a given interval (defaults to 10 minutes)
-        # only runs on Immutable Filesystems
+                if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
+                    # The index of these files gets created once they're
+                    # merged, which avoids writing an additional file for
+                    # each batch of messages
+                    _logs_uri = self._get_timestamped_filename()
+                    with self.artifact_store.open(
+                        os.path.join(
+                            self.logs_uri,
+                            _logs_uri,
+                        ),
+                        "w",
+                    ) as file:
+                        file.write(text)
+                else:
+                    offset = 0
+                    if self.artifact_store.exists(self.logs_uri):
+                        offset = self.artifact_store.size(self.logs_uri) or 0
+                    entry = LogIndexEntry(
+                        offset=offset,
+                        size=len(text.encode()),
+                        lines=_count_lines(text.encode()),
+                        start_time=self.buffer[0][0],
+                        end_time=self.buffer[-1][0],
+                    )
+                    with self.artifact_store.open(self.logs_uri, "a") as file:
+                        file.write(text)
+                    with self.artifact_store.open(
+                        get_logs_index_uri(self.logs_uri), "a"
+                    ) as file:
+                        file.write(entry.model_dump_json() + "\n")
+
+        except (OSError, IOError) as e:
+            # This exception can be raised if there are issues with the
+            # underlying system calls, such as reaching the maximum number
+            # of open files, permission issues, file corruption, or other
+            # I/O errors.
+            logger.error(f"Error while trying to write logs: {e}")
+        finally:
+            self.buffer = []
+            self.last_save_time = time.time()
+
+    def _merge_log_files_if_needed(self) -> None:
+        """Merges the created log files on a given interval.
+
+        This only applies to immutable filesystems.
+        """
         if (
             self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM
             and time.time() - self.last_merge_time > self.merge_files_interval
@@ -358,7 +821,12 @@ class StepLogsStorage:
         """
         if self.artifact_store.config.IS_IMMUTABLE_FILESYSTEM:
             merged_file_suffix = "_merged"
-            files_ = self.artifact_store.listdir(self.logs_uri)
+            all_files = {
+                str(f) for f in self.artifact_store.listdir(self.logs_uri)
+            }
+            files_ = [
+                f for f in all_files if not f.endswith(LOGS_INDEX_EXTENSION)
+            ]
             if not merge_all_files:
                 # already merged files will not be merged again
                 files_ = [f for f in files_ if merged_file_suffix not in f]
@@ -370,30 +838,93 @@ class StepLogsStorage:
                 logger.debug("Log files count: %s", len(files_))
 
                 missing_files = set()
+                index: List[LogIndexEntry] = []
+                offset = 0
                 # dump all logs to a local file first
                 with self.artifact_store.open(
                     os.path.join(self.logs_uri, file_name_), "w"
                 ) as merged_file:
                     for file in files_:
                         try:
-                            merged_file.write(
-                                str(
-                                    _load_file_from_artifact_store(
-                                        os.path.join(self.logs_uri, str(file)),
-                                        artifact_store=self.artifact_store,
-                                        mode="r",
-                                    )
+                            content = str(
+                                _load_file_from_artifact_store(
+                                    os.path.join(self.logs_uri, file),
+                                    artifact_store=self.artifact_store,
+                                    mode="r",
                                 )
                             )
                         except DoesNotExistException:
                             missing_files.add(file)
+                            continue
+
+                        merged_file.write(content)
+                        index.extend(
+                            self._get_index_entries(
+                                file,
+                                content=content,
+                                has_index=get_logs_index_uri(file)
+                                in all_files,
+                                offset=offset,
+                            )
+                        )
+                        offset += len(content.encode())
+
+                with self.artifact_store.open(
+                    get_logs_index_uri(
+                        os.path.join(self.logs_uri, file_name_)
+                    ),
+                    "w",
+                ) as index_file:
+                    for entry in index:
+                        index_file.write(entry.model_dump_json() + "\n")
 
                 # clean up left over files
                 for file in files_:
                     if file not in missing_files:
                         self.artifact_store.remove(
-                            os.path.join(self.logs_uri, str(file))
+                            os.path.join(self.logs_uri, file)
                         )
+                    if get_logs_index_uri(file) in all_files:
+                        self.artifact_store.remove(
+                            os.path.join(
+                                self.logs_uri, get_logs_index_uri(file)
+                            )
+                        )
+
+    def _get_index_entries(
+        self, file_name: str, content: str, has_index: bool, offset: int
+    ) -> List[LogIndexEntry]:
+        """Gets the index entries of a log file which gets merged.
+
+        Args:
+            file_name: The name of the log file.
+            content: The content of the log file.
+            has_index: Whether the log file has an index file.
+            offset: The offset of the log file in the merged file.
+
+        Returns:
+            The index entries for the merged file.
+        """
+        if has_index:
+            entries = _read_logs_index(
+                self.artifact_store,
+                get_logs_index_uri(os.path.join(self.logs_uri, file_name)),
+            )
+            for entry in entries:
+                entry.offset += offset
+            return entries
+
+        data = content.encode()
+        timestamp = _get_timestamp_from_filename(file_name)
+        return [
+            LogIndexEntry(
+                offset=offset,
+                size=len(data),
+                lines=_count_lines(data),
+                start_time=timestamp,
+                end_time=timestamp,
+            )
+        ]
 
 
 class StepLogsStorageContext:
@@ -446,8 +977,6 @@ class StepLogsStorageContext:
 
         Restores the `write` method of both stderr and stdout.
         """
-        self.storage.save_to_file(force=True)
-
         setattr(sys.stdout, "write", self.stdout_write)
         setattr(sys.stdout, "flush", self.stdout_flush)
 
@@ -456,6 +985,8 @@ class StepLogsStorageContext:
 
         redirected.set(False)
 
+        self.storage.close()
+
         try:
             self.storage.merge_log_files(merge_all_files=True)
         except (OSError, IOError) as e:
@@ -29,7 +29,10 @@ from zenml.materializers.cloudpickle_materializer import (
 from zenml.materializers.structured_string_materializer import (
     StructuredStringMaterializer,
 )
-from zenml.materializers.numpy_materializer import NumpyMaterializer
+from zenml.materializers.numpy_materializer import (
+    ChunkedNumpyMaterializer,
+    NumpyMaterializer,
+)
 from zenml.materializers.pandas_materializer import PandasMaterializer
 from zenml.materializers.pydantic_materializer import PydanticMaterializer
 from zenml.materializers.service_materializer import ServiceMaterializer
@@ -40,6 +43,7 @@ __all__ = [
     "BytesMaterializer",
     "CloudpickleMaterializer",
     "StructuredStringMaterializer",
+    "ChunkedNumpyMaterializer",
     "NumpyMaterializer",
     "PandasMaterializer",
     "PydanticMaterializer",
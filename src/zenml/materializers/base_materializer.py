@@ -14,7 +14,10 @@
 """Metaclass implementation for registering ZenML BaseMaterializer subclasses."""
 
 import inspect
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type, cast
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple, Type, cast
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
 from zenml.enums import ArtifactType, VisualizationType
@@ -23,6 +26,7 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.materializer_registry import materializer_registry
 from zenml.metadata.metadata_types import MetadataType
+from zenml.utils import io_utils
 
 logger = get_logger(__name__)
 
@@ -115,6 +119,11 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
 
     _DOCS_BUILDING_MODE: ClassVar[bool] = False
 
+    # Total number of bytes written to `self.uri`, if tracked by the
+    # materializer. See `_add_bytes_written(...)`.
+    _bytes_written: Optional[int] = None
+    _bytes_written_unknown: bool = False
+
     def __init__(
         self, uri: str, artifact_store: Optional[BaseArtifactStore] = None
     ):
@@ -222,6 +231,85 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         # Optionally, extract some metadata from `data` for ZenML to store.
         return {}
 
+    def compute_content_hash(self, data: Any) -> Optional[str]:
+        """Compute a hash of the content of the given data.
+
+        If this method is not overridden, no content hash will be stored for
+        the artifact. Artifacts with a content hash can be cached based on
+        their content instead of their ID, see
+        `zenml.config.CacheSettings.content_addressed`.
+
+        Only override this method if the hash can be computed cheaply and two
+        objects with the same hash are guaranteed to be equal.
+
+        Args:
+            data: The data to compute the content hash for.
+
+        Returns:
+            The content hash or None if no hash can be computed.
+        """
+        return None
+
+    @contextmanager
+    def get_local_directory(
+        self, path: str, mode: str = "r", cleanup: bool = True
+    ) -> Iterator[str]:
+        """Gets a local directory to read or write a directory of the artifact.
+
+        Whenever possible, materializers should read and write their data
+        directly using file handles returned by `self.artifact_store.open`.
+        This method is a fallback for libraries that can only read from or
+        write to a local directory:
+
+        ```
+        with self.get_local_directory(
+            os.path.join(self.uri, "model"), mode="w"
+        ) as local_dir:
+            model.save_pretrained(local_dir)
+        ```
+
+        If the artifact store is on the local filesystem, the directory inside
+        the artifact store is used directly without copying any data.
+        Otherwise, the data is copied from the artifact store into a temporary
+        directory when reading, or from a temporary directory into the
+        artifact store after the block exits without error when writing.
+
+        Args:
+            path: The path of the directory in the artifact store.
+            mode: `r` to read the directory, `w` to write it.
+            cleanup: Whether to remove the temporary directory after reading.
+                Set this to False if the loaded data keeps referencing the
+                local files, e.g. because they are memory-mapped. Temporary
+                directories used for writing are always removed.
+
+        Yields:
+            The path of the local directory.
+
+        Raises:
+            ValueError: If the mode is invalid.
+        """
+        if mode not in ("r", "w"):
+            raise ValueError(
+                f"Invalid mode `{mode}`, must be either `r` or `w`."
+            )
+
+        if not io_utils.is_remote(path):
+            if mode == "w":
+                self.artifact_store.makedirs(path)
+            yield path
+            return
+
+        temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
+        try:
+            if mode == "r":
+                io_utils.copy_dir(path, temp_dir)
+            yield temp_dir
+            if mode == "w":
+                io_utils.copy_dir(temp_dir, path)
+        finally:
+            if mode == "w" or cleanup:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
     # ================
     # Internal Methods
     # ================
@@ -284,7 +372,28 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
         """
         from zenml.metadata.metadata_types import StorageSize
 
+        if self._bytes_written is not None:
+            return {"storage_size": StorageSize(self._bytes_written)}
+
         storage_size = fileio.size(self.uri)
         if isinstance(storage_size, int):
             return {"storage_size": StorageSize(storage_size)}
         return {}
+
+    def _add_bytes_written(self, num_bytes: Optional[int]) -> None:
+        """Adds to the number of bytes written to the artifact URI.
+
+        Materializers that call this method for every file they write allow
+        the storage size of the artifact to be computed without querying the
+        artifact store, which can be slow for remote artifact stores.
+
+        Args:
+            num_bytes: The number of bytes written. If this is None, the
+                total number of bytes written is considered unknown and the
+                storage size will be queried from the artifact store instead.
+        """
+        if num_bytes is None or self._bytes_written_unknown:
+            self._bytes_written_unknown = True
+            self._bytes_written = None
+        else:
+            self._bytes_written = (self._bytes_written or 0) + num_bytes
@@ -13,10 +13,14 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
@@ -24,6 +28,7 @@ from typing import (
     Optional,
     Tuple,
     Type,
+    TypeVar,
     Union,
 )
 
@@ -38,6 +43,10 @@ if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
 
 logger = get_logger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
@@ -114,6 +123,23 @@ class BuiltInMaterializer(BaseMaterializer):
 
         return {}
 
+    def compute_content_hash(
+        self, data: Union[bool, float, int, str]
+    ) -> Optional[str]:
+        """Compute a hash of the content of the given basic type.
+
+        Args:
+            data: The data to compute the content hash for.
+
+        Returns:
+            The content hash.
+        """
+        hash_ = hashlib.sha256()
+        # Include the type so that e.g. `1` and `True` have different hashes
+        hash_.update(type(data).__name__.encode())
+        hash_.update(json.dumps(data).encode())
+        return hash_.hexdigest()
+
 
 class BytesMaterializer(BaseMaterializer):
     """Handle `bytes` data type, which is not JSON serializable."""
@@ -154,6 +180,17 @@ class BytesMaterializer(BaseMaterializer):
         with self.artifact_store.open(self.data_path, "wb") as file_:
             file_.write(data)
 
+    def compute_content_hash(self, data: bytes) -> Optional[str]:
+        """Compute a hash of the content of the given bytes object.
+
+        Args:
+            data: The data to compute the content hash for.
+
+        Returns:
+            The content hash.
+        """
+        return hashlib.sha256(data).hexdigest()
+
 
 def _all_serializable(iterable: Iterable[Any]) -> bool:
     """For an iterable, check whether all of its elements are JSON-serializable.
@@ -259,6 +296,9 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         tuple,
     )
 
+    # Maximum number of elements that are saved or loaded in parallel.
+    MAX_WORKERS: ClassVar[int] = 8
+
     def __init__(
         self, uri: str, artifact_store: Optional[BaseArtifactStore] = None
     ):
@@ -283,6 +323,8 @@ class BuiltInContainerMaterializer(BaseMaterializer):
             3. Initialize the materializer with the desired path,
             4. Use `load()` of that materializer to load the element.
 
+        Elements are loaded in parallel using up to `MAX_WORKERS` threads.
+
         Args:
             data_type: The type of the data to read.
 
@@ -323,15 +365,7 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
             # New format for zenml > 0.37.0
             elif isinstance(metadata, list):
-                for entry in metadata:
-                    path_ = entry["path"]
-                    type_ = source_utils.load(entry["type"])
-                    materializer_class = source_utils.load(
-                        entry["materializer"]
-                    )
-                    materializer = materializer_class(uri=path_)
-                    element = materializer.load(type_)
-                    outputs.append(element)
+                outputs = self._map_elements(self._load_element, metadata)
 
             else:
                 raise RuntimeError(f"Unknown metadata format: {metadata}.")
@@ -353,7 +387,9 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
         Otherwise, use the `default_materializer_registry` to find the correct
         materializer for each element and materialize each element into a
-        subdirectory.
+        subdirectory. Elements of basic types are stored directly in the
+        metadata file instead. Elements are saved in parallel using up to
+        `MAX_WORKERS` threads.
 
         Tuples and sets are cast to list before materialization.
 
@@ -378,43 +414,106 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
-        # Get path, type, and corresponding materializer for each element.
-        metadata: List[Dict[str, str]] = []
-        materializers: List[BaseMaterializer] = []
-        try:
-            for i, element in enumerate(data):
-                element_path = os.path.join(self.uri, str(i))
-                self.artifact_store.mkdir(element_path)
-                type_ = type(element)
-                materializer_class = materializer_registry[type_]
-                materializer = materializer_class(uri=element_path)
-                materializers.append(materializer)
+        # non-serializable list: Store basic elements directly in the metadata
+        # file and materialize all other elements into a subfolder each.
+        metadata: List[Dict[str, Any]] = []
+        elements: List[Tuple[Any, BaseMaterializer]] = []
+        for i, element in enumerate(data):
+            type_ = type(element)
+            if type_ in BASIC_TYPES:
                 metadata.append(
                     {
-                        "path": element_path,
                         "type": source_utils.resolve(type_).import_path,
-                        "materializer": source_utils.resolve(
-                            materializer_class
-                        ).import_path,
+                        "value": element,
                     }
                 )
+                continue
+
+            element_path = os.path.join(self.uri, str(i))
+            materializer_class = materializer_registry[type_]
+            materializer = materializer_class(
+                uri=element_path, artifact_store=self.artifact_store
+            )
+            elements.append((element, materializer))
+            metadata.append(
+                {
+                    "path": element_path,
+                    "type": source_utils.resolve(type_).import_path,
+                    "materializer": source_utils.resolve(
+                        materializer_class
+                    ).import_path,
+                }
+            )
+
+        try:
+            self._map_elements(self._save_element, elements)
             # Write metadata as JSON.
             yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
-                materializer.validate_type_compatibility(type(element))
-                materializer.save(element)
         # If an error occurs, delete all created files.
         except Exception as e:
             # Delete metadata
             if self.artifact_store.exists(self.metadata_path):
                 self.artifact_store.remove(self.metadata_path)
             # Delete all elements that were already saved.
-            for entry in metadata:
-                self.artifact_store.rmtree(entry["path"])
+            for _, materializer in elements:
+                if self.artifact_store.exists(materializer.uri):
+                    self.artifact_store.rmtree(materializer.uri)
             raise e
 
+    def _save_element(self, element: Tuple[Any, BaseMaterializer]) -> None:
+        """Materializes a single element of a container.
+
+        Args:
+            element: The element and the materializer to save it with.
+        """
+        data, materializer = element
+        self.artifact_store.mkdir(materializer.uri)
+        materializer.validate_type_compatibility(type(data))
+        materializer.save(data)
+
+    def _load_element(self, entry: Dict[str, Any]) -> Any:
+        """Loads a single element of a container.
+
+        Args:
+            entry: The metadata entry of the element.
+
+        Returns:
+            The element.
+        """
+        if "value" in entry:
+            return entry["value"]
+
+        type_ = source_utils.load(entry["type"])
+        materializer_class = source_utils.load(entry["materializer"])
+        materializer = materializer_class(
+            uri=entry["path"], artifact_store=self.artifact_store
+        )
+        return materializer.load(type_)
+
+    def _map_elements(
+        self, function: Callable[[_T], _R], items: List[_T]
+    ) -> List[_R]:
+        """Applies a function to elements, in parallel if there are several.
+
+        All calls are finished before this method returns, even if one of
+        them fails.
+
+        Args:
+            function: The function to apply.
+            items: The items to apply the function to.
+
+        Returns:
+            The results in the same order as the items.
+        """
+        if len(items) <= 1 or self.MAX_WORKERS <= 1:
+            return [function(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_WORKERS, len(items))
+        ) as executor:
+            futures = [executor.submit(function, item) for item in items]
+        return [future.result() for future in futures]
+
     def extract_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given built-in container object.
 
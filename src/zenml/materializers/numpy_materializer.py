@@ -13,9 +13,24 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML NumPy materializer."""
 
+import hashlib
+import json
 import os
+import weakref
+import zlib
 from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import numpy as np
 
@@ -23,10 +38,13 @@ from zenml.enums import ArtifactType, VisualizationType
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
+
 logger = get_logger(__name__)
 
 
@@ -36,6 +54,17 @@ DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
+# Remote arrays that are loaded as memory-mapped arrays are downloaded into
+# the artifact cache. If the artifact cache is disabled, they're downloaded
+# into a separate cache in this directory inside the global config directory
+# instead, whose least recently used arrays are evicted once its size exceeds
+# the maximum size.
+NUMPY_CACHE_DIRECTORY_NAME = "numpy_cache"
+NUMPY_CACHE_MAX_SIZE = 4 * 1024 * 1024 * 1024
+
+CHUNKED_MANIFEST_FILENAME = "manifest.json"
+CHUNKED_FORMAT_VERSION = 1
+
 
 class NumpyMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
@@ -46,6 +75,12 @@ class NumpyMaterializer(BaseMaterializer):
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
 
+        If the requested data type is `np.memmap`, the array is returned as a
+        read-only memory-mapped array instead of being read into memory. This
+        allows multiple processes to share the same pages of an array in the
+        operating system page cache. Arrays in a remote artifact store are
+        downloaded to a local cache directory first.
+
         Args:
             data_type: The type of the data to read.
 
@@ -59,6 +94,9 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if self.artifact_store.exists(numpy_file):
+            if issubclass(data_type, np.memmap):
+                return self._load_memory_mapped(numpy_file)
+
             with self.artifact_store.open(numpy_file, "rb") as f:
                 return np.load(f, allow_pickle=True)
         elif self.artifact_store.exists(os.path.join(self.uri, DATA_FILENAME)):
@@ -95,6 +133,80 @@ class NumpyMaterializer(BaseMaterializer):
                     "You can install `pyarrow` by running `pip install pyarrow`.",
                 )
 
+    def _load_memory_mapped(self, numpy_file: str) -> "NDArray[Any]":
+        """Loads a `.npy` file as a read-only memory-mapped array.
+
+        Args:
+            numpy_file: The path of the `.npy` file.
+
+        Returns:
+            The memory-mapped array, or a regular array if the array contains
+            Python objects and can therefore not be memory-mapped.
+
+        Raises:
+            BaseException: If the array could not be loaded.
+        """
+        release: Optional[Callable[[], None]] = None
+        if io_utils.is_remote(numpy_file):
+            local_file, release = self._get_local_copy()
+        else:
+            local_file = numpy_file
+
+        try:
+            try:
+                array = np.load(local_file, mmap_mode="r")
+            except ValueError:
+                logger.warning(
+                    "Unable to memory-map the numpy array stored at `%s` as "
+                    "it contains Python objects, loading it into memory "
+                    "instead.",
+                    numpy_file,
+                )
+                array = np.load(local_file, allow_pickle=True)
+        except BaseException:
+            if release:
+                release()
+            raise
+
+        if release:
+            if isinstance(array, np.memmap):
+                # The cached file must not be evicted while it is mapped
+                weakref.finalize(array, release)
+            else:
+                release()
+        return array  # type: ignore[no-any-return]
+
+    def _get_local_copy(self) -> Tuple[str, Callable[[], None]]:
+        """Gets a local copy of the remote `.npy` file of the artifact.
+
+        The artifact is downloaded into the artifact cache, or into a
+        separate size-bounded cache if the artifact cache is disabled. In
+        both cases it is reused by all subsequent loads of the same artifact
+        on this machine.
+
+        Returns:
+            The path of the local copy and a function to release it. The local
+            copy won't be evicted from the cache until it is released.
+        """
+        from zenml.artifacts.artifact_cache import (
+            ArtifactCache,
+            get_artifact_cache,
+        )
+
+        artifact_cache = get_artifact_cache() or ArtifactCache(
+            path=os.path.join(
+                io_utils.get_global_config_directory(),
+                NUMPY_CACHE_DIRECTORY_NAME,
+            ),
+            max_size=NUMPY_CACHE_MAX_SIZE,
+        )
+        local_path, release = artifact_cache.get(
+            artifact_version_id=None,
+            uri=self.uri,
+            artifact_store=self.artifact_store,
+        )
+        return os.path.join(local_path, NUMPY_FILENAME), release
+
     def save(self, arr: "NDArray[Any]") -> None:
         """Writes a np.ndarray to the artifact store as a `.npy` file.
 
@@ -106,6 +218,25 @@ class NumpyMaterializer(BaseMaterializer):
         ) as f:
             np.save(f, arr)
 
+    def compute_content_hash(self, arr: "NDArray[Any]") -> Optional[str]:
+        """Compute a hash of the content of the given numpy array.
+
+        Args:
+            arr: The numpy array to compute the content hash for.
+
+        Returns:
+            The content hash or None if the array contains Python objects.
+        """
+        if arr.dtype.hasobject:
+            # The buffer of these arrays only contains pointers to the objects
+            return None
+
+        hash_ = hashlib.sha256()
+        hash_.update(arr.dtype.str.encode())
+        hash_.update(str(arr.shape).encode())
+        hash_.update(np.ascontiguousarray(arr).data)
+        return hash_.hexdigest()
+
     def save_visualizations(
         self, arr: "NDArray[Any]"
     ) -> Dict[str, VisualizationType]:
@@ -244,3 +375,285 @@ class NumpyMaterializer(BaseMaterializer):
             "most_common_count": most_common_count,
         }
         return text_metadata
+
+
+class ChunkedArray:
+    """Read-only proxy for a numpy array stored in chunks.
+
+    The array data is only downloaded when it is accessed. Indexing the proxy
+    along the first axis only downloads the chunks that contain the requested
+    rows, all other operations load the full array.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        manifest: Dict[str, Any],
+        artifact_store: "BaseArtifactStore",
+        max_workers: int = 8,
+    ) -> None:
+        """Initializes the chunked array.
+
+        Args:
+            uri: The URI of the directory containing the chunks.
+            manifest: The manifest of the chunked array.
+            artifact_store: The artifact store in which the chunks are stored.
+            max_workers: The maximum number of chunks to download in parallel.
+        """
+        self._uri = uri
+        self._artifact_store = artifact_store
+        self._max_workers = max_workers
+        self.shape: Tuple[int, ...] = tuple(manifest["shape"])
+        self.dtype = np.dtype(manifest["dtype"])
+        self._compression: Optional[str] = manifest["compression"]
+        self._chunks: List[Dict[str, Any]] = manifest["chunks"]
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the array.
+
+        Returns:
+            The number of dimensions.
+        """
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        """The number of elements of the array.
+
+        Returns:
+            The number of elements.
+        """
+        return int(np.prod(self.shape))
+
+    def __len__(self) -> int:
+        """The length of the first axis of the array.
+
+        Returns:
+            The length of the first axis.
+        """
+        return self.shape[0]
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> "NDArray[Any]":
+        """Loads the full array.
+
+        Args:
+            dtype: The dtype of the returned array.
+            copy: Unused, the returned array is always a new array.
+
+        Returns:
+            The full array.
+        """
+        array = self._load_rows(0, len(self))
+        if dtype is not None:
+            array = array.astype(dtype, copy=False)
+        return array
+
+    def __getitem__(self, key: Any) -> Any:
+        """Loads a part of the array.
+
+        Args:
+            key: Any numpy index.
+
+        Returns:
+            The indexed data.
+        """
+        first, rest = (
+            (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+        )
+        if isinstance(first, (int, np.integer)):
+            index = int(first)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(
+                    f"Index {first} is out of bounds for axis 0 with size "
+                    f"{len(self)}."
+                )
+            return self._load_rows(index, index + 1)[(0, *rest)]
+        elif isinstance(first, slice):
+            start, stop, step = first.indices(len(self))
+            indices = range(start, stop, step)
+            if not indices:
+                return np.empty((0, *self.shape[1:]), dtype=self.dtype)[rest]
+            low, high = min(indices), max(indices) + 1
+            rows = self._load_rows(low, high)
+            local_slice = slice(
+                start - low,
+                None if stop - low < 0 else stop - low,
+                step,
+            )
+            return rows[(local_slice, *rest)]
+
+        return np.asarray(self)[key]
+
+    def __repr__(self) -> str:
+        """String representation of the chunked array.
+
+        Returns:
+            The string representation.
+        """
+        return (
+            f"ChunkedArray(shape={self.shape}, dtype={self.dtype}, "
+            f"chunks={len(self._chunks)})"
+        )
+
+    def _load_rows(self, start: int, stop: int) -> "NDArray[Any]":
+        """Loads a range of rows along the first axis.
+
+        Args:
+            start: The first row to load.
+            stop: The row after the last row to load.
+
+        Returns:
+            The loaded rows.
+        """
+        chunks = [
+            chunk
+            for chunk in self._chunks
+            if chunk["offset"] < stop
+            and chunk["offset"] + chunk["rows"] > start
+        ]
+        if not chunks:
+            return np.empty((0, *self.shape[1:]), dtype=self.dtype)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(chunks))
+        ) as executor:
+            arrays = list(executor.map(self._load_chunk, chunks))
+
+        rows: "NDArray[Any]" = (
+            np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+        )
+        first_offset = chunks[0]["offset"]
+        return rows[start - first_offset : stop - first_offset]
+
+    def _load_chunk(self, chunk: Dict[str, Any]) -> "NDArray[Any]":
+        """Downloads and decompresses a single chunk.
+
+        Args:
+            chunk: The manifest entry of the chunk.
+
+        Returns:
+            The chunk data.
+        """
+        with self._artifact_store.open(
+            os.path.join(self._uri, chunk["file"]), "rb"
+        ) as f:
+            data = f.read()
+        if self._compression == "zlib":
+            data = zlib.decompress(data)
+        return np.frombuffer(data, dtype=self.dtype).reshape(
+            (chunk["rows"], *self.shape[1:])
+        )
+
+
+class ChunkedNumpyMaterializer(NumpyMaterializer):
+    """Materializer to store numpy arrays in compressed chunks.
+
+    Arrays are split into chunks along their first axis. Each chunk is
+    compressed and stored in a separate file, next to a JSON manifest that
+    contains the shape and dtype of the array as well as the offset of each
+    chunk. Chunks are uploaded and downloaded in parallel, and loading an
+    array as a `ChunkedArray` allows reading slices of the array without
+    downloading all of it.
+
+    Arrays that contain Python objects are stored in the single file format
+    of the `NumpyMaterializer`, which is also used to load artifacts that
+    were not stored in chunks.
+    """
+
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (
+        np.ndarray,
+        ChunkedArray,
+    )
+
+    # The approximate uncompressed size of each chunk in bytes
+    CHUNK_SIZE: ClassVar[int] = 64 * 1024 * 1024
+    # Compression level for zlib, or None to store the chunks uncompressed
+    COMPRESSION_LEVEL: ClassVar[Optional[int]] = 1
+    MAX_WORKERS: ClassVar[int] = 8
+
+    def load(self, data_type: Type[Any]) -> Any:
+        """Reads a numpy array.
+
+        Args:
+            data_type: The type of the data to read. If this is
+                `ChunkedArray`, a proxy is returned that only downloads chunks
+                when they are accessed.
+
+        Returns:
+            The numpy array.
+        """
+        manifest_file = os.path.join(self.uri, CHUNKED_MANIFEST_FILENAME)
+        if not self.artifact_store.exists(manifest_file):
+            return super().load(data_type)
+
+        with self.artifact_store.open(manifest_file, "r") as f:
+            manifest = json.loads(f.read())
+
+        array = ChunkedArray(
+            uri=self.uri,
+            manifest=manifest,
+            artifact_store=self.artifact_store,
+            max_workers=self.MAX_WORKERS,
+        )
+        if issubclass(data_type, ChunkedArray):
+            return array
+        return np.asarray(array)
+
+    def save(self, arr: "NDArray[Any]") -> None:
+        """Writes a numpy array in compressed chunks.
+
+        Args:
+            arr: The numpy array to write.
+        """
+        arr = np.asarray(arr)
+        if arr.dtype.hasobject or arr.ndim == 0:
+            super().save(arr)
+            return
+
+        row_size = max(arr[:1].nbytes, 1)
+        rows_per_chunk = max(self.CHUNK_SIZE // row_size, 1)
+        chunks = [
+            {
+                "file": f"chunk_{i:06d}.bin",
+                "offset": offset,
+                "rows": min(rows_per_chunk, len(arr) - offset),
+            }
+            for i, offset in enumerate(range(0, len(arr), rows_per_chunk))
+        ]
+
+        def _save_chunk(chunk: Dict[str, Any]) -> None:
+            start = chunk["offset"]
+            data = np.ascontiguousarray(
+                arr[start : start + chunk["rows"]]
+            ).tobytes()
+            if self.COMPRESSION_LEVEL is not None:
+                data = zlib.compress(data, self.COMPRESSION_LEVEL)
+            with self.artifact_store.open(
+                os.path.join(self.uri, chunk["file"]), "wb"
+            ) as f:
+                f.write(data)
+
+        if chunks:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_WORKERS, len(chunks))
+            ) as executor:
+                list(executor.map(_save_chunk, chunks))
+
+        manifest = {
+            "version": CHUNKED_FORMAT_VERSION,
+            "shape": list(arr.shape),
+            "dtype": arr.dtype.str,
+            "compression": (
+                "zlib" if self.COMPRESSION_LEVEL is not None else None
+            ),
+            "chunks": chunks,
+        }
+        # The manifest is written last so that incomplete arrays are never
+        # loaded as chunked arrays.
+        with self.artifact_store.open(
+            os.path.join(self.uri, CHUNKED_MANIFEST_FILENAME), "w"
+        ) as f:
+            f.write(json.dumps(manifest))
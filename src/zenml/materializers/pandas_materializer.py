@@ -13,9 +13,27 @@
 #  permissions and limitations under the License.
 """Materializer for Pandas."""
 
+import math
+import operator
 import os
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type, Union
-
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import numpy as np
 import pandas as pd
 
 from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
@@ -24,13 +42,500 @@ from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 logger = get_logger(__name__)
 
 PARQUET_FILENAME = "df.parquet.gzip"
 COMPRESSION_TYPE = "gzip"
 
+PARQUET_PARTITIONS_DIRECTORY = "df.parquet"
+PARQUET_PARTITION_FILENAME = "part-{:05d}.parquet"
+
 CSV_FILENAME = "df.csv"
 
+DEFAULT_BATCH_SIZE = 65536
+
+# Filters in disjunctive normal form, same as the `filters` argument of
+# `pyarrow.parquet.read_table`: Either a list of `(column, op, value)`
+# predicates that all need to match, or a list of such lists of which at
+# least one needs to match.
+FilterPredicate = Tuple[str, str, Any]
+Filters = Union[List[FilterPredicate], List[List[FilterPredicate]]]
+
+_COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _normalize_filters(
+    filters: Optional[Filters],
+) -> List[List[FilterPredicate]]:
+    """Converts filters to a list of conjunctions.
+
+    Args:
+        filters: The filters to normalize.
+
+    Returns:
+        A list of conjunctions of which at least one needs to match.
+
+    Raises:
+        ValueError: If the filters contain an unsupported operator.
+    """
+    if not filters:
+        return []
+
+    if isinstance(filters[0], tuple):
+        conjunctions = cast(List[List[FilterPredicate]], [filters])
+    else:
+        conjunctions = cast(List[List[FilterPredicate]], filters)
+
+    for conjunction in conjunctions:
+        for _, op, _ in conjunction:
+            if op not in _COMPARISON_OPERATORS and op not in ("in", "not in"):
+                raise ValueError(f"Unsupported filter operator `{op}`.")
+
+    return conjunctions
+
+
+def _predicate_may_match(
+    min_value: Any, max_value: Any, op: str, value: Any
+) -> bool:
+    """Checks whether a predicate can match values in a given range.
+
+    Args:
+        min_value: The minimum value of the column.
+        max_value: The maximum value of the column.
+        op: The operator of the predicate.
+        value: The value of the predicate.
+
+    Returns:
+        False if no value in the range matches the predicate, True otherwise.
+    """
+    try:
+        if op in ("=", "=="):
+            return bool(min_value <= value <= max_value)
+        elif op == "!=":
+            return not (min_value == max_value == value)
+        elif op == "<":
+            return bool(min_value < value)
+        elif op == "<=":
+            return bool(min_value <= value)
+        elif op == ">":
+            return bool(max_value > value)
+        elif op == ">=":
+            return bool(max_value >= value)
+        elif op == "in":
+            return any(min_value <= v <= max_value for v in value)
+    except TypeError:
+        pass
+    return True
+
+
+def _may_contain_matches(
+    statistics: Dict[str, Tuple[Any, Any]],
+    filters: List[List[FilterPredicate]],
+) -> bool:
+    """Checks whether a block of rows can contain rows matching filters.
+
+    Args:
+        statistics: The minimum and maximum value of the columns in the block.
+        filters: The normalized filters.
+
+    Returns:
+        False if the statistics guarantee that no row matches the filters,
+        True otherwise.
+    """
+    if not filters:
+        return True
+
+    return any(
+        all(
+            column not in statistics
+            or _predicate_may_match(*statistics[column], op, value)
+            for column, op, value in conjunction
+        )
+        for conjunction in filters
+    )
+
+
+def _filter_dataframe(
+    df: pd.DataFrame, filters: List[List[FilterPredicate]]
+) -> pd.DataFrame:
+    """Filters the rows of a dataframe.
+
+    Args:
+        df: The dataframe to filter.
+        filters: The normalized filters.
+
+    Returns:
+        The rows of the dataframe matching the filters.
+    """
+    if not filters:
+        return df
+
+    mask = pd.Series(False, index=df.index)
+    for conjunction in filters:
+        conjunction_mask = pd.Series(True, index=df.index)
+        for column, op, value in conjunction:
+            if op == "in":
+                conjunction_mask &= df[column].isin(value)
+            elif op == "not in":
+                conjunction_mask &= ~df[column].isin(value)
+            else:
+                conjunction_mask &= _COMPARISON_OPERATORS[op](
+                    df[column], value
+                )
+        mask |= conjunction_mask
+    return df[mask]
+
+
+class _RunningStatistics:
+    """Statistics of numeric columns computed in a single pass over chunks.
+
+    Means and variances of the chunks are combined using the parallel
+    algorithm by Chan et al., which is numerically stable.
+    """
+
+    def __init__(self, num_columns: int) -> None:
+        """Initializes the statistics.
+
+        Args:
+            num_columns: The number of columns.
+        """
+        self.count = np.zeros(num_columns)
+        self.mean = np.zeros(num_columns)
+        self.m2 = np.zeros(num_columns)
+        self.min = np.full(num_columns, np.nan)
+        self.max = np.full(num_columns, np.nan)
+
+    def update(self, values: "NDArray[np.float64]") -> None:
+        """Updates the statistics with a chunk of rows.
+
+        Args:
+            values: 2D array of the chunk values, with NaN for missing values.
+        """
+        if len(values) == 0:
+            return
+
+        count = np.count_nonzero(~np.isnan(values), axis=0)
+        mean = np.divide(
+            np.nansum(values, axis=0),
+            count,
+            out=np.zeros(len(count)),
+            where=count > 0,
+        )
+        m2 = np.nansum((values - mean) ** 2, axis=0)
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += np.divide(
+            delta * count, total, out=np.zeros(len(total)), where=total > 0
+        )
+        self.m2 += m2 + np.divide(
+            delta**2 * self.count * count,
+            total,
+            out=np.zeros(len(total)),
+            where=total > 0,
+        )
+        self.count = total
+        self.min = np.fmin(self.min, np.fmin.reduce(values, axis=0))
+        self.max = np.fmax(self.max, np.fmax.reduce(values, axis=0))
+
+    @property
+    def std(self) -> "NDArray[np.float64]":
+        """The sample standard deviation of each column.
+
+        Returns:
+            The standard deviations, NaN for columns with less than two values.
+        """
+        variance: "NDArray[np.float64]" = np.divide(
+            self.m2,
+            self.count - 1,
+            out=np.full(len(self.count), np.nan),
+            where=self.count > 1,
+        )
+        return np.sqrt(variance)
+
+
+class LazyDataFrame:
+    """Lazy handle to a dataframe stored by the `PandasMaterializer`.
+
+    Using this class as the type annotation of a step input (or passing it as
+    `data_type` to `load_artifact`) does not read the dataframe. Instead, the
+    data can be read partially by selecting columns, filtering rows and
+    limiting the number of rows. For data stored as parquet, columns that are
+    not selected are never read and row groups that can not contain any
+    matching rows are skipped based on their statistics.
+
+    Series are stored as a dataframe with a single `series` column.
+    """
+
+    def __init__(self, uri: str, artifact_store: BaseArtifactStore) -> None:
+        """Initializes the lazy dataframe.
+
+        Args:
+            uri: The URI of the artifact.
+            artifact_store: The artifact store where the artifact is stored.
+        """
+        self.uri = uri
+        self.artifact_store = artifact_store
+
+    @property
+    def _parquet_files(self) -> List[str]:
+        """The parquet files of the dataframe, in order.
+
+        Returns:
+            The paths of all parquet files or an empty list if the dataframe
+            is stored as a `.csv` file.
+        """
+        return _get_parquet_files(self.uri, self.artifact_store)
+
+    @property
+    def columns(self) -> List[str]:
+        """The column names of the dataframe.
+
+        Returns:
+            The column names.
+        """
+        parquet_files = self._parquet_files
+        if not parquet_files:
+            with self.artifact_store.open(
+                os.path.join(self.uri, CSV_FILENAME), mode="rb"
+            ) as f:
+                return [
+                    str(column)
+                    for column in pd.read_csv(f, index_col=0, nrows=0).columns
+                ]
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        with self.artifact_store.open(parquet_files[0], mode="rb") as f:
+            schema = pq.ParquetFile(f).schema_arrow
+        index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+        return [name for name in schema.names if name not in index_columns]
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+        nrows: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Reads (parts of) the dataframe into memory.
+
+        Args:
+            columns: The columns to read. If not given, all columns are read.
+            filters: Only read rows that match these filters. Uses the same
+                format as the `filters` argument of
+                `pyarrow.parquet.read_table`, e.g.
+                `[("year", ">=", 2020), ("country", "in", ["DE", "FR"])]`.
+            nrows: The maximum number of rows to read.
+
+        Returns:
+            The dataframe.
+        """
+        batch_size = DEFAULT_BATCH_SIZE
+        if nrows is not None:
+            batch_size = max(min(batch_size, nrows), 1)
+
+        batches = []
+        remaining = nrows
+        for batch in self.iter_batches(
+            columns=columns, filters=filters, batch_size=batch_size
+        ):
+            if remaining is not None:
+                batch = batch.iloc[:remaining]
+                remaining -= len(batch)
+            batches.append(batch)
+            if remaining is not None and remaining <= 0:
+                break
+
+        if not batches:
+            return self._empty_dataframe(columns)
+        return pd.concat(batches) if len(batches) > 1 else batches[0]
+
+    def iter_batches(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over the dataframe in batches.
+
+        Only a single batch is kept in memory at any time.
+
+        Args:
+            columns: The columns to read. If not given, all columns are read.
+            filters: Only read rows that match these filters. See `read` for
+                the format.
+            batch_size: The maximum number of rows of each batch.
+
+        Yields:
+            Dataframes with at most `batch_size` rows.
+        """
+        normalized_filters = _normalize_filters(filters)
+        parquet_files = self._parquet_files
+        if parquet_files:
+            for parquet_file in parquet_files:
+                yield from self._iter_parquet_batches(
+                    parquet_file,
+                    columns=columns,
+                    filters=normalized_filters,
+                    batch_size=batch_size,
+                )
+        else:
+            with self.artifact_store.open(
+                os.path.join(self.uri, CSV_FILENAME), mode="rb"
+            ) as f:
+                for batch in pd.read_csv(
+                    f, index_col=0, parse_dates=True, chunksize=batch_size
+                ):
+                    batch = _filter_dataframe(batch, normalized_filters)
+                    if columns is not None:
+                        batch = batch[list(columns)]
+                    if len(batch):
+                        yield batch
+
+    def _iter_parquet_batches(
+        self,
+        parquet_file: str,
+        columns: Optional[Sequence[str]],
+        filters: List[List[FilterPredicate]],
+        batch_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterates over the row groups of a parquet file in batches.
+
+        Args:
+            parquet_file: The path of the parquet file.
+            columns: The columns to read.
+            filters: The normalized filters.
+            batch_size: The maximum number of rows of each batch.
+
+        Yields:
+            Dataframes with at most `batch_size` rows.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        filter_columns = {column for c in filters for column, _, _ in c}
+        read_columns = None
+        if columns is not None:
+            # Filters are applied after reading a batch, so we need to read
+            # the filtered columns as well
+            read_columns = list(columns) + sorted(
+                filter_columns.difference(columns)
+            )
+        expression = pq.filters_to_expression(filters) if filters else None
+
+        with self.artifact_store.open(parquet_file, mode="rb") as f:
+            file = pq.ParquetFile(f)
+            for i in range(file.metadata.num_row_groups):
+                if not _may_contain_matches(
+                    _get_row_group_statistics(
+                        file.metadata.row_group(i), filter_columns
+                    ),
+                    filters,
+                ):
+                    continue
+
+                for record_batch in file.iter_batches(
+                    batch_size=batch_size,
+                    row_groups=[i],
+                    columns=read_columns,
+                    use_pandas_metadata=True,
+                ):
+                    table = pa.Table.from_batches([record_batch])
+                    if expression is not None:
+                        table = table.filter(expression)
+                    if table.num_rows == 0:
+                        continue
+                    batch = table.to_pandas()
+                    if columns is not None:
+                        batch = batch[list(columns)]
+                    yield batch
+
+    def _empty_dataframe(
+        self, columns: Optional[Sequence[str]]
+    ) -> pd.DataFrame:
+        """Creates an empty dataframe with the requested columns.
+
+        Args:
+            columns: The requested columns.
+
+        Returns:
+            The empty dataframe.
+        """
+        return pd.DataFrame(
+            columns=list(columns) if columns is not None else self.columns
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the lazy dataframe.
+
+        Returns:
+            The string representation.
+        """
+        return f"LazyDataFrame(uri={self.uri!r})"
+
+
+def _get_parquet_files(
+    uri: str, artifact_store: BaseArtifactStore
+) -> List[str]:
+    """Gets the parquet files in which a dataframe is stored.
+
+    Args:
+        uri: The URI of the artifact.
+        artifact_store: The artifact store where the artifact is stored.
+
+    Returns:
+        The paths of all parquet files in order, or an empty list if the
+        dataframe is not stored as parquet.
+    """
+    partitions_dir = os.path.join(uri, PARQUET_PARTITIONS_DIRECTORY)
+    if artifact_store.isdir(partitions_dir):
+        return [
+            os.path.join(partitions_dir, filename)
+            for filename in sorted(
+                str(f) for f in artifact_store.listdir(partitions_dir)
+            )
+        ]
+
+    parquet_path = os.path.join(uri, PARQUET_FILENAME)
+    if artifact_store.exists(parquet_path):
+        return [parquet_path]
+
+    return []
+
+
+def _get_row_group_statistics(
+    row_group: Any, columns: AbstractSet[str]
+) -> Dict[str, Tuple[Any, Any]]:
+    """Gets the minimum and maximum values of columns in a parquet row group.
+
+    Args:
+        row_group: The metadata of the row group.
+        columns: The columns for which to get the statistics.
+
+    Returns:
+        The minimum and maximum values of all columns with statistics.
+    """
+    statistics = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if column.path_in_schema not in columns:
+            continue
+        stats = column.statistics
+        if stats is not None and stats.has_min_max:
+            statistics[column.path_in_schema] = (stats.min, stats.max)
+    return statistics
+
 
 class PandasMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
@@ -41,6 +546,16 @@ class PandasMaterializer(BaseMaterializer):
     )
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
 
+    # Number of rows per parquet row group. Smaller row groups allow skipping
+    # more data when reading filtered rows of the dataframe.
+    PARQUET_ROW_GROUP_SIZE: ClassVar[int] = 100_000
+    # Dataframes larger than this (in bytes of memory) are stored in multiple
+    # parquet files of roughly this size.
+    PARQUET_PARTITION_SIZE: ClassVar[int] = 1024 * 1024 * 1024
+    # Quantiles for the visualization are computed on a random sample of this
+    # many rows for larger dataframes. All other statistics are exact.
+    STATISTICS_SAMPLE_SIZE: ClassVar[int] = 1_000_000
+
     def __init__(
         self, uri: str, artifact_store: Optional[BaseArtifactStore] = None
     ):
@@ -51,8 +566,9 @@ class PandasMaterializer(BaseMaterializer):
             artifact_store: The artifact store where the artifact data is stored.
         """
         super().__init__(uri, artifact_store)
+        self._statistics: Optional[Tuple[int, pd.DataFrame]] = None
         try:
-            import pyarrow  # type: ignore # noqa
+            import pyarrow  # noqa
 
             self.pyarrow_exists = True
         except ImportError:
@@ -68,11 +584,31 @@ class PandasMaterializer(BaseMaterializer):
             self.parquet_path = os.path.join(self.uri, PARQUET_FILENAME)
             self.csv_path = os.path.join(self.uri, CSV_FILENAME)
 
-    def load(self, data_type: Type[Any]) -> Union[pd.DataFrame, pd.Series]:
+    @classmethod
+    def can_handle_type(cls, data_type: Type[Any]) -> bool:
+        """Whether the materializer can read/write a certain type.
+
+        Args:
+            data_type: The type to check.
+
+        Returns:
+            Whether the materializer can read/write the given type.
+        """
+        # `LazyDataFrame` is not an associated type as it can only be loaded,
+        # not saved.
+        return issubclass(data_type, LazyDataFrame) or super().can_handle_type(
+            data_type
+        )
+
+    def load(
+        self, data_type: Type[Any]
+    ) -> Union[pd.DataFrame, pd.Series, LazyDataFrame]:
         """Reads `pd.DataFrame` or `pd.Series` from a `.parquet` or `.csv` file.
 
         Args:
-            data_type: The type of the data to read.
+            data_type: The type of the data to read. If this is
+                `LazyDataFrame`, the data is not read but a handle is returned
+                that allows reading parts of the data.
 
         Raises:
             ImportError: If pyarrow or fastparquet is not installed.
@@ -80,12 +616,34 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             The pandas dataframe or series.
         """
-        if self.artifact_store.exists(self.parquet_path):
+        parquet_files = _get_parquet_files(self.uri, self.artifact_store)
+        if parquet_files and not self.pyarrow_exists:
+            raise ImportError(
+                "You have an old version of a `PandasMaterializer` "
+                "data artifact stored in the artifact store "
+                "as a `.parquet` file, which requires `pyarrow` "
+                "for reading, You can install `pyarrow` by running "
+                "'`pip install pyarrow fastparquet`'."
+            )
+
+        if issubclass(data_type, LazyDataFrame):
+            return LazyDataFrame(
+                uri=self.uri, artifact_store=self.artifact_store
+            )
+
+        if parquet_files:
             if self.pyarrow_exists:
-                with self.artifact_store.open(
-                    self.parquet_path, mode="rb"
-                ) as f:
-                    df = pd.read_parquet(f)
+                partitions = []
+                for parquet_file in parquet_files:
+                    with self.artifact_store.open(
+                        parquet_file, mode="rb"
+                    ) as f:
+                        partitions.append(pd.read_parquet(f))
+                df = (
+                    pd.concat(partitions)
+                    if len(partitions) > 1
+                    else partitions[0]
+                )
             else:
                 raise ImportError(
                     "You have an old version of a `PandasMaterializer` "
@@ -131,11 +689,51 @@ class PandasMaterializer(BaseMaterializer):
             df = df.to_frame(name="series")
 
         if self.pyarrow_exists:
-            with self.artifact_store.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
+            num_partitions = math.ceil(
+                df.memory_usage(index=True, deep=True).sum()
+                / self.PARQUET_PARTITION_SIZE
+            )
+            if num_partitions > 1:
+                self._save_partitioned_parquet(df, num_partitions)
+            else:
+                with self.artifact_store.open(
+                    self.parquet_path, mode="wb"
+                ) as f:
+                    df.to_parquet(
+                        f,
+                        compression=COMPRESSION_TYPE,
+                        row_group_size=self.PARQUET_ROW_GROUP_SIZE,
+                    )
+                    self._add_bytes_written(_get_position(f))
         else:
             with self.artifact_store.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
+                self._add_bytes_written(_get_position(f))
+
+    def _save_partitioned_parquet(
+        self, df: pd.DataFrame, num_partitions: int
+    ) -> None:
+        """Writes a pandas dataframe to multiple parquet files.
+
+        Args:
+            df: The pandas dataframe to write.
+            num_partitions: The number of files to write.
+        """
+        partitions_dir = os.path.join(self.uri, PARQUET_PARTITIONS_DIRECTORY)
+        self.artifact_store.makedirs(partitions_dir)
+
+        rows_per_partition = math.ceil(len(df) / num_partitions)
+        for i, start in enumerate(range(0, len(df), rows_per_partition)):
+            partition_path = os.path.join(
+                partitions_dir, PARQUET_PARTITION_FILENAME.format(i)
+            )
+            with self.artifact_store.open(partition_path, mode="wb") as f:
+                df.iloc[start : start + rows_per_partition].to_parquet(
+                    f,
+                    compression=COMPRESSION_TYPE,
+                    row_group_size=self.PARQUET_ROW_GROUP_SIZE,
+                )
+                self._add_bytes_written(_get_position(f))
 
     def save_visualizations(
         self, df: Union[pd.DataFrame, pd.Series]
@@ -148,10 +746,16 @@ class PandasMaterializer(BaseMaterializer):
         Returns:
             A dictionary of visualization URIs and their types.
         """
+        describe = self._get_statistics(df)
+        if describe.empty:
+            # No numeric columns, describe the non-numeric columns instead
+            describe = df.describe()
+
         describe_uri = os.path.join(self.uri, "describe.csv")
         describe_uri = describe_uri.replace("\\", "/")
         with self.artifact_store.open(describe_uri, mode="wb") as f:
-            df.describe().to_csv(f)
+            describe.to_csv(f)
+            self._add_bytes_written(_get_position(f))
         return {describe_uri: VisualizationType.CSV}
 
     def extract_metadata(
@@ -166,27 +770,92 @@ class PandasMaterializer(BaseMaterializer):
             The extracted metadata as a dictionary.
         """
         pandas_metadata: Dict[str, "MetadataType"] = {"shape": df.shape}
+        statistics = self._get_statistics(df)
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
-
+            if not statistics.empty:
+                for stat_name in ("mean", "std", "min", "max"):
+                    pandas_metadata[stat_name] = float(
+                        statistics.loc[stat_name].iloc[0]
+                    )
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
+            for stat_name in ("mean", "std", "min", "max"):
                 pandas_metadata[stat_name] = {
                     str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
+                    for key, value in statistics.loc[stat_name].items()
                 }
 
         return pandas_metadata
+
+    def _get_statistics(
+        self, df: Union[pd.DataFrame, pd.Series]
+    ) -> pd.DataFrame:
+        """Gets descriptive statistics of the numeric columns of a dataframe.
+
+        The statistics are computed only once per dataframe and shared between
+        the visualization and the metadata of the artifact. Count, mean,
+        standard deviation, minimum and maximum are computed in a single pass
+        over chunks of `PARQUET_ROW_GROUP_SIZE` rows. Quantiles are computed
+        on a sample of `STATISTICS_SAMPLE_SIZE` rows for larger dataframes.
+
+        Args:
+            df: The pandas dataframe or series.
+
+        Returns:
+            The statistics in the same format as `pd.DataFrame.describe()`.
+        """
+        if self._statistics is not None and self._statistics[0] == id(df):
+            return self._statistics[1]
+
+        frame = df.to_frame() if isinstance(df, pd.Series) else df
+        numeric_df = frame.select_dtypes(include=["number", "bool"])
+
+        running_statistics = _RunningStatistics(len(numeric_df.columns))
+        for start in range(0, len(numeric_df), self.PARQUET_ROW_GROUP_SIZE):
+            chunk = numeric_df.iloc[
+                start : start + self.PARQUET_ROW_GROUP_SIZE
+            ]
+            running_statistics.update(
+                chunk.to_numpy(dtype="float64", na_value=np.nan)
+            )
+
+        sample = numeric_df
+        if len(numeric_df) > self.STATISTICS_SAMPLE_SIZE:
+            sample = numeric_df.sample(
+                n=self.STATISTICS_SAMPLE_SIZE, random_state=0
+            )
+        quantiles = sample.astype("float64").quantile([0.25, 0.5, 0.75])
+
+        statistics = pd.DataFrame(
+            [
+                running_statistics.count,
+                running_statistics.mean,
+                running_statistics.std,
+                running_statistics.min,
+                *quantiles.to_numpy(),
+                running_statistics.max,
+            ],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            columns=numeric_df.columns,
+        )
+        self._statistics = (id(df), statistics)
+        return statistics
+
+
+def _get_position(f: Any) -> Optional[int]:
+    """Gets the current position in a file.
+
+    Args:
+        f: The file.
+
+    Returns:
+        The position, or None if it could not be determined.
+    """
+    try:
+        return int(f.tell())
+    except (AttributeError, OSError, ValueError):
+        return None
@@ -13,13 +13,18 @@
 #  permissions and limitations under the License.
 """Custom types that can be used as metadata of ZenML artifacts."""
 
+import json
 from typing import Any, Dict, List, Set, Tuple, Union
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
+from zenml.constants import TEXT_FIELD_MAX_LENGTH
+from zenml.logger import get_logger
 from zenml.utils.enum_utils import StrEnum
 
+logger = get_logger(__name__)
+
 
 class Uri(str):
     """Special string class to indicate a URI."""
@@ -203,3 +208,42 @@ def cast_to_metadata_type(
     metadata_type = metadata_enum_to_type_mapping[type_]
     typed_value = metadata_type(value)
     return typed_value  # type: ignore[no-any-return]
+
+
+def validate_metadata(
+    metadata: Dict[str, MetadataType],
+) -> Tuple[Dict[str, MetadataType], Dict[str, MetadataTypeEnum]]:
+    """Validate metadata and get the types of its values.
+
+    Metadata values that are too large to be stored in the database or that
+    are not of a supported type are skipped.
+
+    Args:
+        metadata: The metadata to validate.
+
+    Returns:
+        The valid metadata values and their types.
+    """
+    values: Dict[str, MetadataType] = {}
+    types: Dict[str, MetadataTypeEnum] = {}
+    for key, value in metadata.items():
+        # Skip metadata that is too large to be stored in the database.
+        if len(json.dumps(value)) > TEXT_FIELD_MAX_LENGTH:
+            logger.warning(
+                f"Metadata value for key '{key}' is too large to be "
+                "stored in the database. Skipping."
+            )
+            continue
+        # Skip metadata that is not of a supported type.
+        try:
+            metadata_type = get_metadata_type(value)
+        except ValueError as e:
+            logger.warning(
+                f"Metadata value for key '{key}' is not of a supported "
+                f"type. Skipping. Full error: {e}"
+            )
+            continue
+        values[key] = value
+        types[key] = metadata_type
+
+    return values, types
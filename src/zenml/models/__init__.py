@@ -281,6 +281,8 @@ from zenml.models.v2.core.stack import (
     StackResponseMetadata,
 )
 from zenml.models.v2.core.step_run import (
+    StepRunCacheLookupRequest,
+    StepRunOutputs,
     StepRunRequest,
     StepRunUpdate,
     StepRunFilter,
@@ -446,6 +448,7 @@ ServiceConnectorResponseBody.model_rebuild()
 ServiceConnectorResponseMetadata.model_rebuild()
 StackResponseBody.model_rebuild()
 StackResponseMetadata.model_rebuild()
+StepRunOutputs.model_rebuild()
 StepRunRequest.model_rebuild()
 StepRunResponseBody.model_rebuild()
 StepRunResponseMetadata.model_rebuild()
@@ -660,6 +663,8 @@ __all__ = [
     "StackResponse",
     "StackResponseBody",
     "StackResponseMetadata",
+    "StepRunCacheLookupRequest",
+    "StepRunOutputs",
     "StepRunRequest",
     "StepRunUpdate",
     "StepRunFilter",
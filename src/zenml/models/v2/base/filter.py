@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 """Base filter model definitions."""
 
+import base64
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import (
@@ -265,11 +267,13 @@ class BaseFilter(BaseModel):
         "sort_by",
         "page",
         "size",
+        "after",
+        "include_total",
         "logical_operator",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = ["include_total"]
 
     # List of fields that are wrapped with `fastapi.Query(default)` in API.
     API_MULTI_INPUT_PARAMS: ClassVar[List[str]] = []
@@ -291,6 +295,19 @@ class BaseFilter(BaseModel):
         le=PAGE_SIZE_MAXIMUM,
         description="Page size",
     )
+    after: Optional[str] = Field(
+        default=None,
+        description="Cursor from which to continue listing, as returned in "
+        "the `next_cursor` of the previous page. If set, the items are "
+        "fetched using keyset pagination and the total amount of items is "
+        "not counted.",
+    )
+    include_total: bool = Field(
+        default=True,
+        description="Whether to count the total amount of items. If "
+        "disabled, the total of the page only includes the items up to and "
+        "including the next page.",
+    )
 
     id: Optional[Union[UUID, str]] = Field(
         default=None,
@@ -402,6 +419,79 @@ class BaseFilter(BaseModel):
 
         return column, operator
 
+    @staticmethod
+    def encode_cursor(sort_value: Any, id: UUID) -> str:
+        """Encodes a cursor pointing to an item.
+
+        Args:
+            sort_value: The value of the sort column of the item.
+            id: The ID of the item.
+
+        Returns:
+            The opaque cursor.
+        """
+        if isinstance(sort_value, datetime):
+            sort_value = sort_value.isoformat()
+        elif isinstance(sort_value, UUID):
+            sort_value = str(sort_value)
+
+        data = json.dumps([sort_value, str(id)], default=str)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def generate_cursor_filter(
+        self, table: Type["AnySchema"]
+    ) -> "ColumnElement[bool]":
+        """Generate a filter selecting all items after the cursor.
+
+        Items are sorted by the sort column and their ID, so the filter
+        selects all items with a sort value after the one of the cursor and
+        the items with the same sort value but a larger ID.
+
+        Args:
+            table: The Table that is being queried from.
+
+        Returns:
+            The filter expression for the query.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        from sqlmodel import and_, or_
+
+        assert self.after is not None
+        try:
+            sort_value, id = json.loads(base64.urlsafe_b64decode(self.after))
+            id = UUID(id)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid pagination cursor: {self.after}")
+
+        column_name, operand = self.sorting_params
+        column = getattr(table, column_name)
+        id_column = getattr(table, "id")
+
+        if sort_value is not None:
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = None
+            if python_type is datetime:
+                sort_value = datetime.fromisoformat(sort_value)
+            elif python_type is UUID:
+                sort_value = UUID(sort_value)
+
+        # NULL values come first in ascending order and last in descending
+        # order
+        if sort_value is None:
+            same_value = and_(column.is_(None), id_column > id)
+            if operand == SorterOps.ASCENDING:
+                return or_(column.is_not(None), same_value)
+            return same_value
+
+        same_value = and_(column == sort_value, id_column > id)
+        if operand == SorterOps.ASCENDING:
+            return or_(column > sort_value, same_value)
+        return or_(column < sort_value, column.is_(None), same_value)
+
     def configure_rbac(
         self,
         authenticated_user_id: UUID,
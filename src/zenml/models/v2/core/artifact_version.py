@@ -20,16 +20,18 @@ from typing import (
     Dict,
     List,
     Optional,
+    Type,
     Union,
 )
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from zenml.config.source import Source, SourceWithValidator
 from zenml.constants import STR_FIELD_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
 from zenml.enums import ArtifactType, GenericFilterOps
 from zenml.logger import get_logger
+from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
 from zenml.model.model import Model
 from zenml.models.v2.base.filter import StrFilter
 from zenml.models.v2.base.scoped import (
@@ -64,11 +66,23 @@ logger = get_logger(__name__)
 class ArtifactVersionRequest(WorkspaceScopedRequest):
     """Request model for artifact versions."""
 
-    artifact_id: UUID = Field(
+    artifact_id: Optional[UUID] = Field(
+        default=None,
         title="ID of the artifact to which this version belongs.",
     )
-    version: Union[str, int] = Field(
-        title="Version of the artifact.", union_mode="left_to_right"
+    artifact_name: Optional[str] = Field(
+        default=None,
+        title="Name of the artifact to which this version belongs.",
+        description="Can be used instead of the artifact ID. The artifact "
+        "will be created if it does not exist yet.",
+        max_length=STR_FIELD_MAX_LENGTH,
+    )
+    version: Optional[Union[str, int]] = Field(
+        default=None,
+        title="Version of the artifact.",
+        description="If not set, the next auto-incremented version of the "
+        "artifact will be used.",
+        union_mode="left_to_right",
     )
     has_custom_name: bool = Field(
         title="Whether the name is custom (True) or auto-generated (False).",
@@ -88,6 +102,11 @@ class ArtifactVersionRequest(WorkspaceScopedRequest):
     data_type: SourceWithValidator = Field(
         title="Data type of the artifact.",
     )
+    content_hash: Optional[str] = Field(
+        title="Hash of the content of the artifact.",
+        default=None,
+        max_length=STR_FIELD_MAX_LENGTH,
+    )
     tags: Optional[List[str]] = Field(
         title="Tags of the artifact.",
         description="Should be a list of plain strings, e.g., ['tag1', 'tag2']",
@@ -96,6 +115,29 @@ class ArtifactVersionRequest(WorkspaceScopedRequest):
     visualizations: Optional[List["ArtifactVisualizationRequest"]] = Field(
         default=None, title="Visualizations of the artifact."
     )
+    metadata: Optional[Dict[str, MetadataType]] = Field(
+        default=None, title="Metadata of the artifact version."
+    )
+    metadata_types: Optional[Dict[str, MetadataTypeEnum]] = Field(
+        default=None, title="Types of the metadata of the artifact version."
+    )
+
+    @model_validator(mode="after")
+    def _validate_artifact(self) -> "ArtifactVersionRequest":
+        """Validates that the artifact of the version is specified.
+
+        Returns:
+            The validated request.
+
+        Raises:
+            ValueError: If neither the artifact ID nor name is specified.
+        """
+        if self.artifact_id is None and self.artifact_name is None:
+            raise ValueError(
+                "Either the artifact ID or name is required to create an "
+                "artifact version."
+            )
+        return self
 
     @field_validator("version")
     @classmethod
@@ -157,6 +199,10 @@ class ArtifactVersionResponseBody(WorkspaceScopedResponseBody):
         title="The ID of the pipeline run that generated this artifact version.",
         default=None,
     )
+    content_hash: Optional[str] = Field(
+        title="Hash of the content of the artifact.",
+        default=None,
+    )
 
     @field_validator("version")
     @classmethod
@@ -277,6 +323,15 @@ class ArtifactVersionResponse(
         """
         return self.get_body().producer_pipeline_run_id
 
+    @property
+    def content_hash(self) -> Optional[str]:
+        """The `content_hash` property.
+
+        Returns:
+            the value of the property.
+        """
+        return self.get_body().content_hash
+
     @property
     def artifact_store_id(self) -> Optional[UUID]:
         """The `artifact_store_id` property.
@@ -365,15 +420,20 @@ class ArtifactVersionResponse(
 
         return Client().get_pipeline_run(self.step.pipeline_run_id)
 
-    def load(self) -> Any:
+    def load(self, data_type: Optional[Type[Any]] = None) -> Any:
         """Materializes (loads) the data stored in this artifact.
 
+        Args:
+            data_type: The type as which to load the artifact. If not
+                provided, the artifact will be loaded as the type it was
+                saved as.
+
         Returns:
             The materialized data.
         """
         from zenml.artifacts.utils import load_artifact_from_response
 
-        return load_artifact_from_response(self)
+        return load_artifact_from_response(self, data_type=data_type)
 
     def download_files(self, path: str, overwrite: bool = False) -> None:
         """Downloads data for an artifact with no materializing.
@@ -473,6 +533,10 @@ class ArtifactVersionFilter(WorkspaceScopedTaggableFilter):
         default=None,
         description="Datatype of the artifact",
     )
+    content_hash: Optional[str] = Field(
+        default=None,
+        description="Hash of the content of the artifact",
+    )
     artifact_store_id: Optional[Union[UUID, str]] = Field(
         default=None,
         description="Artifact store for this artifact",
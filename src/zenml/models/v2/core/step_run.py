@@ -110,6 +110,17 @@ class StepRunRequest(WorkspaceScopedRequest):
     )
 
 
+class StepRunCacheLookupRequest(BaseModel):
+    """Request model to look up cached step runs for multiple cache keys."""
+
+    workspace: UUID = Field(
+        title="The workspace in which to look up the cached step runs."
+    )
+    cache_keys: List[str] = Field(
+        title="The cache keys for which to look up cached step runs.",
+    )
+
+
 # ------------------ Update Model ------------------
 
 
@@ -456,6 +467,18 @@ class StepRunResponse(
         return self.get_resources().model_version
 
 
+class StepRunOutputs(BaseModel):
+    """Outputs of a step run, used to resolve the inputs of later steps."""
+
+    id: UUID = Field(title="The ID of the step run.")
+    status: Optional[ExecutionStatus] = Field(
+        default=None, title="The status of the step run."
+    )
+    outputs: Dict[str, "ArtifactVersionResponse"] = Field(
+        title="The output artifact versions of the step run.",
+    )
+
+
 # ------------------ Filter Model ------------------
 
 
@@ -28,6 +28,7 @@ from zenml.utils.pydantic_utils import before_validator_handler
 if TYPE_CHECKING:
     from zenml.config.step_configurations import Step
     from zenml.models import PipelineDeploymentResponse
+    from zenml.orchestrators.cache_utils import CachedStep
 
 logger = get_logger(__name__)
 
@@ -183,17 +184,24 @@ class BaseOrchestrator(StackComponent, ABC):
 
         return result
 
-    def run_step(self, step: "Step") -> None:
+    def run_step(
+        self,
+        step: "Step",
+        cached_step: Optional["CachedStep"] = None,
+    ) -> None:
         """Runs the given step.
 
         Args:
             step: The step to run.
+            cached_step: An existing step run that was already looked up in
+                the cache for this step.
         """
         assert self._active_deployment
         launcher = StepLauncher(
             deployment=self._active_deployment,
             step=step,
             orchestrator_run_id=self.get_orchestrator_run_id(),
+            cached_step=cached_step,
         )
         launcher.launch()
 
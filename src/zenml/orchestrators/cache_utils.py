@@ -14,27 +14,51 @@
 """Utilities for caching."""
 
 import hashlib
-from typing import TYPE_CHECKING, Dict, Optional
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus, SorterOps
 from zenml.logger import get_logger
+from zenml.models import StepRunCacheLookupRequest
+from zenml.orchestrators import utils as orchestrator_utils
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from zenml.artifact_stores import BaseArtifactStore
     from zenml.config.step_configurations import Step
-    from zenml.models import StepRunResponse
+    from zenml.models import PipelineDeploymentResponse, StepRunResponse
 
 logger = get_logger(__name__)
 
 
+class CachedStep(NamedTuple):
+    """An existing step run that a step can reuse without running.
+
+    Attributes:
+        cache_key: The cache key that was used to look up the step run.
+        step_run: The existing step run with this cache key.
+    """
+
+    cache_key: str
+    step_run: "StepRunResponse"
+
+
 def generate_cache_key(
     step: "Step",
     input_artifact_ids: Dict[str, "UUID"],
     artifact_store: "BaseArtifactStore",
     workspace_id: "UUID",
+    input_artifact_content_hashes: Optional[Dict[str, Optional[str]]] = None,
 ) -> str:
     """Generates a cache key for a step run.
 
@@ -46,7 +70,8 @@ def generate_cache_key(
     - the artifact store ID and path,
     - the source code that defines the step,
     - the parameters of the step,
-    - the names and IDs of the input artifacts of the step,
+    - the names and IDs of the input artifacts of the step, or their content
+      hashes if content addressed caching is enabled for the step,
     - the names and source codes of the output artifacts of the step,
     - the source codes of the output materializers of the step.
     - additional custom caching parameters of the step.
@@ -56,6 +81,10 @@ def generate_cache_key(
         input_artifact_ids: The input artifact IDs for the step.
         artifact_store: The artifact store of the active stack.
         workspace_id: The ID of the active workspace.
+        input_artifact_content_hashes: The content hashes of the input
+            artifacts for the step. These are used instead of the IDs for all
+            input artifacts that have a content hash if content addressed
+            caching is enabled for the step.
 
     Returns:
         A cache key.
@@ -84,9 +113,14 @@ def generate_cache_key(
         hash_.update(str(value).encode())
 
     # Input artifacts
+    content_addressed = step.config.cache_settings.content_addressed
+    content_hashes = input_artifact_content_hashes or {}
     for name, artifact_version_id in input_artifact_ids.items():
         hash_.update(name.encode())
-        hash_.update(artifact_version_id.bytes)
+        if content_addressed and (content_hash := content_hashes.get(name)):
+            hash_.update(f"content:{content_hash}".encode())
+        else:
+            hash_.update(artifact_version_id.bytes)
 
     # Output artifacts and materializers
     for name, output in step.config.outputs.items():
@@ -102,6 +136,33 @@ def generate_cache_key(
     return hash_.hexdigest()
 
 
+def requires_content_hashes(
+    step_name: str, deployment: "PipelineDeploymentResponse"
+) -> bool:
+    """Checks whether the outputs of a step need a content hash.
+
+    Content hashes are only used by steps with content addressed caching, so
+    they're computed if the step itself or any step that consumes its outputs
+    has content addressed caching enabled.
+
+    Args:
+        step_name: The name of the step.
+        deployment: The deployment that contains the step.
+
+    Returns:
+        Whether content hashes should be computed for the outputs of the step.
+    """
+    for name, step in deployment.step_configurations.items():
+        if not step.config.cache_settings.content_addressed:
+            continue
+        if name == step_name or any(
+            input_.step_name == step_name
+            for input_ in step.spec.inputs.values()
+        ):
+            return True
+    return False
+
+
 def get_cached_step_run(cache_key: str) -> Optional["StepRunResponse"]:
     """If a given step can be cached, get the corresponding existing step run.
 
@@ -127,3 +188,136 @@ def get_cached_step_run(cache_key: str) -> Optional["StepRunResponse"]:
     if cache_candidates:
         return cache_candidates[0]
     return None
+
+
+def get_cached_step_runs(
+    cache_keys: Iterable[str],
+) -> Dict[str, "StepRunResponse"]:
+    """Get the existing step runs for multiple cache keys in a single request.
+
+    Args:
+        cache_keys: The cache keys to look up.
+
+    Returns:
+        The existing step runs by cache key. Cache keys for which no step run
+        can be cached are not included.
+    """
+    client = Client()
+    return client.zen_store.get_cached_step_runs(
+        StepRunCacheLookupRequest(
+            workspace=client.active_workspace.id,
+            cache_keys=list(cache_keys),
+        )
+    )
+
+
+def get_cached_steps(
+    deployment: "PipelineDeploymentResponse",
+    artifact_store: "BaseArtifactStore",
+) -> Dict[str, CachedStep]:
+    """Finds the steps of a deployment that can be cached without running them.
+
+    A step can be cached upfront if caching is enabled for it, all its inputs
+    are outputs of other steps, and all its upstream steps can be cached
+    upfront as well. The cache keys of all steps of one level of the DAG are
+    looked up with a single request, which means the number of requests is
+    bounded by the depth of the cached part of the DAG.
+
+    Args:
+        deployment: The deployment for which to find the cached steps.
+        artifact_store: The artifact store of the stack the deployment runs on.
+
+    Returns:
+        The existing step runs that can be reused and their cache keys, by
+        step name.
+    """
+    if not any(
+        orchestrator_utils.is_setting_enabled(
+            is_enabled_on_step=step.config.enable_cache,
+            is_enabled_on_pipeline=deployment.pipeline_configuration.enable_cache,
+        )
+        for step in deployment.step_configurations.values()
+    ):
+        return {}
+
+    workspace_id = Client().active_workspace.id
+    cached_steps: Dict[str, CachedStep] = {}
+    resolved_steps: Set[str] = set()
+
+    while True:
+        step_names_by_cache_key: Dict[str, List[str]] = defaultdict(list)
+
+        for step_name, step in deployment.step_configurations.items():
+            if step_name in resolved_steps or not all(
+                upstream_step in resolved_steps
+                for upstream_step in step.spec.upstream_steps
+            ):
+                continue
+
+            if any(
+                upstream_step not in cached_steps
+                for upstream_step in step.spec.upstream_steps
+            ):
+                # At least one upstream step needs to run, which means this
+                # step needs to run as well.
+                resolved_steps.add(step_name)
+                continue
+
+            cache_enabled = orchestrator_utils.is_setting_enabled(
+                is_enabled_on_step=step.config.enable_cache,
+                is_enabled_on_pipeline=deployment.pipeline_configuration.enable_cache,
+            )
+            if (
+                not cache_enabled
+                or step.config.external_input_artifacts
+                or step.config.model_artifacts_or_metadata
+                or step.config.client_lazy_loaders
+            ):
+                # The inputs of these steps can only be resolved at runtime
+                resolved_steps.add(step_name)
+                continue
+
+            input_artifact_ids: Dict[str, "UUID"] = {}
+            input_artifact_content_hashes: Dict[str, Optional[str]] = {}
+            for name, input_ in step.spec.inputs.items():
+                upstream_outputs = cached_steps[
+                    input_.step_name
+                ].step_run.outputs
+                if input_.output_name not in upstream_outputs:
+                    resolved_steps.add(step_name)
+                    break
+                artifact = upstream_outputs[input_.output_name]
+                input_artifact_ids[name] = artifact.id
+                input_artifact_content_hashes[name] = artifact.content_hash
+            else:
+                cache_key = generate_cache_key(
+                    step=step,
+                    input_artifact_ids=input_artifact_ids,
+                    artifact_store=artifact_store,
+                    workspace_id=workspace_id,
+                    input_artifact_content_hashes=input_artifact_content_hashes,
+                )
+                step_names_by_cache_key[cache_key].append(step_name)
+
+        if not step_names_by_cache_key:
+            break
+
+        try:
+            cached_step_runs = get_cached_step_runs(step_names_by_cache_key)
+        except Exception as e:
+            # This can happen e.g. if the server does not support bulk cache
+            # lookups yet, in which case the steps will query the cache
+            # individually once they get launched.
+            logger.debug("Failed to look up cached steps: %s", e)
+            break
+
+        for cache_key, step_names in step_names_by_cache_key.items():
+            for step_name in step_names:
+                resolved_steps.add(step_name)
+                if cache_key in cached_step_runs:
+                    cached_steps[step_name] = CachedStep(
+                        cache_key=cache_key,
+                        step_run=cached_step_runs[cache_key],
+                    )
+
+    return cached_steps
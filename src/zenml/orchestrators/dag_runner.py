@@ -13,18 +13,35 @@
 #  permissions and limitations under the License.
 """DAG (Directed Acyclic Graph) Runners."""
 
-import threading
+import heapq
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from zenml.logger import get_logger
+from zenml.utils.enum_utils import StrEnum
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
 
-def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
+
+def reverse_dag(dag: Dict[T, List[T]]) -> Dict[T, List[T]]:
     """Reverse a DAG.
 
     Args:
@@ -33,7 +50,7 @@ def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     Returns:
         Adjacency list representation of the reversed DAG.
     """
-    reversed_dag = defaultdict(list)
+    reversed_dag: Dict[T, List[T]] = defaultdict(list)
 
     # Reverse all edges in the graph.
     for node, upstream_nodes in dag.items():
@@ -54,6 +71,59 @@ class NodeStatus(Enum):
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
+
+
+class FailurePolicy(StrEnum):
+    """Policy that defines how the DAG runner reacts to failed nodes.
+
+    `FAIL_FAST`: No new nodes are started once a node failed. Nodes that are
+        already running are waited for, all remaining nodes are skipped.
+    `CONTINUE`: Only the nodes downstream of a failed node are skipped, all
+        other nodes keep running.
+    """
+
+    FAIL_FAST = "fail_fast"
+    CONTINUE = "continue"
+
+
+def get_critical_path_lengths(dag: Dict[T, List[T]]) -> Dict[T, int]:
+    """Computes the length of the longest downstream path for each node.
+
+    The length of a path is the number of nodes it contains, which means
+    nodes without downstream nodes have a critical path length of 1. Nodes
+    that are part of a cycle are assigned a length of 0.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+
+    Returns:
+        The critical path length of each node.
+    """
+    reversed_dag = reverse_dag(dag)
+    num_pending_downstream = {
+        node: len(downstream_nodes)
+        for node, downstream_nodes in reversed_dag.items()
+    }
+    queue = deque(
+        node for node, count in num_pending_downstream.items() if count == 0
+    )
+    lengths: Dict[T, int] = {node: 0 for node in reversed_dag}
+
+    # Process nodes in reverse topological order, starting with the sinks.
+    while queue:
+        node = queue.popleft()
+        lengths[node] = 1 + max(
+            (lengths[downstream] for downstream in reversed_dag[node]),
+            default=0,
+        )
+        for upstream_node in dag.get(node, []):
+            num_pending_downstream[upstream_node] -= 1
+            if num_pending_downstream[upstream_node] == 0:
+                queue.append(upstream_node)
+
+    return lengths
 
 
 class ThreadedDagRunner:
@@ -63,7 +133,11 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes are scheduled from a ready queue onto a fixed pool of worker
+    threads. A node becomes ready once all its upstream nodes completed, and
+    ready nodes with the longest downstream path are started first. If
+    `run_fn` raises an exception, the node is marked as failed and its
+    downstream nodes are skipped.
     """
 
     def __init__(
@@ -71,6 +145,8 @@ class ThreadedDagRunner:
         dag: Dict[str, List[str]],
         run_fn: Callable[[str], Any],
         parallel_node_startup_waiting_period: float = 0.0,
+        max_concurrency: Optional[int] = None,
+        failure_policy: FailurePolicy = FailurePolicy.CONTINUE,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -81,7 +157,16 @@ class ThreadedDagRunner:
             run_fn: A function `run_fn(node)` that runs a single node
             parallel_node_startup_waiting_period: Delay in seconds to wait in
                 between starting parallel nodes.
+            max_concurrency: Maximum number of nodes to run at the same time.
+                If not set, all nodes that are ready will be run in parallel.
+            failure_policy: How to proceed once a node failed.
+
+        Raises:
+            ValueError: If `max_concurrency` is smaller than 1.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1.")
+
         self.parallel_node_startup_waiting_period = (
             parallel_node_startup_waiting_period
         )
@@ -90,7 +175,12 @@ class ThreadedDagRunner:
         self.run_fn = run_fn
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
+        self.max_concurrency = max_concurrency
+        self.failure_policy = failure_policy
+        self._priorities = get_critical_path_lengths(dag)
+        self._node_order = {node: i for i, node in enumerate(self.nodes)}
+        self._ready_queue: List[Tuple[int, int, str]] = []
+        self._last_node_start_time: Optional[float] = None
 
     def _can_run(self, node: str) -> bool:
         """Determine whether a node is ready to be run.
@@ -115,88 +205,122 @@ class ThreadedDagRunner:
 
         return True
 
-    def _run_node(self, node: str) -> None:
-        """Run a single node.
-
-        Calls the user-defined run_fn, then calls `self._finish_node`.
+    def _enqueue_if_ready(self, node: str) -> None:
+        """Adds a node to the ready queue if it can be run.
 
         Args:
             node: The node.
         """
-        self.run_fn(node)
-        self._finish_node(node)
-
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
+        if self._can_run(node):
+            heapq.heappush(
+                self._ready_queue,
+                (-self._priorities[node], self._node_order[node], node),
+            )
 
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+    def _start_node(
+        self, node: str, executor: ThreadPoolExecutor
+    ) -> "Future[Any]":
+        """Submits a node to the worker pool.
 
         Args:
             node: The node.
+            executor: The executor that runs the nodes.
 
         Returns:
-            The thread in which the node was run.
+            The future of the node run.
         """
-        # Update node status to running.
         assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
 
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
+        if (
+            self._last_node_start_time is not None
+            and self.parallel_node_startup_waiting_period > 0
+        ):
+            remaining_waiting_period = (
+                self.parallel_node_startup_waiting_period
+                - (time.time() - self._last_node_start_time)
+            )
+            if remaining_waiting_period > 0:
+                time.sleep(remaining_waiting_period)
+
+        self.node_states[node] = NodeStatus.RUNNING
+        self._last_node_start_time = time.time()
+        return executor.submit(self.run_fn, node)
+
+    def _skip_downstream_nodes(self, node: str) -> None:
+        """Marks all waiting nodes downstream of a node as skipped.
+
+        Args:
+            node: The node.
+        """
+        stack = list(self.reversed_dag[node])
+        while stack:
+            downstream_node = stack.pop()
+            if self.node_states[downstream_node] == NodeStatus.WAITING:
+                self.node_states[downstream_node] = NodeStatus.SKIPPED
+                logger.warning(
+                    f"Skipping node `{downstream_node}` because upstream "
+                    f"node `{node}` did not complete."
+                )
+                stack.extend(self.reversed_dag[downstream_node])
 
-    def _finish_node(self, node: str) -> None:
+    def _finish_node(self, node: str, future: "Future[Any]") -> None:
         """Finish a node run.
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+        Updates the node status depending on the result of the node run, then
+        either enqueues the downstream nodes that can now run or skips them.
 
         Args:
             node: The node.
+            future: The future of the node run.
         """
-        # Update node status to completed.
         assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
 
-        # Run downstream nodes.
-        threads: List[threading.Thread] = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                if threads and self.parallel_node_startup_waiting_period > 0:
-                    time.sleep(self.parallel_node_startup_waiting_period)
-
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
+        exception = future.exception()
+        if exception is None:
+            self.node_states[node] = NodeStatus.COMPLETED
+            for downstream_node in self.reversed_dag[node]:
+                self._enqueue_if_ready(downstream_node)
+            return
+
+        self.node_states[node] = NodeStatus.FAILED
+        logger.error(
+            f"Node `{node}` failed: {exception}",
+            exc_info=(type(exception), exception, exception.__traceback__),
+        )
+        self._skip_downstream_nodes(node)
 
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+        if self.failure_policy == FailurePolicy.FAIL_FAST:
+            self._ready_queue.clear()
+            for other_node, state in self.node_states.items():
+                if state == NodeStatus.WAITING:
+                    self.node_states[other_node] = NodeStatus.SKIPPED
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
-        The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        The order of execution is determined using topological sort, ready
+        nodes are prioritized by the length of their critical path. Nodes are
+        run in a pool of worker threads to enable parallelism.
+
+        Raises:
+            RuntimeError: If one or more nodes failed.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads: List[threading.Thread] = []
         for node in self.nodes:
-            if self._can_run(node):
-                if threads and self.parallel_node_startup_waiting_period > 0:
-                    time.sleep(self.parallel_node_startup_waiting_period)
+            self._enqueue_if_ready(node)
 
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
+        max_workers = self.max_concurrency or max(len(self.nodes), 1)
+        running: Dict["Future[Any]", str] = {}
 
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while self._ready_queue or running:
+                while self._ready_queue and len(running) < max_workers:
+                    _, _, node = heapq.heappop(self._ready_queue)
+                    future = self._start_node(node, executor=executor)
+                    running[future] = node
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish_node(running.pop(future), future=future)
 
         # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
@@ -206,3 +330,14 @@ class ThreadedDagRunner:
                     f"Node `{node}` was never run, because it was still"
                     f" waiting for the following nodes: `{upstream_nodes}`."
                 )
+
+        failed_nodes = [
+            node
+            for node, state in self.node_states.items()
+            if state == NodeStatus.FAILED
+        ]
+        if failed_nodes:
+            raise RuntimeError(
+                "The following nodes failed: "
+                f"{', '.join(str(node) for node in failed_nodes)}."
+            )
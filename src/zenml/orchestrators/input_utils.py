@@ -13,16 +13,111 @@
 #  permissions and limitations under the License.
 """Utilities for inputs."""
 
-from typing import TYPE_CHECKING, Dict, List, Tuple
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 from uuid import UUID
 
 from zenml.client import Client
 from zenml.config.step_configurations import Step
+from zenml.enums import ExecutionStatus
 from zenml.exceptions import InputResolutionError
-from zenml.utils import pagination_utils
+from zenml.models import StepRunOutputs
 
 if TYPE_CHECKING:
-    from zenml.models import ArtifactVersionResponse
+    from zenml.models import ArtifactVersionResponse, StepRunResponse
+
+# Outputs of the successful steps of the latest pipeline run in this process,
+# by pipeline run ID and step name. Steps that run in the same process as
+# their upstream steps (e.g. with the local orchestrator) use this to resolve
+# their inputs without querying the ZenML store. Steps might run in multiple
+# threads, so the index must only be accessed while holding the lock.
+_step_outputs_index: Dict[UUID, Dict[str, StepRunOutputs]] = {}
+_step_outputs_index_lock = threading.Lock()
+
+# Only the outputs of these steps don't change anymore
+_INDEXED_STEP_STATUSES = {ExecutionStatus.COMPLETED, ExecutionStatus.CACHED}
+
+
+def index_step_run(run_id: UUID, step_run: "StepRunResponse") -> None:
+    """Adds the outputs of a finished step run to the step index.
+
+    Args:
+        run_id: The ID of the pipeline run to which the step run belongs.
+        step_run: The finished step run.
+    """
+    _index_step_outputs(
+        run_id=run_id,
+        step_outputs={
+            step_run.name: StepRunOutputs(
+                id=step_run.id,
+                status=step_run.status,
+                outputs=step_run.outputs,
+            )
+        },
+    )
+
+
+def _index_step_outputs(
+    run_id: UUID, step_outputs: Dict[str, StepRunOutputs]
+) -> None:
+    """Adds step outputs to the step index.
+
+    The index only keeps the steps of a single pipeline run, adding steps of
+    a different run discards all previously indexed steps. Steps that are not
+    completed or cached are ignored, as their outputs might still change.
+
+    Args:
+        run_id: The ID of the pipeline run to which the steps belong.
+        step_outputs: The outputs by step name.
+    """
+    step_outputs = {
+        step_name: outputs
+        for step_name, outputs in step_outputs.items()
+        if outputs.status in _INDEXED_STEP_STATUSES
+    }
+    if not step_outputs:
+        return
+
+    with _step_outputs_index_lock:
+        if run_id not in _step_outputs_index:
+            _step_outputs_index.clear()
+
+        _step_outputs_index.setdefault(run_id, {}).update(step_outputs)
+
+
+def get_step_outputs(
+    run_id: UUID, step_names: Iterable[str]
+) -> Dict[str, StepRunOutputs]:
+    """Gets the outputs of steps of a pipeline run.
+
+    Only steps which are not in the step index yet are fetched from the
+    ZenML store.
+
+    Args:
+        run_id: The ID of the pipeline run.
+        step_names: The names of the steps for which to get the outputs.
+
+    Returns:
+        The outputs by step name. Steps that don't exist in the pipeline run
+        are not included.
+    """
+    step_names = set(step_names)
+    with _step_outputs_index_lock:
+        indexed_steps = _step_outputs_index.get(run_id, {})
+        step_outputs = {
+            step_name: indexed_steps[step_name]
+            for step_name in step_names
+            if step_name in indexed_steps
+        }
+
+    if missing_step_names := step_names - set(step_outputs):
+        fetched_step_outputs = Client().zen_store.get_run_step_outputs(
+            run_id=run_id, step_names=sorted(missing_step_names)
+        )
+        _index_step_outputs(run_id=run_id, step_outputs=fetched_step_outputs)
+        step_outputs.update(fetched_step_outputs)
+
+    return step_outputs
 
 
 def resolve_step_inputs(
@@ -47,12 +142,13 @@ def resolve_step_inputs(
     """
     from zenml.models import ArtifactVersionResponse, RunMetadataResponse
 
-    current_run_steps = {
-        run_step.name: run_step
-        for run_step in pagination_utils.depaginate(
-            Client().list_run_steps, pipeline_run_id=run_id
-        )
-    }
+    current_run_steps = get_step_outputs(
+        run_id=run_id,
+        step_names={
+            *(input_.step_name for input_ in step.spec.inputs.values()),
+            *step.spec.upstream_steps,
+        },
+    )
 
     input_artifacts: Dict[str, "ArtifactVersionResponse"] = {}
     for name, input_ in step.spec.inputs.items():
@@ -13,41 +13,65 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
+import os
+import subprocess
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
 from uuid import uuid4
 
+from pydantic import PositiveInt
+
+from zenml.constants import ENV_ZENML_CUSTOM_SOURCE_ROOT
+from zenml.entrypoints import StepEntrypointConfiguration
 from zenml.logger import get_logger
-from zenml.orchestrators import BaseOrchestrator
+from zenml.orchestrators import BaseOrchestrator, cache_utils
 from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import FailurePolicy, ThreadedDagRunner
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import source_utils, string_utils
 
 if TYPE_CHECKING:
     from zenml.models import PipelineDeploymentResponse
+    from zenml.orchestrators.cache_utils import CachedStep
 
 logger = get_logger(__name__)
 
+ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID = "ZENML_LOCAL_ORCHESTRATOR_RUN_ID"
+
 
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs all steps sequentially in the current
+    process. If `max_parallel_steps` is configured to a value larger than 1,
+    steps without dependencies on each other are run concurrently in separate
+    processes. This orchestrator does not support running on a schedule.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def config(self) -> "LocalOrchestratorConfig":
+        """Returns the `LocalOrchestratorConfig` config.
+
+        Returns:
+            The configuration.
+        """
+        return cast(LocalOrchestratorConfig, self._config)
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponse",
         stack: "Stack",
         environment: Dict[str, str],
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
+
+        Steps are executed sequentially in the current process, unless the
+        orchestrator is configured to run multiple steps in parallel.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -65,7 +89,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step_name, step in deployment.step_configurations.items():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -75,16 +98,110 @@ class LocalOrchestrator(BaseOrchestrator):
                     step_name,
                 )
 
-            self.run_step(
-                step=step,
-            )
+        try:
+            if self.config.max_parallel_steps > 1:
+                # Looking up the cached steps upfront only pays off if it
+                # saves starting separate processes. Sequentially executed
+                # steps query the cache themselves when they get launched.
+                cached_steps = cache_utils.get_cached_steps(
+                    deployment=deployment, artifact_store=stack.artifact_store
+                )
+                self._run_steps_in_parallel(
+                    deployment=deployment,
+                    environment=environment,
+                    cached_steps=cached_steps,
+                )
+            else:
+                for step in deployment.step_configurations.values():
+                    self.run_step(step=step)
+        finally:
+            self._orchestrator_run_id = None
 
         run_duration = time.time() - start_time
         logger.info(
             "Pipeline run has finished in `%s`.",
             string_utils.get_human_readable_time(run_duration),
         )
-        self._orchestrator_run_id = None
+
+    def _run_steps_in_parallel(
+        self,
+        deployment: "PipelineDeploymentResponse",
+        environment: Dict[str, str],
+        cached_steps: Dict[str, "CachedStep"],
+    ) -> None:
+        """Runs the steps of a deployment in parallel separate processes.
+
+        Each step is run using the step entrypoint configuration, which means
+        that caching, input resolution and status publishing behave exactly
+        the same as for sequentially executed steps. A step only starts once
+        all its upstream steps finished successfully.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            environment: Environment variables to set in the step processes.
+            cached_steps: Existing step runs by step name for all steps
+                that can be cached without running them.
+        """
+        assert self._orchestrator_run_id
+
+        # Cached steps don't run any user code, so there is no need to start a
+        # separate process for them.
+        for step_name, step in deployment.step_configurations.items():
+            if step_name in cached_steps:
+                self.run_step(step=step, cached_step=cached_steps[step_name])
+
+        command = StepEntrypointConfiguration.get_entrypoint_command()
+        source_root = source_utils.get_source_root()
+
+        step_environment = os.environ.copy()
+        step_environment.update(environment)
+        step_environment[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID] = (
+            self._orchestrator_run_id
+        )
+        step_environment[ENV_ZENML_CUSTOM_SOURCE_ROOT] = source_root
+
+        def _run_step_in_subprocess(step_name: str) -> None:
+            """Runs a single step in a separate process.
+
+            Args:
+                step_name: Name of the step to run.
+
+            Raises:
+                RuntimeError: If the step process exited with a non-zero
+                    exit code.
+            """
+            arguments = StepEntrypointConfiguration.get_entrypoint_arguments(
+                step_name=step_name, deployment_id=deployment.id
+            )
+            logger.info("Running step `%s` in a separate process.", step_name)
+            process = subprocess.run(
+                command + arguments,
+                env=step_environment,
+                cwd=source_root,
+            )
+            if process.returncode != 0:
+                raise RuntimeError(
+                    f"Step `{step_name}` failed with exit code "
+                    f"{process.returncode}."
+                )
+
+        pipeline_dag = {
+            step_name: [
+                upstream_step
+                for upstream_step in step.spec.upstream_steps
+                if upstream_step not in cached_steps
+            ]
+            for step_name, step in deployment.step_configurations.items()
+            if step_name not in cached_steps
+        }
+        # Fail fast to mirror the sequential execution, which stops at the
+        # first failed step.
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=_run_step_in_subprocess,
+            max_concurrency=self.config.max_parallel_steps,
+            failure_policy=FailurePolicy.FAIL_FAST,
+        ).run()
 
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
@@ -96,14 +213,28 @@ class LocalOrchestrator(BaseOrchestrator):
         Returns:
             The orchestrator run id.
         """
-        if not self._orchestrator_run_id:
-            raise RuntimeError("No run id set.")
+        if self._orchestrator_run_id:
+            return self._orchestrator_run_id
 
-        return self._orchestrator_run_id
+        # Steps that are running in a separate process launched by a parallel
+        # local orchestrator receive the run id as an environment variable
+        if ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID in os.environ:
+            return os.environ[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID]
+
+        raise RuntimeError("No run id set.")
 
 
 class LocalOrchestratorConfig(BaseOrchestratorConfig):
-    """Local orchestrator config."""
+    """Local orchestrator config.
+
+    Attributes:
+        max_parallel_steps: Maximum number of steps to run at the same time.
+            If set to a value larger than 1, steps that don't depend on each
+            other are run concurrently in separate processes. The default of 1
+            runs all steps sequentially in the current process.
+    """
+
+    max_parallel_steps: PositiveInt = 1
 
     @property
     def is_local(self) -> bool:
@@ -55,6 +55,7 @@ from zenml.stack import Stack
 from zenml.utils import string_utils
 
 if TYPE_CHECKING:
+    from zenml.orchestrators.cache_utils import CachedStep
     from zenml.step_operators import BaseStepOperator
 
 logger = get_logger(__name__)
@@ -115,6 +116,7 @@ class StepLauncher:
         deployment: PipelineDeploymentResponse,
         step: Step,
         orchestrator_run_id: str,
+        cached_step: Optional["CachedStep"] = None,
     ):
         """Initializes the launcher.
 
@@ -122,6 +124,10 @@ class StepLauncher:
             deployment: The pipeline deployment.
             step: The step to launch.
             orchestrator_run_id: The orchestrator pipeline run id.
+            cached_step: An existing step run that was already looked up in
+                the cache for this step. If the cache key of the step matches
+                the cache key used for this lookup, the step run will be
+                reused instead of querying the cache again.
 
         Raises:
             RuntimeError: If the deployment has no associated stack.
@@ -129,6 +135,7 @@ class StepLauncher:
         self._deployment = deployment
         self._step = step
         self._orchestrator_run_id = orchestrator_run_id
+        self._cached_step = cached_step
 
         if not deployment.stack:
             raise RuntimeError(
@@ -226,7 +233,11 @@ class StepLauncher:
                     )
 
                 logger.info(f"Step `{self._step_name}` has started.")
-                if execution_needed:
+                if not execution_needed:
+                    input_utils.index_step_run(
+                        run_id=pipeline_run.id, step_run=step_run_response
+                    )
+                else:
                     retries = 0
                     last_retry = True
                     max_retries = (
@@ -386,6 +397,10 @@ class StepLauncher:
             input_artifact_ids=input_artifact_ids,
             artifact_store=self._stack.artifact_store,
             workspace_id=Client().active_workspace.id,
+            input_artifact_content_hashes={
+                input_name: artifact.content_hash
+                for input_name, artifact in input_artifacts.items()
+            },
         )
 
         step_run.inputs = input_artifact_ids
@@ -406,9 +421,17 @@ class StepLauncher:
 
         execution_needed = True
         if cache_enabled:
-            cached_step_run = cache_utils.get_cached_step_run(
-                cache_key=cache_key
-            )
+            cached_step_run: Optional[StepRunResponse] = None
+            if self._cached_step and self._cached_step.cache_key == cache_key:
+                # The input artifacts might differ from the ones of the
+                # cached step run, e.g. for content addressed caching, so
+                # the cache keys are compared instead.
+                cached_step_run = self._cached_step.step_run
+
+            if not cached_step_run:
+                cached_step_run = cache_utils.get_cached_step_run(
+                    cache_key=cache_key
+                )
             if cached_step_run:
                 logger.info(f"Using cached version of `{self._step_name}`.")
                 execution_needed = False
@@ -457,6 +480,9 @@ class StepLauncher:
             run_id=pipeline_run.id,
             step_run_id=step_run.id,
             force_write_logs=force_write_logs,
+            compute_content_hashes=cache_utils.requires_content_hashes(
+                step_name=self._step_name, deployment=self._deployment
+            ),
         )
 
         output_artifact_uris = output_utils.prepare_output_artifact_uris(
@@ -16,11 +16,15 @@
 
 import copy
 import inspect
-from contextlib import nullcontext
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -28,8 +32,10 @@ from typing import (
 )
 from uuid import UUID
 
+from zenml.artifacts.artifact_cache import load_with_artifact_cache
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
-from zenml.artifacts.utils import save_artifact
+from zenml.artifacts.utils import _store_artifact_data_and_prepare_request
+from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
 from zenml.constants import (
@@ -45,6 +51,7 @@ from zenml.model.utils import (
     link_step_artifacts_to_model,
 )
 from zenml.new.steps.step_context import StepContext, get_step_context
+from zenml.orchestrators.input_utils import index_step_run
 from zenml.orchestrators.publish_utils import (
     publish_step_run_metadata,
     publish_successful_step_run,
@@ -64,9 +71,12 @@ from zenml.utils import materializer_utils, source_utils
 from zenml.utils.typing_utils import get_origin, is_union
 
 if TYPE_CHECKING:
+    from zenml.artifact_stores import BaseArtifactStore
+    from zenml.config import OutputSavingSettings
     from zenml.config.source import Source
     from zenml.config.step_configurations import Step
     from zenml.models import (
+        ArtifactVersionRequest,
         ArtifactVersionResponse,
         PipelineRunResponse,
         StepRunResponse,
@@ -256,6 +266,8 @@ class StepRunner:
                             output_annotations=output_annotations,
                             artifact_metadata_enabled=artifact_metadata_enabled,
                             artifact_visualization_enabled=artifact_visualization_enabled,
+                            output_saving_settings=step_run_info.config.output_saving_settings,
+                            compute_content_hashes=step_run_info.compute_content_hashes,
                         )
                         link_step_artifacts_to_model(
                             artifact_version_ids=output_artifact_ids
@@ -270,10 +282,11 @@ class StepRunner:
                     StepContext._clear()  # Remove the step context singleton
 
             # Update the status and output artifacts of the step run.
-            publish_successful_step_run(
+            published_step_run = publish_successful_step_run(
                 step_run_id=step_run_info.step_run_id,
                 output_artifact_ids=output_artifact_ids,
             )
+            index_step_run(run_id=pipeline_run.id, step_run=published_step_run)
 
     def _load_step(self) -> "BaseStep":
         """Load the step instance.
@@ -452,9 +465,19 @@ class StepRunner:
                 artifact.materializer, expected_class=BaseMaterializer
             )
         )
-        materializer: BaseMaterializer = materializer_class(artifact.uri)
-        materializer.validate_type_compatibility(data_type)
-        return materializer.load(data_type=data_type)
+
+        def _load(
+            uri: str, artifact_store: Optional["BaseArtifactStore"]
+        ) -> Any:
+            materializer: BaseMaterializer = materializer_class(
+                uri, artifact_store
+            )
+            materializer.validate_type_compatibility(data_type)
+            return materializer.load(data_type=data_type)
+
+        return load_with_artifact_cache(
+            _load, artifact_version_id=artifact.id, uri=artifact.uri
+        )
 
     def _validate_outputs(
         self,
@@ -542,6 +565,8 @@ class StepRunner:
         output_annotations: Dict[str, OutputSignature],
         artifact_metadata_enabled: bool,
         artifact_visualization_enabled: bool,
+        output_saving_settings: Optional["OutputSavingSettings"] = None,
+        compute_content_hashes: bool = False,
     ) -> Dict[str, UUID]:
         """Stores the output artifacts of the step.
 
@@ -555,12 +580,16 @@ class StepRunner:
                 enabled.
             artifact_visualization_enabled: Whether artifact visualization is
                 enabled.
+            output_saving_settings: Settings that configure how the outputs
+                are saved.
+            compute_content_hashes: Whether to compute the content hashes of
+                the outputs for content addressed caching.
 
         Returns:
             The IDs of the published output artifacts.
         """
         step_context = get_step_context()
-        output_artifacts: Dict[str, UUID] = {}
+        output_kwargs: Dict[str, Dict[str, Any]] = {}
 
         for output_name, return_value in output_data.items():
             data_type = type(return_value)
@@ -621,22 +650,101 @@ class StepRunner:
             # Get full set of tags
             tags = step_context.get_output_tags(output_name)
 
-            artifact = save_artifact(
+            output_kwargs[output_name] = dict(
                 name=artifact_name,
                 data=return_value,
-                materializer=materializer_class,
+                materializer_class=materializer_class,
                 uri=uri,
-                extract_metadata=artifact_metadata_enabled,
-                include_visualizations=artifact_visualization_enabled,
+                store_metadata=artifact_metadata_enabled,
+                store_visualizations=artifact_visualization_enabled,
                 has_custom_name=has_custom_name,
                 version=version,
                 tags=tags,
-                user_metadata=user_metadata,
-                manual_save=False,
+                metadata=user_metadata,
+                compute_content_hash=compute_content_hashes,
             )
-            output_artifacts[output_name] = artifact.id
 
-        return output_artifacts
+        if not output_kwargs:
+            return {}
+
+        if (
+            output_saving_settings
+            and output_saving_settings.parallel
+            and len(output_kwargs) > 1
+        ):
+            artifact_requests = self._save_outputs_in_parallel(
+                output_kwargs=output_kwargs,
+                settings=output_saving_settings,
+            )
+        else:
+            artifact_requests = [
+                _store_artifact_data_and_prepare_request(**kwargs)
+                for kwargs in output_kwargs.values()
+            ]
+
+        # Publish all output artifacts in a single transaction
+        responses = Client().zen_store.batch_create_artifact_versions(
+            artifact_requests
+        )
+        return {
+            output_name: response.id
+            for output_name, response in zip(output_data, responses)
+        }
+
+    def _save_outputs_in_parallel(
+        self,
+        output_kwargs: Dict[str, Dict[str, Any]],
+        settings: "OutputSavingSettings",
+    ) -> List["ArtifactVersionRequest"]:
+        """Materializes the outputs of the step in a thread pool.
+
+        Args:
+            output_kwargs: Mapping of output names to the arguments to store
+                the output.
+            settings: The output saving settings of the step.
+
+        Raises:
+            BaseException: The exception raised while saving the first output
+                that failed. All failures are logged individually.
+
+        Returns:
+            The artifact version requests for the saved outputs, in the same
+            order as the outputs.
+        """
+        memory_budget = _MemoryBudget(limit=settings.memory_budget)
+
+        def _save(kwargs: Dict[str, Any]) -> "ArtifactVersionRequest":
+            with memory_budget.reserve(_estimate_memory_size(kwargs["data"])):
+                return _store_artifact_data_and_prepare_request(**kwargs)
+
+        max_workers = min(
+            settings.max_workers or len(output_kwargs), len(output_kwargs)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                output_name: executor.submit(_save, kwargs)
+                for output_name, kwargs in output_kwargs.items()
+            }
+
+        artifact_requests = []
+        errors: Dict[str, BaseException] = {}
+        for output_name, future in futures.items():
+            error = future.exception()
+            if error:
+                logger.error(
+                    "Failed to save output artifact `%s` of step `%s`: %s",
+                    output_name,
+                    self._step.config.name,
+                    error,
+                )
+                errors[output_name] = error
+            else:
+                artifact_requests.append(future.result())
+
+        if errors:
+            raise next(iter(errors.values()))
+
+        return artifact_requests
 
     def _prepare_model_context_for_step(self) -> None:
         try:
@@ -672,3 +780,68 @@ class StepRunner:
                 f"Failed to load hook source with exception: '{hook_source}': "
                 f"{e}"
             )
+
+
+class _MemoryBudget:
+    """Limits the memory size of objects that are processed concurrently."""
+
+    def __init__(self, limit: Optional[int] = None) -> None:
+        """Initializes the memory budget.
+
+        Args:
+            limit: The maximum total size in bytes. If not set, the budget
+                is unlimited.
+        """
+        self._limit = limit
+        self._used = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def reserve(self, size: int) -> Iterator[None]:
+        """Reserves part of the memory budget.
+
+        Blocks until enough of the budget is available. Reservations that
+        exceed the entire budget wait until nothing else is reserved.
+
+        Args:
+            size: The size in bytes to reserve.
+
+        Yields:
+            None.
+        """
+        if self._limit is None:
+            yield
+            return
+
+        limit = self._limit
+        size = min(size, limit)
+        with self._condition:
+            self._condition.wait_for(lambda: self._used + size <= limit)
+            self._used += size
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._used -= size
+                self._condition.notify_all()
+
+
+def _estimate_memory_size(data: Any) -> int:
+    """Estimates the in-memory size of an object.
+
+    Args:
+        data: The object.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    # Arrays and tensors expose the size of their data buffer, whereas
+    # `sys.getsizeof` might only include the size of the object header.
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    try:
+        return sys.getsizeof(data)
+    except TypeError:
+        return 0
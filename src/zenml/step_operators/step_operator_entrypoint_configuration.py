@@ -22,7 +22,7 @@ from zenml.entrypoints.step_entrypoint_configuration import (
     STEP_NAME_OPTION,
     StepEntrypointConfiguration,
 )
-from zenml.orchestrators import input_utils, output_utils
+from zenml.orchestrators import cache_utils, input_utils, output_utils
 from zenml.orchestrators.step_runner import StepRunner
 
 if TYPE_CHECKING:
@@ -87,6 +87,10 @@ class StepOperatorEntrypointConfiguration(StepEntrypointConfiguration):
             run_id=pipeline_run.id,
             step_run_id=step_run_id,
             force_write_logs=lambda: None,
+            compute_content_hashes=cache_utils.requires_content_hashes(
+                step_name=self.entrypoint_args[STEP_NAME_OPTION],
+                deployment=deployment,
+            ),
         )
 
         stack = Client().active_stack
@@ -0,0 +1,151 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility classes for in-memory caching."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe in-memory cache that evicts the least recently used items.
+
+    Only use this to cache values that never change for a given key, or
+    configure a `ttl` to bound how long a cached value might be outdated.
+    Values can only be invalidated by removing them explicitly.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of items in the cache.
+            ttl: Optional number of seconds after which a cached item
+                expires.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: "OrderedDict[K, Tuple[V, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _get(self, key: K) -> Tuple[bool, Optional[V]]:
+        """Gets a value from the cache while holding the lock.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            Whether the key is cached and the cached value.
+        """
+        if key not in self._items:
+            return False, None
+
+        value, expires_at = self._items[key]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._items[key]
+            return False, None
+
+        self._items.move_to_end(key)
+        return True, value
+
+    def get(self, key: K) -> Optional[V]:
+        """Gets a value from the cache.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The cached value or None if the key is not in the cache.
+        """
+        with self._lock:
+            return self._get(key)[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Stores a value in the cache.
+
+        Args:
+            key: The key of the value.
+            value: The value to store.
+        """
+        if self.maxsize <= 0:
+            return
+
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = time.monotonic() + self.ttl
+
+        with self._lock:
+            self._items[key] = (value, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_create(self, key: K, create: Callable[[], V]) -> V:
+        """Gets a value from the cache, creating it if necessary.
+
+        Args:
+            key: The key of the value.
+            create: Function to create the value if it is not in the cache.
+                This is called without holding a lock, so concurrent calls
+                for the same key might create the value multiple times.
+
+        Returns:
+            The cached or created value.
+        """
+        with self._lock:
+            found, value = self._get(key)
+            if found:
+                return value  # type: ignore[return-value]
+
+        value = create()
+        self.set(key, value)
+        return value
+
+    def remove(self, key: K) -> None:
+        """Removes a value from the cache if it exists.
+
+        Args:
+            key: The key of the value to remove.
+        """
+        with self._lock:
+            self._items.pop(key, None)
+
+    def remove_if(self, predicate: Callable[[K], bool]) -> None:
+        """Removes all values whose key matches a predicate.
+
+        Args:
+            predicate: Function that returns True for all keys to remove.
+        """
+        with self._lock:
+            for key in [key for key in self._items if predicate(key)]:
+                del self._items[key]
+
+    def clear(self) -> None:
+        """Removes all values from the cache."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        """Gets the number of cached values.
+
+        Returns:
+            The number of cached values.
+        """
+        return len(self._items)
@@ -16,14 +16,15 @@
 import fnmatch
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
 import click
 
 from zenml.constants import APP_NAME, ENV_ZENML_CONFIG_PATH, REMOTE_FS_PREFIX
 from zenml.io.fileio import (
+    DEFAULT_TRANSFER_MAX_WORKERS,
     convert_to_str,
-    copy,
+    copy_files,
     exists,
     isdir,
     listdir,
@@ -97,7 +98,10 @@ def read_file_contents_as_string(file_path: str) -> str:
 
 
 def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    max_workers: int = DEFAULT_TRANSFER_MAX_WORKERS,
 ) -> None:
     """Copies dir from source to destination.
 
@@ -105,23 +109,31 @@ def copy_dir(
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
+        max_workers: The maximum number of files to copy concurrently.
     """
-    for source_file in listdir(source_dir):
-        source_path = os.path.join(source_dir, convert_to_str(source_file))
-        destination_path = os.path.join(
-            destination_dir, convert_to_str(source_file)
-        )
-        if isdir(source_path):
-            if source_path == destination_dir:
-                # if the destination is a subdirectory of the source, we skip
-                # copying it to avoid an infinite loop.
-                continue
-            copy_dir(source_path, destination_path, overwrite)
-        else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
+    files: List[Tuple[str, str]] = []
+
+    def _collect_files(source: str, destination: str) -> None:
+        for source_file in listdir(source):
+            source_path = os.path.join(source, convert_to_str(source_file))
+            destination_path = os.path.join(
+                destination, convert_to_str(source_file)
             )
-            copy(str(source_path), str(destination_path), overwrite)
+            if isdir(source_path):
+                if source_path == destination_dir:
+                    # if the destination is a subdirectory of the source, we
+                    # skip copying it to avoid an infinite loop.
+                    continue
+                _collect_files(source_path, destination_path)
+            else:
+                files.append((source_path, destination_path))
+
+    _collect_files(source_dir, destination_dir)
+
+    for directory in {os.path.dirname(dst) for _, dst in files}:
+        create_dir_recursive_if_not_exists(directory)
+
+    copy_files(files, overwrite=overwrite, max_workers=max_workers)
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
@@ -13,9 +13,10 @@
 #  permissions and limitations under the License.
 """Pagination utilities."""
 
-from typing import Any, Callable, List, TypeVar
+import inspect
+from typing import Any, Callable, Dict, List, TypeVar
 
-from zenml.models import BaseIdentifiedResponse, Page
+from zenml.models import BaseFilter, BaseIdentifiedResponse, Page
 
 AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
 
@@ -25,6 +26,10 @@ def depaginate(
 ) -> List[AnyResponse]:
     """Depaginate the results from a client or store method that returns pages.
 
+    If possible, the subsequent pages are fetched using the cursor returned
+    with each page instead of the page number, which avoids counting the
+    total amount of items and scanning all previous items for each page.
+
     Args:
         list_method: The list method to depaginate.
         **kwargs: Arguments for the list method.
@@ -32,10 +37,35 @@ def depaginate(
     Returns:
         A list of the corresponding Response Models.
     """
+    # Store methods receive a filter model, client methods receive the
+    # filter and pagination values as separate arguments
+    filter_model_arg = next(
+        (
+            key
+            for key, value in kwargs.items()
+            if isinstance(value, BaseFilter)
+        ),
+        None,
+    )
+    supports_cursor = (
+        filter_model_arg is not None
+        or "after" in inspect.signature(list_method).parameters
+    )
+
     page = list_method(**kwargs)
     items = list(page.items)
     while page.index < page.total_pages:
-        kwargs["page"] = page.index + 1
+        update: Dict[str, Any] = {"page": page.index + 1}
+        if supports_cursor and page.next_cursor:
+            update["after"] = page.next_cursor
+
+        if filter_model_arg:
+            kwargs[filter_model_arg] = kwargs[filter_model_arg].model_copy(
+                update=update
+            )
+        else:
+            kwargs.update(update)
+
         page = list_method(**kwargs)
         items += list(page.items)
 
@@ -16,7 +16,12 @@
 import re
 from typing import TYPE_CHECKING, Dict, Sequence, Type
 
-from zenml.config.constants import DOCKER_SETTINGS_KEY, RESOURCE_SETTINGS_KEY
+from zenml.config.constants import (
+    CACHE_SETTINGS_KEY,
+    DOCKER_SETTINGS_KEY,
+    OUTPUT_SAVING_SETTINGS_KEY,
+    RESOURCE_SETTINGS_KEY,
+)
 from zenml.enums import StackComponentType
 
 if TYPE_CHECKING:
@@ -126,10 +131,17 @@ def get_general_settings() -> Dict[str, Type["BaseSettings"]]:
     Returns:
         Dictionary mapping general settings keys to their type.
     """
-    from zenml.config import DockerSettings, ResourceSettings
+    from zenml.config import (
+        CacheSettings,
+        DockerSettings,
+        OutputSavingSettings,
+        ResourceSettings,
+    )
 
     return {
+        CACHE_SETTINGS_KEY: CacheSettings,
         DOCKER_SETTINGS_KEY: DockerSettings,
+        OUTPUT_SAVING_SETTINGS_KEY: OutputSavingSettings,
         RESOURCE_SETTINGS_KEY: ResourceSettings,
     }
 
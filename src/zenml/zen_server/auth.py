@@ -14,7 +14,7 @@
 """Authentication module for ZenML server."""
 
 from contextvars import ContextVar
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Callable, Optional, Union
 from urllib.parse import urlencode
 from uuid import UUID
@@ -52,8 +52,14 @@ from zenml.models import (
     UserResponse,
     UserUpdate,
 )
+from zenml.zen_server.cache import CachedRBAC
 from zenml.zen_server.jwt import JWTToken
-from zenml.zen_server.utils import server_config, zen_store
+from zenml.zen_server.utils import (
+    auth_context_cache,
+    rbac,
+    server_config,
+    zen_store,
+)
 
 logger = get_logger(__name__)
 
@@ -152,14 +158,157 @@ def _fetch_and_verify_api_key(
         raise AuthorizationException(error)
 
     # Update the "last used" timestamp of the API key
-    store.update_internal_api_key(
-        api_key.id,
-        APIKeyInternalUpdate(update_last_login=True),
-    )
+    if _is_last_login_outdated(api_key.last_login):
+        store.update_internal_api_key(
+            api_key.id,
+            APIKeyInternalUpdate(update_last_login=True),
+        )
 
     return api_key
 
 
+def _is_last_login_outdated(last_login: Optional[datetime]) -> bool:
+    """Checks if the last login time of a device or API key needs an update.
+
+    The last login time is only updated once per configured interval, to
+    avoid a database write for each authenticated request.
+
+    Args:
+        last_login: The current last login time.
+
+    Returns:
+        Whether the last login time should be updated.
+    """
+    if last_login is None:
+        return True
+
+    interval = timedelta(seconds=server_config().last_login_update_interval)
+    return datetime.utcnow() - last_login >= interval
+
+
+def invalidate_auth_cache(
+    user_id: Optional[UUID] = None,
+    api_key_id: Optional[UUID] = None,
+    device_id: Optional[UUID] = None,
+) -> None:
+    """Removes cached authentication details of a user, API key or device.
+
+    This must be called whenever a user, service account, API key or device
+    is updated or deleted, so that the access tokens issued for them are
+    verified again.
+
+    Args:
+        user_id: The ID of the user or service account.
+        api_key_id: The ID of the API key.
+        device_id: The ID of the device.
+    """
+    auth_context_cache().invalidate(
+        user_id=user_id, api_key_id=api_key_id, device_id=device_id
+    )
+
+    if user_id and server_config().rbac_enabled:
+        rbac_implementation = rbac()
+        if isinstance(rbac_implementation, CachedRBAC):
+            rbac_implementation.invalidate(user_id)
+
+
+def _authenticate_access_token(
+    token: JWTToken, encoded_token: str
+) -> AuthContext:
+    """Verify the user, API key and device that an access token was issued for.
+
+    Args:
+        token: The decoded access token.
+        encoded_token: The encoded access token.
+
+    Returns:
+        The authentication context of the access token.
+
+    Raises:
+        AuthorizationException: If the user, API key or device is not valid.
+    """
+    try:
+        user_model = zen_store().get_user(
+            user_name_or_id=token.user_id, include_private=True
+        )
+    except KeyError:
+        error = (
+            f"Authentication error: error retrieving token account "
+            f"{token.user_id}"
+        )
+        logger.error(error)
+        raise AuthorizationException(error)
+
+    if not user_model.active:
+        error = (
+            f"Authentication error: account {user_model.name} is not active"
+        )
+        logger.error(error)
+        raise AuthorizationException(error)
+
+    api_key_model: Optional[APIKeyInternalResponse] = None
+    if token.api_key_id:
+        # The API token was generated from an API key. We still have to
+        # verify if the API key hasn't been deactivated or deleted in the
+        # meantime.
+        api_key_model = _fetch_and_verify_api_key(token.api_key_id)
+
+    device_model: Optional[OAuthDeviceInternalResponse] = None
+    if token.device_id:
+        # Access tokens that have been issued for a device are only valid
+        # for that device, so we need to check if the device ID matches any
+        # of the valid devices in the database.
+        try:
+            device_model = zen_store().get_internal_authorized_device(
+                device_id=token.device_id
+            )
+        except KeyError:
+            error = (
+                f"Authentication error: error retrieving token device "
+                f"{token.device_id}"
+            )
+            logger.error(error)
+            raise AuthorizationException(error)
+
+        if device_model.user is None or device_model.user.id != user_model.id:
+            error = (
+                f"Authentication error: device {token.device_id} "
+                f"does not belong to user {user_model.name}"
+            )
+            logger.error(error)
+            raise AuthorizationException(error)
+
+        if device_model.status != OAuthDeviceStatus.ACTIVE:
+            error = (
+                f"Authentication error: device {token.device_id} is not active"
+            )
+            logger.error(error)
+            raise AuthorizationException(error)
+
+        if device_model.expires and datetime.utcnow() >= device_model.expires:
+            error = (
+                f"Authentication error: device {token.device_id} has expired"
+            )
+            logger.error(error)
+            raise AuthorizationException(error)
+
+        if _is_last_login_outdated(device_model.last_login):
+            zen_store().update_internal_authorized_device(
+                device_id=device_model.id,
+                update=OAuthDeviceInternalUpdate(
+                    update_last_login=True,
+                ),
+            )
+
+    return AuthContext(
+        user=user_model,
+        access_token=token,
+        encoded_access_token=encoded_token,
+        device=device_model,
+        api_key=api_key_model,
+    )
+
+
 def authenticate_credentials(
     user_name_or_id: Optional[Union[str, UUID]] = None,
     password: Optional[str] = None,
@@ -243,94 +392,23 @@ def authenticate_credentials(
             logger.exception(error)
             raise AuthorizationException(error)
 
-        try:
-            user_model = zen_store().get_user(
-                user_name_or_id=decoded_token.user_id, include_private=True
+        cache = auth_context_cache()
+        auth_context = cache.get(decoded_token, access_token)
+        if (
+            auth_context
+            and auth_context.device
+            and auth_context.device.expires
+            and datetime.utcnow() >= auth_context.device.expires
+        ):
+            # The device expired after the context was cached, so we need to
+            # verify it again
+            auth_context = None
+
+        if auth_context is None:
+            auth_context = _authenticate_access_token(
+                token=decoded_token, encoded_token=access_token
             )
-        except KeyError:
-            error = (
-                f"Authentication error: error retrieving token account "
-                f"{decoded_token.user_id}"
-            )
-            logger.error(error)
-            raise AuthorizationException(error)
-
-        if not user_model.active:
-            error = (
-                f"Authentication error: account {user_model.name} is not "
-                f"active"
-            )
-            logger.error(error)
-            raise AuthorizationException(error)
-
-        api_key_model: Optional[APIKeyInternalResponse] = None
-        if decoded_token.api_key_id:
-            # The API token was generated from an API key. We still have to
-            # verify if the API key hasn't been deactivated or deleted in the
-            # meantime.
-            api_key_model = _fetch_and_verify_api_key(decoded_token.api_key_id)
-
-        device_model: Optional[OAuthDeviceInternalResponse] = None
-        if decoded_token.device_id:
-            # Access tokens that have been issued for a device are only valid
-            # for that device, so we need to check if the device ID matches any
-            # of the valid devices in the database.
-            try:
-                device_model = zen_store().get_internal_authorized_device(
-                    device_id=decoded_token.device_id
-                )
-            except KeyError:
-                error = (
-                    f"Authentication error: error retrieving token device "
-                    f"{decoded_token.device_id}"
-                )
-                logger.error(error)
-                raise AuthorizationException(error)
-
-            if (
-                device_model.user is None
-                or device_model.user.id != user_model.id
-            ):
-                error = (
-                    f"Authentication error: device {decoded_token.device_id} "
-                    f"does not belong to user {user_model.name}"
-                )
-                logger.error(error)
-                raise AuthorizationException(error)
-
-            if device_model.status != OAuthDeviceStatus.ACTIVE:
-                error = (
-                    f"Authentication error: device {decoded_token.device_id} "
-                    f"is not active"
-                )
-                logger.error(error)
-                raise AuthorizationException(error)
-
-            if (
-                device_model.expires
-                and datetime.utcnow() >= device_model.expires
-            ):
-                error = (
-                    f"Authentication error: device {decoded_token.device_id} "
-                    "has expired"
-                )
-                logger.error(error)
-                raise AuthorizationException(error)
-
-            zen_store().update_internal_authorized_device(
-                device_id=device_model.id,
-                update=OAuthDeviceInternalUpdate(
-                    update_last_login=True,
-                ),
-            )
-
-        auth_context = AuthContext(
-            user=user_model,
-            access_token=decoded_token,
-            encoded_access_token=access_token,
-            device=device_model,
-            api_key=api_key_model,
-        )
+            cache.set(decoded_token, access_token, auth_context)
 
     else:
         # IMPORTANT: the ONLY way we allow the authentication process to
@@ -522,8 +600,7 @@ def authenticate_external_user(external_access_token: str) -> AuthContext:
         )
     except Exception as e:
         logger.exception(
-            f"Error fetching user information from external authenticator: "
-            f"{e}"
+            f"Error fetching user information from external authenticator: {e}"
         )
         raise AuthorizationException(
             "Error fetching user information from external authenticator."
@@ -591,6 +668,7 @@ def authenticate_external_user(external_access_token: str) -> AuthContext:
                 is_admin=external_user.is_admin,
             ),
         )
+        invalidate_auth_cache(user_id=user.id)
     except KeyError:
         logger.info(
             f"External user with ID {external_user.id} not found in ZenML "
@@ -0,0 +1,422 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""In-memory caches for the ZenML server."""
+
+import hashlib
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from zenml.models import BaseIdentifiedResponse
+from zenml.utils.cache_utils import LRUCache
+from zenml.zen_server.rbac.models import Action, Resource
+from zenml.zen_server.rbac.rbac_interface import RBACInterface
+
+if TYPE_CHECKING:
+    from fastapi import Request, Response
+
+    from zenml.models import UserResponse
+    from zenml.zen_server.auth import AuthContext
+    from zenml.zen_server.jwt import JWTToken
+
+AnyResponse = TypeVar("AnyResponse", bound=BaseIdentifiedResponse)  # type: ignore[type-arg]
+
+ResponseCacheKey = Tuple[str, UUID, bool]
+AuthContextCacheKey = Tuple[UUID, Optional[UUID], Optional[UUID], str]
+PermissionCacheKey = Tuple[UUID, Resource, Action]
+
+
+class ResponseCache:
+    """Cache for responses of entities that don't change once they're created.
+
+    Responses are cached by entity type, ID and hydration flag. The cache is
+    local to each server process, so the entries of a deleted entity are
+    only removed from the process that handled the deletion. The TTL of the
+    cache bounds how long other processes might still return them, as well
+    as how outdated nested models of a cached response (e.g. the user or
+    pipeline of a deployment) might be.
+
+    Responses are cached before they're dehydrated, which means permissions
+    still need to be verified for each request.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of cached responses.
+            ttl: Optional number of seconds after which a cached response
+                expires.
+        """
+        self._cache: LRUCache[ResponseCacheKey, BaseIdentifiedResponse] = (  # type: ignore[type-arg]
+            LRUCache(maxsize=maxsize, ttl=ttl)
+        )
+
+    def get_or_fetch(
+        self,
+        response_type: Type[AnyResponse],
+        id: UUID,
+        hydrate: bool,
+        fetch: Callable[[], AnyResponse],
+        is_immutable: Optional[Callable[[AnyResponse], bool]] = None,
+    ) -> AnyResponse:
+        """Gets a cached response or fetches it.
+
+        Args:
+            response_type: The type of the response.
+            id: The ID of the entity.
+            hydrate: Whether the response is hydrated.
+            fetch: Function to fetch the response if it is not cached.
+            is_immutable: Optional function that decides whether a fetched
+                response will not change anymore and can therefore be cached.
+                If not given, all responses are cached.
+
+        Returns:
+            The cached or fetched response.
+        """
+        key = (response_type.__name__, id, hydrate)
+        response = self._cache.get(key)
+        if response is not None:
+            return cast(AnyResponse, response)
+
+        response = fetch()
+        if is_immutable is None or is_immutable(response):
+            self._cache.set(key, response)
+        return response
+
+    def cached(
+        self,
+        response_type: Type[AnyResponse],
+        get_method: Callable[..., AnyResponse],
+        is_immutable: Optional[Callable[[AnyResponse], bool]] = None,
+    ) -> Callable[..., AnyResponse]:
+        """Wraps a store method to get an entity with this cache.
+
+        Args:
+            response_type: The type of the response.
+            get_method: The store method to get the entity. It must accept
+                the entity ID and a `hydrate` keyword argument.
+            is_immutable: Optional function that decides whether a fetched
+                response will not change anymore and can therefore be cached.
+                If not given, all responses are cached.
+
+        Returns:
+            The wrapped method.
+        """
+
+        def _get(id: UUID, hydrate: bool = True) -> AnyResponse:
+            return self.get_or_fetch(
+                response_type=response_type,
+                id=id,
+                hydrate=hydrate,
+                fetch=lambda: get_method(id, hydrate=hydrate),
+                is_immutable=is_immutable,
+            )
+
+        return _get
+
+    def invalidate(
+        self,
+        response_type: Type[BaseIdentifiedResponse],  # type: ignore[type-arg]
+        id: Optional[UUID] = None,
+    ) -> None:
+        """Removes cached responses.
+
+        Args:
+            response_type: The type of the responses to remove.
+            id: The ID of the entity whose responses to remove. If not given,
+                all responses of the given type are removed.
+        """
+        type_name = response_type.__name__
+        if id:
+            for hydrate in (True, False):
+                self._cache.remove((type_name, id, hydrate))
+        else:
+            self._cache.remove_if(lambda key: key[0] == type_name)
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        self._cache.clear()
+
+
+class AuthContextCache:
+    """Cache for the authentication contexts of access tokens.
+
+    Access tokens are still decoded for each request, which verifies their
+    signature and expiration. The cache only saves the database queries and
+    writes required to validate the user, API key and device that a token
+    was issued for.
+
+    Cached contexts must be invalidated when their user, API key or device
+    changes. The TTL of the cache bounds how long other server processes,
+    which don't see these changes, might still accept an access token.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of cached authentication contexts.
+            ttl: Optional number of seconds after which a cached
+                authentication context expires.
+        """
+        self._cache: LRUCache[AuthContextCacheKey, "AuthContext"] = LRUCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    @staticmethod
+    def _get_key(token: "JWTToken", encoded_token: str) -> AuthContextCacheKey:
+        """Gets the cache key for an access token.
+
+        Args:
+            token: The decoded access token.
+            encoded_token: The encoded access token.
+
+        Returns:
+            The cache key.
+        """
+        return (
+            token.user_id,
+            token.api_key_id,
+            token.device_id,
+            encoded_token,
+        )
+
+    def get(
+        self, token: "JWTToken", encoded_token: str
+    ) -> Optional["AuthContext"]:
+        """Gets the cached authentication context of an access token.
+
+        Args:
+            token: The decoded access token.
+            encoded_token: The encoded access token.
+
+        Returns:
+            The cached authentication context or None if the token is not
+            cached.
+        """
+        return self._cache.get(self._get_key(token, encoded_token))
+
+    def set(
+        self,
+        token: "JWTToken",
+        encoded_token: str,
+        auth_context: "AuthContext",
+    ) -> None:
+        """Caches the authentication context of an access token.
+
+        Args:
+            token: The decoded access token.
+            encoded_token: The encoded access token.
+            auth_context: The authentication context.
+        """
+        self._cache.set(self._get_key(token, encoded_token), auth_context)
+
+    def invalidate(
+        self,
+        user_id: Optional[UUID] = None,
+        api_key_id: Optional[UUID] = None,
+        device_id: Optional[UUID] = None,
+    ) -> None:
+        """Removes the cached authentication contexts of a user, key or device.
+
+        Args:
+            user_id: Remove all contexts of access tokens issued for this
+                user or service account.
+            api_key_id: Remove all contexts of access tokens issued for this
+                API key.
+            device_id: Remove all contexts of access tokens issued for this
+                device.
+        """
+        self._cache.remove_if(
+            lambda key: (
+                (user_id is not None and key[0] == user_id)
+                or (api_key_id is not None and key[1] == api_key_id)
+                or (device_id is not None and key[2] == device_id)
+            )
+        )
+
+    def clear(self) -> None:
+        """Removes all cached authentication contexts."""
+        self._cache.clear()
+
+
+class CachedRBAC(RBACInterface):
+    """RBAC implementation that caches the decisions of another one.
+
+    Permissions of a user are invalidated when their resource memberships are
+    updated through this server. Changes made elsewhere (e.g. in the RBAC
+    service itself) are picked up once the cached decisions expire.
+    """
+
+    def __init__(
+        self, rbac: RBACInterface, maxsize: int, ttl: Optional[float] = None
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            rbac: The RBAC implementation whose decisions to cache.
+            maxsize: The maximum number of cached decisions of each kind.
+            ttl: Optional number of seconds after which a cached decision
+                expires.
+        """
+        self._rbac = rbac
+        self._permissions: LRUCache[PermissionCacheKey, bool] = LRUCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._allowed_resource_ids: LRUCache[
+            PermissionCacheKey, Tuple[bool, List[str]]
+        ] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def check_permissions(
+        self, user: "UserResponse", resources: Set[Resource], action: Action
+    ) -> Dict[Resource, bool]:
+        """Checks if a user has permissions to perform an action on resources.
+
+        Args:
+            user: User which wants to access a resource.
+            resources: The resources the user wants to access.
+            action: The action that the user wants to perform on the resources.
+
+        Returns:
+            A dictionary mapping resources to a boolean which indicates whether
+            the user has permissions to perform the action on that resource.
+        """
+        permissions = {}
+        uncached_resources = set()
+        for resource in resources:
+            permission = self._permissions.get((user.id, resource, action))
+            if permission is None:
+                uncached_resources.add(resource)
+            else:
+                permissions[resource] = permission
+
+        if uncached_resources:
+            for resource, permission in self._rbac.check_permissions(
+                user=user, resources=uncached_resources, action=action
+            ).items():
+                self._permissions.set((user.id, resource, action), permission)
+                permissions[resource] = permission
+
+        return permissions
+
+    def list_allowed_resource_ids(
+        self, user: "UserResponse", resource: Resource, action: Action
+    ) -> Tuple[bool, List[str]]:
+        """Lists all resource IDs of a resource type that a user can access.
+
+        Args:
+            user: User which wants to access a resource.
+            resource: The resource the user wants to access.
+            action: The action that the user wants to perform on the resource.
+
+        Returns:
+            A tuple (full_resource_access, resource_ids).
+            `full_resource_access` will be `True` if the user can perform the
+            given action on any instance of the given resource type, `False`
+            otherwise. If `full_resource_access` is `False`, `resource_ids`
+            will contain the list of instance IDs that the user can perform
+            the action on.
+        """
+        full_resource_access, resource_ids = (
+            self._allowed_resource_ids.get_or_create(
+                (user.id, resource, action),
+                lambda: self._rbac.list_allowed_resource_ids(
+                    user=user, resource=resource, action=action
+                ),
+            )
+        )
+        return full_resource_access, list(resource_ids)
+
+    def update_resource_membership(
+        self, user: "UserResponse", resource: Resource, actions: List[Action]
+    ) -> None:
+        """Update the resource membership of a user.
+
+        Args:
+            user: User for which the resource membership should be updated.
+            resource: The resource.
+            actions: The actions that the user should be able to perform on the
+                resource.
+        """
+        self._rbac.update_resource_membership(
+            user=user, resource=resource, actions=actions
+        )
+        self.invalidate(user.id)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Removes all cached decisions for a user.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        self._permissions.remove_if(lambda key: key[0] == user_id)
+        self._allowed_resource_ids.remove_if(lambda key: key[0] == user_id)
+
+
+def compute_etag(model: BaseModel) -> str:
+    """Computes the ETag of a response model.
+
+    Args:
+        model: The response model.
+
+    Returns:
+        The ETag of the model.
+    """
+    digest = hashlib.sha256(model.model_dump_json().encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def verify_etag(
+    request: "Request", response: "Response", model: BaseModel
+) -> None:
+    """Sets the ETag header and checks it against the `If-None-Match` header.
+
+    Args:
+        request: The request.
+        response: The response.
+        model: The response model that will be returned.
+
+    Raises:
+        HTTPException: With status 304 if the client already has the current
+            version of the response.
+    """
+    from fastapi import HTTPException
+
+    etag = compute_etag(model)
+    if if_none_match := request.headers.get("If-None-Match"):
+        client_etags = set()
+        for value in if_none_match.split(","):
+            value = value.strip()
+            # `If-None-Match` uses the weak comparison, see RFC 7232
+            if value.startswith("W/"):
+                value = value[2:]
+            client_etags.add(value)
+
+        if etag in client_etags or "*" in client_etags:
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
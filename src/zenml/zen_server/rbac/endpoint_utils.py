@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """High-level helper functions to write endpoints with RBAC."""
 
-from typing import Any, Callable, TypeVar, Union
+from typing import Any, Callable, List, TypeVar, Union
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -96,6 +96,55 @@ def verify_permissions_and_create_entity(
     return created
 
 
+def verify_permissions_and_batch_create_entity(
+    batch: List[AnyRequest],
+    resource_type: ResourceType,
+    create_method: Callable[[List[AnyRequest]], List[AnyResponse]],
+) -> List[AnyResponse]:
+    """Verify permissions and create a batch of entities if authorized.
+
+    Args:
+        batch: The list of entities to create.
+        resource_type: The resource type of the entities to create.
+        create_method: The method to create the entities.
+
+    Raises:
+        IllegalOperationError: If any of the request models has a different
+            owner then the currently authenticated user.
+
+    Returns:
+        The created entities.
+    """
+    auth_context = get_auth_context()
+    assert auth_context
+
+    for request_model in batch:
+        if isinstance(request_model, UserScopedRequest):
+            if request_model.user != auth_context.user.id:
+                raise IllegalOperationError(
+                    f"Not allowed to create resource '{resource_type}' for a "
+                    "different user."
+                )
+    verify_permission(resource_type=resource_type, action=Action.CREATE)
+
+    needs_usage_increment = (
+        resource_type in REPORTABLE_RESOURCES
+        and resource_type not in REQUIRES_CUSTOM_RESOURCE_REPORTING
+    )
+    if needs_usage_increment:
+        # The entitlement check only verifies that a single entity can still
+        # be created, the usage of all entities is reported afterwards.
+        check_entitlement(resource_type)
+
+    created = create_method(batch)
+
+    if needs_usage_increment:
+        for entity in created:
+            report_usage(resource_type, resource_id=entity.id)
+
+    return created
+
+
 def verify_permissions_and_get_entity(
     id: UUIDOrStr,
     get_method: Callable[[UUIDOrStr], AnyResponse],
@@ -23,6 +23,7 @@ from zenml.models import (
     ArtifactRequest,
     ArtifactResponse,
     ArtifactUpdate,
+    ArtifactVersionResponse,
     Page,
 )
 from zenml.zen_server.auth import AuthContext, authorize
@@ -38,6 +39,7 @@ from zenml.zen_server.rbac.models import ResourceType
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    response_cache,
     zen_store,
 )
 
@@ -153,12 +155,15 @@ def update_artifact(
     Returns:
         The updated artifact.
     """
-    return verify_permissions_and_update_entity(
+    artifact = verify_permissions_and_update_entity(
         id=artifact_id,
         update_model=artifact_update,
         get_method=zen_store().get_artifact,
         update_method=zen_store().update_artifact,
     )
+    # Artifact versions include their artifact
+    response_cache().invalidate(ArtifactVersionResponse)
+    return artifact
 
 
 @artifact_router.delete(
@@ -180,3 +185,5 @@ def delete_artifact(
         get_method=zen_store().get_artifact,
         delete_method=zen_store().delete_artifact,
     )
+    # Deleting an artifact also deletes all its versions
+    response_cache().invalidate(ArtifactVersionResponse)
@@ -13,12 +13,19 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for artifact versions."""
 
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 
 from zenml.artifacts.utils import load_artifact_visualization
-from zenml.constants import API, ARTIFACT_VERSIONS, VERSION_1, VISUALIZE
+from zenml.constants import (
+    API,
+    ARTIFACT_VERSIONS,
+    BATCH,
+    VERSION_1,
+    VISUALIZE,
+)
 from zenml.models import (
     ArtifactVersionFilter,
     ArtifactVersionRequest,
@@ -28,22 +35,26 @@ from zenml.models import (
     Page,
 )
 from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.cache import verify_etag
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
+    verify_permissions_and_batch_create_entity,
     verify_permissions_and_create_entity,
     verify_permissions_and_delete_entity,
     verify_permissions_and_get_entity,
     verify_permissions_and_prune_entities,
     verify_permissions_and_update_entity,
 )
-from zenml.zen_server.rbac.models import ResourceType
+from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
     dehydrate_page,
     get_allowed_resource_ids,
+    verify_permission,
 )
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    response_cache,
     zen_store,
 )
 
@@ -111,6 +122,7 @@ def create_artifact_version(
     Returns:
         The created artifact version.
     """
+    _verify_additional_permissions([artifact_version])
     return verify_permissions_and_create_entity(
         request_model=artifact_version,
         resource_type=ResourceType.ARTIFACT_VERSION,
@@ -118,6 +130,53 @@ def create_artifact_version(
     )
 
 
+@artifact_version_router.post(
+    BATCH,
+    response_model=List[ArtifactVersionResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def batch_create_artifact_versions(
+    artifact_versions: List[ArtifactVersionRequest],
+    _: AuthContext = Security(authorize),
+) -> List[ArtifactVersionResponse]:
+    """Create multiple artifact versions in a single transaction.
+
+    Args:
+        artifact_versions: The artifact versions to create.
+
+    Returns:
+        The created artifact versions.
+    """
+    _verify_additional_permissions(artifact_versions)
+    return verify_permissions_and_batch_create_entity(
+        batch=artifact_versions,
+        resource_type=ResourceType.ARTIFACT_VERSION,
+        create_method=zen_store().batch_create_artifact_versions,
+    )
+
+
+def _verify_additional_permissions(
+    artifact_versions: List[ArtifactVersionRequest],
+) -> None:
+    """Verify permissions for entities created alongside artifact versions.
+
+    Artifact versions that reference their artifact by name might create the
+    artifact, and artifact versions that include metadata create run metadata.
+
+    Args:
+        artifact_versions: The artifact versions to create.
+    """
+    if any(av.artifact_id is None for av in artifact_versions):
+        verify_permission(
+            resource_type=ResourceType.ARTIFACT, action=Action.CREATE
+        )
+    if any(av.metadata for av in artifact_versions):
+        verify_permission(
+            resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
+        )
+
+
 @artifact_version_router.get(
     "/{artifact_version_id}",
     response_model=ArtifactVersionResponse,
@@ -125,6 +184,8 @@ def create_artifact_version(
 )
 @handle_exceptions
 def get_artifact_version(
+    request: Request,
+    response: Response,
     artifact_version_id: UUID,
     hydrate: bool = True,
     _: AuthContext = Security(authorize),
@@ -132,6 +193,8 @@ def get_artifact_version(
     """Get an artifact version by ID.
 
     Args:
+        request: The request.
+        response: The response.
         artifact_version_id: The ID of the artifact version to get.
         hydrate: Flag deciding whether to hydrate the output model(s)
             by including metadata fields in the response.
@@ -139,11 +202,15 @@ def get_artifact_version(
     Returns:
         The artifact version with the given ID.
     """
-    return verify_permissions_and_get_entity(
+    artifact_version = verify_permissions_and_get_entity(
         id=artifact_version_id,
-        get_method=zen_store().get_artifact_version,
+        get_method=response_cache().cached(
+            ArtifactVersionResponse, zen_store().get_artifact_version
+        ),
         hydrate=hydrate,
     )
+    verify_etag(request=request, response=response, model=artifact_version)
+    return artifact_version
 
 
 @artifact_version_router.put(
@@ -166,12 +233,14 @@ def update_artifact_version(
     Returns:
         The updated artifact.
     """
-    return verify_permissions_and_update_entity(
+    artifact_version = verify_permissions_and_update_entity(
         id=artifact_version_id,
         update_model=artifact_version_update,
         get_method=zen_store().get_artifact_version,
         update_method=zen_store().update_artifact_version,
     )
+    response_cache().invalidate(ArtifactVersionResponse, artifact_version_id)
+    return artifact_version
 
 
 @artifact_version_router.delete(
@@ -193,6 +262,7 @@ def delete_artifact_version(
         get_method=zen_store().get_artifact_version,
         delete_method=zen_store().delete_artifact_version,
     )
+    response_cache().invalidate(ArtifactVersionResponse, artifact_version_id)
 
 
 @artifact_version_router.delete(
@@ -214,6 +284,7 @@ def prune_artifact_versions(
         prune_method=zen_store().prune_artifact_versions,
         only_versions=only_versions,
     )
+    response_cache().invalidate(ArtifactVersionResponse)
 
 
 @artifact_version_router.get(
@@ -36,7 +36,11 @@ from zenml.models import (
     OAuthDeviceVerificationRequest,
     Page,
 )
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_cache,
+)
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -166,9 +170,11 @@ def update_authorized_device(
             "this ID found."
         )
 
-    return zen_store().update_authorized_device(
+    updated_device = zen_store().update_authorized_device(
         device_id=device_id, update=update
     )
+    invalidate_auth_cache(device_id=device_id)
+    return updated_device
 
 
 @router.put(
@@ -303,3 +309,4 @@ def delete_authorized_device(
         )
 
     zen_store().delete_authorized_device(device_id=device_id)
+    invalidate_auth_cache(device_id=device_id)
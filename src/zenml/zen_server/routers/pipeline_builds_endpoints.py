@@ -16,7 +16,14 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Security
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Request,
+    Response,
+    Security,
+)
 
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
 from zenml.constants import API, PIPELINE_BUILDS, VERSION_1
@@ -27,6 +34,7 @@ from zenml.models import (
     PipelineRunResponse,
 )
 from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.cache import verify_etag
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_delete_entity,
@@ -38,6 +46,7 @@ from zenml.zen_server.rbac.utils import verify_permission
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    response_cache,
     server_config,
     zen_store,
 )
@@ -88,6 +97,8 @@ def list_builds(
 )
 @handle_exceptions
 def get_build(
+    request: Request,
+    response: Response,
     build_id: UUID,
     hydrate: bool = True,
     _: AuthContext = Security(authorize),
@@ -95,6 +106,8 @@ def get_build(
     """Gets a specific build using its unique id.
 
     Args:
+        request: The request.
+        response: The response.
         build_id: ID of the build to get.
         hydrate: Flag deciding whether to hydrate the output model(s)
             by including metadata fields in the response.
@@ -102,9 +115,15 @@ def get_build(
     Returns:
         A specific build object.
     """
-    return verify_permissions_and_get_entity(
-        id=build_id, get_method=zen_store().get_build, hydrate=hydrate
+    build = verify_permissions_and_get_entity(
+        id=build_id,
+        get_method=response_cache().cached(
+            PipelineBuildResponse, zen_store().get_build
+        ),
+        hydrate=hydrate,
     )
+    verify_etag(request=request, response=response, model=build)
+    return build
 
 
 @router.delete(
@@ -126,6 +145,7 @@ def delete_build(
         get_method=zen_store().get_build,
         delete_method=zen_store().delete_build,
     )
+    response_cache().invalidate(PipelineBuildResponse, build_id)
 
 
 if server_config().workload_manager_enabled:
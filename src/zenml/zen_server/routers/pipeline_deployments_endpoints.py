@@ -16,7 +16,14 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Security
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Request,
+    Response,
+    Security,
+)
 
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
 from zenml.constants import API, PIPELINE_DEPLOYMENTS, VERSION_1
@@ -25,8 +32,10 @@ from zenml.models import (
     PipelineDeploymentFilter,
     PipelineDeploymentResponse,
     PipelineRunResponse,
+    StepRunResponse,
 )
 from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.cache import verify_etag
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_delete_entity,
@@ -38,6 +47,7 @@ from zenml.zen_server.rbac.utils import verify_permission
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    response_cache,
     server_config,
     workload_manager,
     zen_store,
@@ -89,6 +99,8 @@ def list_deployments(
 )
 @handle_exceptions
 def get_deployment(
+    request: Request,
+    response: Response,
     deployment_id: UUID,
     hydrate: bool = True,
     _: AuthContext = Security(authorize),
@@ -96,6 +108,8 @@ def get_deployment(
     """Gets a specific deployment using its unique id.
 
     Args:
+        request: The request.
+        response: The response.
         deployment_id: ID of the deployment to get.
         hydrate: Flag deciding whether to hydrate the output model(s)
             by including metadata fields in the response.
@@ -103,11 +117,15 @@ def get_deployment(
     Returns:
         A specific deployment object.
     """
-    return verify_permissions_and_get_entity(
+    deployment = verify_permissions_and_get_entity(
         id=deployment_id,
-        get_method=zen_store().get_deployment,
+        get_method=response_cache().cached(
+            PipelineDeploymentResponse, zen_store().get_deployment
+        ),
         hydrate=hydrate,
     )
+    verify_etag(request=request, response=response, model=deployment)
+    return deployment
 
 
 @router.delete(
@@ -129,6 +147,9 @@ def delete_deployment(
         get_method=zen_store().get_deployment,
         delete_method=zen_store().delete_deployment,
     )
+    response_cache().invalidate(PipelineDeploymentResponse, deployment_id)
+    # Deleting a deployment also deletes the step runs of its pipeline runs
+    response_cache().invalidate(StepRunResponse)
 
 
 if server_config().workload_manager_enabled:
@@ -37,7 +37,11 @@ from zenml.models import (
     ServiceAccountResponse,
     ServiceAccountUpdate,
 )
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_cache,
+)
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_create_entity,
@@ -178,12 +182,14 @@ def update_service_account(
     Returns:
         The updated service account.
     """
-    return verify_permissions_and_update_entity(
+    service_account = verify_permissions_and_update_entity(
         id=service_account_name_or_id,
         update_model=service_account_update,
         get_method=zen_store().get_service_account,
         update_method=zen_store().update_service_account,
     )
+    invalidate_auth_cache(user_id=service_account.id)
+    return service_account
 
 
 @router.delete(
@@ -200,11 +206,12 @@ def delete_service_account(
     Args:
         service_account_name_or_id: Name or ID of the service account.
     """
-    verify_permissions_and_delete_entity(
+    service_account = verify_permissions_and_delete_entity(
         id=service_account_name_or_id,
         get_method=zen_store().get_service_account,
         delete_method=zen_store().delete_service_account,
     )
+    invalidate_auth_cache(user_id=service_account.id)
 
 
 # --------
@@ -336,11 +343,13 @@ def update_api_key(
     """
     service_account = zen_store().get_service_account(service_account_id)
     verify_permission_for_model(service_account, action=Action.UPDATE)
-    return zen_store().update_api_key(
+    api_key = zen_store().update_api_key(
         service_account_id=service_account_id,
         api_key_name_or_id=api_key_name_or_id,
         api_key_update=api_key_update,
     )
+    invalidate_auth_cache(api_key_id=api_key.id)
+    return api_key
 
 
 @router.put(
@@ -371,11 +380,13 @@ def rotate_api_key(
     """
     service_account = zen_store().get_service_account(service_account_id)
     verify_permission_for_model(service_account, action=Action.UPDATE)
-    return zen_store().rotate_api_key(
+    api_key = zen_store().rotate_api_key(
         service_account_id=service_account_id,
         api_key_name_or_id=api_key_name_or_id,
         rotate_request=rotate_request,
     )
+    invalidate_auth_cache(api_key_id=api_key.id)
+    return api_key
 
 
 @router.delete(
@@ -401,3 +412,4 @@ def delete_api_key(
         service_account_id=service_account_id,
         api_key_name_or_id=api_key_name_or_id,
     )
+    invalidate_auth_cache(user_id=service_account.id)
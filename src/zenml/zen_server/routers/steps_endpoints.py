@@ -13,29 +13,44 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+import itertools
+from datetime import datetime
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    Security,
+)
+from fastapi.responses import StreamingResponse
 
 from zenml.constants import (
     API,
+    CACHE_LOOKUP,
     LOGS,
     STATUS,
     STEP_CONFIGURATION,
     STEPS,
+    STREAM,
     VERSION_1,
 )
 from zenml.enums import ExecutionStatus
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging.step_logging import fetch_logs, stream_logs
 from zenml.models import (
+    LogsResponse,
     Page,
+    StepRunCacheLookupRequest,
     StepRunFilter,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
 )
 from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.cache import verify_etag
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rbac.models import Action, ResourceType
 from zenml.zen_server.rbac.utils import (
@@ -47,6 +62,7 @@ from zenml.zen_server.rbac.utils import (
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    response_cache,
     zen_store,
 )
 
@@ -120,6 +136,52 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.post(
+    CACHE_LOOKUP,
+    response_model=Dict[str, StepRunResponse],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_cached_step_runs(
+    cache_lookup: StepRunCacheLookupRequest,
+    hydrate: bool = False,
+    auth_context: AuthContext = Security(authorize),
+) -> Dict[str, StepRunResponse]:
+    """Get the cached step runs for multiple cache keys at once.
+
+    Args:
+        cache_lookup: The workspace and cache keys to look up.
+        hydrate: Flag deciding whether to hydrate the output model(s)
+            by including metadata fields in the response.
+        auth_context: Authentication context.
+
+    Returns:
+        The cached step runs by cache key.
+    """
+    allowed_pipeline_run_ids = get_allowed_resource_ids(
+        resource_type=ResourceType.PIPELINE_RUN
+    )
+    # The pipeline run ID of a step run is only included in the metadata, so
+    # we always need to hydrate the step runs to filter them if RBAC is enabled
+    cached_step_runs = zen_store().get_cached_step_runs(
+        cache_lookup=cache_lookup,
+        hydrate=hydrate or allowed_pipeline_run_ids is not None,
+    )
+
+    if allowed_pipeline_run_ids is not None:
+        cached_step_runs = {
+            cache_key: step_run
+            for cache_key, step_run in cached_step_runs.items()
+            if step_run.pipeline_run_id in allowed_pipeline_run_ids
+            or (step_run.user and step_run.user.id == auth_context.user.id)
+        }
+
+    return {
+        cache_key: dehydrate_response_model(step_run)
+        for cache_key, step_run in cached_step_runs.items()
+    }
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponse,
@@ -127,6 +189,8 @@ def create_run_step(
 )
 @handle_exceptions
 def get_step(
+    request: Request,
+    response: Response,
     step_id: UUID,
     hydrate: bool = True,
     _: AuthContext = Security(authorize),
@@ -134,6 +198,8 @@ def get_step(
     """Get one specific step.
 
     Args:
+        request: The request.
+        response: The response.
         step_id: ID of the step to get.
         hydrate: Flag deciding whether to hydrate the output model(s)
             by including metadata fields in the response.
@@ -141,11 +207,22 @@ def get_step(
     Returns:
         The step.
     """
-    step = zen_store().get_run_step(step_id, hydrate=hydrate)
+    # Only step runs which have successfully finished won't change anymore
+    step = response_cache().get_or_fetch(
+        response_type=StepRunResponse,
+        id=step_id,
+        hydrate=hydrate,
+        fetch=lambda: zen_store().get_run_step(step_id, hydrate=hydrate),
+        is_immutable=lambda step: (
+            step.status in {ExecutionStatus.COMPLETED, ExecutionStatus.CACHED}
+        ),
+    )
     pipeline_run = zen_store().get_run(step.pipeline_run_id)
     verify_permission_for_model(pipeline_run, action=Action.READ)
 
-    return dehydrate_response_model(step)
+    step = dehydrate_response_model(step)
+    verify_etag(request=request, response=response, model=step)
+    return step
 
 
 @router.put(
@@ -175,6 +252,7 @@ def update_step(
     updated_step = zen_store().update_run_step(
         step_run_id=step_id, step_run_update=step_model
     )
+    response_cache().invalidate(StepRunResponse, step_id)
     return dehydrate_response_model(updated_step)
 
 
@@ -238,18 +316,136 @@ def get_step_logs(
     step_id: UUID,
     offset: int = 0,
     length: int = 1024 * 1024 * 16,  # Default to 16MiB of data
+    tail: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
     _: AuthContext = Security(authorize),
 ) -> str:
     """Get the logs of a specific step.
 
+    If any of the line or time filters is set, the logs are queried using
+    the log index. The offset can't be combined with these filters, and the
+    length limits the amount of bytes of the filtered logs that are returned.
+
     Args:
         step_id: ID of the step for which to get the logs.
         offset: The offset from which to start reading.
         length: The amount of bytes that should be read.
+        tail: Only return the last `tail` lines of the logs.
+        start_line: Index of the first line to return.
+        end_line: Index after the last line to return.
+        start_time: Only return logs written after this time.
+        end_time: Only return logs written before this time.
 
     Returns:
         The logs of the step.
 
+    Raises:
+        HTTPException: If an offset is combined with line or time filters.
+    """
+    store = zen_store()
+    logs = _get_step_logs_model(step_id)
+    if any(
+        value is not None
+        for value in (tail, start_line, end_line, start_time, end_time)
+    ):
+        if offset != 0:
+            raise HTTPException(
+                status_code=422,
+                detail="The offset can't be combined with line or time "
+                "filters.",
+            )
+
+        blocks = stream_logs(
+            zen_store=store,
+            artifact_store_id=logs.artifact_store_id,
+            logs_uri=logs.uri,
+            tail=tail,
+            start_line=start_line,
+            end_line=end_line,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        result = bytearray()
+        try:
+            for block in blocks:
+                result += block.encode()
+                if len(result) >= length:
+                    break
+        finally:
+            # Stops reading the logs and cleans up the artifact store
+            blocks.close()
+        # Characters cut off by the length limit are dropped
+        return bytes(result[: max(length, 0)]).decode(errors="ignore")
+
+    return fetch_logs(
+        zen_store=store,
+        artifact_store_id=logs.artifact_store_id,
+        logs_uri=logs.uri,
+        offset=offset,
+        length=length,
+    )
+
+
+@router.get(
+    "/{step_id}" + LOGS + STREAM,
+    response_class=StreamingResponse,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def stream_step_logs(
+    step_id: UUID,
+    tail: Optional[int] = None,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    _: AuthContext = Security(authorize),
+) -> StreamingResponse:
+    """Stream the logs of a specific step.
+
+    Args:
+        step_id: ID of the step for which to stream the logs.
+        tail: Only return the last `tail` lines of the logs.
+        start_line: Index of the first line to return.
+        end_line: Index after the last line to return.
+        start_time: Only return logs written after this time.
+        end_time: Only return logs written before this time.
+
+    Returns:
+        A response streaming the logs of the step.
+    """
+    logs = _get_step_logs_model(step_id)
+    blocks = stream_logs(
+        zen_store=zen_store(),
+        artifact_store_id=logs.artifact_store_id,
+        logs_uri=logs.uri,
+        tail=tail,
+        start_line=start_line,
+        end_line=end_line,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    # Errors can't be reported with a proper status code anymore once the
+    # response started, so the logs are located before returning it.
+    first_block = next(blocks, None)
+    return StreamingResponse(
+        itertools.chain([] if first_block is None else [first_block], blocks),
+        media_type="text/plain",
+    )
+
+
+def _get_step_logs_model(step_id: UUID) -> LogsResponse:
+    """Get the logs model of a step after verifying permissions.
+
+    Args:
+        step_id: ID of the step for which to get the logs.
+
+    Returns:
+        The logs model of the step.
+
     Raises:
         HTTPException: If no logs are available for this step.
     """
@@ -257,16 +453,9 @@ def get_step_logs(
     pipeline_run = zen_store().get_run(step.pipeline_run_id)
     verify_permission_for_model(pipeline_run, action=Action.READ)
 
-    store = zen_store()
     logs = step.logs
     if logs is None:
         raise HTTPException(
             status_code=404, detail="No logs available for this step"
         )
-    return fetch_logs(
-        zen_store=store,
-        artifact_store_id=logs.artifact_store_id,
-        logs_uri=logs.uri,
-        offset=offset,
-        length=length,
-    )
+    return logs
@@ -43,6 +43,7 @@ from zenml.zen_server.auth import (
     AuthContext,
     authenticate_credentials,
     authorize,
+    invalidate_auth_cache,
 )
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.rate_limit import RequestLimiter
@@ -406,6 +407,7 @@ if server_config().auth_scheme != AuthScheme.EXTERNAL:
             user_id=user.id,
             user_update=safe_user_update,
         )
+        invalidate_auth_cache(user_id=user.id)
         return dehydrate_response_model(updated_user)
 
     @activation_router.put(
@@ -467,9 +469,11 @@ if server_config().auth_scheme != AuthScheme.EXTERNAL:
         # Activate the user: set active to True and clear the activation token
         safe_user_update.active = True
         safe_user_update.activation_token = None
-        return zen_store().update_user(
+        updated_user = zen_store().update_user(
             user_id=user.id, user_update=safe_user_update
         )
+        invalidate_auth_cache(user_id=user.id)
+        return updated_user
 
     @router.put(
         "/{user_name_or_id}" + DEACTIVATE,
@@ -516,6 +520,7 @@ if server_config().auth_scheme != AuthScheme.EXTERNAL:
         user = zen_store().update_user(
             user_id=user.id, user_update=user_update
         )
+        invalidate_auth_cache(user_id=user.id)
         # add back the original unhashed activation token
         user.get_body().activation_token = token
         return dehydrate_response_model(user)
@@ -561,6 +566,7 @@ if server_config().auth_scheme != AuthScheme.EXTERNAL:
             )
 
         zen_store().delete_user(user_name_or_id=user_name_or_id)
+        invalidate_auth_cache(user_id=user.id)
 
     @router.put(
         "/{user_name_or_id}" + EMAIL_ANALYTICS,
@@ -608,6 +614,7 @@ if server_config().auth_scheme != AuthScheme.EXTERNAL:
             updated_user = zen_store().update_user(
                 user_id=user.id, user_update=user_update
             )
+            invalidate_auth_cache(user_id=user.id)
             return dehydrate_response_model(updated_user)
         else:
             raise AuthorizationException(
@@ -714,6 +721,7 @@ if server_config().auth_scheme != AuthScheme.EXTERNAL:
         updated_user = zen_store().update_user(
             user_id=auth_context.user.id, user_update=safe_user_update
         )
+        invalidate_auth_cache(user_id=auth_context.user.id)
         return dehydrate_response_model(updated_user)
 
 
@@ -21,6 +21,7 @@ from fastapi import APIRouter, Depends, Security
 from zenml.constants import (
     API,
     ARTIFACTS,
+    BATCH,
     CODE_REPOSITORIES,
     FULL_STACK,
     GET_OR_CREATE,
@@ -46,6 +47,7 @@ from zenml.constants import (
 from zenml.enums import MetadataResourceTypes
 from zenml.exceptions import IllegalOperationError
 from zenml.models import (
+    ArtifactVersionResponse,
     CodeRepositoryFilter,
     CodeRepositoryRequest,
     CodeRepositoryResponse,
@@ -89,6 +91,7 @@ from zenml.models import (
     StackFilter,
     StackRequest,
     StackResponse,
+    StepRunResponse,
     WorkspaceFilter,
     WorkspaceRequest,
     WorkspaceResponse,
@@ -117,6 +120,7 @@ from zenml.zen_server.rbac.utils import (
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    response_cache,
     zen_store,
 )
 
@@ -263,6 +267,8 @@ def delete_workspace(
         get_method=zen_store().get_workspace,
         delete_method=zen_store().delete_workspace,
     )
+    # Deleting a workspace also deletes all entities of that workspace
+    response_cache().clear()
 
 
 @router.get(
@@ -962,15 +968,76 @@ def create_run_metadata(
 
     Returns:
         The created run metadata.
+    """
+    workspace = zen_store().get_workspace(run_metadata.workspace)
+    _verify_run_metadata_permissions(
+        workspace_name_or_id=workspace_name_or_id,
+        workspace_id=workspace.id,
+        run_metadata=run_metadata,
+        auth_context=auth_context,
+    )
+
+    result = zen_store().create_run_metadata(run_metadata)
+    _invalidate_run_metadata_resource(run_metadata)
+    return result
+
+
+@router.post(
+    WORKSPACES + "/{workspace_name_or_id}" + RUN_METADATA + BATCH,
+    response_model=List[RunMetadataResponse],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def batch_create_run_metadata(
+    workspace_name_or_id: Union[str, UUID],
+    run_metadata: List[RunMetadataRequest],
+    auth_context: AuthContext = Security(authorize),
+) -> List[RunMetadataResponse]:
+    """Creates multiple run metadata entries in a single transaction.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        run_metadata: The run metadata to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created run metadata.
+    """
+    workspace = zen_store().get_workspace(workspace_name_or_id)
+    for request in run_metadata:
+        _verify_run_metadata_permissions(
+            workspace_name_or_id=workspace_name_or_id,
+            workspace_id=workspace.id,
+            run_metadata=request,
+            auth_context=auth_context,
+        )
+
+    result = zen_store().batch_create_run_metadata(run_metadata)
+    for request in run_metadata:
+        _invalidate_run_metadata_resource(request)
+    return result
+
+
+def _verify_run_metadata_permissions(
+    workspace_name_or_id: Union[str, UUID],
+    workspace_id: UUID,
+    run_metadata: RunMetadataRequest,
+    auth_context: AuthContext,
+) -> None:
+    """Verifies that the authenticated user is allowed to create run metadata.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace of the endpoint.
+        workspace_id: ID of the workspace of the endpoint.
+        run_metadata: The run metadata to create.
+        auth_context: Authentication context.
 
     Raises:
         IllegalOperationError: If the workspace or user specified in the run
             metadata does not match the current workspace or authenticated user.
         RuntimeError: If the resource type is not supported.
     """
-    workspace = zen_store().get_workspace(run_metadata.workspace)
-
-    if run_metadata.workspace != workspace.id:
+    if run_metadata.workspace != workspace_id:
         raise IllegalOperationError(
             "Creating run metadata outside of the workspace scope "
             f"of this endpoint `{workspace_name_or_id}` is "
@@ -1006,7 +1073,21 @@ def create_run_metadata(
         resource_type=ResourceType.RUN_METADATA, action=Action.CREATE
     )
 
-    return zen_store().create_run_metadata(run_metadata)
+
+def _invalidate_run_metadata_resource(
+    run_metadata: RunMetadataRequest,
+) -> None:
+    """Removes the cached responses of the resource of new run metadata.
+
+    Args:
+        run_metadata: The created run metadata.
+    """
+    if run_metadata.resource_type == MetadataResourceTypes.STEP_RUN:
+        response_cache().invalidate(StepRunResponse, run_metadata.resource_id)
+    elif run_metadata.resource_type == MetadataResourceTypes.ARTIFACT_VERSION:
+        response_cache().invalidate(
+            ArtifactVersionResponse, run_metadata.resource_id
+        )
 
 
 @router.post(
@@ -1522,8 +1603,7 @@ def create_model_version_pipeline_run_link(
         )
     if model_version_pipeline_run_link.user != auth_context.user.id:
         raise IllegalOperationError(
-            "Creating models for a user other than yourself "
-            "is not supported."
+            "Creating models for a user other than yourself is not supported."
         )
 
     model_version = zen_store().get_model_version(model_version_id)
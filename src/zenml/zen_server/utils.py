@@ -39,6 +39,11 @@ from zenml.enums import ServerProviderType
 from zenml.exceptions import IllegalOperationError, OAuthError
 from zenml.logger import get_logger
 from zenml.plugins.plugin_flavor_registry import PluginFlavorRegistry
+from zenml.zen_server.cache import (
+    AuthContextCache,
+    CachedRBAC,
+    ResponseCache,
+)
 from zenml.zen_server.deploy.deployment import ServerDeployment
 from zenml.zen_server.deploy.local.local_zen_server import (
     LocalServerDeploymentConfig,
@@ -61,6 +66,8 @@ _feature_gate: Optional[FeatureGateInterface] = None
 _workload_manager: Optional[WorkloadManagerInterface] = None
 _plugin_flavor_registry: Optional[PluginFlavorRegistry] = None
 _secure_headers: Optional[secure.Secure] = None
+_response_cache: Optional[ResponseCache] = None
+_auth_context_cache: Optional[AuthContextCache] = None
 
 
 def zen_store() -> "SqlZenStore":
@@ -116,7 +123,12 @@ def initialize_rbac() -> None:
         implementation_class = source_utils.load_and_validate_class(
             rbac_source, expected_class=RBACInterface
         )
-        _rbac = implementation_class()
+        config = server_config()
+        _rbac = CachedRBAC(
+            implementation_class(),
+            maxsize=config.auth_cache_size,
+            ttl=config.auth_cache_ttl,
+        )
 
 
 def feature_gate() -> FeatureGateInterface:
@@ -216,6 +228,56 @@ def initialize_zen_store() -> None:
     _zen_store = zen_store_
 
 
+def response_cache() -> ResponseCache:
+    """Return the cache for responses of immutable entities.
+
+    Returns:
+        The response cache.
+
+    Raises:
+        RuntimeError: If the response cache is not initialized.
+    """
+    global _response_cache
+    if _response_cache is None:
+        raise RuntimeError("Response cache not initialized")
+    return _response_cache
+
+
+def initialize_response_cache() -> None:
+    """Initialize the cache for responses of immutable entities."""
+    global _response_cache
+
+    config = server_config()
+    _response_cache = ResponseCache(
+        maxsize=config.response_cache_size, ttl=config.response_cache_ttl
+    )
+
+
+def auth_context_cache() -> AuthContextCache:
+    """Return the cache for authentication contexts of access tokens.
+
+    Returns:
+        The authentication context cache.
+
+    Raises:
+        RuntimeError: If the authentication context cache is not initialized.
+    """
+    global _auth_context_cache
+    if _auth_context_cache is None:
+        raise RuntimeError("Authentication context cache not initialized")
+    return _auth_context_cache
+
+
+def initialize_auth_context_cache() -> None:
+    """Initialize the cache for authentication contexts of access tokens."""
+    global _auth_context_cache
+
+    config = server_config()
+    _auth_context_cache = AuthContextCache(
+        maxsize=config.auth_cache_size, ttl=config.auth_cache_ttl
+    )
+
+
 def secure_headers() -> secure.Secure:
     """Return the secure headers component.
 
@@ -73,15 +73,18 @@ from zenml.zen_server.routers import (
     workspaces_endpoints,
 )
 from zenml.zen_server.utils import (
+    initialize_auth_context_cache,
     initialize_feature_gate,
     initialize_plugins,
     initialize_rbac,
+    initialize_response_cache,
     initialize_secure_headers,
     initialize_workload_manager,
     initialize_zen_store,
     secure_headers,
     server_config,
 )
+from zenml.zen_stores.statement_counter import count_statements
 
 if server_config().use_legacy_dashboard:
     DASHBOARD_DIRECTORY = "dashboard_legacy"
@@ -190,6 +193,30 @@ async def infer_source_context(request: Request, call_next: Any) -> Any:
     return await call_next(request)
 
 
+@app.middleware("http")
+async def count_sql_statements(request: Request, call_next: Any) -> Any:
+    """A middleware to log the number of SQL statements of each request.
+
+    Args:
+        request: the incoming request object.
+        call_next: a function that will receive the request as a parameter and
+            pass it to the corresponding path operation.
+
+    Returns:
+        the response to the request.
+    """
+    with count_statements() as counter:
+        response = await call_next(request)
+
+    logger.debug(
+        "Executed %d SQL statements for request %s %s.",
+        counter.count,
+        request.method,
+        request.url.path,
+    )
+    return response
+
+
 @app.on_event("startup")
 def initialize() -> None:
     """Initialize the ZenML server."""
@@ -205,6 +232,8 @@ def initialize() -> None:
     initialize_workload_manager()
     initialize_plugins()
     initialize_secure_headers()
+    initialize_response_cache()
+    initialize_auth_context_cache()
 
 
 if server_config().use_legacy_dashboard:
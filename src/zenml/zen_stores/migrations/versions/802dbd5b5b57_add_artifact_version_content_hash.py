@@ -0,0 +1,41 @@
+"""Add artifact version content hash [802dbd5b5b57].
+
+Revision ID: 802dbd5b5b57
+Revises: 0.62.0
+Create Date: 2024-07-22 10:12:31.482193
+
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "802dbd5b5b57"
+down_revision = "0.62.0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("artifact_version", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "content_hash",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+        batch_op.create_index(
+            "ix_artifact_version_content_hash",
+            ["content_hash"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("artifact_version", schema=None) as batch_op:
+        batch_op.drop_index("ix_artifact_version_content_hash")
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,54 @@
+"""Add indexes for frequent queries [8a596c2249bc].
+
+Revision ID: 8a596c2249bc
+Revises: 802dbd5b5b57
+Create Date: 2024-07-29 09:41:12.318706
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8a596c2249bc"
+down_revision = "802dbd5b5b57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_step_run_cache_key",
+            ["cache_key", "workspace_id", "status", "created"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_step_run_pipeline_run_id_name",
+            ["pipeline_run_id", "name"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("artifact_version", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_artifact_version_uri",
+            ["uri"],
+            unique=False,
+            mysql_length=255,
+        )
+        batch_op.create_index(
+            "ix_artifact_version_artifact_id_version_number",
+            ["artifact_id", "version_number"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("artifact_version", schema=None) as batch_op:
+        batch_op.drop_index("ix_artifact_version_artifact_id_version_number")
+        batch_op.drop_index("ix_artifact_version_uri")
+
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_step_run_pipeline_run_id_name")
+        batch_op.drop_index("ix_step_run_cache_key")
@@ -23,6 +23,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -56,6 +57,8 @@ from zenml.constants import (
     ARTIFACT_VERSIONS,
     ARTIFACT_VISUALIZATIONS,
     ARTIFACTS,
+    BATCH,
+    CACHE_LOOKUP,
     CODE_REFERENCES,
     CODE_REPOSITORIES,
     CONFIG,
@@ -99,6 +102,7 @@ from zenml.constants import (
     STACK_COMPONENTS,
     STACK_DEPLOYMENT,
     STACKS,
+    STEP_OUTPUTS,
     STEPS,
     TAGS,
     TRIGGER_EXECUTIONS,
@@ -223,7 +227,9 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunCacheLookupRequest,
     StepRunFilter,
+    StepRunOutputs,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -931,6 +937,23 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACT_VERSIONS,
         )
 
+    def batch_create_artifact_versions(
+        self, artifact_versions: List[ArtifactVersionRequest]
+    ) -> List[ArtifactVersionResponse]:
+        """Creates multiple artifact versions in a single transaction.
+
+        Args:
+            artifact_versions: The artifact versions to create.
+
+        Returns:
+            The created artifact versions.
+        """
+        return self._batch_create_resources(
+            resources=artifact_versions,
+            response_model=ArtifactVersionResponse,
+            route=ARTIFACT_VERSIONS + BATCH,
+        )
+
     def get_artifact_version(
         self, artifact_version_id: UUID, hydrate: bool = True
     ) -> ArtifactVersionResponse:
@@ -1889,6 +1912,34 @@ class RestZenStore(BaseZenStore):
                 result.append(RunMetadataResponse.model_validate(metadata))
         return result
 
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates multiple run metadata entries in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+        result: List[RunMetadataResponse] = []
+        # The server scopes run metadata by workspace, so we send one batch
+        # request per workspace.
+        workspaces: Dict[UUID, List[RunMetadataRequest]] = {}
+        for request in run_metadata:
+            workspaces.setdefault(request.workspace, []).append(request)
+        for workspace_id, workspace_requests in workspaces.items():
+            result.extend(
+                self._batch_create_resources(
+                    resources=workspace_requests,
+                    response_model=RunMetadataResponse,
+                    route=f"{WORKSPACES}/{str(workspace_id)}{RUN_METADATA}"
+                    + BATCH,
+                )
+            )
+        return result
+
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
     ) -> RunMetadataResponse:
@@ -2995,6 +3046,81 @@ class RestZenStore(BaseZenStore):
             params={"hydrate": hydrate},
         )
 
+    def get_cached_step_runs(
+        self,
+        cache_lookup: StepRunCacheLookupRequest,
+        hydrate: bool = False,
+    ) -> Dict[str, StepRunResponse]:
+        """Get the cached step runs for multiple cache keys at once.
+
+        For each cache key, the latest successfully completed step run with
+        this cache key in the given workspace is returned.
+
+        Args:
+            cache_lookup: The workspace and cache keys to look up.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The cached step runs by cache key. Cache keys without a cached
+            step run are not included.
+
+        Raises:
+            ValueError: If the server response is not a dictionary.
+        """
+        if not cache_lookup.cache_keys:
+            return {}
+
+        response_body = self.post(
+            f"{STEPS}{CACHE_LOOKUP}",
+            body=cache_lookup,
+            params={"hydrate": hydrate},
+        )
+        if not isinstance(response_body, dict):
+            raise ValueError(
+                f"Bad API Response. Expected dict, got {type(response_body)}"
+            )
+        return {
+            cache_key: StepRunResponse.model_validate(step_run)
+            for cache_key, step_run in response_body.items()
+        }
+
+    def get_run_step_outputs(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the outputs of step runs of a pipeline run.
+
+        This only fetches the information required to resolve the inputs of
+        later steps of the run, which is a lot cheaper than listing the full
+        step runs.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps for which to get the outputs.
+
+        Returns:
+            The outputs by step name. Steps that don't exist in the pipeline
+            run are not included.
+
+        Raises:
+            ValueError: If the server response is not a dictionary.
+        """
+        if not step_names:
+            return {}
+
+        response_body = self.get(
+            f"{RUNS}/{run_id}{STEP_OUTPUTS}",
+            params={"step_names": step_names},
+        )
+        if not isinstance(response_body, dict):
+            raise ValueError(
+                f"Bad API Response. Expected dict, got {type(response_body)}"
+            )
+        return {
+            step_name: StepRunOutputs.model_validate(outputs)
+            for step_name, outputs in response_body.items()
+        }
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -4203,7 +4329,7 @@ class RestZenStore(BaseZenStore):
     def post(
         self,
         path: str,
-        body: BaseModel,
+        body: Union[BaseModel, Sequence[BaseModel]],
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
         **kwargs: Any,
@@ -4221,10 +4347,16 @@ class RestZenStore(BaseZenStore):
             The response body.
         """
         logger.debug(f"Sending POST request to {path}...")
+        if isinstance(body, BaseModel):
+            data = body.model_dump_json()
+        else:
+            data = (
+                "[" + ",".join(item.model_dump_json() for item in body) + "]"
+            )
         return self._request(
             "POST",
             self.url + API + VERSION_1 + path,
-            data=body.model_dump_json(),
+            data=data,
             params=params,
             timeout=timeout,
             **kwargs,
@@ -4284,6 +4416,36 @@ class RestZenStore(BaseZenStore):
 
         return response_model.model_validate(response_body)
 
+    def _batch_create_resources(
+        self,
+        resources: Sequence[AnyRequest],
+        response_model: Type[AnyResponse],
+        route: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[AnyResponse]:
+        """Create multiple resources in a single request.
+
+        Args:
+            resources: The resources to create.
+            route: The resource REST API route to use.
+            response_model: The model to use to deserialize the response
+                body items.
+            params: Optional query parameters to pass to the endpoint.
+
+        Returns:
+            The created resources.
+
+        Raises:
+            ValueError: If the server response is not a list.
+        """
+        response_body = self.post(f"{route}", body=resources, params=params)
+        if not isinstance(response_body, list):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(response_body)}"
+            )
+
+        return [response_model.model_validate(r) for r in response_body]
+
     def _create_workspace_scoped_resource(
         self,
         resource: AnyWorkspaceScopedRequest,
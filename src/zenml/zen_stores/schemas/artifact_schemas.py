@@ -14,11 +14,13 @@
 """SQLModel implementation of artifact table."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, Column, Index
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import Field, Relationship
 
 from zenml.config.source import Source
@@ -167,6 +169,15 @@ class ArtifactVersionSchema(BaseSchema, table=True):
     """SQL Model for artifact versions."""
 
     __tablename__ = "artifact_version"
+    __table_args__ = (
+        # MySQL can only index a prefix of `TEXT` columns
+        Index("ix_artifact_version_uri", "uri", mysql_length=255),
+        Index(
+            "ix_artifact_version_artifact_id_version_number",
+            "artifact_id",
+            "version_number",
+        ),
+    )
 
     # Fields
     version: str
@@ -175,6 +186,7 @@ class ArtifactVersionSchema(BaseSchema, table=True):
     uri: str = Field(sa_column=Column(TEXT, nullable=False))
     materializer: str = Field(sa_column=Column(TEXT, nullable=False))
     data_type: str = Field(sa_column=Column(TEXT, nullable=False))
+    content_hash: Optional[str] = Field(default=None, index=True)
     tags: List["TagResourceSchema"] = Relationship(
         back_populates="artifact_version",
         sa_relationship_kwargs=dict(
@@ -257,22 +269,29 @@ class ArtifactVersionSchema(BaseSchema, table=True):
     def from_request(
         cls,
         artifact_version_request: ArtifactVersionRequest,
+        artifact_id: UUID,
+        version: Union[str, int],
     ) -> "ArtifactVersionSchema":
         """Convert an `ArtifactVersionRequest` to an `ArtifactVersionSchema`.
 
         Args:
             artifact_version_request: The request model to convert.
+            artifact_id: The ID of the artifact to which the version belongs.
+                This might differ from the artifact ID of the request, which
+                is optional.
+            version: The version of the artifact. This might differ from the
+                version of the request, which is optional.
 
         Returns:
             The converted schema.
         """
         try:
-            version_number = int(artifact_version_request.version)
+            version_number = int(version)
         except ValueError:
             version_number = None
         return cls(
-            artifact_id=artifact_version_request.artifact_id,
-            version=str(artifact_version_request.version),
+            artifact_id=artifact_id,
+            version=str(version),
             version_number=version_number,
             artifact_store_id=artifact_version_request.artifact_store_id,
             workspace_id=artifact_version_request.workspace,
@@ -281,8 +300,51 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             uri=artifact_version_request.uri,
             materializer=artifact_version_request.materializer.model_dump_json(),
             data_type=artifact_version_request.data_type.model_dump_json(),
+            content_hash=artifact_version_request.content_hash,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[ExecutableOption]:
+        """Get the query options to eagerly load data needed by `to_model()`.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        from zenml.zen_stores.schemas.tag_schemas import TagResourceSchema
+
+        options: List[ExecutableOption] = [
+            joinedload(cls.artifact).options(  # type: ignore[arg-type]
+                selectinload(ArtifactSchema.versions),  # type: ignore[arg-type]
+                selectinload(ArtifactSchema.tags).joinedload(  # type: ignore[arg-type]
+                    TagResourceSchema.tag  # type: ignore[arg-type]
+                ),
+            ),
+            joinedload(cls.user),  # type: ignore[arg-type]
+            selectinload(cls.tags).joinedload(TagResourceSchema.tag),  # type: ignore[arg-type]
+            selectinload(cls.output_of_step_runs).joinedload(  # type: ignore[arg-type]
+                StepRunOutputArtifactSchema.step_run  # type: ignore[arg-type]
+            ),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(cls.workspace),  # type: ignore[arg-type]
+                    selectinload(cls.visualizations),  # type: ignore[arg-type]
+                    selectinload(cls.run_metadata),  # type: ignore[arg-type]
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -341,6 +403,7 @@ class ArtifactVersionSchema(BaseSchema, table=True):
             updated=self.updated,
             tags=[t.tag.to_model() for t in self.tags],
             producer_pipeline_run_id=producer_pipeline_run_id,
+            content_hash=self.content_hash,
         )
 
         # Create the metadata of the model
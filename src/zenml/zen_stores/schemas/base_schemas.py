@@ -14,9 +14,10 @@
 """Base classes for SQLModel schemas."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Sequence, TypeVar
 from uuid import UUID, uuid4
 
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import Field, SQLModel
 
 if TYPE_CHECKING:
@@ -32,6 +33,30 @@ class BaseSchema(SQLModel):
     created: datetime = Field(default_factory=datetime.utcnow)
     updated: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[ExecutableOption]:
+        """Get the query options to eagerly load data needed by `to_model()`.
+
+        Relationships are loaded lazily by default, which means that
+        converting a list of schemas to models issues separate queries for
+        each schema. Schemas which are listed frequently should override this
+        method to load these relationships for all schemas at once instead.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        return []
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -14,7 +14,7 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import TEXT, Column, String
@@ -30,6 +30,7 @@ from zenml.models import (
     PipelineDeploymentResponseBody,
     PipelineDeploymentResponseMetadata,
 )
+from zenml.utils.cache_utils import LRUCache
 from zenml.utils.json_utils import pydantic_encoder
 from zenml.zen_stores.schemas.base_schemas import BaseSchema
 from zenml.zen_stores.schemas.code_repository_schemas import (
@@ -47,6 +48,17 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.pipeline_run_schemas import PipelineRunSchema
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
+# Deployments are immutable, which means their parsed configurations can be
+# cached by deployment ID and shared by all pipeline runs and step runs of the
+# deployment.
+DEPLOYMENT_CONFIGURATION_CACHE_SIZE = 128
+_pipeline_configuration_cache: LRUCache[UUID, PipelineConfiguration] = (
+    LRUCache(maxsize=DEPLOYMENT_CONFIGURATION_CACHE_SIZE)
+)
+_step_configurations_cache: LRUCache[UUID, Dict[str, Step]] = LRUCache(
+    maxsize=DEPLOYMENT_CONFIGURATION_CACHE_SIZE
+)
+
 
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
@@ -189,6 +201,41 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             server_version=request.server_version,
         )
 
+    def get_pipeline_configuration(self) -> PipelineConfiguration:
+        """Get the parsed pipeline configuration of the deployment.
+
+        Returns:
+            The pipeline configuration.
+        """
+        return _pipeline_configuration_cache.get_or_create(
+            self.id,
+            lambda: PipelineConfiguration.model_validate_json(
+                self.pipeline_configuration
+            ),
+        )
+
+    def get_step_configurations(self) -> Dict[str, Step]:
+        """Get the parsed step configurations of the deployment.
+
+        The returned objects are shared between all callers and must not be
+        modified.
+
+        Returns:
+            The step configurations by step name.
+        """
+
+        def _parse_step_configurations() -> Dict[str, Step]:
+            return {
+                name: Step.model_validate(step_configuration)
+                for name, step_configuration in json.loads(
+                    self.step_configurations
+                ).items()
+            }
+
+        return _step_configurations_cache.get_or_create(
+            self.id, _parse_step_configurations
+        )
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -206,13 +253,6 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         Returns:
             The created `PipelineDeploymentResponse`.
         """
-        pipeline_configuration = PipelineConfiguration.model_validate_json(
-            self.pipeline_configuration
-        )
-        step_configurations = json.loads(self.step_configurations)
-        for s, c in step_configurations.items():
-            step_configurations[s] = Step.model_validate(c)
-
         body = PipelineDeploymentResponseBody(
             user=self.user.to_model() if self.user else None,
             created=self.created,
@@ -223,8 +263,8 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             metadata = PipelineDeploymentResponseMetadata(
                 workspace=self.workspace.to_model(),
                 run_name_template=self.run_name_template,
-                pipeline_configuration=pipeline_configuration,
-                step_configurations=step_configurations,
+                pipeline_configuration=self.get_pipeline_configuration(),
+                step_configurations=self.get_step_configurations(),
                 client_environment=json.loads(self.client_environment),
                 client_version=self.client_version,
                 server_version=self.server_version,
@@ -15,10 +15,12 @@
 
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import TEXT, Column, Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
@@ -215,6 +217,59 @@ class PipelineRunSchema(NamedSchema, table=True):
             trigger_execution_id=request.trigger_execution_id,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[ExecutableOption]:
+        """Get the query options to eagerly load data needed by `to_model()`.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
+
+        options: List[ExecutableOption] = [
+            joinedload(cls.user),  # type: ignore[arg-type]
+            joinedload(cls.trigger_execution),  # type: ignore[arg-type]
+            # Deployments contain large configurations and are often shared
+            # between runs, so we load them in a separate query.
+            selectinload(cls.deployment).options(  # type: ignore[arg-type]
+                joinedload(PipelineDeploymentSchema.stack).joinedload(  # type: ignore[arg-type]
+                    StackSchema.user  # type: ignore[arg-type]
+                ),
+                joinedload(PipelineDeploymentSchema.pipeline).options(  # type: ignore[arg-type]
+                    joinedload(PipelineSchema.user),  # type: ignore[arg-type]
+                    selectinload(PipelineSchema.runs),  # type: ignore[arg-type]
+                ),
+                joinedload(PipelineDeploymentSchema.build).joinedload(  # type: ignore[arg-type]
+                    PipelineBuildSchema.user  # type: ignore[arg-type]
+                ),
+                joinedload(PipelineDeploymentSchema.schedule).joinedload(  # type: ignore[arg-type]
+                    ScheduleSchema.user  # type: ignore[arg-type]
+                ),
+                joinedload(PipelineDeploymentSchema.code_reference),  # type: ignore[arg-type]
+            ),
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(cls.workspace),  # type: ignore[arg-type]
+                    selectinload(cls.run_metadata),  # type: ignore[arg-type]
+                    selectinload(cls.step_runs).options(  # type: ignore[arg-type]
+                        *StepRunSchema.get_query_options()  # type: ignore[arg-type]
+                    ),
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -241,22 +296,25 @@ class PipelineRunSchema(NamedSchema, table=True):
             else {}
         )
 
-        run_metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-
         if self.deployment is not None:
-            deployment = self.deployment.to_model()
+            deployment = self.deployment
 
-            config = deployment.pipeline_configuration
-            client_environment = deployment.client_environment
+            config = deployment.get_pipeline_configuration()
+            client_environment = json.loads(deployment.client_environment)
 
-            stack = deployment.stack
-            pipeline = deployment.pipeline
-            build = deployment.build
-            schedule = deployment.schedule
-            code_reference = deployment.code_reference
+            stack = deployment.stack.to_model() if deployment.stack else None
+            pipeline = (
+                deployment.pipeline.to_model() if deployment.pipeline else None
+            )
+            build = deployment.build.to_model() if deployment.build else None
+            schedule = (
+                deployment.schedule.to_model() if deployment.schedule else None
+            )
+            code_reference = (
+                deployment.code_reference.to_model()
+                if deployment.code_reference
+                else None
+            )
 
         elif self.pipeline_configuration is not None:
             config = PipelineConfiguration.model_validate_json(
@@ -298,6 +356,10 @@ class PipelineRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            run_metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
             steps = {step.name: step.to_model() for step in self.step_runs}
 
             metadata = PipelineRunResponseMetadata(
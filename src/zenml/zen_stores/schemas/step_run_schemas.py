@@ -13,13 +13,14 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
-import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import TEXT, Column, String
+from sqlalchemy import TEXT, Column, Index, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.step_configurations import Step
@@ -55,6 +56,16 @@ class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        Index(
+            "ix_step_run_cache_key",
+            "cache_key",
+            "workspace_id",
+            "status",
+            "created",
+        ),
+        Index("ix_step_run_pipeline_run_id_name", "pipeline_run_id", "name"),
+    )
 
     # Fields
     start_time: Optional[datetime] = Field(nullable=True)
@@ -174,6 +185,51 @@ class StepRunSchema(NamedSchema, table=True):
             source_code=request.source_code,
         )
 
+    @classmethod
+    def get_query_options(
+        cls,
+        include_metadata: bool = False,
+        include_resources: bool = False,
+        **kwargs: Any,
+    ) -> Sequence[ExecutableOption]:
+        """Get the query options to eagerly load data needed by `to_model()`.
+
+        Args:
+            include_metadata: Whether the metadata will be filled.
+            include_resources: Whether the resources will be filled.
+            **kwargs: Keyword arguments to allow schema specific logic
+
+        Returns:
+            The query options.
+        """
+        from zenml.zen_stores.schemas.artifact_schemas import (
+            ArtifactVersionSchema,
+        )
+
+        artifact_version_options = ArtifactVersionSchema.get_query_options()
+        options: List[ExecutableOption] = [
+            joinedload(cls.user),  # type: ignore[arg-type]
+            # Deployments contain large configurations and are shared between
+            # all steps of a run, so we load them in a separate query.
+            selectinload(cls.deployment),  # type: ignore[arg-type]
+            selectinload(cls.input_artifacts)  # type: ignore[arg-type]
+            .joinedload(StepRunInputArtifactSchema.artifact_version)  # type: ignore[arg-type]
+            .options(*artifact_version_options),  # type: ignore[arg-type]
+            selectinload(cls.output_artifacts)  # type: ignore[arg-type]
+            .joinedload(StepRunOutputArtifactSchema.artifact_version)  # type: ignore[arg-type]
+            .options(*artifact_version_options),  # type: ignore[arg-type]
+        ]
+        if include_metadata:
+            options.extend(
+                [
+                    joinedload(cls.workspace),  # type: ignore[arg-type]
+                    joinedload(cls.logs),  # type: ignore[arg-type]
+                    selectinload(cls.run_metadata),  # type: ignore[arg-type]
+                    selectinload(cls.parents),  # type: ignore[arg-type]
+                ]
+            )
+        return options
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -196,11 +252,6 @@ class StepRunSchema(NamedSchema, table=True):
             RuntimeError: If the step run schema does not have a deployment_id
                 or a step_configuration.
         """
-        run_metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-
         input_artifacts = {
             artifact.name: artifact.artifact_version.to_model()
             for artifact in self.input_artifacts
@@ -215,13 +266,9 @@ class StepRunSchema(NamedSchema, table=True):
 
         full_step_config = None
         if self.deployment is not None:
-            step_configuration = json.loads(
-                self.deployment.step_configurations
-            )
-            if self.name in step_configuration:
-                full_step_config = Step.model_validate(
-                    step_configuration[self.name]
-                )
+            step_configurations = self.deployment.get_step_configurations()
+            if self.name in step_configurations:
+                full_step_config = step_configurations[self.name]
             elif not self.step_configuration:
                 raise ValueError(
                     f"Unable to load the configuration for step `{self.name}` from the"
@@ -252,6 +299,10 @@ class StepRunSchema(NamedSchema, table=True):
         )
         metadata = None
         if include_metadata:
+            run_metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
             metadata = StepRunResponseMetadata(
                 workspace=self.workspace.to_model(),
                 config=full_step_config.config,
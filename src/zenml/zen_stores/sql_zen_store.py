@@ -20,6 +20,7 @@ import math
 import os
 import re
 import sys
+import time
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
@@ -96,6 +97,7 @@ from zenml.constants import (
     ENV_ZENML_LOCAL_SERVER,
     ENV_ZENML_SERVER,
     FINISHED_ONBOARDING_SURVEY_KEY,
+    MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION,
     SQL_STORE_BACKUP_DIRECTORY_NAME,
     TEXT_FIELD_MAX_LENGTH,
     handle_bool_env_var,
@@ -107,6 +109,7 @@ from zenml.enums import (
     DatabaseBackupStrategy,
     ExecutionStatus,
     LoggingLevels,
+    MetadataResourceTypes,
     ModelStages,
     OnboardingStep,
     SecretScope,
@@ -133,6 +136,7 @@ from zenml.exceptions import (
 )
 from zenml.io import fileio
 from zenml.logger import get_console_handler, get_logger, get_logging_level
+from zenml.metadata.metadata_types import get_metadata_type
 from zenml.models import (
     ActionFilter,
     ActionRequest,
@@ -253,7 +257,9 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunCacheLookupRequest,
     StepRunFilter,
+    StepRunOutputs,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -347,6 +353,7 @@ from zenml.zen_stores.secrets_stores.base_secrets_store import BaseSecretsStore
 from zenml.zen_stores.secrets_stores.sql_secrets_store import (
     SqlSecretsStoreConfiguration,
 )
+from zenml.zen_stores.statement_counter import instrument_engine
 
 AnyNamedSchema = TypeVar("AnyNamedSchema", bound=NamedSchema)
 AnySchema = TypeVar("AnySchema", bound=BaseSchema)
@@ -972,12 +979,18 @@ class SqlZenStore(BaseZenStore):
         """
         query = filter_model.apply_filter(query=query, table=table)
 
+        # Cursors are only supported for queries which are paginated in the
+        # database, custom fetches always use offset pagination.
+        use_cursor = filter_model.after is not None and not custom_fetch
+        count_total = filter_model.include_total and not use_cursor
+
         # Get the total amount of items in the database for a given query
         custom_fetch_result: Optional[Sequence[Any]] = None
+        total = 0
         if custom_fetch:
             custom_fetch_result = custom_fetch(session, query, filter_model)
             total = len(custom_fetch_result)
-        else:
+        elif count_total:
             result = session.scalar(
                 select(func.count()).select_from(
                     query.options(noload("*")).subquery()
@@ -986,8 +999,6 @@ class SqlZenStore(BaseZenStore):
 
             if result:
                 total = result
-            else:
-                total = 0
 
         # Sorting
         column, operand = filter_model.sorting_params
@@ -1002,21 +1013,23 @@ class SqlZenStore(BaseZenStore):
         query = query.order_by(sort_clause, asc(table.id))  # type: ignore[arg-type]
 
         # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
-        else:
-            total_pages = math.ceil(total / filter_model.size)
+        if custom_fetch or count_total:
+            if total == 0:
+                total_pages = 1
+            else:
+                total_pages = math.ceil(total / filter_model.size)
 
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
-            )
+            if filter_model.page > total_pages:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. The requested page "
+                    f"size is {filter_model.size} and there are a total of "
+                    f"{total} items for this query. The maximum page value "
+                    f"therefore is {total_pages}."
+                )
 
         # Get a page of the actual data
         item_schemas: Sequence[AnySchema]
+        has_next_page: bool
         if custom_fetch:
             assert custom_fetch_result is not None
             item_schemas = custom_fetch_result
@@ -1024,10 +1037,45 @@ class SqlZenStore(BaseZenStore):
             item_schemas = item_schemas[
                 filter_model.offset : filter_model.offset + filter_model.size
             ]
+            has_next_page = filter_model.page < total_pages
         else:
+            if use_cursor:
+                query = query.where(
+                    filter_model.generate_cursor_filter(table=table)
+                )
+            else:
+                query = query.offset(filter_model.offset)
+
+            # Eagerly load all relationships that are required to convert the
+            # schemas to models, instead of loading them for each schema
+            # separately.
+            if not custom_schema_to_model_conversion:
+                query = query.options(
+                    *table.get_query_options(include_metadata=hydrate)
+                )
+
+            # Fetch one additional item to find out if there is a next page
             item_schemas = session.exec(
-                query.limit(filter_model.size).offset(filter_model.offset)
+                query.limit(filter_model.size + 1)
             ).all()
+            has_next_page = len(item_schemas) > filter_model.size
+            item_schemas = item_schemas[: filter_model.size]
+
+            if not count_total:
+                # Only count the items up to the next page
+                total = (
+                    filter_model.offset
+                    + len(item_schemas)
+                    + int(has_next_page)
+                )
+                total_pages = filter_model.page + int(has_next_page)
+
+        next_cursor = None
+        if has_next_page and not custom_fetch and item_schemas:
+            last_item = item_schemas[-1]
+            next_cursor = filter_model.encode_cursor(
+                sort_value=getattr(last_item, column), id=last_item.id
+            )
 
         # Convert this page of items from schemas to models.
         items: List[AnyResponse] = []
@@ -1053,6 +1101,7 @@ class SqlZenStore(BaseZenStore):
             items=items,
             index=filter_model.page,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
     # ====================================
@@ -1071,6 +1120,7 @@ class SqlZenStore(BaseZenStore):
         self._engine = create_engine(
             url=url, connect_args=connect_args, **engine_args
         )
+        instrument_engine(self._engine)
         self._migration_utils = MigrationUtils(
             url=url,
             connect_args=connect_args,
@@ -2672,69 +2722,265 @@ class SqlZenStore(BaseZenStore):
 
         Returns:
             The created artifact version.
+        """
+        return self.batch_create_artifact_versions([artifact_version])[0]
+
+    def batch_create_artifact_versions(
+        self, artifact_versions: List[ArtifactVersionRequest]
+    ) -> List[ArtifactVersionResponse]:
+        """Creates multiple artifact versions in a single transaction.
+
+        Args:
+            artifact_versions: The artifact versions to create.
+
+        Returns:
+            The created artifact versions.
 
         Raises:
-            EntityExistsError: if an artifact with the same name and version
-                already exists.
+            EntityExistsError: If an artifact version with the same name and
+                version already exists, or if no new auto-incremented version
+                could be created.
         """
-        with Session(self.engine) as session:
-            # Check if an artifact with the given name and version exists
-            def _check(tolerance: int = 0) -> None:
-                query = session.exec(
-                    select(ArtifactVersionSchema)
-                    .where(
-                        ArtifactVersionSchema.artifact_id
-                        == artifact_version.artifact_id
+        if not artifact_versions:
+            return []
+
+        for i in range(MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION):
+            with Session(self.engine) as session:
+                schemas: List[ArtifactVersionSchema] = []
+                created_artifact_ids: Set[UUID] = set()
+                for artifact_version in artifact_versions:
+                    schema, artifact_created = (
+                        self._create_artifact_version_schema(
+                            session=session, artifact_version=artifact_version
+                        )
+                    )
+                    schemas.append(schema)
+                    if artifact_created:
+                        created_artifact_ids.add(schema.artifact_id)
+
+                # Check if versions with the same name and version exist
+                duplicates = session.exec(
+                    select(
+                        ArtifactVersionSchema.artifact_id,
+                        ArtifactVersionSchema.version,
                     )
                     .where(
-                        ArtifactVersionSchema.version
-                        == artifact_version.version
+                        or_(
+                            *[
+                                and_(
+                                    ArtifactVersionSchema.artifact_id
+                                    == schema.artifact_id,
+                                    ArtifactVersionSchema.version
+                                    == schema.version,
+                                )
+                                for schema in schemas
+                            ]
+                        )
                     )
-                )
-                existing_artifact = query.fetchmany(tolerance + 1)
-                if (
-                    existing_artifact is not None
-                    and len(existing_artifact) > tolerance
-                ):
-                    raise EntityExistsError(
-                        f"Unable to create artifact with name "
-                        f"'{existing_artifact[0].artifact.name}' and version "
-                        f"'{artifact_version.version}': An artifact with the same "
-                        "name and version already exists."
+                    .group_by(
+                        ArtifactVersionSchema.artifact_id,  # type: ignore[arg-type]
+                        ArtifactVersionSchema.version,
                     )
+                    .having(func.count() > 1)
+                ).all()
 
-            _check()
-            # Create the artifact version.
-            artifact_version_schema = ArtifactVersionSchema.from_request(
-                artifact_version
-            )
-            session.add(artifact_version_schema)
-
-            # Save visualizations of the artifact.
-            if artifact_version.visualizations:
-                for vis in artifact_version.visualizations:
-                    vis_schema = ArtifactVisualizationSchema.from_model(
-                        artifact_visualization_request=vis,
-                        artifact_version_id=artifact_version_schema.id,
-                    )
-                    session.add(vis_schema)
+                if duplicates:
+                    duplicate_keys = set(duplicates)
+                    for artifact_version, schema in zip(
+                        artifact_versions, schemas
+                    ):
+                        if (
+                            artifact_version.version is not None
+                            and (schema.artifact_id, schema.version)
+                            in duplicate_keys
+                        ):
+                            artifact_name = (
+                                artifact_version.artifact_name
+                                or schema.artifact.name
+                            )
+                            raise EntityExistsError(
+                                f"Unable to create artifact with name "
+                                f"'{artifact_name}' and version "
+                                f"'{artifact_version.version}': An artifact "
+                                "with the same name and version already "
+                                "exists."
+                            )
+                    session.rollback()
+                else:
+                    try:
+                        session.commit()
+                    except IntegrityError:
+                        # An artifact with the same name was created
+                        # concurrently, the next attempt will use it.
+                        session.rollback()
+                    else:
+                        # Tags are attached in separate sessions, which is
+                        # why this needs to happen after the commit.
+                        self._attach_tags_to_artifact_versions(
+                            artifact_versions=artifact_versions,
+                            schemas=schemas,
+                            created_artifact_ids=created_artifact_ids,
+                        )
+                        return [
+                            schema.to_model(include_metadata=True)
+                            for schema in schemas
+                        ]
 
-            # Save tags of the artifact.
-            if artifact_version.tags:
+            # Only auto-incremented versions are conflicting, which means
+            # another version was created concurrently. Smoothed exponential
+            # back-off, it will go as 0.2, 0.3, 0.45, 0.68, 1.01, 1.52, ...
+            sleep = 0.2 * 1.5**i
+            logger.debug(
+                "Failed to create auto-incremented artifact versions. "
+                f"Retrying in {sleep}..."
+            )
+            time.sleep(sleep)
+
+        raise EntityExistsError(
+            "Failed to create new artifact versions. Retried "
+            f"{MAX_RETRIES_FOR_VERSIONED_ENTITY_CREATION} times. This could be "
+            "driven by exceptionally high concurrency of pipeline runs. "
+            "Please, reach out to us on ZenML Slack for support."
+        )
+
+    def _attach_tags_to_artifact_versions(
+        self,
+        artifact_versions: List[ArtifactVersionRequest],
+        schemas: List[ArtifactVersionSchema],
+        created_artifact_ids: Set[UUID],
+    ) -> None:
+        """Attaches the tags of created artifact versions.
+
+        Args:
+            artifact_versions: The artifact version requests.
+            schemas: The created artifact version schemas.
+            created_artifact_ids: IDs of the artifacts that were created
+                alongside the artifact versions. The tags of the first
+                version of each of these artifacts are attached to the artifact
+                as well.
+        """
+        tagged_artifact_ids: Set[UUID] = set()
+        for artifact_version, schema in zip(artifact_versions, schemas):
+            if not artifact_version.tags:
+                continue
+            if (
+                schema.artifact_id in created_artifact_ids
+                and schema.artifact_id not in tagged_artifact_ids
+            ):
+                tagged_artifact_ids.add(schema.artifact_id)
                 self._attach_tags_to_resource(
                     tag_names=artifact_version.tags,
-                    resource_id=artifact_version_schema.id,
-                    resource_type=TaggableResourceTypes.ARTIFACT_VERSION,
+                    resource_id=schema.artifact_id,
+                    resource_type=TaggableResourceTypes.ARTIFACT,
                 )
+            self._attach_tags_to_resource(
+                tag_names=artifact_version.tags,
+                resource_id=schema.id,
+                resource_type=TaggableResourceTypes.ARTIFACT_VERSION,
+            )
 
-            try:
-                _check(1)
-                session.commit()
-            except EntityExistsError as e:
-                session.rollback()
-                raise e
+    def _create_artifact_version_schema(
+        self, session: Session, artifact_version: ArtifactVersionRequest
+    ) -> Tuple[ArtifactVersionSchema, bool]:
+        """Creates an artifact version schema and adds it to a session.
+
+        Args:
+            session: The session to which to add the artifact version.
+            artifact_version: The artifact version to create.
+
+        Returns:
+            The artifact version schema and whether the artifact of the
+            version was created as well.
+
+        Raises:
+            KeyError: If the artifact of the version does not exist.
+        """
+        artifact_created = False
+
+        # Get or create the artifact
+        if artifact_version.artifact_id:
+            artifact_schema = session.exec(
+                select(ArtifactSchema).where(
+                    ArtifactSchema.id == artifact_version.artifact_id
+                )
+            ).first()
+            if artifact_schema is None:
+                raise KeyError(
+                    f"Unable to create artifact version: No artifact with ID "
+                    f"'{artifact_version.artifact_id}' found."
+                )
+        else:
+            artifact_schema = session.exec(
+                select(ArtifactSchema).where(
+                    ArtifactSchema.name == artifact_version.artifact_name
+                )
+            ).first()
+            if artifact_schema is None:
+                artifact_request = ArtifactRequest(
+                    name=artifact_version.artifact_name,
+                    has_custom_name=artifact_version.has_custom_name,
+                    tags=artifact_version.tags,
+                )
+                validate_name(artifact_request)
+                artifact_schema = ArtifactSchema.from_request(artifact_request)
+                session.add(artifact_schema)
+                artifact_created = True
+            elif (
+                artifact_schema.has_custom_name
+                != artifact_version.has_custom_name
+            ):
+                artifact_schema.has_custom_name = (
+                    artifact_version.has_custom_name
+                )
+                session.add(artifact_schema)
 
-            return artifact_version_schema.to_model(include_metadata=True)
+        # Get the next auto-incremented version if no version is specified
+        version = artifact_version.version
+        if version is None:
+            latest_version_number = session.exec(
+                select(func.max(ArtifactVersionSchema.version_number)).where(
+                    ArtifactVersionSchema.artifact_id == artifact_schema.id
+                )
+            ).first()
+            version = (latest_version_number or 0) + 1
+
+        artifact_version_schema = ArtifactVersionSchema.from_request(
+            artifact_version,
+            artifact_id=artifact_schema.id,
+            version=version,
+        )
+        session.add(artifact_version_schema)
+
+        # Save visualizations of the artifact.
+        if artifact_version.visualizations:
+            for vis in artifact_version.visualizations:
+                vis_schema = ArtifactVisualizationSchema.from_model(
+                    artifact_visualization_request=vis,
+                    artifact_version_id=artifact_version_schema.id,
+                )
+                session.add(vis_schema)
+
+        # Save metadata of the artifact.
+        if artifact_version.metadata:
+            metadata_types = artifact_version.metadata_types or {}
+            for schema in self._get_run_metadata_schemas(
+                RunMetadataRequest(
+                    workspace=artifact_version.workspace,
+                    user=artifact_version.user,
+                    resource_id=artifact_version_schema.id,
+                    resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+                    stack_component_id=None,
+                    values=artifact_version.metadata,
+                    types={
+                        key: metadata_types.get(key)
+                        or get_metadata_type(value)
+                        for key, value in artifact_version.metadata.items()
+                    },
+                )
+            ):
+                session.add(schema)
+
+        return artifact_version_schema, artifact_created
 
     def get_artifact_version(
         self, artifact_version_id: UUID, hydrate: bool = True
@@ -4983,26 +5229,54 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The created run metadata.
         """
-        return_value: List[RunMetadataResponse] = []
-        with Session(self.engine) as session:
-            for key, value in run_metadata.values.items():
-                type_ = run_metadata.types[key]
-                run_metadata_schema = RunMetadataSchema(
-                    workspace_id=run_metadata.workspace,
-                    user_id=run_metadata.user,
-                    resource_id=run_metadata.resource_id,
-                    resource_type=run_metadata.resource_type.value,
-                    stack_component_id=run_metadata.stack_component_id,
-                    key=key,
-                    value=json.dumps(value),
-                    type=type_,
-                )
-                session.add(run_metadata_schema)
-                session.commit()
-                return_value.append(
-                    run_metadata_schema.to_model(include_metadata=True)
-                )
-        return return_value
+        return self.batch_create_run_metadata([run_metadata])
+
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates multiple run metadata entries in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+        with Session(self.engine) as session:
+            schemas: List[RunMetadataSchema] = []
+            for request in run_metadata:
+                schemas.extend(self._get_run_metadata_schemas(request))
+            session.add_all(schemas)
+            session.commit()
+            return [
+                schema.to_model(include_metadata=True) for schema in schemas
+            ]
+
+    @staticmethod
+    def _get_run_metadata_schemas(
+        run_metadata: RunMetadataRequest,
+    ) -> List[RunMetadataSchema]:
+        """Converts a run metadata request to schemas.
+
+        Args:
+            run_metadata: The run metadata request.
+
+        Returns:
+            One schema for each metadata key of the request.
+        """
+        return [
+            RunMetadataSchema(
+                workspace_id=run_metadata.workspace,
+                user_id=run_metadata.user,
+                resource_id=run_metadata.resource_id,
+                resource_type=run_metadata.resource_type.value,
+                stack_component_id=run_metadata.stack_component_id,
+                key=key,
+                value=json.dumps(value),
+                type=run_metadata.types[key],
+            )
+            for key, value in run_metadata.values.items()
+        ]
 
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
@@ -7705,6 +7979,110 @@ class SqlZenStore(BaseZenStore):
                 hydrate=hydrate,
             )
 
+    def get_cached_step_runs(
+        self,
+        cache_lookup: StepRunCacheLookupRequest,
+        hydrate: bool = False,
+    ) -> Dict[str, StepRunResponse]:
+        """Get the cached step runs for multiple cache keys at once.
+
+        For each cache key, the latest successfully completed step run with
+        this cache key in the given workspace is returned.
+
+        Args:
+            cache_lookup: The workspace and cache keys to look up.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The cached step runs by cache key. Cache keys without a cached
+            step run are not included.
+        """
+        cache_keys = set(cache_lookup.cache_keys)
+        if not cache_keys:
+            return {}
+
+        with Session(self.engine) as session:
+            filters = and_(
+                col(StepRunSchema.cache_key).in_(cache_keys),
+                StepRunSchema.status == ExecutionStatus.COMPLETED.value,
+                StepRunSchema.workspace_id == cache_lookup.workspace,
+            )
+            latest_runs = (
+                select(
+                    StepRunSchema.cache_key,
+                    func.max(StepRunSchema.created).label("created"),
+                )
+                .where(filters)
+                .group_by(col(StepRunSchema.cache_key))
+                .subquery()
+            )
+            step_runs = session.exec(
+                select(StepRunSchema)
+                .join(
+                    latest_runs,
+                    and_(
+                        StepRunSchema.cache_key == latest_runs.c.cache_key,
+                        StepRunSchema.created == latest_runs.c.created,
+                    ),
+                )
+                .where(filters)
+            ).all()
+
+            cached_step_runs: Dict[str, StepRunResponse] = {}
+            for step_run in step_runs:
+                assert step_run.cache_key
+                # Multiple step runs with the same cache key might have been
+                # created at the exact same time, in which case we just use
+                # the first one.
+                if step_run.cache_key not in cached_step_runs:
+                    cached_step_runs[step_run.cache_key] = step_run.to_model(
+                        include_metadata=hydrate, include_resources=hydrate
+                    )
+
+            return cached_step_runs
+
+    def get_run_step_outputs(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the outputs of step runs of a pipeline run.
+
+        This only fetches the information required to resolve the inputs of
+        later steps of the run, which is a lot cheaper than listing the full
+        step runs.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps for which to get the outputs.
+
+        Returns:
+            The outputs by step name. Steps that don't exist in the pipeline
+            run are not included.
+        """
+        if not step_names:
+            return {}
+
+        with Session(self.engine) as session:
+            step_runs = session.exec(
+                select(StepRunSchema)
+                .where(StepRunSchema.pipeline_run_id == run_id)
+                .where(col(StepRunSchema.name).in_(set(step_names)))
+            ).all()
+
+            return {
+                step_run.name: StepRunOutputs(
+                    id=step_run.id,
+                    status=ExecutionStatus(step_run.status),
+                    outputs={
+                        output.name: output.artifact_version.to_model(
+                            pipeline_run_id_in_context=run_id
+                        )
+                        for output in step_run.output_artifacts
+                    },
+                )
+                for step_run in step_runs
+            }
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -0,0 +1,87 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Instrumentation to count the SQL statements executed by the SQL store."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class StatementCounter:
+    """Counter for the SQL statements executed in a block of code."""
+
+    def __init__(self) -> None:
+        """Initializes the counter."""
+        self.count = 0
+
+
+# The counters are mutable objects so that statements which are executed in
+# a copy of the current context (e.g. in the threadpool which runs the sync
+# FastAPI endpoints) are still counted.
+_active_counters: ContextVar[Tuple[StatementCounter, ...]] = ContextVar(
+    "active_statement_counters", default=()
+)
+
+
+@contextmanager
+def count_statements() -> Iterator[StatementCounter]:
+    """Counts the SQL statements executed inside the context.
+
+    Only statements that are executed by an engine that has been instrumented
+    using `instrument_engine(...)` are counted. Contexts can be nested, in
+    which case each statement is counted by all active counters.
+
+    Example:
+    ```
+    with count_statements() as counter:
+        Client().list_pipeline_runs()
+
+    print(counter.count)
+    ```
+
+    Yields:
+        The statement counter.
+    """
+    counter = StatementCounter()
+    token = _active_counters.set(_active_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+def _before_cursor_execute(*args: Any, **kwargs: Any) -> None:
+    """Increments all active statement counters.
+
+    Args:
+        *args: Positional arguments of the SQLAlchemy event.
+        **kwargs: Keyword arguments of the SQLAlchemy event.
+    """
+    for counter in _active_counters.get():
+        counter.count += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Instruments an engine to count the statements it executes.
+
+    Args:
+        engine: The engine to instrument.
+    """
+    if not event.contains(
+        engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
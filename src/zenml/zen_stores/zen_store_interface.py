@@ -15,7 +15,7 @@
 
 import datetime
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.config.pipeline_run_configuration import PipelineRunConfiguration
@@ -125,7 +125,9 @@ from zenml.models import (
     StackRequest,
     StackResponse,
     StackUpdate,
+    StepRunCacheLookupRequest,
     StepRunFilter,
+    StepRunOutputs,
     StepRunRequest,
     StepRunResponse,
     StepRunUpdate,
@@ -660,6 +662,19 @@ class ZenStoreInterface(ABC):
             The created artifact version.
         """
 
+    @abstractmethod
+    def batch_create_artifact_versions(
+        self, artifact_versions: List[ArtifactVersionRequest]
+    ) -> List[ArtifactVersionResponse]:
+        """Creates multiple artifact versions in a single transaction.
+
+        Args:
+            artifact_versions: The artifact versions to create.
+
+        Returns:
+            The created artifact versions.
+        """
+
     @abstractmethod
     def get_artifact_version(
         self, artifact_version_id: UUID, hydrate: bool = True
@@ -1560,6 +1575,19 @@ class ZenStoreInterface(ABC):
             The created run metadata.
         """
 
+    @abstractmethod
+    def batch_create_run_metadata(
+        self, run_metadata: List[RunMetadataRequest]
+    ) -> List[RunMetadataResponse]:
+        """Creates multiple run metadata entries in a single transaction.
+
+        Args:
+            run_metadata: The run metadata to create.
+
+        Returns:
+            The created run metadata.
+        """
+
     @abstractmethod
     def get_run_metadata(
         self, run_metadata_id: UUID, hydrate: bool = True
@@ -2361,6 +2389,46 @@ class ZenStoreInterface(ABC):
             A list of all step runs matching the filter criteria.
         """
 
+    @abstractmethod
+    def get_cached_step_runs(
+        self,
+        cache_lookup: StepRunCacheLookupRequest,
+        hydrate: bool = False,
+    ) -> Dict[str, StepRunResponse]:
+        """Get the cached step runs for multiple cache keys at once.
+
+        For each cache key, the latest successfully completed step run with
+        this cache key in the given workspace is returned.
+
+        Args:
+            cache_lookup: The workspace and cache keys to look up.
+            hydrate: Flag deciding whether to hydrate the output model(s)
+                by including metadata fields in the response.
+
+        Returns:
+            The cached step runs by cache key. Cache keys without a cached
+            step run are not included.
+        """
+
+    @abstractmethod
+    def get_run_step_outputs(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, StepRunOutputs]:
+        """Get the outputs of step runs of a pipeline run.
+
+        This only fetches the information required to resolve the inputs of
+        later steps of the run, which is a lot cheaper than listing the full
+        step runs.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the steps for which to get the outputs.
+
+        Returns:
+            The outputs by step name. Steps that don't exist in the pipeline
+            run are not included.
+        """
+
     @abstractmethod
     def update_run_step(
         self,
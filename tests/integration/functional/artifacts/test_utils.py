@@ -7,6 +7,7 @@ import zipfile
 from typing import Optional, Tuple
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from typing_extensions import Annotated
 
@@ -17,7 +18,12 @@ from zenml import (
     save_artifact,
     step,
 )
+from zenml.artifact_stores.base_artifact_store import (
+    CONTENT_ADDRESSED_DIRECTORY,
+)
+from zenml.artifacts.utils import CONTENT_ADDRESSED_MARKER_FILENAME
 from zenml.client import Client
+from zenml.enums import StackComponentType
 from zenml.models.v2.core.artifact import ArtifactResponse
 
 
@@ -369,3 +375,79 @@ def test_parallel_artifact_creation(clean_client: Client):
     assert {av.version for av in avs} == {
         str(i) for i in range(1, process_count + 1)
     }
+
+
+def test_content_addressed_artifact_storage(clean_client: Client, mocker):
+    """Test that content addressed artifact stores deduplicate data."""
+    default_stack = clean_client.active_stack_model
+    clean_client.create_stack_component(
+        name="content_addressed",
+        flavor="local",
+        component_type=StackComponentType.ARTIFACT_STORE,
+        configuration={
+            "path": os.path.join(
+                clean_client.active_stack.artifact_store.path,
+                "content_addressed_store",
+            ),
+            "content_addressed": True,
+        },
+    )
+    clean_client.create_stack(
+        name="content_addressed",
+        components={
+            StackComponentType.ORCHESTRATOR: default_stack.components[
+                StackComponentType.ORCHESTRATOR
+            ][0].id,
+            StackComponentType.ARTIFACT_STORE: "content_addressed",
+        },
+    )
+    clean_client.activate_stack("content_addressed")
+    artifact_store = clean_client.active_stack.artifact_store
+    assert artifact_store.config.content_addressed
+
+    first = save_artifact(np.arange(10), "first")
+    second = save_artifact(np.arange(10), "second")
+    other = save_artifact(np.arange(11), "first")
+
+    assert first.uri == second.uri
+    assert first.uri != other.uri
+    assert first.uri.startswith(
+        os.path.join(artifact_store.path, CONTENT_ADDRESSED_DIRECTORY)
+    )
+    assert len(second.visualizations) == len(first.visualizations) > 0
+    assert np.array_equal(load_artifact("second"), np.arange(10))
+    for visualization in first.visualizations:
+        assert visualization.uri.startswith(first.uri)
+        assert artifact_store.exists(visualization.uri)
+
+    # A concurrent writer of the same content publishes its data after the
+    # existing artifact version was looked up
+    from zenml.artifacts import utils as artifact_utils
+
+    get_content_addressed_uri = artifact_utils._get_content_addressed_uri
+    mocker.patch.object(
+        artifact_utils,
+        "_get_content_addressed_uri",
+        side_effect=lambda **kwargs: (
+            get_content_addressed_uri(**kwargs)[0],
+            None,
+        ),
+    )
+    concurrent = save_artifact(np.arange(10), "concurrent")
+    assert concurrent.uri == first.uri
+    assert set(artifact_store.listdir(os.path.dirname(first.uri))) == {
+        os.path.basename(first.uri),
+        CONTENT_ADDRESSED_MARKER_FILENAME,
+    }
+    assert {v.uri for v in concurrent.visualizations} == {
+        v.uri for v in first.visualizations
+    }
+
+    # Shared data is only deleted once no artifact version references it
+    clean_client.delete_artifact_version(
+        first.id, delete_from_artifact_store=True
+    )
+    assert artifact_store.exists(second.uri)
+    clean_client.prune_artifacts(delete_from_artifact_store=True)
+    assert not artifact_store.exists(second.uri)
+    assert not artifact_store.exists(other.uri)
@@ -23,6 +23,7 @@ from tests.integration.functional.zen_stores.utils import (
     constant_int_output_test_step,
     int_plus_one_test_step,
 )
+from zenml import pipeline, step
 from zenml.constants import TEXT_FIELD_MAX_LENGTH
 from zenml.enums import ExecutionStatus
 
@@ -229,3 +230,38 @@ def _get_first_step_of_last_run(
 ) -> "StepRunResponse":
     """Get the output of the last run."""
     return pipe.model.last_run.steps["step_"]
+
+
+@step(enable_cache=False)
+def _uncached_producer_step() -> int:
+    return 42
+
+
+@step
+def _consumer_step(value: int) -> int:
+    return value + 1
+
+
+def test_content_addressed_caching(clean_client: "Client"):
+    """Tests that steps with content addressed caching are cached if their
+    inputs contain the same data as in a previous run."""
+
+    @pipeline
+    def _pipeline(content_addressed: bool):
+        value = _uncached_producer_step()
+        _consumer_step.with_options(
+            settings={"cache": {"content_addressed": content_addressed}}
+        )(value)
+
+    _pipeline(content_addressed=False)
+    _pipeline(content_addressed=False)
+    step_run = _pipeline.model.last_run.steps["_consumer_step"]
+    assert step_run.status == ExecutionStatus.COMPLETED
+    # Content hashes are only computed if a consumer needs them
+    assert step_run.inputs["value"].content_hash is None
+
+    _pipeline(content_addressed=True)
+    _pipeline(content_addressed=True)
+    step_run = _pipeline.model.last_run.steps["_consumer_step"]
+    assert step_run.status == ExecutionStatus.CACHED
+    assert step_run.inputs["value"].content_hash
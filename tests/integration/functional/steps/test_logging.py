@@ -1,5 +1,6 @@
 import os
 import time
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -7,7 +8,14 @@ from zenml import pipeline, step
 from zenml.artifacts.utils import _load_file_from_artifact_store
 from zenml.client import Client
 from zenml.logger import get_logger
-from zenml.logging.step_logging import fetch_logs
+from zenml.logging.step_logging import (
+    LOGS_INDEX_EXTENSION,
+    StepLogsStorage,
+    fetch_logs,
+    get_logs_index_uri,
+    prepare_logs_uri,
+    stream_logs,
+)
 
 logger = get_logger(__name__)
 
@@ -84,6 +92,7 @@ def test_that_small_files_are_merged_together():
     files = artifact_store.listdir(
         ret.steps["steps_writing_above_the_count_limit"].logs.uri
     )
+    files = [f for f in files if not f.endswith(LOGS_INDEX_EXTENSION)]
     assert len(files) == 1
     content = str(
         _load_file_from_artifact_store(
@@ -220,3 +229,122 @@ def test_that_fetch_logs_works_with_legacy(clean_client: Client):
     assert data_.count("1") == 3
     assert data_.count("2") == 3
     assert data_.count("3") == 3
+
+
+def test_step_logs_storage_writes_messages_in_background(
+    clean_client: Client,
+):
+    """Tests that queued messages are written by the background thread."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="step")
+
+    storage = StepLogsStorage(logs_uri=logs_uri, max_messages=2)
+    for i in range(5):
+        storage.write(f"message {i}")
+    storage.save_to_file(force=True)
+
+    with artifact_store.open(logs_uri, "r") as f:
+        assert f.read().splitlines() == [f"message {i}" for i in range(5)]
+
+    storage.write("last message")
+    storage.close()
+
+    assert not storage._shipper.is_alive()
+    with artifact_store.open(logs_uri, "r") as f:
+        assert f.read().splitlines()[-1] == "last message"
+
+
+def test_step_logs_storage_drops_messages_if_queue_is_full(
+    clean_client: Client,
+):
+    """Tests that messages are dropped and accounted for if the queue is
+    full."""
+    artifact_store = clean_client.active_stack.artifact_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="step")
+
+    # Without a running shipper thread, the queue never gets drained
+    with patch.object(StepLogsStorage, "_ship_logs"):
+        storage = StepLogsStorage(logs_uri=logs_uri, max_queue_size=2)
+    for i in range(5):
+        storage.write(f"message {i}")
+    assert storage.dropped_messages == 3
+
+    storage.close()
+    with artifact_store.open(logs_uri, "r") as f:
+        lines = f.read().splitlines()
+
+    assert lines[:2] == ["message 0", "message 1"]
+    assert "3 log messages were dropped" in lines[2]
+
+
+def test_stream_logs_with_line_and_time_filters(clean_client: Client):
+    """Tests querying indexed logs by lines and time."""
+    artifact_store = clean_client.active_stack.artifact_store
+    zen_store = clean_client.zen_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="step")
+
+    storage = StepLogsStorage(logs_uri=logs_uri)
+    for i in range(3):
+        storage.write(f"message {i}")
+    storage.save_to_file(force=True)
+    time.sleep(0.01)
+    checkpoint = datetime.now(timezone.utc)
+    time.sleep(0.01)
+    for i in range(3, 6):
+        storage.write(f"message {i}")
+    storage.close()
+
+    assert artifact_store.exists(get_logs_index_uri(logs_uri))
+
+    def _query(**kwargs):
+        return "".join(
+            stream_logs(zen_store, artifact_store.id, logs_uri, **kwargs)
+        ).splitlines()
+
+    all_lines = [f"message {i}" for i in range(6)]
+    assert _query() == all_lines
+    assert _query(tail=2) == all_lines[-2:]
+    assert _query(tail=10) == all_lines
+    assert _query(start_line=2, end_line=4) == all_lines[2:4]
+    assert _query(start_line=1, tail=2) == all_lines[-2:]
+    assert _query(start_time=checkpoint) == all_lines[3:]
+    assert _query(end_time=checkpoint) == all_lines[:3]
+
+    # Data appended without index entries is still returned
+    with artifact_store.open(logs_uri, "a") as f:
+        f.write("not indexed\n")
+    assert _query(tail=1) == ["not indexed"]
+
+
+@patch(
+    "zenml.artifact_stores.base_artifact_store.BaseArtifactStoreConfig.IS_IMMUTABLE_FILESYSTEM",
+    True,
+)
+def test_merged_log_files_are_indexed(clean_client: Client):
+    """Tests that merged log files of immutable filesystems get an index."""
+    artifact_store = clean_client.active_stack.artifact_store
+    zen_store = clean_client.zen_store
+    logs_uri = prepare_logs_uri(artifact_store, step_name="step")
+
+    storage = StepLogsStorage(logs_uri=logs_uri)
+    for i in range(4):
+        storage.write(f"message {i}")
+        storage.save_to_file(force=True)
+    storage.close()
+    storage.merge_log_files(merge_all_files=True)
+
+    files = artifact_store.listdir(logs_uri)
+    assert len(files) == 2
+    assert any(f.endswith(LOGS_INDEX_EXTENSION) for f in files)
+
+    logs = "".join(stream_logs(zen_store, artifact_store.id, logs_uri))
+    assert logs.splitlines() == [f"message {i}" for i in range(4)]
+    logs = "".join(
+        stream_logs(
+            zen_store, artifact_store.id, logs_uri, start_line=1, tail=2
+        )
+    )
+    assert logs.splitlines() == ["message 2", "message 3"]
+    assert fetch_logs(zen_store, artifact_store.id, logs_uri, -10) == (
+        "message 3\n"
+    )
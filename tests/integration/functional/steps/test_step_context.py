@@ -9,6 +9,7 @@ from typing_extensions import Annotated
 from zenml import get_step_context, log_artifact_metadata, pipeline, step
 from zenml.artifacts.artifact_config import ArtifactConfig
 from zenml.client import Client
+from zenml.config import OutputSavingSettings
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
@@ -80,6 +81,36 @@ def test_materializer_can_access_step_context():
     _complex_object_materialization_pipeline()
 
 
+@step(
+    output_materializers=ComplexObjectMaterializer,
+    settings={"output_saving": OutputSavingSettings(parallel=True)},
+)
+def _output_complex_objects_in_parallel_step() -> Tuple[
+    Annotated[ComplexObject, "first"], Annotated[ComplexObject, "second"]
+]:
+    """This step calls `save` of `ComplexObjectMaterializer` from multiple
+    threads."""
+    return ComplexObject(name="foo"), ComplexObject(name="bar")
+
+
+def test_materializer_can_access_step_context_when_saving_in_parallel():
+    """Validate that step context is available to Materializers when the
+    outputs are saved in parallel."""
+
+    @pipeline(name="bar")
+    def _parallel_saving_pipeline():
+        _output_complex_objects_in_parallel_step()
+
+    run = _parallel_saving_pipeline()
+    outputs = run.steps["_output_complex_objects_in_parallel_step"].outputs
+    assert outputs["first"].load() == ComplexObject(
+        name="foo", pipeline_name="bar"
+    )
+    assert outputs["second"].load() == ComplexObject(
+        name="bar", pipeline_name="bar"
+    )
+
+
 def test_step_can_access_step_context():
     """Call step using step context directly, before Materializers"""
 
@@ -25,7 +25,9 @@ from uuid import UUID, uuid4
 
 import pytest
 from pydantic import SecretStr
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
 
 from tests.integration.functional.utils import sample_name
 from tests.integration.functional.zen_stores.utils import (
@@ -88,6 +90,7 @@ from zenml.models import (
     ArtifactVersionFilter,
     ArtifactVersionRequest,
     ArtifactVersionResponse,
+    BaseFilter,
     ComponentFilter,
     ComponentUpdate,
     ModelVersionArtifactFilter,
@@ -129,8 +132,11 @@ from zenml.models.v2.core.step_run import StepRunRequest
 from zenml.models.v2.core.user import UserFilter
 from zenml.utils import code_repository_utils, source_utils
 from zenml.utils.enum_utils import StrEnum
+from zenml.utils.pagination_utils import depaginate
 from zenml.zen_stores.rest_zen_store import RestZenStore
+from zenml.zen_stores.schemas import ArtifactVersionSchema, StepRunSchema
 from zenml.zen_stores.sql_zen_store import SqlZenStore
+from zenml.zen_stores.statement_counter import count_statements
 
 DEFAULT_NAME = "default"
 
@@ -3054,6 +3060,100 @@ def test_artifact_fetch_works_with_invalid_name(clean_client: "Client"):
     store.delete_artifact(response.id)
 
 
+def test_batch_create_artifact_versions(clean_client: "Client"):
+    """Tests creating multiple artifact versions in a single transaction."""
+    store = clean_client.zen_store
+    artifact_name = sample_name("batch_artifact")
+
+    def _request(version=None, metadata=None):
+        return ArtifactVersionRequest(
+            artifact_name=artifact_name,
+            version=version,
+            has_custom_name=True,
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            type=ArtifactType.DATA,
+            uri=sample_name("uri"),
+            materializer=Source(module="acme.foo", type=SourceType.INTERNAL),
+            data_type=Source(module="acme.foo", type=SourceType.INTERNAL),
+            metadata=metadata,
+        )
+
+    # Versions of a new artifact are auto-incremented within the batch
+    artifact_versions = store.batch_create_artifact_versions(
+        [_request(metadata={"key": 1}), _request(), _request(version="foo")]
+    )
+    assert [av.version for av in artifact_versions] == ["1", "2", "foo"]
+    assert len({av.artifact.id for av in artifact_versions}) == 1
+    assert artifact_versions[0].run_metadata["key"].value == 1
+    assert artifact_versions[0].run_metadata["key"].type == (
+        MetadataTypeEnum.INT
+    )
+    assert store.get_artifact(artifact_versions[0].artifact.id).name == (
+        artifact_name
+    )
+
+    # A conflicting explicit version rolls back the entire batch
+    with pytest.raises(EntityExistsError):
+        store.batch_create_artifact_versions(
+            [_request(), _request(version="foo")]
+        )
+    assert (
+        store.list_artifact_versions(
+            ArtifactVersionFilter(name=artifact_name)
+        ).total
+        == 3
+    )
+
+    assert store.create_artifact_version(_request()).version == "3"
+
+
+def test_batch_create_run_metadata(clean_client: "Client"):
+    """Tests creating run metadata for multiple resources at once."""
+    store = clean_client.zen_store
+    artifact_versions = store.batch_create_artifact_versions(
+        [
+            ArtifactVersionRequest(
+                artifact_name=sample_name("batch_artifact"),
+                has_custom_name=True,
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+                type=ArtifactType.DATA,
+                uri=sample_name("uri"),
+                materializer=Source(
+                    module="acme.foo", type=SourceType.INTERNAL
+                ),
+                data_type=Source(module="acme.foo", type=SourceType.INTERNAL),
+            )
+            for _ in range(2)
+        ]
+    )
+
+    run_metadata = store.batch_create_run_metadata(
+        [
+            RunMetadataRequest(
+                user=clean_client.active_user.id,
+                workspace=clean_client.active_workspace.id,
+                resource_id=artifact_version.id,
+                resource_type=MetadataResourceTypes.ARTIFACT_VERSION,
+                stack_component_id=None,
+                values={"a": 1, "b": "foo"},
+                types={
+                    "a": MetadataTypeEnum.INT,
+                    "b": MetadataTypeEnum.STRING,
+                },
+            )
+            for artifact_version in artifact_versions
+        ]
+    )
+    assert len(run_metadata) == 4
+
+    for artifact_version in artifact_versions:
+        fetched = store.get_artifact_version(artifact_version.id)
+        assert fetched.run_metadata["a"].value == 1
+        assert fetched.run_metadata["b"].value == "foo"
+
+
 # .---------.
 # | Logs    |
 # '---------'
@@ -5494,3 +5594,156 @@ def test_updating_the_pipeline_run_status(step_status, expected_run_status):
         )
         run_status = Client().get_pipeline_run(run_context.runs[-1].id).status
         assert run_status == expected_run_status
+
+
+def test_cursor_pagination(clean_client: Client):
+    """Tests listing entities using pagination cursors."""
+    store = clean_client.zen_store
+    for i in range(5):
+        clean_client.create_tag(TagRequest(name=f"tag_{i}"))
+
+    first_page = store.list_tags(TagFilter(size=2, sort_by="desc:name"))
+    assert [tag.name for tag in first_page] == ["tag_4", "tag_3"]
+    assert first_page.total == 5
+    assert first_page.next_cursor
+
+    second_page = store.list_tags(
+        TagFilter(
+            size=2,
+            sort_by="desc:name",
+            page=2,
+            after=first_page.next_cursor,
+        )
+    )
+    assert [tag.name for tag in second_page] == ["tag_2", "tag_1"]
+    # The total is not counted for requests with a cursor
+    assert second_page.total == 5
+    assert second_page.total_pages == 3
+
+    last_page = store.list_tags(
+        TagFilter(
+            size=2,
+            sort_by="desc:name",
+            page=3,
+            after=second_page.next_cursor,
+        )
+    )
+    assert [tag.name for tag in last_page] == ["tag_0"]
+    assert last_page.next_cursor is None
+    assert last_page.index == last_page.total_pages
+
+    uncounted_page = store.list_tags(TagFilter(size=2, include_total=False))
+    assert uncounted_page.total == 3
+    assert uncounted_page.total_pages == 2
+
+    with pytest.raises(ValueError):
+        store.list_tags(TagFilter(after="invalid"))
+
+
+def test_depaginate_uses_cursors(clean_client: Client):
+    """Tests that depaginating uses the pagination cursors."""
+    for i in range(5):
+        clean_client.create_tag(TagRequest(name=f"tag_{i}"))
+        clean_client.create_workspace(name=f"workspace_{i}", description="")
+
+    with patch.object(
+        BaseFilter,
+        "generate_cursor_filter",
+        autospec=True,
+        side_effect=BaseFilter.generate_cursor_filter,
+    ) as cursor_filter:
+        tags = depaginate(
+            clean_client.list_tags,
+            tag_filter_model=TagFilter(size=2, name="startswith:tag_"),
+        )
+        assert cursor_filter.call_count == 2
+
+    assert sorted(tag.name for tag in tags) == [f"tag_{i}" for i in range(5)]
+
+    workspaces = depaginate(
+        clean_client.list_workspaces, size=2, name="startswith:workspace_"
+    )
+    assert sorted(workspace.name for workspace in workspaces) == [
+        f"workspace_{i}" for i in range(5)
+    ]
+
+
+def test_frequent_queries_use_indexes():
+    """Tests that frequent store queries are answered using indexes."""
+    store = Client().zen_store
+    if (
+        not isinstance(store, SqlZenStore)
+        or store.engine.dialect.name != "sqlite"
+    ):
+        pytest.skip("Query plans are only checked for SQLite stores.")
+
+    queries = {
+        "ix_step_run_cache_key": select(StepRunSchema).where(
+            StepRunSchema.cache_key == "cache_key",
+            StepRunSchema.status == ExecutionStatus.COMPLETED.value,
+            StepRunSchema.workspace_id == uuid4(),
+        ),
+        "ix_step_run_pipeline_run_id_name": select(StepRunSchema).where(
+            StepRunSchema.name == "step",
+            StepRunSchema.pipeline_run_id == uuid4(),
+        ),
+        "ix_artifact_version_uri": select(ArtifactVersionSchema).where(
+            ArtifactVersionSchema.uri == "uri"
+        ),
+        "ix_artifact_version_artifact_id_version_number": select(
+            func.max(ArtifactVersionSchema.version_number)
+        ).where(ArtifactVersionSchema.artifact_id == uuid4()),
+    }
+
+    with store.engine.connect() as connection:
+        for index_name, query in queries.items():
+            compiled = query.compile(dialect=store.engine.dialect)
+            parameters = tuple(
+                value.hex if isinstance(value, UUID) else value
+                for value in (
+                    compiled.params[name] for name in compiled.positiontup
+                )
+            )
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {compiled}", parameters
+            ).all()
+            assert any(index_name in str(row) for row in plan), plan
+
+
+@pytest.mark.parametrize("hydrate", [False, True])
+def test_list_queries_do_not_scale_with_page_size(hydrate: bool):
+    """Tests that listing entities does not issue a query per entity."""
+    store = Client().zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Statements are only counted for SQL stores.")
+
+    def _count_statements(list_method, filter_model) -> int:
+        with count_statements() as counter:
+            page = list_method(filter_model, hydrate=hydrate)
+        assert page.items
+        return counter.count
+
+    context = PipelineRunContext(3)
+    with context:
+        list_calls = [
+            (
+                store.list_runs,
+                lambda size: PipelineRunFilter(
+                    name=f"startswith:{context.pipeline_name}", size=size
+                ),
+            ),
+            (
+                store.list_run_steps,
+                lambda size: StepRunFilter(sort_by="desc:created", size=size),
+            ),
+            (
+                store.list_artifact_versions,
+                lambda size: ArtifactVersionFilter(
+                    sort_by="desc:created", size=size
+                ),
+            ),
+        ]
+        for list_method, get_filter in list_calls:
+            assert _count_statements(
+                list_method, get_filter(1)
+            ) == _count_statements(list_method, get_filter(6))
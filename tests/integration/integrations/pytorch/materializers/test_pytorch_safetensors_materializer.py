@@ -0,0 +1,79 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("safetensors")
+
+from torch.nn import Embedding, Linear, Module  # noqa: E402
+
+from tests.unit.test_general import _test_materializer  # noqa: E402
+from zenml.integrations.pytorch.materializers.pytorch_safetensors_materializer import (  # noqa: E402
+    INDEX_FILENAME,
+    LazyStateDict,
+    PyTorchSafetensorsMaterializer,
+)
+
+
+class TiedModel(Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.embedding = Embedding(10, 4)
+        self.output = Linear(4, 10)
+        self.output.weight = self.embedding.weight
+
+
+def test_pytorch_safetensors_materializer(clean_client):
+    """Tests the PyTorch safetensors materializer."""
+    module = Linear(20, 20)
+    loaded_module = _test_materializer(
+        step_output=module,
+        materializer_class=PyTorchSafetensorsMaterializer,
+        expected_metadata_size=3,
+        validation_function=lambda uri: os.path.exists(
+            os.path.join(uri, INDEX_FILENAME)
+        ),
+    )
+
+    assert loaded_module.in_features == 20
+    assert loaded_module.out_features == 20
+    assert torch.equal(loaded_module.weight, module.weight)
+    assert torch.equal(loaded_module.bias, module.bias)
+
+
+def test_pytorch_safetensors_materializer_shards_and_tied_weights(
+    clean_client, mocker
+):
+    """Tests sharding, tied weights and lazy loading of tensors."""
+    mocker.patch.object(PyTorchSafetensorsMaterializer, "MAX_SHARD_SIZE", 100)
+    module = TiedModel()
+
+    uri = os.path.join(clean_client.active_stack.artifact_store.path, "model")
+    materializer = PyTorchSafetensorsMaterializer(uri=uri)
+    materializer.save(module)
+
+    assert len([f for f in os.listdir(uri) if f.endswith(".safetensors")]) == 2
+
+    loaded_module = materializer.load(TiedModel)
+    assert torch.equal(loaded_module.embedding.weight, module.embedding.weight)
+    assert (
+        loaded_module.output.weight.data_ptr()
+        == loaded_module.embedding.weight.data_ptr()
+    )
+
+    state_dict = materializer.load(LazyStateDict)
+    assert set(state_dict) == set(module.state_dict())
+    assert torch.equal(state_dict["output.weight"], module.output.weight)
@@ -0,0 +1,205 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import gc
+import os
+from uuid import uuid4
+
+from zenml.artifacts.artifact_cache import (
+    ArtifactCache,
+    get_artifact_cache,
+    load_with_artifact_cache,
+)
+from zenml.client import Client
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE_MB,
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+)
+
+
+def _write_artifact(artifact_store, name: str, size: int) -> str:
+    """Writes an artifact with a nested file to the artifact store."""
+    uri = os.path.join(artifact_store.path, name)
+    artifact_store.makedirs(os.path.join(uri, "nested"))
+    with artifact_store.open(os.path.join(uri, "data.bin"), "wb") as f:
+        f.write(b"a" * size)
+    with artifact_store.open(os.path.join(uri, "nested", "meta"), "w") as f:
+        f.write(name)
+    return uri
+
+
+def test_artifact_cache_downloads_once(clean_client, tmp_path, mocker):
+    """Tests that the artifact cache only downloads each artifact once."""
+    artifact_store = Client().active_stack.artifact_store
+    uri = _write_artifact(artifact_store, "artifact", size=10)
+    artifact_version_id = uuid4()
+
+    cache = ArtifactCache(path=str(tmp_path), max_size=1000)
+    walk_spy = mocker.spy(artifact_store, "walk")
+
+    local_uri, release = cache.get(artifact_version_id, uri, artifact_store)
+    assert local_uri.startswith(str(tmp_path))
+    with open(os.path.join(local_uri, "data.bin"), "rb") as f:
+        assert f.read() == b"a" * 10
+    with open(os.path.join(local_uri, "nested", "meta")) as f:
+        assert f.read() == "artifact"
+    release()
+
+    local_uri_2, release = cache.get(artifact_version_id, uri, artifact_store)
+    assert local_uri_2 == local_uri
+    assert walk_spy.call_count == 1
+    release()
+
+    cache_store = cache.get_artifact_store(artifact_store)
+    assert cache_store.exists(os.path.join(local_uri, "data.bin"))
+
+
+def test_artifact_cache_evicts_least_recently_used_entries(
+    clean_client, tmp_path
+):
+    """Tests that the artifact cache evicts entries once it is full."""
+    artifact_store = Client().active_stack.artifact_store
+    cache = ArtifactCache(path=str(tmp_path), max_size=40)
+
+    uris = [
+        _write_artifact(artifact_store, f"artifact_{i}", size=10)
+        for i in range(3)
+    ]
+    ids = [uuid4() for _ in uris]
+
+    first, release = cache.get(ids[0], uris[0], artifact_store)
+    release()
+    second, release = cache.get(ids[1], uris[1], artifact_store)
+    release()
+    # Mark the first entry as more recently used than the second one
+    os.utime(f"{second}.json", (0, 0))
+    _, release = cache.get(ids[0], uris[0], artifact_store)
+    release()
+    third, release = cache.get(ids[2], uris[2], artifact_store)
+    release()
+
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+    assert os.path.exists(third)
+
+
+def test_artifact_cache_does_not_evict_leased_entries(
+    clean_client, tmp_path
+):
+    """Tests that entries are not evicted while they are being read."""
+    artifact_store = Client().active_stack.artifact_store
+    cache = ArtifactCache(path=str(tmp_path), max_size=30)
+
+    uris = [
+        _write_artifact(artifact_store, f"artifact_{i}", size=10)
+        for i in range(3)
+    ]
+    ids = [uuid4() for _ in uris]
+
+    first, release_first = cache.get(ids[0], uris[0], artifact_store)
+    os.utime(f"{first}.json", (0, 0))
+    second, release_second = cache.get(ids[1], uris[1], artifact_store)
+
+    # The first entry is still being read, so it is kept even though the
+    # cache exceeds its maximum size
+    assert os.path.exists(first)
+    with open(os.path.join(first, "data.bin"), "rb") as f:
+        assert f.read() == b"a" * 10
+
+    release_first()
+    release_second()
+    third, release_third = cache.get(ids[2], uris[2], artifact_store)
+    release_third()
+    assert not os.path.exists(first)
+    assert not os.path.exists(second)
+    assert os.path.exists(third)
+
+    # Leases of processes that exited without releasing them are ignored
+    lease_directory = os.path.join(
+        str(tmp_path), "leases", os.path.basename(third)
+    )
+    stale_lease = os.path.join(lease_directory, "12345-stale")
+    with open(stale_lease, "w"):
+        pass
+    os.utime(f"{third}.json", (0, 0))
+    _, release_first = cache.get(ids[0], uris[0], artifact_store)
+    release_first()
+    assert not os.path.exists(third)
+    assert not os.path.exists(stale_lease)
+
+
+class _LazyData:
+    """Data that reads from its files after it was loaded."""
+
+    def __init__(self, path: str, artifact_store) -> None:
+        self.path = path
+        self.artifact_store = artifact_store
+
+
+def test_load_with_artifact_cache(clean_client, tmp_path, mocker):
+    """Tests loading an artifact with the artifact cache."""
+    artifact_store = Client().active_stack.artifact_store
+    uri = _write_artifact(artifact_store, "artifact", size=10)
+    artifact_version_id = uuid4()
+
+    def _load(uri, artifact_store):
+        return _LazyData(uri, artifact_store)
+
+    # Local artifacts are never cached
+    mocker.patch.dict(
+        os.environ,
+        {
+            ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE_MB: "1",
+            ENV_ZENML_ARTIFACT_CACHE_PATH: str(tmp_path),
+        },
+    )
+    data = load_with_artifact_cache(
+        _load, artifact_version_id, uri, artifact_store
+    )
+    assert data.path == uri
+
+    mocker.patch(
+        "zenml.artifacts.artifact_cache.io_utils.is_remote",
+        return_value=True,
+    )
+    data = load_with_artifact_cache(
+        _load, artifact_version_id, uri, artifact_store
+    )
+    assert data.path.startswith(str(tmp_path))
+    assert data.artifact_store.exists(os.path.join(data.path, "data.bin"))
+
+    # The entry is leased as long as the loaded data exists
+    cache = get_artifact_cache()
+    key = os.path.basename(data.path)
+    assert cache._is_leased(key)
+    del data
+    gc.collect()
+    assert not cache._is_leased(key)
+
+    # Data without weak reference support is leased until the process exits
+    load_with_artifact_cache(
+        lambda uri, artifact_store: [_LazyData(uri, artifact_store)],
+        artifact_version_id,
+        uri,
+        artifact_store,
+    )
+    gc.collect()
+    assert cache._is_leased(key)
+
+    # Disabled cache
+    mocker.patch.dict(os.environ, {ENV_ZENML_ARTIFACT_CACHE_MAX_SIZE_MB: "0"})
+    assert get_artifact_cache() is None
+    data = load_with_artifact_cache(
+        _load, artifact_version_id, uri, artifact_store
+    )
+    assert data.path == uri
@@ -11,16 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import io
 import os
 import shutil
 import tempfile
+from typing import Dict
 from uuid import uuid4
 
 import numpy as np
 import pytest
 
 from zenml.artifacts.utils import (
-    _get_new_artifact_version,
+    CONTENT_ADDRESSED_MARKER_FILENAME,
+    _commit_content_addressed_data,
+    _get_committed_content_addressed_uri,
     _load_artifact_from_uri,
     load_artifact_from_response,
     load_model_from_metadata,
@@ -29,7 +33,7 @@ from zenml.artifacts.utils import (
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
 from zenml.materializers.numpy_materializer import NUMPY_FILENAME
-from zenml.models import ArtifactVersionResponse, Page
+from zenml.models import ArtifactVersionResponse
 
 
 @pytest.fixture
@@ -153,9 +157,9 @@ def test__load_artifact(numpy_file_uri):
         _load_artifact_from_uri(materializer, data_type, numpy_file_uri)
         assert False, "Expected a ModuleNotFoundError to be raised."
     except ModuleNotFoundError as e:
-        assert (
-            str(e) == "No module named 'random_materializer_class_path'"
-        ), "Unexpected error message."
+        assert str(e) == "No module named 'random_materializer_class_path'", (
+            "Unexpected error message."
+        )
 
     # Test with invalid data type and ensure that a ModuleNotFoundError is
     # raised
@@ -164,9 +168,9 @@ def test__load_artifact(numpy_file_uri):
         _load_artifact_from_uri(materializer, data_type, numpy_file_uri)
         assert False, "Expected a ModuleNotFoundError to be raised."
     except ModuleNotFoundError as e:
-        assert (
-            str(e) == "No module named 'random_data_type_class_path'"
-        ), "Unexpected error message."
+        assert str(e) == "No module named 'random_data_type_class_path'", (
+            "Unexpected error message."
+        )
 
     # Test with valid materializer and data type and ensure that the artifact
     # is loaded correctly
@@ -176,33 +180,96 @@ def test__load_artifact(numpy_file_uri):
     assert isinstance(artifact, np.ndarray)
 
 
-def test__get_new_artifact_version(mocker, sample_artifact_version_model):
-    """Unit test for the `_get_new_artifact_version` function."""
-    # If no artifact exists, "1" should be returned
-    mocker.patch(
-        "zenml.client.Client.list_artifact_versions",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=0,
-            items=[],
-        ),
+class _Upload(io.StringIO):
+    """File that is only stored in the object store once it is closed."""
+
+    def __init__(self, objects: Dict[str, str], path: str) -> None:
+        super().__init__()
+        self._objects = objects
+        self._path = path
+
+    def close(self) -> None:
+        if not self.closed:
+            self._objects[self._path] = self.getvalue()
+        super().close()
+
+
+class _ObjectStore:
+    """Artifact store with the semantics of an object store like S3.
+
+    Directories only exist as prefixes of objects and, like for the `fsspec`
+    based artifact stores, renaming only moves a single object.
+    """
+
+    def __init__(self) -> None:
+        self.objects: Dict[str, str] = {}
+
+    def open(self, path: str, mode: str = "r"):
+        if "w" in mode:
+            return _Upload(self.objects, path)
+        if path not in self.objects:
+            raise FileNotFoundError(path)
+        return io.StringIO(self.objects[path])
+
+    def exists(self, path: str) -> bool:
+        return path in self.objects or any(
+            key.startswith(f"{path}/") for key in self.objects
+        )
+
+    def rename(self, src: str, dst: str, overwrite: bool = False) -> None:
+        if src not in self.objects:
+            raise FileNotFoundError(src)
+        if not overwrite and dst in self.objects:
+            raise FileExistsError(dst)
+        self.objects[dst] = self.objects.pop(src)
+
+    def rmtree(self, path: str) -> None:
+        for key in [key for key in self.objects if key.startswith(f"{path}/")]:
+            del self.objects[key]
+
+
+def test_committing_content_addressed_data_in_object_store():
+    """Tests committing content addressed data without renaming
+    directories."""
+    store = _ObjectStore()
+    content_uri = "s3://bucket/content_addressed/ab/abc"
+    for name in ["first", "second", "third"]:
+        store.objects[f"{content_uri}/{name}/{NUMPY_FILENAME}"] = "data"
+
+    # Data is only committed once the marker exists
+    assert _get_committed_content_addressed_uri(store, content_uri) is None
+
+    first_uri = f"{content_uri}/first"
+    assert (
+        _commit_content_addressed_data(
+            store, content_uri=content_uri, data_uri=first_uri
+        )
+        == first_uri
     )
-    assert _get_new_artifact_version(sample_artifact_version_model.name) == 1
-
-    # If an artifact exists, the next version should be returned
-    mocker.patch(
-        "zenml.client.Client.list_artifact_versions",
-        return_value=Page(
-            index=1,
-            max_size=1,
-            total_pages=1,
-            total=1,
-            items=[sample_artifact_version_model],
-        ),
+    assert (
+        _get_committed_content_addressed_uri(store, content_uri) == first_uri
     )
+
+    # Later writers discard their copy of the data
+    assert (
+        _commit_content_addressed_data(
+            store, content_uri=content_uri, data_uri=f"{content_uri}/second"
+        )
+        == first_uri
+    )
+    assert not store.exists(f"{content_uri}/second")
+
+    # Markers of deleted data are replaced
+    store.rmtree(first_uri)
+    assert _get_committed_content_addressed_uri(store, content_uri) is None
+    third_uri = f"{content_uri}/third"
     assert (
-        _get_new_artifact_version(sample_artifact_version_model.name)
-        == int(sample_artifact_version_model.version) + 1
+        _commit_content_addressed_data(
+            store, content_uri=content_uri, data_uri=third_uri
+        )
+        == third_uri
     )
+    assert set(store.objects) == {
+        f"{third_uri}/{NUMPY_FILENAME}",
+        f"{content_uri}/{CONTENT_ADDRESSED_MARKER_FILENAME}",
+    }
@@ -75,16 +75,15 @@ from zenml.models.v2.core.service import (
     ServiceResponseMetadata,
 )
 from zenml.new.pipelines.pipeline import Pipeline
-from zenml.orchestrators.base_orchestrator import BaseOrchestratorConfig
-from zenml.orchestrators.local.local_orchestrator import LocalOrchestrator
+from zenml.orchestrators.local.local_orchestrator import (
+    LocalOrchestrator,
+    LocalOrchestratorConfig,
+)
 from zenml.pipelines import pipeline
 from zenml.services.service_status import ServiceState
 from zenml.services.service_type import ServiceType
 from zenml.stack.stack import Stack
-from zenml.stack.stack_component import (
-    StackComponentConfig,
-    StackComponentType,
-)
+from zenml.stack.stack_component import StackComponentType
 from zenml.step_operators import BaseStepOperator, BaseStepOperatorConfig
 from zenml.steps import StepContext, step
 from zenml.steps.entrypoint_function_utils import StepArtifact
@@ -96,7 +95,7 @@ def local_stack():
     orchestrator = LocalOrchestrator(
         name="",
         id=uuid4(),
-        config=StackComponentConfig(),
+        config=LocalOrchestratorConfig(),
         flavor="default",
         type=StackComponentType.ORCHESTRATOR,
         user=uuid4(),
@@ -129,7 +128,7 @@ def local_orchestrator():
     return LocalOrchestrator(
         name="",
         id=uuid4(),
-        config=BaseOrchestratorConfig(),
+        config=LocalOrchestratorConfig(),
         flavor="local",
         type=StackComponentType.ORCHESTRATOR,
         user=uuid4(),
@@ -23,7 +23,7 @@ import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import text
 
-from zenml.io import fileio
+from zenml.io import fileio, local_filesystem
 from zenml.logger import get_logger
 from zenml.utils import io_utils
 
@@ -113,6 +113,60 @@ def test_copy_raises_error_when_file_exists(tmp_path) -> None:
         fileio.copy(src, dst)
 
 
+def test_copy_files_copies_all_files(tmp_path) -> None:
+    """Test that copy_files copies multiple files concurrently."""
+    files = []
+    for i in range(5):
+        src = os.path.join(tmp_path, f"src_{i}.txt")
+        with open(src, "w") as f:
+            f.write(str(i))
+        files.append((src, os.path.join(tmp_path, f"dst_{i}.txt")))
+
+    fileio.copy_files(files, max_workers=3)
+
+    for i, (_, dst) in enumerate(files):
+        with open(dst) as f:
+            assert f.read() == str(i)
+
+    with pytest.raises(FileExistsError):
+        fileio.copy_files(files)
+
+
+def test_copy_files_downloads_large_files_in_ranges(tmp_path, mocker) -> None:
+    """Test that large files are copied between filesystems in byte ranges."""
+    src = os.path.join(tmp_path, "remote", "data.bin")
+    dst = os.path.join(tmp_path, "local", "data.bin")
+    os.makedirs(os.path.dirname(src))
+    os.makedirs(os.path.dirname(dst))
+    data = os.urandom(1000)
+    with open(src, "wb") as f:
+        f.write(data)
+
+    remote_filesystem = type(
+        "RemoteFilesystem", (local_filesystem.LocalFilesystem,), {}
+    )
+    mocker.patch.object(
+        fileio,
+        "_get_filesystem",
+        side_effect=lambda path: (
+            remote_filesystem
+            if "remote" in str(path)
+            else local_filesystem.LocalFilesystem
+        ),
+    )
+    range_spy = mocker.spy(fileio, "_copy_file_range")
+    progress = []
+
+    fileio.copy_files(
+        [(src, dst)], part_size=300, progress_callback=progress.append
+    )
+
+    with open(dst, "rb") as f:
+        assert f.read() == data
+    assert range_spy.call_count == 4
+    assert sum(progress) == 1000
+
+
 def test_file_exists_function(tmp_path) -> None:
     """Test that file_exists returns True when the file exists."""
     with NamedTemporaryFile(dir=tmp_path) as temp_file:
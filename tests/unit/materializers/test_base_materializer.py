@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
 from contextlib import ExitStack as does_not_raise
 
 import pytest
@@ -60,3 +61,47 @@ def test_validate_type_compatibility():
 
     with pytest.raises(TypeError):
         materializer.validate_type_compatibility(data_type=str)
+
+
+def test_get_local_directory(clean_client, mocker):
+    """Unit test for `BaseMaterializer.get_local_directory`."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "local_directory_test")
+    materializer = TestMaterializer(uri=uri)
+    path = os.path.join(uri, "data")
+
+    # Local artifact stores are used directly
+    with materializer.get_local_directory(path, mode="w") as local_dir:
+        assert local_dir == path
+        with open(os.path.join(local_dir, "file.txt"), "w") as f:
+            f.write("local")
+    with materializer.get_local_directory(path) as local_dir:
+        assert local_dir == path
+
+    # Remote artifact stores are copied from/to a temporary directory
+    mocker.patch(
+        "zenml.materializers.base_materializer.io_utils.is_remote",
+        return_value=True,
+    )
+    path = os.path.join(uri, "remote_data")
+    with materializer.get_local_directory(path, mode="w") as local_dir:
+        assert local_dir != path
+        with open(os.path.join(local_dir, "file.txt"), "w") as f:
+            f.write("remote")
+    assert not os.path.exists(local_dir)
+    with open(os.path.join(path, "file.txt")) as f:
+        assert f.read() == "remote"
+
+    with materializer.get_local_directory(path) as local_dir:
+        assert local_dir != path
+        with open(os.path.join(local_dir, "file.txt")) as f:
+            assert f.read() == "remote"
+    assert not os.path.exists(local_dir)
+
+    with materializer.get_local_directory(path, cleanup=False) as local_dir:
+        pass
+    assert os.path.exists(os.path.join(local_dir, "file.txt"))
+
+    with pytest.raises(ValueError):
+        with materializer.get_local_directory(path, mode="a"):
+            pass
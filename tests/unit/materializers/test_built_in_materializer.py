@@ -15,11 +15,15 @@ import os
 from tempfile import TemporaryDirectory
 from typing import Optional, Type
 
+import pytest
+
 from tests.unit.test_general import _test_materializer
 from zenml.client import Client
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.built_in_materializer import (
     BuiltInContainerMaterializer,
+    BuiltInMaterializer,
+    BytesMaterializer,
 )
 
 
@@ -51,6 +55,26 @@ def test_bytes_materialization():
     assert result == example
 
 
+def test_basic_type_content_hash(tmp_path):
+    """Test that the content hash of basic types depends on value and type."""
+    materializer = BuiltInMaterializer(uri=str(tmp_path))
+
+    assert materializer.compute_content_hash(
+        "aria"
+    ) == materializer.compute_content_hash("aria")
+    assert materializer.compute_content_hash(
+        "aria"
+    ) != materializer.compute_content_hash("axl")
+    assert materializer.compute_content_hash(
+        1
+    ) != materializer.compute_content_hash(True)
+
+    bytes_materializer = BytesMaterializer(uri=str(tmp_path))
+    assert bytes_materializer.compute_content_hash(
+        b"aria"
+    ) != bytes_materializer.compute_content_hash(b"axl")
+
+
 def test_empty_dict_list_tuple_materialization():
     """Test materialization for empty `dict`, `list`, `tuple` objects."""
     for type_, example in [
@@ -230,3 +254,34 @@ def test_container_materializer_for_custom_types(
         assert result[0].myname == "aria"
         assert result[1].myname == "axl"
         assert result == example
+
+
+def test_container_materializer_parallel_elements(
+    mocker, clean_client: "Client"
+):
+    """Test saving and loading container elements in parallel.
+
+    Basic elements should be stored in the metadata file instead of a
+    subfolder each, and all subfolders should be removed if any element fails
+    to save.
+    """
+    example = [b"0", 1, "a", None, 2.5, True, b"1", CustomType()] * 5
+    with TemporaryDirectory(
+        dir=clean_client.active_stack.artifact_store.path
+    ) as artifact_uri:
+        materializer = BuiltInContainerMaterializer(uri=artifact_uri)
+        materializer.save(example)
+
+        # One subfolder for each bytes and custom type element + metadata
+        assert len(os.listdir(artifact_uri)) == 15 + 1
+        assert materializer.load(list) == example
+
+        mocker.patch.object(
+            CustomTypeMaterializer, "save", side_effect=RuntimeError
+        )
+        failing_uri = os.path.join(artifact_uri, "failing")
+        os.mkdir(failing_uri)
+        materializer = BuiltInContainerMaterializer(uri=failing_uri)
+        with pytest.raises(RuntimeError):
+            materializer.save(example)
+        assert os.listdir(failing_uri) == []
@@ -12,13 +12,24 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import gc
+import os
+
 import numpy as np
 
 from tests.unit.test_general import _test_materializer
-from zenml.materializers.numpy_materializer import NumpyMaterializer
+from zenml.materializers.materializer_registry import materializer_registry
+from zenml.materializers.numpy_materializer import (
+    CHUNKED_MANIFEST_FILENAME,
+    NUMPY_CACHE_DIRECTORY_NAME,
+    ChunkedArray,
+    ChunkedNumpyMaterializer,
+    NumpyMaterializer,
+)
 from zenml.metadata.metadata_types import (
     DType,
 )
+from zenml.utils.io_utils import get_global_config_directory
 
 
 def test_numpy_materializer():
@@ -84,3 +95,150 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_content_hash(tmp_path):
+    """Test that the content hash of numpy arrays depends on their data,
+    shape and dtype."""
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    array = np.arange(6)
+
+    assert materializer.compute_content_hash(
+        array
+    ) == materializer.compute_content_hash(np.arange(6))
+    assert materializer.compute_content_hash(
+        array
+    ) != materializer.compute_content_hash(np.arange(1, 7))
+    assert materializer.compute_content_hash(
+        array
+    ) != materializer.compute_content_hash(array.reshape(2, 3))
+    assert materializer.compute_content_hash(
+        array
+    ) != materializer.compute_content_hash(array.astype(np.float64))
+    # Non-contiguous arrays are hashed by their content
+    assert materializer.compute_content_hash(
+        np.arange(12)[::2]
+    ) == materializer.compute_content_hash(np.arange(0, 12, 2))
+
+    assert (
+        materializer.compute_content_hash(np.array([object()], dtype=object))
+        is None
+    )
+
+
+def test_numpy_materializer_memory_mapped_loading(clean_client, mocker):
+    """Test that arrays can be loaded as read-only memory-mapped arrays."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "numpy_memmap_test")
+    artifact_store.makedirs(uri)
+    materializer = NumpyMaterializer(uri=uri)
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    materializer.save(array)
+
+    loaded = materializer.load(np.memmap)
+    assert isinstance(loaded, np.memmap)
+    assert not loaded.flags.writeable
+    assert np.array_equal(loaded, array)
+
+    # Regular loads still read the array into memory
+    assert not isinstance(materializer.load(np.ndarray), np.memmap)
+
+    # Remote arrays are downloaded into a local cache before being mapped
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.io_utils.is_remote",
+        return_value=True,
+    )
+    loaded = materializer.load(np.memmap)
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, array)
+    assert loaded.filename.startswith(
+        os.path.join(get_global_config_directory(), NUMPY_CACHE_DIRECTORY_NAME)
+    )
+
+    # The cache is bounded, but mapped arrays are never evicted
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.NUMPY_CACHE_MAX_SIZE", 0
+    )
+    other_materializers = []
+    for name in ["first", "second"]:
+        other_uri = os.path.join(artifact_store.path, f"{name}_memmap_test")
+        artifact_store.makedirs(other_uri)
+        other_materializers.append(NumpyMaterializer(uri=other_uri))
+        other_materializers[-1].save(array)
+
+    other_loaded = other_materializers[0].load(np.memmap)
+    cached_file = loaded.filename
+    assert os.path.exists(cached_file)
+
+    del loaded
+    gc.collect()
+    other_materializers[1].load(np.memmap)
+    assert not os.path.exists(cached_file)
+    assert os.path.exists(other_loaded.filename)
+
+    # Arrays of Python objects can't be memory-mapped
+    object_array = np.array(["a", 1], dtype=object)
+    materializer.save(object_array)
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.io_utils.is_remote",
+        return_value=False,
+    )
+    assert np.array_equal(materializer.load(np.memmap), object_array)
+
+
+def test_chunked_numpy_materializer(clean_client, mocker):
+    """Test storing and lazily loading arrays in compressed chunks."""
+    mocker.patch.object(ChunkedNumpyMaterializer, "CHUNK_SIZE", 64)
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "numpy_chunked_test")
+    artifact_store.makedirs(uri)
+    materializer = ChunkedNumpyMaterializer(uri=uri)
+    array = np.arange(40, dtype=np.int64).reshape(10, 4)
+    materializer.save(array)
+
+    # Each row has 32 bytes, so every chunk contains two rows
+    assert artifact_store.exists(os.path.join(uri, CHUNKED_MANIFEST_FILENAME))
+    assert len(artifact_store.listdir(uri)) == 6
+    assert np.array_equal(materializer.load(np.ndarray), array)
+
+    proxy = materializer.load(ChunkedArray)
+    assert isinstance(proxy, ChunkedArray)
+    assert proxy.shape == array.shape
+    assert proxy.dtype == array.dtype
+    assert len(proxy) == 10
+    assert np.array_equal(proxy[3], array[3])
+    assert np.array_equal(proxy[-1, 1:], array[-1, 1:])
+    assert np.array_equal(proxy[3:8], array[3:8])
+    assert np.array_equal(proxy[8:2:-3, 2], array[8:2:-3, 2])
+    assert np.array_equal(proxy[5:5], array[5:5])
+    assert np.array_equal(proxy[[1, 7]], array[[1, 7]])
+    assert np.array_equal(np.asarray(proxy), array)
+
+    # Arrays of Python objects are stored in the regular format
+    object_array = np.array(["a", 1], dtype=object)
+    uri = os.path.join(artifact_store.path, "numpy_chunked_object_test")
+    artifact_store.makedirs(uri)
+    materializer = ChunkedNumpyMaterializer(uri=uri)
+    materializer.save(object_array)
+    assert not artifact_store.exists(
+        os.path.join(uri, CHUNKED_MANIFEST_FILENAME)
+    )
+    assert np.array_equal(materializer.load(np.ndarray), object_array)
+
+
+def test_chunked_numpy_materializer_loads_regular_arrays(clean_client):
+    """Test that the chunked materializer loads arrays of the old format."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "numpy_legacy_test")
+    artifact_store.makedirs(uri)
+    array = np.arange(6, dtype=np.float32)
+    NumpyMaterializer(uri=uri).save(array)
+
+    loaded = ChunkedNumpyMaterializer(uri=uri).load(np.ndarray)
+    assert np.array_equal(loaded, array)
+
+    # The regular materializer stays the default for numpy arrays
+    assert (
+        materializer_registry[np.ndarray] is NumpyMaterializer
+        and materializer_registry[ChunkedArray] is ChunkedNumpyMaterializer
+    )
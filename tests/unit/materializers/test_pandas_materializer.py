@@ -13,11 +13,18 @@
 #  permissions and limitations under the License.
 
 import datetime
+import os
 
 import pandas
+import pytest
 
 from tests.unit.test_general import _test_materializer
-from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.materializers.pandas_materializer import (
+    LazyDataFrame,
+    PandasMaterializer,
+    _may_contain_matches,
+    _normalize_filters,
+)
 
 
 def test_pandas_materializer():
@@ -100,3 +107,110 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_lazy_loading(clean_client):
+    """Test reading parts of a dataframe through a lazy handle."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "pandas_lazy_test")
+    artifact_store.makedirs(uri)
+    materializer = PandasMaterializer(uri=uri)
+    df = pandas.DataFrame(
+        {"a": range(100), "b": [i % 3 for i in range(100)], "c": 1.5}
+    )
+    materializer.save(df)
+
+    assert materializer.can_handle_type(LazyDataFrame)
+    lazy_df = materializer.load(LazyDataFrame)
+    assert isinstance(lazy_df, LazyDataFrame)
+    assert lazy_df.columns == ["a", "b", "c"]
+
+    assert lazy_df.read().equals(df)
+    assert lazy_df.read(columns=["c", "a"]).equals(df[["c", "a"]])
+    assert lazy_df.read(nrows=5).equals(df.iloc[:5])
+
+    filtered = lazy_df.read(
+        columns=["a"], filters=[("b", "==", 1), ("a", ">=", 50)], nrows=3
+    )
+    assert filtered.equals(df[(df.b == 1) & (df.a >= 50)][["a"]].iloc[:3])
+
+    filtered = lazy_df.read(filters=[[("a", "<", 2)], [("a", "in", [98])]])
+    assert list(filtered.a) == [0, 1, 98]
+
+    empty = lazy_df.read(columns=["a"], filters=[("a", ">", 1000)])
+    assert empty.empty and list(empty.columns) == ["a"]
+
+    batches = list(lazy_df.iter_batches(columns=["a"], batch_size=30))
+    assert [len(batch) for batch in batches] == [30, 30, 30, 10]
+
+
+def test_pandas_filter_statistics():
+    """Test skipping blocks of rows based on column statistics."""
+    statistics = {"a": (10, 20), "b": ("x", "y")}
+
+    def may_match(filters):
+        return _may_contain_matches(statistics, _normalize_filters(filters))
+
+    assert may_match(None)
+    assert may_match([("a", "==", 15)])
+    assert not may_match([("a", "==", 25)])
+    assert not may_match([("a", "<", 10)])
+    assert may_match([("a", "<=", 10)])
+    assert not may_match([("a", ">", 20), ("b", "==", "x")])
+    assert may_match([[("a", ">", 20)], [("b", "==", "x")]])
+    assert not may_match([("a", "in", [1, 2, 30])])
+    # Columns without statistics and incomparable values can't be skipped
+    assert may_match([("c", "==", 1)])
+    assert may_match([("b", ">", 1)])
+
+    with pytest.raises(ValueError):
+        _normalize_filters([("a", "like", "x")])
+
+
+def test_pandas_materializer_statistics(clean_client, mocker):
+    """Test that statistics are computed once and match pandas."""
+    artifact_store = clean_client.active_stack.artifact_store
+    uri = os.path.join(artifact_store.path, "pandas_statistics_test")
+    artifact_store.makedirs(uri)
+    mocker.patch.object(PandasMaterializer, "PARQUET_ROW_GROUP_SIZE", 7)
+    materializer = PandasMaterializer(uri=uri)
+    df = pandas.DataFrame(
+        {
+            "a": [float(i) for i in range(50)],
+            "b": [None if i % 4 == 0 else i * 0.5 for i in range(50)],
+            "c": [i % 2 == 0 for i in range(50)],
+            "d": ["x"] * 50,
+        }
+    )
+    materializer.save(df)
+
+    describe_spy = mocker.spy(pandas.DataFrame, "describe")
+    fileio_size_spy = mocker.patch(
+        "zenml.materializers.base_materializer.fileio.size"
+    )
+    materializer.save_visualizations(df)
+    metadata = materializer.extract_full_metadata(df)
+    describe_spy.assert_not_called()
+    fileio_size_spy.assert_not_called()
+
+    expected = df[["a", "b", "c"]].astype("float64").describe()
+    statistics = materializer._get_statistics(df)
+    assert list(statistics.index) == list(expected.index)
+    assert (statistics - expected).abs().max().max() < 1e-9
+
+    for stat_name, stat in {
+        "mean": df.mean,
+        "std": df.std,
+        "min": df.min,
+        "max": df.max,
+    }.items():
+        assert metadata[stat_name] == pytest.approx(
+            {
+                key: float(value)
+                for key, value in stat(numeric_only=True).to_dict().items()
+            }
+        )
+
+    assert metadata["storage_size"] == sum(
+        os.path.getsize(os.path.join(uri, f)) for f in os.listdir(uri)
+    )
@@ -11,9 +11,21 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+from uuid import uuid4
 
+import pytest
+
+from zenml.config.step_configurations import Step
 from zenml.enums import StackComponentType
-from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.orchestrators import (
+    LocalOrchestrator,
+    LocalOrchestratorFlavor,
+    cache_utils,
+)
+from zenml.orchestrators.local.local_orchestrator import (
+    ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID,
+    LocalOrchestratorConfig,
+)
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +35,159 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+def _create_step(name, upstream_steps):
+    """Creates a step configuration with the given upstream steps."""
+    return Step.model_validate(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": upstream_steps,
+            },
+            "config": {"name": name},
+        }
+    )
+
+
+def test_local_orchestrator_runs_steps_sequentially_by_default(
+    mocker, local_orchestrator
+):
+    """Tests that the local orchestrator runs steps in the current process
+    if no parallelism is configured."""
+    run_step = mocker.patch.object(LocalOrchestrator, "run_step")
+    subprocess_run = mocker.patch("subprocess.run")
+    get_cached_steps = mocker.patch.object(cache_utils, "get_cached_steps")
+    deployment = mocker.MagicMock(
+        schedule=None,
+        step_configurations={
+            "step_1": _create_step("step_1", []),
+            "step_2": _create_step("step_2", ["step_1"]),
+        },
+    )
+
+    local_orchestrator.prepare_or_run_pipeline(
+        deployment=deployment, stack=mocker.MagicMock(), environment={}
+    )
+
+    assert run_step.call_count == 2
+    subprocess_run.assert_not_called()
+    # Sequentially executed steps query the cache when they get launched
+    get_cached_steps.assert_not_called()
+
+
+def test_local_orchestrator_runs_steps_in_parallel(mocker, local_orchestrator):
+    """Tests that the local orchestrator runs steps in separate processes in
+    the order defined by the step dependencies."""
+    local_orchestrator._config = LocalOrchestratorConfig(max_parallel_steps=2)
+    mocker.patch(
+        "zenml.utils.source_utils.get_source_root", return_value="/root"
+    )
+    mocker.patch.object(cache_utils, "get_cached_steps", return_value={})
+    executed_steps = []
+    run_ids = set()
+
+    def _run(command, env, cwd):
+        step_name = command[command.index("--step_name") + 1]
+        executed_steps.append(step_name)
+        run_ids.add(env[ENV_ZENML_LOCAL_ORCHESTRATOR_RUN_ID])
+        assert cwd == "/root"
+        return mocker.MagicMock(returncode=0)
+
+    mocker.patch("subprocess.run", side_effect=_run)
+    deployment = mocker.MagicMock(
+        schedule=None,
+        id=uuid4(),
+        step_configurations={
+            "step_1": _create_step("step_1", []),
+            "step_2": _create_step("step_2", ["step_1"]),
+            "step_3": _create_step("step_3", ["step_1"]),
+            "step_4": _create_step("step_4", ["step_2", "step_3"]),
+        },
+    )
+
+    local_orchestrator.prepare_or_run_pipeline(
+        deployment=deployment, stack=mocker.MagicMock(), environment={}
+    )
+
+    assert executed_steps[0] == "step_1"
+    assert set(executed_steps[1:3]) == {"step_2", "step_3"}
+    assert executed_steps[3] == "step_4"
+    assert len(run_ids) == 1
+    assert local_orchestrator._orchestrator_run_id is None
+
+
+def test_local_orchestrator_fails_if_parallel_step_fails(
+    mocker, local_orchestrator
+):
+    """Tests that the local orchestrator raises an error and does not run
+    downstream steps if a step running in a separate process fails."""
+    local_orchestrator._config = LocalOrchestratorConfig(max_parallel_steps=2)
+    mocker.patch(
+        "zenml.utils.source_utils.get_source_root", return_value="/root"
+    )
+    mocker.patch.object(cache_utils, "get_cached_steps", return_value={})
+    executed_steps = []
+
+    def _run(command, env, cwd):
+        step_name = command[command.index("--step_name") + 1]
+        executed_steps.append(step_name)
+        return mocker.MagicMock(returncode=1 if step_name == "step_1" else 0)
+
+    mocker.patch("subprocess.run", side_effect=_run)
+    deployment = mocker.MagicMock(
+        schedule=None,
+        id=uuid4(),
+        step_configurations={
+            "step_1": _create_step("step_1", []),
+            "step_2": _create_step("step_2", ["step_1"]),
+        },
+    )
+
+    with pytest.raises(RuntimeError):
+        local_orchestrator.prepare_or_run_pipeline(
+            deployment=deployment, stack=mocker.MagicMock(), environment={}
+        )
+
+    assert executed_steps == ["step_1"]
+
+
+def test_local_orchestrator_runs_cached_steps_in_current_process(
+    mocker, local_orchestrator
+):
+    """Tests that steps which can be cached upfront are not run in a separate
+    process."""
+    local_orchestrator._config = LocalOrchestratorConfig(max_parallel_steps=2)
+    mocker.patch(
+        "zenml.utils.source_utils.get_source_root", return_value="/root"
+    )
+    cached_step = mocker.MagicMock()
+    mocker.patch.object(
+        cache_utils,
+        "get_cached_steps",
+        return_value={"step_1": cached_step},
+    )
+    run_step = mocker.patch.object(LocalOrchestrator, "run_step")
+    executed_steps = []
+
+    def _run(command, env, cwd):
+        executed_steps.append(command[command.index("--step_name") + 1])
+        return mocker.MagicMock(returncode=0)
+
+    mocker.patch("subprocess.run", side_effect=_run)
+    step_1 = _create_step("step_1", [])
+    deployment = mocker.MagicMock(
+        schedule=None,
+        id=uuid4(),
+        step_configurations={
+            "step_1": step_1,
+            "step_2": _create_step("step_2", ["step_1"]),
+        },
+    )
+
+    local_orchestrator.prepare_or_run_pipeline(
+        deployment=deployment, stack=mocker.MagicMock(), environment={}
+    )
+
+    run_step.assert_called_once_with(step=step_1, cached_step=cached_step)
+    assert executed_steps == ["step_2"]
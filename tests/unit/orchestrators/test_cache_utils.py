@@ -18,6 +18,7 @@ from uuid import uuid4
 
 import pytest
 
+from zenml.config import CacheSettings
 from zenml.config.compiler import Compiler
 from zenml.config.source import Source
 from zenml.config.step_configurations import Step
@@ -145,6 +146,44 @@ def test_generate_cache_key_considers_input_artifacts(
     assert key_1 != key_2
 
 
+def test_generate_cache_key_uses_input_content_hashes_if_enabled(
+    generate_cache_key_kwargs,
+):
+    """Check that the cache key only depends on the content hashes of the
+    input artifacts if content addressed caching is enabled."""
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "content_hash"
+    }
+    key_1 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_2 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_1 != key_2
+
+    generate_cache_key_kwargs["step"].config.model_config["frozen"] = False
+    generate_cache_key_kwargs["step"].config.settings = {
+        "cache": CacheSettings(content_addressed=True)
+    }
+    key_3 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_4 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_3 == key_4
+
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": "other_content_hash"
+    }
+    key_5 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_4 != key_5
+
+    # Artifacts without content hash are still identified by their ID
+    generate_cache_key_kwargs["input_artifact_content_hashes"] = {
+        "input_1": None
+    }
+    key_6 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    generate_cache_key_kwargs["input_artifact_ids"] = {"input_1": uuid4()}
+    key_7 = cache_utils.generate_cache_key(**generate_cache_key_kwargs)
+    assert key_6 != key_7
+
+
 def test_generate_cache_key_considers_output_artifacts(
     generate_cache_key_kwargs,
 ):
@@ -269,3 +308,210 @@ def test_fetching_cached_step_run_uses_latest_candidate(
 
     cached_step = cache_utils.get_cached_step_run(cache_key="cache_key")
     assert cached_step == response_2
+
+
+def test_fetching_multiple_cached_step_runs(
+    clean_client,
+    sample_pipeline_deployment_request_model,
+    sample_pipeline_run_request_model,
+    sample_step_request_model,
+):
+    """Tests that cached step runs for multiple cache keys can be fetched with
+    a single request and that only completed step runs are returned."""
+    workspace_id = clean_client.active_workspace.id
+    sample_step_request_model.workspace = workspace_id
+    sample_pipeline_deployment_request_model.workspace = workspace_id
+    sample_pipeline_run_request_model.workspace = workspace_id
+    sample_pipeline_deployment_request_model.step_configurations = {
+        "sample_step": Step.model_validate(
+            {
+                "spec": {"source": "module.step_class", "upstream_steps": []},
+                "config": {"name": "sample_step"},
+            }
+        )
+    }
+
+    deployment_response = clean_client.zen_store.create_deployment(
+        sample_pipeline_deployment_request_model
+    )
+    sample_pipeline_run_request_model.deployment = deployment_response.id
+    sample_step_request_model.deployment = deployment_response.id
+
+    responses = []
+    for index, (cache_key, status) in enumerate(
+        [
+            ("key_1", ExecutionStatus.COMPLETED),
+            ("key_1", ExecutionStatus.COMPLETED),
+            ("key_2", ExecutionStatus.COMPLETED),
+            ("key_3", ExecutionStatus.RUNNING),
+        ]
+    ):
+        sample_pipeline_run_request_model.name = f"run_{index}"
+        run = clean_client.zen_store.create_run(
+            sample_pipeline_run_request_model
+        )
+        sample_step_request_model.pipeline_run_id = run.id
+        sample_step_request_model.cache_key = cache_key
+        sample_step_request_model.status = status
+        responses.append(
+            clean_client.zen_store.create_run_step(sample_step_request_model)
+        )
+
+    cached_step_runs = cache_utils.get_cached_step_runs(
+        ["key_1", "key_2", "key_3", "key_4"]
+    )
+    assert set(cached_step_runs) == {"key_1", "key_2"}
+    assert cached_step_runs["key_1"].id == responses[1].id
+    assert cached_step_runs["key_2"].id == responses[2].id
+
+    assert cache_utils.get_cached_step_runs([]) == {}
+
+
+def test_getting_cached_steps_of_deployment(
+    mocker, create_step_run, sample_artifact_version_model
+):
+    """Tests that steps are only cached upfront if all their upstream steps
+    are cached as well."""
+
+    def _step(name, upstream_steps, enable_cache=None):
+        return Step.model_validate(
+            {
+                "spec": {
+                    "source": "module.step_class",
+                    "upstream_steps": upstream_steps,
+                    "inputs": {
+                        f"input_{upstream_step}": {
+                            "step_name": upstream_step,
+                            "output_name": "output",
+                        }
+                        for upstream_step in upstream_steps
+                    },
+                },
+                "config": {"name": name, "enable_cache": enable_cache},
+            }
+        )
+
+    deployment = mocker.MagicMock()
+    deployment.pipeline_configuration.enable_cache = None
+    deployment.step_configurations = {
+        "root": _step("root", []),
+        "uncached_root": _step("uncached_root", [], enable_cache=False),
+        "child": _step("child", ["root"]),
+        "mixed_child": _step("mixed_child", ["root", "uncached_root"]),
+        "grandchild": _step("grandchild", ["child"]),
+    }
+    mocker.patch.object(
+        cache_utils,
+        "generate_cache_key",
+        side_effect=lambda step, **kwargs: step.config.name,
+    )
+    cached_step_runs = {
+        name: create_step_run(
+            output_artifacts={"output": sample_artifact_version_model}
+        )
+        for name in ["root", "child", "mixed_child", "grandchild"]
+    }
+    lookups = []
+
+    def _get_cached_step_runs(cache_keys):
+        lookups.append(set(cache_keys))
+        return {
+            key: cached_step_runs[key]
+            for key in cache_keys
+            if key in cached_step_runs
+        }
+
+    mocker.patch.object(
+        cache_utils, "get_cached_step_runs", side_effect=_get_cached_step_runs
+    )
+
+    cached_steps = cache_utils.get_cached_steps(
+        deployment=deployment, artifact_store=mocker.MagicMock()
+    )
+
+    assert cached_steps == {
+        name: cache_utils.CachedStep(
+            cache_key=name, step_run=cached_step_runs[name]
+        )
+        for name in ["root", "child", "grandchild"]
+    }
+    assert lookups == [{"root"}, {"child"}, {"grandchild"}]
+
+
+def test_getting_cached_steps_without_caching_skips_lookups(mocker):
+    """Tests that no cache lookups happen if caching is disabled for all
+    steps of a deployment."""
+    deployment = mocker.MagicMock()
+    deployment.pipeline_configuration.enable_cache = False
+    deployment.step_configurations = {
+        "step": Step.model_validate(
+            {
+                "spec": {"source": "module.step_class", "upstream_steps": []},
+                "config": {"name": "step"},
+            }
+        )
+    }
+    mock_client = mocker.patch("zenml.orchestrators.cache_utils.Client")
+    get_cached_step_runs = mocker.patch.object(
+        cache_utils, "get_cached_step_runs"
+    )
+
+    assert (
+        cache_utils.get_cached_steps(
+            deployment=deployment, artifact_store=mocker.MagicMock()
+        )
+        == {}
+    )
+    mock_client.assert_not_called()
+    get_cached_step_runs.assert_not_called()
+
+
+def test_content_hashes_are_only_required_for_content_addressed_steps(
+    mocker,
+):
+    """Tests that content hashes are only required for the outputs of steps
+    that are content addressed or consumed by content addressed steps."""
+
+    def _step(name, upstream_steps, content_addressed=False):
+        return Step.model_validate(
+            {
+                "spec": {
+                    "source": "module.step_class",
+                    "upstream_steps": upstream_steps,
+                    "inputs": {
+                        f"input_{upstream_step}": {
+                            "step_name": upstream_step,
+                            "output_name": "output",
+                        }
+                        for upstream_step in upstream_steps
+                    },
+                },
+                "config": {
+                    "name": name,
+                    "settings": {
+                        "cache": {"content_addressed": content_addressed}
+                    },
+                },
+            }
+        )
+
+    deployment = mocker.MagicMock()
+    deployment.step_configurations = {
+        "root": _step("root", []),
+        "other_root": _step("other_root", []),
+        "child": _step("child", ["root"], content_addressed=True),
+        "grandchild": _step("grandchild", ["child"]),
+        "content_addressed_leaf": _step(
+            "content_addressed_leaf", ["other_root"], content_addressed=True
+        ),
+    }
+
+    assert cache_utils.requires_content_hashes("root", deployment)
+    assert cache_utils.requires_content_hashes("child", deployment)
+    assert not cache_utils.requires_content_hashes("grandchild", deployment)
+    assert cache_utils.requires_content_hashes("other_root", deployment)
+
+    deployment.step_configurations["content_addressed_leaf"] = _step(
+        "content_addressed_leaf", ["other_root"]
+    )
+    assert not cache_utils.requires_content_hashes("other_root", deployment)
@@ -12,10 +12,20 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+import pytest
+
+from zenml.orchestrators.dag_runner import (
+    FailurePolicy,
+    NodeStatus,
+    ThreadedDagRunner,
+    get_critical_path_lengths,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -24,6 +34,13 @@ def test_reverse_dag():
     assert reverse_dag(dag) == {1: [5], 2: [3], 3: [], 5: [3], 7: [1, 5]}
 
 
+def test_critical_path_lengths():
+    """Test `dag_runner.get_critical_path_lengths()`."""
+    dag = {1: [7], 2: [], 3: [2, 5], 5: [1, 7], 7: []}
+    assert get_critical_path_lengths(dag) == {1: 3, 2: 2, 3: 1, 5: 2, 7: 4}
+    assert get_critical_path_lengths({1: [2], 2: [1]}) == {1: 0, 2: 0}
+
+
 class MockRunFn:
     """Stateful function that iteratively does `r=(r+1)*f(x)`."""
 
@@ -68,3 +85,84 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_dag_runner_max_concurrency():
+    """Test that the DAG runner never runs more nodes at once than allowed."""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run_fn(node):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    dag = {node: [] for node in range(6)}
+    ThreadedDagRunner(dag, run_fn, max_concurrency=2).run()
+    assert max_running == 2
+
+
+def test_dag_runner_prioritizes_critical_path():
+    """Test that ready nodes with the longest downstream path run first."""
+    executed_nodes = []
+    dag = {"a": [], "b": [], "c": ["b"], "d": ["c"]}
+    ThreadedDagRunner(dag, executed_nodes.append, max_concurrency=1).run()
+    assert executed_nodes == ["b", "c", "a", "d"]
+
+
+def _failing_run_fn(failing_node, executed_nodes):
+    """Creates a run function that fails for a single node."""
+
+    def run_fn(node):
+        executed_nodes.append(node)
+        if node == failing_node:
+            raise ValueError("Oh no!")
+
+    return run_fn
+
+
+def test_dag_runner_skips_downstream_nodes_of_failed_node():
+    """Test that downstream nodes of a failed node are skipped while all
+    other nodes are still run."""
+    executed_nodes = []
+    dag = {"a": [], "b": ["a"], "c": ["b"], "d": []}
+    runner = ThreadedDagRunner(
+        dag, _failing_run_fn("a", executed_nodes), max_concurrency=1
+    )
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert set(executed_nodes) == {"a", "d"}
+    assert runner.node_states == {
+        "a": NodeStatus.FAILED,
+        "b": NodeStatus.SKIPPED,
+        "c": NodeStatus.SKIPPED,
+        "d": NodeStatus.COMPLETED,
+    }
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started after a failure when using the
+    fail fast policy."""
+    executed_nodes = []
+    dag = {"a": [], "b": ["a"], "c": []}
+    runner = ThreadedDagRunner(
+        dag,
+        _failing_run_fn("a", executed_nodes),
+        max_concurrency=1,
+        failure_policy=FailurePolicy.FAIL_FAST,
+    )
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert executed_nodes == ["a"]
+    assert runner.node_states == {
+        "a": NodeStatus.FAILED,
+        "b": NodeStatus.SKIPPED,
+        "c": NodeStatus.SKIPPED,
+    }
@@ -17,8 +17,9 @@ from uuid import uuid4
 import pytest
 
 from zenml.config.step_configurations import Step
+from zenml.enums import ExecutionStatus
 from zenml.exceptions import InputResolutionError
-from zenml.models import Page
+from zenml.models import StepRunOutputs
 from zenml.orchestrators import input_utils
 
 
@@ -33,10 +34,14 @@ def test_input_resolution(
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={
+            "upstream_step": StepRunOutputs(
+                id=step_run.id,
+                status=step_run.status,
+                outputs=step_run.outputs,
+            )
+        },
     )
     step = Step.model_validate(
         {
@@ -64,10 +69,8 @@ def test_input_resolution(
 def test_input_resolution_with_missing_step_run(mocker):
     """Tests that input resolution fails if the upstream step run is missing."""
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={},
     )
     step = Step.model_validate(
         {
@@ -97,10 +100,14 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={
+            "upstream_step": StepRunOutputs(
+                id=step_run.id,
+                status=step_run.status,
+                outputs=step_run.outputs,
+            )
+        },
     )
     step = Step.model_validate(
         {
@@ -122,49 +129,156 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
         input_utils.resolve_step_inputs(step=step, run_id=uuid4())
 
 
-def test_input_resolution_fetches_all_run_steps(
+def test_input_resolution_only_fetches_steps_missing_in_index(
     mocker, sample_artifact_version_model, create_step_run
 ):
-    """Tests that input resolution fetches all step runs of the pipeline run."""
-    step_run = create_step_run(
-        step_run_name="upstream_step",
+    """Tests that input resolution only fetches the upstream steps which are
+    not in the step index yet."""
+    run_id = uuid4()
+    indexed_step_run = create_step_run(
+        step_run_name="indexed_step",
         output_artifacts={"output_name": sample_artifact_version_model},
     )
-    second_step_run = create_step_run(
-        step_run_name="other_step",
-    )
-    return_values = [
-        Page(index=1, max_size=1, total_pages=2, total=2, items=[step_run]),
-        Page(
-            index=2,
-            max_size=1,
-            total_pages=2,
-            total=2,
-            items=[second_step_run],
-        ),
-    ]
-    mock_list_run_steps = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        side_effect=return_values,
+    fetched_step_run = create_step_run(
+        step_run_name="fetched_step",
+        output_artifacts={"output_name": sample_artifact_version_model},
+    )
+    input_utils.index_step_run(run_id=run_id, step_run=indexed_step_run)
+
+    mock_get_run_step_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        return_value={
+            "fetched_step": StepRunOutputs(
+                id=fetched_step_run.id,
+                status=fetched_step_run.status,
+                outputs=fetched_step_run.outputs,
+            )
+        },
     )
     step = Step.model_validate(
         {
             "spec": {
                 "source": "module.step_class",
-                "upstream_steps": ["upstream_step"],
+                "upstream_steps": ["indexed_step", "fetched_step"],
                 "inputs": {
-                    "input_name": {
-                        "step_name": "upstream_step",
+                    "first_input": {
+                        "step_name": "indexed_step",
                         "output_name": "output_name",
-                    }
+                    },
+                    "second_input": {
+                        "step_name": "fetched_step",
+                        "output_name": "output_name",
+                    },
                 },
             },
             "config": {"name": "step_name", "enable_cache": True},
         }
     )
 
-    input_utils.resolve_step_inputs(step=step, run_id=uuid4())
+    input_artifacts, parent_ids = input_utils.resolve_step_inputs(
+        step=step, run_id=run_id
+    )
+    assert input_artifacts == {
+        "first_input": sample_artifact_version_model,
+        "second_input": sample_artifact_version_model,
+    }
+    assert parent_ids == [indexed_step_run.id, fetched_step_run.id]
+    mock_get_run_step_outputs.assert_called_once_with(
+        run_id=run_id, step_names=["fetched_step"]
+    )
+
+    # All upstream steps are indexed now, so resolving the inputs again does
+    # not fetch anything
+    input_utils.resolve_step_inputs(step=step, run_id=run_id)
+    assert mock_get_run_step_outputs.call_count == 1
+
 
-    # `resolve_step_inputs(...)` depaginates the run steps so we fetch all
-    # step runs for the pipeline run
-    assert mock_list_run_steps.call_count == 2
+def test_step_index_only_contains_successful_steps(
+    mocker, sample_artifact_version_model, create_step_run
+):
+    """Tests that only completed or cached steps are added to the step
+    index."""
+    run_id = uuid4()
+    running_step_run = create_step_run(step_run_name="running_step")
+    running_step_run.body.status = ExecutionStatus.RUNNING
+    input_utils.index_step_run(run_id=run_id, step_run=running_step_run)
+
+    mock_get_run_step_outputs = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_run_step_outputs",
+        side_effect=lambda run_id, step_names: {
+            step_name: StepRunOutputs(
+                id=uuid4(),
+                status=ExecutionStatus.RUNNING
+                if step_name == "running_step"
+                else ExecutionStatus.CACHED,
+                outputs={"output_name": sample_artifact_version_model},
+            )
+            for step_name in step_names
+        },
+    )
+
+    step_names = ["cached_step", "running_step"]
+    assert set(
+        input_utils.get_step_outputs(run_id=run_id, step_names=step_names)
+    ) == set(step_names)
+    mock_get_run_step_outputs.assert_called_once_with(
+        run_id=run_id, step_names=step_names
+    )
+
+    input_utils.get_step_outputs(run_id=run_id, step_names=step_names)
+    mock_get_run_step_outputs.assert_called_with(
+        run_id=run_id, step_names=["running_step"]
+    )
+
+
+def test_fetching_step_outputs_of_run(
+    clean_client,
+    sample_pipeline_deployment_request_model,
+    sample_pipeline_run_request_model,
+    sample_step_request_model,
+):
+    """Tests that the outputs of steps of a run can be fetched by name."""
+    workspace_id = clean_client.active_workspace.id
+    sample_step_request_model.workspace = workspace_id
+    sample_pipeline_deployment_request_model.workspace = workspace_id
+    sample_pipeline_run_request_model.workspace = workspace_id
+    sample_pipeline_deployment_request_model.step_configurations = {
+        step_name: Step.model_validate(
+            {
+                "spec": {"source": "module.step_class", "upstream_steps": []},
+                "config": {"name": step_name},
+            }
+        )
+        for step_name in ["first_step", "second_step"]
+    }
+
+    deployment_response = clean_client.zen_store.create_deployment(
+        sample_pipeline_deployment_request_model
+    )
+    sample_pipeline_run_request_model.deployment = deployment_response.id
+    sample_step_request_model.deployment = deployment_response.id
+    run = clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+    sample_step_request_model.pipeline_run_id = run.id
+    sample_step_request_model.status = ExecutionStatus.RUNNING
+
+    step_runs = {}
+    for step_name in ["first_step", "second_step"]:
+        sample_step_request_model.name = step_name
+        step_runs[step_name] = clean_client.zen_store.create_run_step(
+            sample_step_request_model
+        )
+
+    step_outputs = clean_client.zen_store.get_run_step_outputs(
+        run_id=run.id, step_names=["first_step", "non_existent"]
+    )
+    assert set(step_outputs) == {"first_step"}
+    assert step_outputs["first_step"].id == step_runs["first_step"].id
+    assert step_outputs["first_step"].status == ExecutionStatus.RUNNING
+    assert step_outputs["first_step"].outputs == {}
+
+    assert (
+        clean_client.zen_store.get_run_step_outputs(
+            run_id=run.id, step_names=[]
+        )
+        == {}
+    )
@@ -17,8 +17,12 @@ from uuid import uuid4
 
 import pytest
 
-from zenml.enums import StackComponentType
+from zenml.enums import ExecutionStatus, StackComponentType
+from zenml.models import StepRunResponse
+from zenml.orchestrators import cache_utils, input_utils
+from zenml.orchestrators import utils as orchestrator_utils
 from zenml.orchestrators.step_launcher import (
+    StepLauncher,
     _get_step_operator,
 )
 from zenml.stack import Stack
@@ -49,3 +53,57 @@ def test_step_operator_validation(local_stack, sample_step_operator):
             stack=stack_with_step_operator,
             step_operator_name=sample_step_operator.name,
         )
+
+
+def test_prepare_reuses_cached_step_with_same_cache_key(
+    mocker, create_step_run
+):
+    """Tests that a step run that was looked up in the cache upfront is
+    reused if it has the same cache key, even if its input artifacts are
+    different, without fetching the hydrated step run."""
+    mocker.patch("zenml.orchestrators.step_launcher.Client")
+    mocker.patch.object(
+        input_utils,
+        "resolve_step_inputs",
+        return_value=({"input": mocker.MagicMock(id=uuid4())}, []),
+    )
+    mocker.patch.object(
+        cache_utils, "generate_cache_key", return_value="cache_key"
+    )
+    get_cached_step_run = mocker.patch.object(
+        cache_utils, "get_cached_step_run", return_value=None
+    )
+    mocker.patch.object(orchestrator_utils, "_link_cached_artifacts_to_model")
+    get_hydrated_version = mocker.patch.object(
+        StepRunResponse, "get_hydrated_version"
+    )
+
+    launcher = StepLauncher.__new__(StepLauncher)
+    launcher._deployment = mocker.MagicMock()
+    launcher._deployment.pipeline_configuration.enable_cache = None
+    launcher._step = mocker.MagicMock()
+    launcher._step.config.enable_cache = None
+    launcher._step.config.model = None
+    launcher._step_name = "step"
+    launcher._stack = mocker.MagicMock()
+
+    # Bulk cache lookups return step runs without metadata
+    cached_step_run = create_step_run()
+    cached_step_run.metadata = None
+    launcher._cached_step = cache_utils.CachedStep(
+        cache_key="cache_key", step_run=cached_step_run
+    )
+    execution_needed, step_run = launcher._prepare(mocker.MagicMock())
+    assert not execution_needed
+    assert step_run.status == ExecutionStatus.CACHED
+    assert step_run.original_step_run_id == cached_step_run.id
+    get_cached_step_run.assert_not_called()
+    get_hydrated_version.assert_not_called()
+
+    launcher._cached_step = cache_utils.CachedStep(
+        cache_key="other_cache_key", step_run=cached_step_run
+    )
+    execution_needed, _ = launcher._prepare(mocker.MagicMock())
+    assert execution_needed
+    get_cached_step_run.assert_called_once_with(cache_key="cache_key")
+    get_hydrated_version.assert_not_called()
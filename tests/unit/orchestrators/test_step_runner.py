@@ -12,17 +12,21 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from uuid import uuid4
 
 import pytest
 
 from zenml import save_artifact
 from zenml.artifacts.unmaterialized_artifact import UnmaterializedArtifact
+from zenml.config import OutputSavingSettings
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
 from zenml.models import PipelineRunResponse, StepRunResponse
 from zenml.orchestrators.step_launcher import StepRunner
+from zenml.orchestrators.step_runner import _MemoryBudget
 from zenml.stack import Stack
 from zenml.steps import step
 
@@ -54,6 +58,7 @@ def test_running_a_successful_step(
     mock_publish_successful_step_run = mocker.patch(
         "zenml.orchestrators.step_runner.publish_successful_step_run"
     )
+    mocker.patch("zenml.orchestrators.step_runner.index_step_run")
 
     step = Step.model_validate(
         {
@@ -110,6 +115,7 @@ def test_running_a_failing_step(
     mock_publish_successful_step_run = mocker.patch(
         "zenml.orchestrators.step_runner.publish_successful_step_run"
     )
+    mocker.patch("zenml.orchestrators.step_runner.index_step_run")
 
     step = Step.model_validate(
         {
@@ -174,3 +180,82 @@ def test_loading_unmaterialized_input_artifact(local_stack, clean_client):
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact.model_dump() == artifact_response.model_dump()
+
+
+def test_parallel_output_saving_reports_errors_per_output(mocker, local_stack):
+    """Tests that failures while saving outputs in parallel are reported for
+    each output."""
+
+    def _save(**kwargs):
+        if kwargs["name"] != "valid":
+            raise RuntimeError(kwargs["name"])
+        return kwargs["name"]
+
+    mocker.patch(
+        "zenml.orchestrators.step_runner._store_artifact_data_and_prepare_request",
+        side_effect=_save,
+    )
+    mock_log_error = mocker.patch(
+        "zenml.orchestrators.step_runner.logger.error"
+    )
+
+    step = Step.model_validate(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+
+    output_kwargs = {
+        name: {"name": name, "data": None}
+        for name in ["valid", "invalid_1", "invalid_2"]
+    }
+    with pytest.raises(RuntimeError, match="invalid_1"):
+        runner._save_outputs_in_parallel(
+            output_kwargs=output_kwargs,
+            settings=OutputSavingSettings(parallel=True),
+        )
+    assert mock_log_error.call_count == 2
+
+    output_kwargs.pop("invalid_1")
+    output_kwargs.pop("invalid_2")
+    assert runner._save_outputs_in_parallel(
+        output_kwargs=output_kwargs,
+        settings=OutputSavingSettings(parallel=True),
+    ) == ["valid"]
+
+
+def test_memory_budget_limits_concurrent_reservations():
+    """Tests that the memory budget blocks reservations exceeding it."""
+    budget = _MemoryBudget(limit=10)
+    active = []
+    max_active = []
+    lock = threading.Lock()
+
+    def _reserve(size):
+        with budget.reserve(size):
+            with lock:
+                active.append(size)
+                max_active.append(sum(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(size)
+
+    threads = [
+        threading.Thread(target=_reserve, args=(size,))
+        for size in [6, 6, 4, 20]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # The reservation exceeding the budget is capped at the budget size
+    assert max(max_active) <= 20
+    assert all(total <= 10 or total == 20 for total in max_active), max_active
@@ -0,0 +1,71 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from zenml.utils.cache_utils import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_items():
+    """Tests that the LRU cache evicts the least recently used items."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.remove("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_get_or_create():
+    """Tests that values are only created if they are not cached."""
+    cache = LRUCache(maxsize=1)
+    calls = []
+
+    def _create():
+        calls.append(None)
+        return len(calls)
+
+    assert cache.get_or_create("a", _create) == 1
+    assert cache.get_or_create("a", _create) == 1
+    assert len(calls) == 1
+
+    disabled_cache = LRUCache(maxsize=0)
+    assert disabled_cache.get_or_create("a", _create) == 2
+    assert disabled_cache.get("a") is None
+
+
+def test_lru_cache_expires_items(mocker):
+    """Tests that items expire after the TTL of the cache."""
+    mock_time = mocker.patch(
+        "zenml.utils.cache_utils.time.monotonic", return_value=0
+    )
+    cache = LRUCache(maxsize=10, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    mock_time.return_value = 9
+    assert cache.get("a") == 1
+
+    mock_time.return_value = 10
+    assert cache.get("a") is None
+    assert cache.get_or_create("b", lambda: 3) == 3
+
+    cache.remove_if(lambda key: key == "b")
+    assert len(cache) == 0
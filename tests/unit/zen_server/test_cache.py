@@ -0,0 +1,276 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from zenml.models import PipelineBuildResponse, StepRunResponse
+from zenml.zen_server.auth import _is_last_login_outdated
+from zenml.zen_server.cache import (
+    AuthContextCache,
+    CachedRBAC,
+    ResponseCache,
+    compute_etag,
+    verify_etag,
+)
+from zenml.zen_server.jwt import JWTToken
+from zenml.zen_server.rbac.models import Action, Resource, ResourceType
+from zenml.zen_server.rbac.rbac_interface import RBACInterface
+
+
+def test_response_cache_caches_immutable_responses(mocker):
+    """Tests that the response cache only caches immutable responses."""
+    cache = ResponseCache(maxsize=10)
+    get_method = mocker.Mock(side_effect=lambda id, hydrate: object())
+    cached_get_method = cache.cached(PipelineBuildResponse, get_method)
+
+    id = uuid4()
+    response = cached_get_method(id, hydrate=True)
+    assert cached_get_method(id, hydrate=True) is response
+    assert cached_get_method(id, hydrate=False) is not response
+    assert get_method.call_count == 2
+
+    # Responses of other types are cached separately
+    step_response = cache.get_or_fetch(
+        StepRunResponse, id=id, hydrate=True, fetch=lambda: "running"
+    )
+    assert step_response == "running"
+
+    # Mutable responses are not cached
+    fetch = mocker.Mock(return_value="running")
+    for _ in range(2):
+        cache.get_or_fetch(
+            StepRunResponse,
+            id=uuid4(),
+            hydrate=True,
+            fetch=fetch,
+            is_immutable=lambda response: response == "completed",
+        )
+    assert fetch.call_count == 2
+
+
+def test_response_cache_invalidation(mocker):
+    """Tests removing responses from the response cache."""
+    cache = ResponseCache(maxsize=10)
+    get_method = mocker.Mock(side_effect=lambda id, hydrate: object())
+    cached_get_method = cache.cached(PipelineBuildResponse, get_method)
+
+    ids = [uuid4(), uuid4()]
+    for id in ids:
+        cached_get_method(id, hydrate=True)
+        cached_get_method(id, hydrate=False)
+    assert get_method.call_count == 4
+
+    cache.invalidate(PipelineBuildResponse, ids[0])
+    cached_get_method(ids[0], hydrate=True)
+    cached_get_method(ids[0], hydrate=False)
+    cached_get_method(ids[1], hydrate=True)
+    assert get_method.call_count == 6
+
+    # Other response types are not affected
+    cache.invalidate(StepRunResponse)
+    cached_get_method(ids[1], hydrate=False)
+    assert get_method.call_count == 6
+
+    cache.invalidate(PipelineBuildResponse)
+    cached_get_method(ids[1], hydrate=False)
+    assert get_method.call_count == 7
+
+
+class _Model(BaseModel):
+    value: int
+
+
+def _get_request(if_none_match: Optional[str] = None) -> Request:
+    """Creates a request with an optional `If-None-Match` header."""
+    headers = []
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_verify_etag():
+    """Tests setting and validating ETags of responses."""
+    model = _Model(value=1)
+    etag = compute_etag(model)
+    assert etag != compute_etag(_Model(value=2))
+
+    response = Response()
+    verify_etag(request=_get_request(), response=response, model=model)
+    assert response.headers["ETag"] == etag
+
+    response = Response()
+    verify_etag(
+        request=_get_request('"outdated"'), response=response, model=model
+    )
+    assert response.headers["ETag"] == etag
+
+    for if_none_match in [etag, f'"outdated", W/{etag}', "*"]:
+        with pytest.raises(HTTPException) as e:
+            verify_etag(
+                request=_get_request(if_none_match),
+                response=Response(),
+                model=model,
+            )
+        assert e.value.status_code == 304
+        assert e.value.headers == {"ETag": etag}
+
+
+def test_auth_context_cache_invalidation():
+    """Tests removing cached authentication contexts."""
+    cache = AuthContextCache(maxsize=10)
+    user_id = uuid4()
+    user_token = JWTToken(user_id=user_id)
+    api_key_token = JWTToken(user_id=uuid4(), api_key_id=uuid4())
+    device_token = JWTToken(user_id=user_id, device_id=uuid4())
+
+    tokens = [user_token, api_key_token, device_token]
+    for token in tokens:
+        cache.set(token, "encoded", auth_context=token)
+        assert cache.get(token, "encoded") is token
+        assert cache.get(token, "other_encoded") is None
+
+    cache.invalidate(api_key_id=api_key_token.api_key_id)
+    assert cache.get(api_key_token, "encoded") is None
+    assert cache.get(user_token, "encoded") is user_token
+
+    cache.invalidate(device_id=device_token.device_id)
+    assert cache.get(device_token, "encoded") is None
+    assert cache.get(user_token, "encoded") is user_token
+
+    cache.set(device_token, "encoded", auth_context=device_token)
+    cache.invalidate(user_id=user_id)
+    assert cache.get(user_token, "encoded") is None
+    assert cache.get(device_token, "encoded") is None
+
+
+class _FakeRBAC(RBACInterface):
+    """RBAC implementation that stores the memberships in memory."""
+
+    def __init__(self) -> None:
+        """Initializes the RBAC implementation."""
+        self.memberships: Dict[Tuple[Resource, Action], Set[str]] = {}
+        self.calls = 0
+
+    def check_permissions(self, user, resources, action):
+        """Checks if a user has permissions to perform an action on resources.
+
+        Args:
+            user: User which wants to access a resource.
+            resources: The resources the user wants to access.
+            action: The action that the user wants to perform on the resources.
+
+        Returns:
+            The permissions for each resource.
+        """
+        self.calls += 1
+        return {
+            resource: user.id in self.memberships.get((resource, action), ())
+            for resource in resources
+        }
+
+    def list_allowed_resource_ids(self, user, resource, action):
+        """Lists all resource IDs of a resource type that a user can access.
+
+        Args:
+            user: User which wants to access a resource.
+            resource: The resource the user wants to access.
+            action: The action that the user wants to perform on the resource.
+
+        Returns:
+            Whether the user has full access and the allowed resource IDs.
+        """
+        self.calls += 1
+        allowed_ids: List[str] = [
+            str(r.id)
+            for (r, a), user_ids in self.memberships.items()
+            if r.type == resource.type and a == action and user.id in user_ids
+        ]
+        return False, allowed_ids
+
+    def update_resource_membership(self, user, resource, actions):
+        """Update the resource membership of a user.
+
+        Args:
+            user: User for which the resource membership should be updated.
+            resource: The resource.
+            actions: The actions that the user should be able to perform on
+                the resource.
+        """
+        for action in actions:
+            self.memberships.setdefault((resource, action), set()).add(user.id)
+
+
+def test_cached_rbac():
+    """Tests caching and invalidating RBAC permission decisions."""
+    fake_rbac = _FakeRBAC()
+    rbac = CachedRBAC(fake_rbac, maxsize=10)
+    user = SimpleNamespace(id=uuid4())
+    other_user = SimpleNamespace(id=uuid4())
+    resource = Resource(type=ResourceType.PIPELINE, id=uuid4())
+    resource_type = Resource(type=ResourceType.PIPELINE)
+
+    assert rbac.check_permissions(user, {resource}, Action.READ) == {
+        resource: False
+    }
+    assert rbac.list_allowed_resource_ids(
+        user, resource_type, Action.READ
+    ) == (False, [])
+    rbac.check_permissions(other_user, {resource}, Action.READ)
+    assert fake_rbac.calls == 3
+
+    # Cached decisions don't call the RBAC implementation
+    rbac.check_permissions(user, {resource}, Action.READ)
+    rbac.list_allowed_resource_ids(user, resource_type, Action.READ)
+    assert fake_rbac.calls == 3
+
+    # Updating the membership invalidates the decisions of that user
+    rbac.update_resource_membership(user, resource, [Action.READ])
+    assert rbac.check_permissions(user, {resource}, Action.READ) == {
+        resource: True
+    }
+    assert rbac.list_allowed_resource_ids(
+        user, resource_type, Action.READ
+    ) == (False, [str(resource.id)])
+    rbac.check_permissions(other_user, {resource}, Action.READ)
+    assert fake_rbac.calls == 5
+
+    # Only uncached resources are checked
+    other_resource = Resource(type=ResourceType.PIPELINE, id=uuid4())
+    assert rbac.check_permissions(
+        user, {resource, other_resource}, Action.READ
+    ) == {resource: True, other_resource: False}
+    assert fake_rbac.calls == 6
+
+    rbac.invalidate(user.id)
+    rbac.check_permissions(user, {resource}, Action.READ)
+    assert fake_rbac.calls == 7
+
+
+def test_last_login_updates_are_throttled(mocker):
+    """Tests that the last login time is only updated once per interval."""
+    mocker.patch(
+        "zenml.zen_server.auth.server_config",
+        return_value=SimpleNamespace(last_login_update_interval=60),
+    )
+    now = datetime.utcnow()
+    assert _is_last_login_outdated(None)
+    assert _is_last_login_outdated(now - timedelta(seconds=61))
+    assert not _is_last_login_outdated(now - timedelta(seconds=10))
@@ -0,0 +1,84 @@
+#  Copyright (c) ZenML GmbH 2024. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from zenml.exceptions import DoesNotExistException
+from zenml.zen_server.routers import steps_endpoints
+
+
+@pytest.fixture
+def step_logs(mocker):
+    """Fixture to mock the logs of a step and the server store."""
+    mocker.patch.object(steps_endpoints, "zen_store")
+    return mocker.patch.object(
+        steps_endpoints,
+        "_get_step_logs_model",
+        return_value=mocker.MagicMock(artifact_store_id=uuid4(), uri="logs"),
+    )
+
+
+def test_filtered_step_logs_are_limited_to_length(mocker, step_logs):
+    """Tests that the length limits the size of filtered step logs and that
+    no more logs than required are read."""
+    read_blocks = []
+
+    def _stream_logs(**kwargs):
+        for block in ["aaaa", "bbbb", "cccc"]:
+            read_blocks.append(block)
+            yield block
+
+    mocker.patch.object(
+        steps_endpoints, "stream_logs", side_effect=_stream_logs
+    )
+
+    logs = steps_endpoints.get_step_logs(
+        step_id=uuid4(), length=6, tail=10, _=None
+    )
+
+    assert logs == "aaaabb"
+    assert read_blocks == ["aaaa", "bbbb"]
+
+
+def test_filtered_step_logs_reject_offset(mocker, step_logs):
+    """Tests that an offset can't be combined with line or time filters."""
+    stream_logs = mocker.patch.object(steps_endpoints, "stream_logs")
+
+    with pytest.raises(HTTPException) as e:
+        steps_endpoints.get_step_logs(
+            step_id=uuid4(), offset=10, start_line=5, _=None
+        )
+
+    assert e.value.status_code == 422
+    stream_logs.assert_not_called()
+
+
+def test_streaming_missing_step_logs_fails_before_response(mocker, step_logs):
+    """Tests that streaming logs which don't exist fails with a proper status
+    code instead of failing after the response started."""
+
+    def _stream_logs(**kwargs):
+        raise DoesNotExistException("No logs.")
+        yield
+
+    mocker.patch.object(
+        steps_endpoints, "stream_logs", side_effect=_stream_logs
+    )
+
+    with pytest.raises(HTTPException) as e:
+        steps_endpoints.stream_step_logs(step_id=uuid4(), _=None)
+
+    assert e.value.status_code == 404